@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Translate recorded meetings in bulk
+Runs continuous recognition over every input file (directories are searched
+for WAV files), a few files at a time, and writes one JSONL line per
+utterance with its file, offset, detected language and translations.
+Prints the real-time factor and throughput of the run at the end.
+With --segment, each recording is instead split at silences and its
+segments are translated in parallel, so one long meeting finishes in a
+fraction of its duration.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.batch import BatchReport, BatchTranslator, find_audio_files  # noqa: E402
+from src.core.config import get_settings  # noqa: E402
+from src.core.translator import AzureSpeechTranslator  # noqa: E402
+
+
+async def run(args, out):
+    """Translate all inputs, streaming records to out"""
+    settings = get_settings()
+    update = {"source_language": args.source or settings.source_language}
+    if args.targets:
+        targets = args.targets[:3]
+        update.update(
+            target_language=targets[0],
+            target_language_2=targets[1] if len(targets) > 1 else None,
+            target_language_3=targets[2] if len(targets) > 2 else None
+        )
+    translator = AzureSpeechTranslator(settings.model_copy(update=update))
+
+    files = find_audio_files(args.inputs, args.pattern)
+    unit = "segments" if args.segment else "file(s)"
+    print(f"Translating {len(files)} file(s), {args.concurrency} {unit} at a time", file=sys.stderr)
+
+    def write_record(record):
+        out.write(record.to_json() + "\n")
+        out.flush()
+
+    engine = BatchTranslator(
+        translator,
+        max_concurrency=args.concurrency,
+        auto_detect_languages=args.languages,
+        file_timeout_s=args.timeout
+    )
+    try:
+        if args.segment:
+            start = time.perf_counter()
+            reports = []
+            for path in files:
+                reports.append(await engine.translate_segmented(
+                    str(path), on_record=write_record,
+                    target_segment_s=args.segment_seconds,
+                    max_segment_s=args.segment_seconds * 2
+                ))
+            report = BatchReport(files=reports, elapsed_seconds=time.perf_counter() - start)
+        else:
+            report = await engine.translate_files(files, on_record=write_record)
+    finally:
+        translator.close()
+
+    for file_report in report.files:
+        status = f"ERROR {file_report.error}" if file_report.error else f"{file_report.utterances} utterances"
+        rtf = file_report.real_time_factor
+        print(f"  {file_report.file}: {status}" + (f", RTF {rtf:.2f}" if rtf is not None else ""), file=sys.stderr)
+    print(json.dumps(report.summary()), file=sys.stderr)
+    return report
+
+
+def main():
+    """Parse arguments and run the batch"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("inputs", nargs="+", help="Audio files or directories")
+    parser.add_argument("--output", "-o", help="JSONL transcript path (default: stdout)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Files processed at once")
+    parser.add_argument("--source", help="Source language (default: SOURCE_LANGUAGE)")
+    parser.add_argument("--targets", nargs="+", help="Up to 3 target languages (default: from settings)")
+    parser.add_argument("--languages", nargs="+", help="Candidate source languages for auto-detection")
+    parser.add_argument("--pattern", default="*.wav", help="File glob inside directories")
+    parser.add_argument("--timeout", type=float, help="Per-file (or per-segment) timeout in seconds")
+    parser.add_argument("--segment", action="store_true", help="Split each file at silences and translate segments in parallel")
+    parser.add_argument("--segment-seconds", type=float, default=30.0, help="Target segment length with --segment")
+    args = parser.parse_args()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            report = asyncio.run(run(args, out))
+    else:
+        report = asyncio.run(run(args, sys.stdout))
+    sys.exit(1 if any(file_report.error for file_report in report.files) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Compare synthesized audio payload sizes across output formats
+Synthesizes the same phrases in each format and reports audio bytes, the
+base64 bytes a WebSocket "recognized" message carries, the ratio to 16 kHz
+PCM and the time to decode the audio again. Uses the speech engine from
+settings (SPEECH_ENGINE=simulated encodes a tone with the same codecs, so
+no Azure credentials are needed).
+"""
+import argparse
+import base64
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.audio_formats import AUDIO_FORMAT_PRESETS, decode_audio, parse_audio_format  # noqa: E402
+from src.core.config import Settings, get_settings  # noqa: E402
+from src.core.translator import AzureSpeechTranslator  # noqa: E402
+
+PHRASES = [
+    "The motion carries.",
+    "Please state your name and address for the record.",
+    "The council will now hear public comment on item four of the agenda.",
+]
+
+
+def main():
+    """Run the comparison"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--engine", choices=["simulated", "azure"], default="simulated")
+    parser.add_argument("--language", default="es-ES")
+    parser.add_argument("--formats", nargs="+", default=list(AUDIO_FORMAT_PRESETS))
+    args = parser.parse_args()
+
+    if args.engine == "azure":
+        settings = get_settings()
+    else:
+        settings = Settings(speech_key="benchmark", speech_region="local", speech_engine="simulated",
+                            simulated_synthesis_ms=0, simulated_connect_ms=0, simulated_jitter_ms=0)
+    settings.tts_cache_enabled = False
+    translator = AzureSpeechTranslator(settings)
+
+    print("=" * 78)
+    print(f"Synthesis payload by output format ({args.engine} engine, {len(PHRASES)} phrases)")
+    print("=" * 78)
+    print(f"{'format':<10} {'name':<30} {'audio B':>9} {'base64 B':>9} {'vs pcm':>7} {'decode':>9}")
+
+    baseline = None
+    for preset in args.formats:
+        audio_format = translator.set_audio_format(preset)
+        clips = [translator.synthesize_translation(phrase, args.language) for phrase in PHRASES]
+        if any(clip is None for clip in clips):
+            print(f"{preset:<10} synthesis failed")
+            continue
+        audio_bytes = sum(len(clip) for clip in clips)
+        base64_bytes = sum(len(base64.b64encode(clip)) for clip in clips)
+        decode_ms = statistics.mean(
+            _timed(lambda clip=clip: decode_audio(clip, parse_audio_format(preset))) for clip in clips
+        )
+        if baseline is None and preset == "pcm":
+            baseline = audio_bytes
+        ratio = f"{baseline / audio_bytes:6.1f}x" if baseline else "      -"
+        print(f"{preset:<10} {audio_format.name:<30} {audio_bytes:>9} {base64_bytes:>9} {ratio:>7} {decode_ms:>7.2f}ms")
+    translator.close()
+
+
+def _timed(func) -> float:
+    """Run func once, return elapsed ms"""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    main()
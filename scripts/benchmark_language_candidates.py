@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark recognition latency with the full vs. narrowed auto-detect candidates
+Streams audio in real time through a push stream into a continuous Live
+Interpreter recognizer built with the full candidate list, lets the
+adaptive language tracker learn the session's languages, then rebuilds the
+recognizer with the narrowed candidates and streams the same audio again.
+Per-utterance latency is the time from the end of the utterance's audio to
+its final result.
+
+Runs on the simulated speech engine by default, with a per-candidate
+language ID cost; pass --engine azure and a 16 kHz 16-bit mono speech
+--wav to measure against the service.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.audio_stream import AudioStreamFeeder  # noqa: E402
+from src.core.config import Settings, get_settings  # noqa: E402
+from src.core.speech_engine import SimulatedSpeechEngine  # noqa: E402
+from src.core.translator import DEFAULT_AUTO_DETECT_LANGUAGES, LiveInterpreterTranslator  # noqa: E402
+
+CHUNK_MS = 100
+BYTES_PER_MS = 32  # 16 kHz 16-bit mono
+
+
+def load_pcm(path: str) -> bytes:
+    """Read PCM frames from a 16 kHz 16-bit mono WAV file"""
+    with wave.open(path, "rb") as wav:
+        if (wav.getframerate(), wav.getsampwidth(), wav.getnchannels()) != (16000, 2, 1):
+            raise SystemExit(f"{path}: expected 16 kHz 16-bit mono PCM")
+        return wav.readframes(wav.getnframes())
+
+
+async def run_burst(translator: LiveInterpreterTranslator, pcm: bytes) -> list:
+    """Stream pcm in real time through a fresh recognizer, return per-utterance latency in ms"""
+    latencies = []
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    push_stream = translator.create_push_stream()
+    recognizer = translator.create_recognizer_from_stream(push_stream, use_continuous_mode=True)
+    feeder = AudioStreamFeeder(push_stream, max_lead_ms=0)
+
+    def on_recognized(evt):
+        audio_end = start + (evt.result.offset + evt.result.duration) / 1e7
+        latencies.append((time.perf_counter() - audio_end) * 1000)
+
+    # Observe raw results for offsets; the translator's result processing feeds the tracker
+    recognizer.recognized.connect(on_recognized)
+    await translator.start_continuous_translation_async(
+        recognizer,
+        recognized_callback=lambda result: None,
+        session_stopped_callback=lambda: loop.call_soon_threadsafe(stopped.set)
+    )
+
+    start = time.perf_counter()
+    writer = asyncio.create_task(feeder.run())
+    chunk_bytes = BYTES_PER_MS * CHUNK_MS
+    for offset in range(0, len(pcm), chunk_bytes):
+        await feeder.feed(pcm[offset:offset + chunk_bytes])
+    feeder.close()
+    await writer
+    # The session stops by itself at the end of the stream
+    await asyncio.wait_for(stopped.wait(), timeout=30)
+    return latencies
+
+
+def report(label: str, candidates: list, latencies: list):
+    """Print latency summary"""
+    if not latencies:
+        print(f"{label:<9} no results")
+        return
+    ordered = sorted(latencies)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(f"{label:<9} candidates={len(candidates)}  mean={statistics.mean(latencies):7.1f}ms  "
+          f"p50={statistics.median(latencies):7.1f}ms  p95={p95:7.1f}ms  n={len(latencies)}")
+
+
+async def main_async(args):
+    """Run the full-candidate burst, then the narrowed one"""
+    if args.engine == "azure":
+        if not args.wav:
+            raise SystemExit("--wav is required with --engine azure")
+        settings = get_settings()
+        engine = None
+    else:
+        settings = Settings(speech_key="benchmark", speech_region="local", speech_engine="simulated",
+                            tts_cache_enabled=False)
+        engine = SimulatedSpeechEngine(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            connect_ms=50,
+            utterance_s=args.utterance_s,
+            language_id_ms=args.language_id_ms,
+            script_languages=args.languages
+        )
+    settings.adaptive_language_detection = True
+    settings.target_language = "es-ES"
+    settings.target_language_2 = None
+
+    if args.wav:
+        pcm = load_pcm(args.wav)
+    else:
+        pcm = b"\x00" * int(BYTES_PER_MS * args.utterance_s * 1000 * args.utterances)
+
+    translator = LiveInterpreterTranslator(settings, use_personal_voice=False, engine=engine)
+    tracker = translator.language_tracker
+
+    print("=" * 70)
+    print(f"Auto-detect candidates: full vs. narrowed ({args.engine} engine)")
+    print("=" * 70)
+
+    full = list(DEFAULT_AUTO_DETECT_LANGUAGES)
+    report("full", full, await run_burst(translator, pcm))
+    if not tracker.narrowed:
+        print(f"tracker did not narrow: {tracker.stats()}")
+        translator.close()
+        return
+    narrowed = tracker.candidates
+    report("narrowed", narrowed, await run_burst(translator, pcm))
+    print(f"narrowed to {narrowed}; tracker stats: {tracker.stats()}")
+    translator.close()
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--engine", choices=["simulated", "azure"], default="simulated")
+    parser.add_argument("--wav", help="16 kHz 16-bit mono speech recording (required for azure)")
+    parser.add_argument("--utterances", type=int, default=10, help="Simulated utterances per burst")
+    parser.add_argument("--utterance-s", type=float, default=1.0, help="Simulated audio per utterance")
+    parser.add_argument("--latency-ms", type=float, default=250.0, help="Simulated base final latency")
+    parser.add_argument("--language-id-ms", type=float, default=40.0,
+                        help="Simulated extra latency per candidate beyond the first")
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--languages", nargs="+", default=["en-US", "es-ES"],
+                        help="Languages spoken in turn by the simulated meeting")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark serialization of outbound WebSocket messages
+Encodes realistic "recognized" messages carrying synthesized audio for three
+languages with each available encoder: json.dumps per send (what send_json
+did), the backend's JSON codec (a reused stdlib encoder, or orjson when it is
+installed) and MessagePack with raw audio when msgpack is installed. Then
+compares serializing per socket against serializing once for N listeners.
+"""
+import argparse
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core import message_codec  # noqa: E402
+from src.core.audio_formats import parse_audio_format  # noqa: E402
+from src.core.message_codec import MSGPACK_SUBPROTOCOL, JsonCodec, get_codec  # noqa: E402
+from src.core.speech_engine import synthetic_audio  # noqa: E402
+
+LANGUAGES = ["es-ES", "fr-FR", "de-DE"]
+TEXT = "The quarterly figures will be presented after the short break this afternoon"
+
+
+def recognized(clips: dict, audio_format, audio) -> dict:
+    """A final result with audio for every language; audio(bytes) builds each audio field"""
+    return {
+        "type": "recognized",
+        "data": {
+            "utterance_id": 1,
+            "original_text": TEXT,
+            "translations": {lang: f"[{lang}] {TEXT}" for lang in LANGUAGES},
+            "detected_language": "en-US",
+            "timestamp": "2026-01-01T12:00:00",
+            "duration_ms": 4200,
+            "synthesized_audio": {lang: audio(clip) for lang, clip in clips.items()},
+            "audio_format": audio_format.name,
+            "audio_mime_type": audio_format.mime_type
+        }
+    }
+
+
+def send_json(message: dict) -> str:
+    """Starlette's send_json: a new json.dumps call per send"""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def encoded_data(encoded):
+    """Wire data of an EncodedMessage or of a plain string"""
+    return getattr(encoded, "data", encoded)
+
+
+def encoders() -> list:
+    """(name, encode, audio field builder) for every encoder available here"""
+    def b64(audio: bytes) -> str:
+        return base64.b64encode(audio).decode("ascii")
+
+    available = [
+        ("json.dumps", send_json, b64),
+        ("json reused", JsonCodec(fast=False).encode, b64),
+    ]
+    if message_codec.orjson is not None:
+        available.append(("orjson", JsonCodec().encode, b64))
+    if message_codec.msgpack_available():
+        codec = get_codec(MSGPACK_SUBPROTOCOL)
+        available.append(("msgpack", codec.encode, codec.audio))
+    return available
+
+
+def cpu_us(fn, iterations: int) -> float:
+    """Mean CPU time of fn in microseconds"""
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--formats", nargs="+", default=["pcm", "mp3", "opus"])
+    parser.add_argument("--listeners", type=int, default=100, help="Sockets receiving the same message")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    available = encoders()
+    missing = [name for name, module in (("orjson", message_codec.orjson), ("msgpack", message_codec.msgpack))
+               if module is None]
+    print("=" * 78)
+    print(f"One recognized message with audio in {len(LANGUAGES)} languages"
+          + (f" (not installed: {', '.join(missing)})" if missing else ""))
+    print("=" * 78)
+    print(f"{'format':<8}{'encoder':<13}{'audio KB':>10}{'message KB':>12}{'encode us':>11}"
+          f"{'per socket ms':>15}{'once ms':>9}")
+    for name in args.formats:
+        audio_format = parse_audio_format(name)
+        clips = {lang: synthetic_audio(f"[{lang}] {TEXT}", audio_format.name) for lang in LANGUAGES}
+        audio_bytes = sum(len(clip) for clip in clips.values())
+        for encoder, encode, audio in available:
+            size = len(encoded_data(encode(recognized(clips, audio_format, audio))))
+            # Building the message is timed too: base64 is part of the JSON cost
+            encode_us = cpu_us(lambda: encode(recognized(clips, audio_format, audio)), args.iterations)
+            # Serializing per socket scales with listeners; serializing once does not
+            per_socket_ms = encode_us * args.listeners / 1000
+            print(f"{name:<8}{encoder:<13}{audio_bytes / 1024:>10.1f}{size / 1024:>12.1f}{encode_us:>11.0f}"
+                  f"{per_socket_ms:>15.1f}{encode_us / 1000:>9.2f}")
+    print()
+    print(f"encode: CPU to build and serialize the message; per socket: {args.listeners} serializations,")
+    print("one per listener; once: one serialization shared by every listener (ConnectionManager.broadcast)")
+
+
+if __name__ == "__main__":
+    main()
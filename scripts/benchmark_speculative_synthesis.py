@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark speculative synthesis of stabilized interim translations
+Runs continuous translation on the simulated speech engine and synthesizes
+every final result, first without speculation and then for each
+combination of stability threshold and quiet period. Reports the time from
+the final result to its audio, the estimated wait speculation removed per
+speculated final, and the share of speculated segments that were wasted.
+
+--revision-rate makes the simulated recognizer mishear words in interims
+and correct them only at the end of the utterance, which is what wastes
+speculative syntheses.
+"""
+import argparse
+import itertools
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.config import Settings  # noqa: E402
+from src.core.speculative import SpeculationStats  # noqa: E402
+from src.core.speech_engine import SimulatedSpeechEngine  # noqa: E402
+from src.core.translator import AzureSpeechTranslator  # noqa: E402
+
+
+def run(args, speculative: bool, stability_events: int = 3, quiet_ms: int = 0) -> dict:
+    """Translate args.seconds of simulated speech, return final-to-audio latencies and speculation stats"""
+    settings = Settings(
+        speech_key="benchmark",
+        speech_region="local",
+        speech_engine="simulated",
+        target_language="es-ES",
+        tts_cache_enabled=False,
+        interim_coalesce_ms=0,
+        speculative_synthesis=speculative,
+        speculative_stability_events=stability_events,
+        speculative_min_words=args.min_words,
+        speculative_quiet_ms=quiet_ms
+    )
+    engine = SimulatedSpeechEngine(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        connect_ms=0,
+        synthesis_ms=args.synthesis_ms,
+        utterance_s=args.utterance_s,
+        revision_rate=args.revision_rate,
+        seed=args.seed
+    )
+    translator = AzureSpeechTranslator(settings, engine=engine)
+    stats = SpeculationStats()
+    if translator.speculator is not None:
+        translator.speculator.stats = stats
+    latencies = []
+
+    def on_final(result):
+        outcomes = translator.synthesize_translations(result.translations)
+        if all(outcome.ok for outcome in outcomes.values()):
+            latencies.append((time.perf_counter() - result.marks["recognized"]) * 1000)
+
+    recognizer = translator.create_recognizer_from_microphone()
+    translator.start_continuous_translation(recognizer, recognized_callback=on_final)
+    time.sleep(args.seconds)
+    translator.stop_continuous_translation(recognizer)
+    translator.release_recognizer(recognizer)
+    translator.close()
+    return {"latencies": latencies, "speculation": stats.stats()}
+
+
+def fmt_ms(value) -> str:
+    return f"{value:8.0f}" if value is not None else "       -"
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=12.0, help="Speech per configuration")
+    parser.add_argument("--utterance-s", type=float, default=1.5)
+    parser.add_argument("--latency-ms", type=float, default=600.0, help="End of speech to final result")
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--synthesis-ms", type=float, default=250.0)
+    parser.add_argument("--revision-rate", type=float, default=0.1)
+    parser.add_argument("--min-words", type=int, default=3)
+    parser.add_argument("--stability", type=int, nargs="+", default=[2, 3, 5])
+    parser.add_argument("--quiet-ms", type=int, nargs="+", default=[0, 300])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    configs = [("off", False, 0, 0)] + [
+        (f"N={stability} quiet={quiet_ms}", True, stability, quiet_ms)
+        for stability, quiet_ms in itertools.product(args.stability, args.quiet_ms)
+    ]
+
+    print("=" * 95)
+    print(f"Speculative synthesis, {args.seconds:.0f}s per run, {args.latency_ms:.0f}ms final latency, "
+          f"{args.synthesis_ms:.0f}ms synthesis, revision rate {args.revision_rate}")
+    print("=" * 95)
+    print(f"{'config':<18}{'finals':>7}{'mean ms':>9}{'p95 ms':>9}{'saved ms':>9}{'wait ms':>9}"
+          f"{'hit':>7}{'complete':>9}{'segments':>9}{'waste':>8}")
+    for label, speculative, stability, quiet_ms in configs:
+        result = run(args, speculative, stability, quiet_ms)
+        latencies = sorted(result["latencies"])
+        spec = result["speculation"]
+        mean = statistics.mean(latencies) if latencies else None
+        p95 = latencies[int(len(latencies) * 0.95)] if latencies else None
+        hit = f"{spec['hit_ratio']:7.0%}" if spec["hit_ratio"] is not None else "      -"
+        complete = spec["finals_complete"] / spec["finals"] if spec["finals"] else None
+        complete = f"{complete:9.0%}" if complete is not None else "        -"
+        waste = f"{spec['waste_ratio']:8.0%}" if spec["waste_ratio"] is not None else "       -"
+        print(f"{label:<18}{len(latencies):>7}{fmt_ms(mean):>9}{fmt_ms(p95):>9}"
+              f"{fmt_ms(spec['mean_saved_ms']):>9}{fmt_ms(spec['mean_wait_ms']):>9}"
+              f"{hit}{complete}{spec['segments_started']:>9}{waste}")
+    print()
+    print("mean/p95: final result to synthesized audio; saved: estimated wait removed and wait: time")
+    print("still spent per speculated final; hit: finals built from speculation;")
+    print("complete: finals with nothing left to synthesize; waste: speculated segments thrown away")
+
+
+if __name__ == "__main__":
+    main()
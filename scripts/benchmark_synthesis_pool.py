@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark pooled vs. per-call speech synthesis
+Runs AzureSpeechTranslator.synthesize_translation against the simulated
+speech engine, which models connection setup and render latency, so no
+Azure credentials are needed.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.config import Settings  # noqa: E402
+from src.core.speech_engine import SimulatedSpeechEngine  # noqa: E402
+from src.core.synthesis import SynthesizerPool  # noqa: E402
+from src.core.translator import AzureSpeechTranslator  # noqa: E402
+
+
+def run(translator, iterations, languages):
+    """Synthesize one phrase per language per iteration, return per-call ms"""
+    timings = []
+    for _ in range(iterations):
+        for lang in languages:
+            start = time.perf_counter()
+            translator.synthesize_translation("The motion carries.", lang)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    """Print latency summary"""
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:<10} mean={statistics.mean(timings):7.2f}ms  "
+          f"p50={statistics.median(timings):7.2f}ms  p95={p95:7.2f}ms  n={len(timings)}")
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--setup-ms", type=float, default=120.0,
+                        help="Simulated connection setup per synthesizer")
+    parser.add_argument("--render-ms", type=float, default=30.0,
+                        help="Simulated time to render one utterance")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    languages = ["es-ES", "fr-FR", "de-DE"]
+    settings = Settings(speech_key="benchmark", speech_region="local", tts_cache_enabled=False)
+    engine = SimulatedSpeechEngine(
+        connect_ms=args.setup_ms, synthesis_ms=args.render_ms, jitter_ms=args.jitter_ms
+    )
+
+    print("=" * 70)
+    print("Synthesis benchmark: per-call vs. pooled synthesizers")
+    print(f"setup={args.setup_ms}ms render={args.render_ms}ms languages={languages}")
+    print("=" * 70)
+
+    per_call = AzureSpeechTranslator(settings, engine=engine)
+    per_call.synthesizer_pool = SynthesizerPool(per_call._create_synthesizer, max_idle_per_key=0)
+    report("per-call", run(per_call, args.iterations, languages))
+
+    pooled = AzureSpeechTranslator(settings, engine=engine)
+    pooled.warm_synthesizers(languages)
+    time.sleep(args.setup_ms / 1000)  # Let the pre-opened connections finish their handshake
+    report("pooled", run(pooled, args.iterations, languages))
+    print(f"pool stats: {pooled.synthesizer_pool.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON/base64 against binary WebSocket frames for synthesized audio
+Builds the messages the backend sends for one final result, first as JSON
+with base64 audio and then as a JSON text message followed by binary frames,
+for whole clips and for streamed chunks. Reports bytes on the wire (including
+WebSocket frame headers) and CPU time per utterance to encode them on the
+server and to decode them on a client.
+"""
+import argparse
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.audio_formats import parse_audio_format  # noqa: E402
+from src.core.audio_frames import FrameKind, decode_frame, encode_frame  # noqa: E402
+from src.core.speech_engine import synthetic_audio  # noqa: E402
+
+LANGUAGES = ["es-ES", "fr-FR", "de-DE"]
+TEXT = "The quarterly figures will be presented after the short break this afternoon"
+
+
+def ws_header_size(length: int) -> int:
+    """Bytes of WebSocket framing for an unmasked server message"""
+    return 2 + (2 if length >= 126 else 0) + (6 if length >= 65536 else 0)
+
+
+def send_json(message: dict) -> bytes:
+    """What the backend puts on the wire for a JSON message (Starlette's send_json)"""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def recognized(utterance_id: int, synthesized_audio: dict, audio_format) -> dict:
+    return {
+        "type": "recognized",
+        "data": {
+            "utterance_id": utterance_id,
+            "original_text": TEXT,
+            "translations": {lang: f"[{lang}] {TEXT}" for lang in LANGUAGES},
+            "detected_language": "en-US",
+            "timestamp": "2026-01-01T12:00:00",
+            "duration_ms": 4200,
+            "synthesized_audio": synthesized_audio,
+            "audio_format": audio_format.name,
+            "audio_mime_type": audio_format.mime_type
+        }
+    }
+
+
+def chunk_message(utterance_id: int, lang: str, sequence: int, chunk: bytes, audio_format, final: bool) -> dict:
+    return {
+        "type": "audio_chunk",
+        "data": {
+            "utterance_id": utterance_id,
+            "language": lang,
+            "sequence": sequence,
+            "audio": base64.b64encode(chunk).decode("utf-8"),
+            "format": audio_format.name,
+            "mime_type": audio_format.mime_type,
+            "final": final,
+            "error": None
+        }
+    }
+
+
+def split(clip: bytes, chunk_bytes: int) -> list:
+    return [clip[i:i + chunk_bytes] for i in range(0, len(clip), chunk_bytes)]
+
+
+def encode_utterance(framing: str, streamed: bool, clips: dict, audio_format, chunk_bytes: int) -> list:
+    """Messages the backend sends for one final result"""
+    binary = framing == "binary"
+    if not streamed:
+        if not binary:
+            audio = {lang: base64.b64encode(clip).decode("utf-8") for lang, clip in clips.items()}
+            return [send_json(recognized(1, audio, audio_format))]
+        return [send_json(recognized(1, {}, audio_format))] + [
+            encode_frame(FrameKind.CLIP, clip, 1, 1, 0, lang, audio_format, final=True)
+            for lang, clip in clips.items()
+        ]
+    messages = [send_json(recognized(1, {}, audio_format))]
+    for lang, clip in clips.items():
+        chunks = split(clip, chunk_bytes) + [b""]
+        for sequence, chunk in enumerate(chunks):
+            final = sequence == len(chunks) - 1
+            if binary:
+                messages.append(encode_frame(FrameKind.CHUNK, chunk, 1, 1, sequence, lang, audio_format, final=final))
+            else:
+                messages.append(send_json(chunk_message(1, lang, sequence, chunk, audio_format, final)))
+    return messages
+
+
+def decode_utterance(messages: list) -> int:
+    """Recover the audio a client gets from the messages, returning its size"""
+    audio = 0
+    for message in messages:
+        if isinstance(message, bytes) and message[:1] != b"{":
+            audio += len(decode_frame(message).payload)
+            continue
+        data = json.loads(message)["data"]
+        if "synthesized_audio" in data:
+            audio += sum(len(base64.b64decode(clip)) for clip in data["synthesized_audio"].values())
+        elif "audio" in data:
+            audio += len(base64.b64decode(data["audio"]))
+    return audio
+
+
+def cpu_us(fn, iterations: int) -> float:
+    """Mean CPU time of fn in microseconds"""
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--formats", nargs="+", default=["pcm", "mp3", "opus"])
+    parser.add_argument("--languages", type=int, default=3, choices=[1, 2, 3])
+    parser.add_argument("--chunk-bytes", type=int, default=8192, help="Streamed chunk size")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print("=" * 92)
+    print(f"One final result in {args.languages} language(s), {len(TEXT)} characters of text per language")
+    print("=" * 92)
+    print(f"{'format':<8}{'delivery':<10}{'framing':<9}{'messages':>9}{'audio KB':>10}{'wire KB':>9}"
+          f"{'overhead':>10}{'server us':>11}{'client us':>11}")
+    for name in args.formats:
+        audio_format = parse_audio_format(name)
+        clips = {lang: synthetic_audio(f"[{lang}] {TEXT}", audio_format.name) for lang in LANGUAGES[:args.languages]}
+        audio_bytes = sum(len(clip) for clip in clips.values())
+        for streamed in (False, True):
+            for framing in ("json", "binary"):
+                messages = encode_utterance(framing, streamed, clips, audio_format, args.chunk_bytes)
+                assert decode_utterance(messages) == audio_bytes
+                wire = sum(len(m) + ws_header_size(len(m)) for m in messages)
+                server = cpu_us(lambda: encode_utterance(framing, streamed, clips, audio_format, args.chunk_bytes),
+                                args.iterations)
+                client = cpu_us(lambda: decode_utterance(messages), args.iterations)
+                print(f"{name:<8}{'chunks' if streamed else 'clip':<10}{framing:<9}{len(messages):>9}"
+                      f"{audio_bytes / 1024:>10.1f}{wire / 1024:>9.1f}{(wire - audio_bytes) / audio_bytes:>10.1%}"
+                      f"{server:>11.0f}{client:>11.0f}")
+    print()
+    print("overhead: wire bytes beyond the audio itself; server: CPU to build and serialize the")
+    print("messages; client: CPU to parse them and recover the audio (Python stand-in for the browser)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Load test broadcast rooms with growing listener counts
+For each listener count, opens that many connections to /ws/listen/<room>,
+then a presenter on /ws/translate configured with the room streams audio in
+real time (silence by default, which the simulated engine still "recognizes").
+Server CPU comes from the backend's /stats before and after each run; a run
+without listeners gives the fixed cost of recognizing, translating and
+synthesizing each utterance, and the remainder divided by the listeners is
+the per-listener cost of fanning results out.
+Start the backend with SPEECH_ENGINE=simulated to load test without Azure.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import resource
+import statistics
+import sys
+import time
+import urllib.request
+import wave
+from pathlib import Path
+
+import websockets
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.audio_frames import BINARY_SUBPROTOCOL, FrameKind, decode_frame, encode_frame  # noqa: E402
+
+
+def load_pcm(path: str) -> bytes:
+    """Read PCM frames from a 16 kHz 16-bit mono WAV file"""
+    with wave.open(path, "rb") as wav:
+        if (wav.getframerate(), wav.getsampwidth(), wav.getnchannels()) != (16000, 2, 1):
+            raise SystemExit(f"{path}: expected 16 kHz 16-bit mono PCM")
+        return wav.readframes(wav.getnframes())
+
+
+def server_cpu_s(stats_url: str) -> float:
+    """CPU seconds the backend process has used"""
+    with urllib.request.urlopen(stats_url, timeout=10) as response:
+        return json.load(response)["process_cpu_s"]
+
+
+async def listen(url: str, binary: bool, connected: asyncio.Event, heard: dict, stats: dict):
+    """One listener: record when each utterance arrives until the presenter leaves"""
+    subprotocols = [BINARY_SUBPROTOCOL] if binary else None
+    async with websockets.connect(url, max_size=None, subprotocols=subprotocols) as ws:
+        await ws.recv()  # connected
+        connected.set()
+        async for raw in ws:
+            if isinstance(raw, bytes):
+                frame = decode_frame(raw)
+                if frame.kind in (FrameKind.CLIP, FrameKind.CHUNK):
+                    stats["audio_bytes"] += len(frame.payload)
+                continue
+            message = json.loads(raw)
+            if message["type"] == "recognized":
+                data = message["data"]
+                heard.setdefault(data["utterance_id"], []).append(time.perf_counter())
+                stats["audio_bytes"] += sum(len(base64.b64decode(a)) for a in data["synthesized_audio"].values())
+            elif message["type"] == "error":
+                stats["errors"] += 1
+            elif message["type"] == "presenter_left":
+                return
+
+
+async def present(url: str, room: str, pcm: bytes, args) -> dict:
+    """The presenter: stream the audio into the room and record when each final result arrives"""
+    chunk_bytes = 32 * args.chunk_ms  # 32 bytes per ms at 16 kHz 16-bit mono
+    recognized = {}
+    subprotocols = [BINARY_SUBPROTOCOL] if args.binary else None
+    async with websockets.connect(url, max_size=None, subprotocols=subprotocols) as ws:
+        session_id = json.loads(await ws.recv())["data"].get("session_id", 0)  # connected
+        await ws.send(json.dumps({"type": "config", "data": {
+            "target_languages": args.targets,
+            "audio_source": "stream",
+            "audio_format": args.audio_format,
+            "room": room
+        }}))
+        confirmed = json.loads(await ws.recv())
+        if confirmed["type"] != "config_confirmed":
+            raise RuntimeError(f"Config refused: {confirmed}")
+        await ws.send(json.dumps({"type": "start_recording", "data": {}}))
+
+        async def receive():
+            async for raw in ws:
+                if isinstance(raw, bytes):
+                    continue
+                message = json.loads(raw)
+                if message["type"] == "recognized":
+                    recognized[message["data"]["utterance_id"]] = time.perf_counter()
+                elif message["type"] == "stopped":
+                    return
+
+        receiver = asyncio.create_task(receive())
+        for sequence, offset in enumerate(range(0, len(pcm), chunk_bytes)):
+            chunk = pcm[offset:offset + chunk_bytes]
+            if args.binary:
+                await ws.send(encode_frame(FrameKind.INPUT, chunk, session_id, sequence=sequence))
+            else:
+                await ws.send(json.dumps({"type": "audio", "data": {"audio": base64.b64encode(chunk).decode("ascii")}}))
+            await asyncio.sleep(args.chunk_ms / 1000)
+        # Trailing silence lets the last utterance finish before stopping
+        await asyncio.sleep(1)
+        await ws.send(json.dumps({"type": "stop_recording", "data": {}}))
+        await asyncio.wait_for(receiver, timeout=30)
+    return recognized
+
+
+async def run_room(args, pcm: bytes, listeners: int) -> dict:
+    """One presenter and the given number of listeners in a fresh room"""
+    room = f"load-{listeners}-{int(time.time())}"
+    listen_url = f"{args.url}/ws/listen/{room}"
+    heard: dict = {}
+    stats = {"audio_bytes": 0, "errors": 0}
+
+    # Connect in batches so the backend is not flooded with handshakes
+    tasks = []
+    for batch in range(0, listeners, args.connect_batch):
+        events = []
+        for _ in range(min(args.connect_batch, listeners - batch)):
+            connected = asyncio.Event()
+            events.append(connected)
+            tasks.append(asyncio.create_task(listen(listen_url, args.binary, connected, heard, stats)))
+        await asyncio.wait_for(asyncio.gather(*(event.wait() for event in events)), timeout=60)
+
+    cpu_before = await asyncio.to_thread(server_cpu_s, args.stats_url)
+    recognized = await present(f"{args.url}/ws/translate", room, pcm, args)
+    results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=60)
+    cpu_s = await asyncio.to_thread(server_cpu_s, args.stats_url) - cpu_before
+
+    spreads = [
+        (max(times) - recognized[utterance_id]) * 1000
+        for utterance_id, times in heard.items() if utterance_id in recognized
+    ]
+    delivered = sum(len(times) for utterance_id, times in heard.items() if utterance_id in recognized)
+    return {
+        "listeners": listeners,
+        "utterances": len(recognized),
+        "delivered": delivered,
+        "failed": sum(isinstance(r, Exception) for r in results) + stats["errors"],
+        "cpu_ms_per_utterance": cpu_s * 1000 / max(len(recognized), 1),
+        "spread_p50_ms": statistics.median(spreads) if spreads else None,
+        "spread_max_ms": max(spreads) if spreads else None
+    }
+
+
+async def main_async(args):
+    """Run a baseline room and one room per listener count"""
+    if args.wav:
+        pcm = load_pcm(args.wav)
+    else:
+        pcm = b"\x00" * (32000 * args.seconds)
+    print(f"Streaming {len(pcm) / 32000:.1f}s of audio into rooms on {args.url} "
+          f"({'binary frames' if args.binary else 'JSON'}, {args.audio_format}, targets {' '.join(args.targets)})")
+    print(f"{'listeners':>10}{'utterances':>12}{'delivered':>11}{'failed':>8}{'server ms/utt':>15}"
+          f"{'us/listener/utt':>17}{'spread p50 ms':>15}{'spread max ms':>15}")
+    baseline = None
+    for listeners in [0] + args.listeners:
+        result = await run_room(args, pcm, listeners)
+        if baseline is None:
+            baseline = result["cpu_ms_per_utterance"]
+        per_listener = ""
+        if listeners:
+            per_listener = f"{(result['cpu_ms_per_utterance'] - baseline) * 1000 / listeners:.0f}"
+        spread_p50 = "" if result["spread_p50_ms"] is None else f"{result['spread_p50_ms']:.0f}"
+        spread_max = "" if result["spread_max_ms"] is None else f"{result['spread_max_ms']:.0f}"
+        print(f"{listeners:>10}{result['utterances']:>12}{result['delivered']:>11}{result['failed']:>8}"
+              f"{result['cpu_ms_per_utterance']:>15.1f}{per_listener:>17}{spread_p50:>15}{spread_max:>15}")
+    print()
+    print("server ms/utt: backend CPU per utterance; us/listener/utt: CPU beyond the listener-free run,")
+    print("per listener; spread: presenter's result to the last listener's copy, as seen by this client")
+
+
+def main():
+    """Parse arguments and run the load test"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--wav", help="16 kHz 16-bit mono WAV fixture (silence if omitted)")
+    parser.add_argument("--seconds", type=int, default=10, help="Seconds of silence to stream without --wav")
+    parser.add_argument("--url", default="ws://localhost:8000")
+    parser.add_argument("--listeners", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    parser.add_argument("--targets", nargs="+", default=["es-ES", "fr-FR", "de-DE"])
+    parser.add_argument("--audio-format", default="mp3")
+    parser.add_argument("--binary", action="store_true", help="Listeners and presenter use binary frames")
+    parser.add_argument("--connect-batch", type=int, default=100, help="Listener handshakes in flight at once")
+    args = parser.parse_args()
+    args.stats_url = args.url.replace("ws://", "http://").replace("wss://", "https://") + "/stats"
+
+    # Each listener is a socket in this process
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = max(args.listeners) + 64
+    if soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(wanted, hard), hard))
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Load test the backend's client audio stream path
+Opens N WebSocket connections to /ws/translate, configures each with
+"audio_source": "stream" and streams a 16 kHz 16-bit mono WAV fixture in
+real-time 100 ms chunks, then reports recognized utterances and latency.
+Start the backend with SPEECH_ENGINE=simulated to load test without Azure.
+With --binary the chunks are uploaded as binary frames instead of base64 JSON.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import statistics
+import sys
+import time
+import wave
+from pathlib import Path
+
+import websockets
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.audio_frames import BINARY_SUBPROTOCOL, FrameKind, encode_frame  # noqa: E402
+
+
+def load_pcm(path: str) -> bytes:
+    """Read PCM frames from a 16 kHz 16-bit mono WAV file"""
+    with wave.open(path, "rb") as wav:
+        if (wav.getframerate(), wav.getsampwidth(), wav.getnchannels()) != (16000, 2, 1):
+            raise SystemExit(f"{path}: expected 16 kHz 16-bit mono PCM")
+        return wav.readframes(wav.getnframes())
+
+
+async def run_client(url: str, pcm: bytes, targets: list, chunk_ms: int, client_id: int, binary: bool = False) -> dict:
+    """Stream one fixture over one connection and collect results"""
+    chunk_bytes = 32 * chunk_ms  # 32 bytes per ms at 16 kHz 16-bit mono
+    stats = {"client": client_id, "recognized": 0, "errors": 0, "first_result_ms": None}
+    subprotocols = [BINARY_SUBPROTOCOL] if binary else None
+
+    async with websockets.connect(url, max_size=None, subprotocols=subprotocols) as ws:
+        session_id = json.loads(await ws.recv())["data"].get("session_id", 0)  # connected
+        await ws.send(json.dumps({"type": "config", "data": {
+            "target_languages": targets,
+            "audio_source": "stream"
+        }}))
+        await ws.recv()  # config_confirmed
+        await ws.send(json.dumps({"type": "start_recording", "data": {}}))
+
+        async def receive():
+            async for raw in ws:
+                if isinstance(raw, bytes):
+                    continue  # Synthesized audio frame
+                message = json.loads(raw)
+                if message["type"] == "recognized":
+                    stats["recognized"] += 1
+                    if stats["first_result_ms"] is None:
+                        stats["first_result_ms"] = (time.perf_counter() - start) * 1000
+                elif message["type"] == "error":
+                    stats["errors"] += 1
+                elif message["type"] == "stopped":
+                    return
+
+        start = time.perf_counter()
+        receiver = asyncio.create_task(receive())
+        for sequence, offset in enumerate(range(0, len(pcm), chunk_bytes)):
+            chunk = pcm[offset:offset + chunk_bytes]
+            if binary:
+                await ws.send(encode_frame(FrameKind.INPUT, chunk, session_id, sequence=sequence))
+            else:
+                await ws.send(json.dumps({
+                    "type": "audio",
+                    "data": {"audio": base64.b64encode(chunk).decode("ascii")}
+                }))
+            await asyncio.sleep(chunk_ms / 1000)
+        await ws.send(json.dumps({"type": "stop_recording", "data": {}}))
+        await asyncio.wait_for(receiver, timeout=30)
+
+    stats["elapsed_s"] = time.perf_counter() - start
+    return stats
+
+
+async def main_async(args):
+    """Run all clients concurrently"""
+    pcm = load_pcm(args.wav)
+    audio_s = len(pcm) / 32000
+    print(f"Streaming {audio_s:.1f}s of audio over {args.connections} connections to {args.url}")
+
+    results = await asyncio.gather(*(
+        run_client(args.url, pcm, args.targets, args.chunk_ms, i, args.binary) for i in range(args.connections)
+    ), return_exceptions=True)
+
+    failed = [r for r in results if isinstance(r, Exception)]
+    ok = [r for r in results if not isinstance(r, Exception)]
+    firsts = [r["first_result_ms"] for r in ok if r["first_result_ms"] is not None]
+    print(f"connections ok={len(ok)} failed={len(failed)}")
+    print(f"recognized utterances={sum(r['recognized'] for r in ok)} errors={sum(r['errors'] for r in ok)}")
+    if firsts:
+        print(f"first result ms: p50={statistics.median(firsts):.0f} max={max(firsts):.0f}")
+    for error in failed[:5]:
+        print(f"  failure: {error!r}")
+
+
+def main():
+    """Parse arguments and run the load test"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("wav", help="16 kHz 16-bit mono WAV fixture")
+    parser.add_argument("--url", default="ws://localhost:8000/ws/translate")
+    parser.add_argument("--connections", type=int, default=5)
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    parser.add_argument("--targets", nargs="+", default=["es-ES"])
+    parser.add_argument("--binary", action="store_true", help="Upload audio as binary frames")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Pre-render a phrase list into the synthesis cache
+Renders each phrase with the configured voice for its language so the
+first occurrence in a meeting is already a cache hit. Set TTS_CACHE_DIR
+so the rendered audio persists for the backend and Streamlit app.
+"""
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.config import get_settings  # noqa: E402
+from src.core.translator import AzureSpeechTranslator  # noqa: E402
+
+
+def main():
+    """Warm the synthesis cache"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--phrases", default=str(Path(__file__).resolve().parent.parent / "examples" / "council_phrases.json"),
+                        help="JSON file mapping language code to a list of phrases in that language")
+    parser.add_argument("--languages", nargs="*",
+                        help="Languages to warm (default: configured target languages)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    settings = get_settings()
+    if not settings.tts_cache_dir:
+        print("⚠️  TTS_CACHE_DIR is not set - rendered audio will not outlive this process")
+
+    with open(args.phrases, encoding="utf-8") as f:
+        phrases = json.load(f)
+    languages = args.languages or settings.target_languages
+    selected = {lang: phrases[lang] for lang in languages if lang in phrases}
+    if not selected:
+        print(f"❌ No phrases for languages {languages} in {args.phrases}")
+        return 1
+
+    translator = AzureSpeechTranslator(settings)
+    try:
+        rendered = translator.warm_synthesis_cache(selected)
+    finally:
+        translator.close()
+
+    for lang, count in rendered.items():
+        print(f"✅ {lang}: {count} rendered, {len(selected[lang]) - count} already cached or failed")
+    print(f"Cache stats: {translator.synthesis_cache.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Bridge Speech SDK event signals onto asyncio futures"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_future(
+    loop: asyncio.AbstractEventLoop,
+    future: asyncio.Future,
+    value: Any = None,
+    exception: Optional[BaseException] = None
+):
+    """
+    Complete an asyncio future from any thread
+
+    SDK events fire on SDK-owned threads; the result is handed to the loop
+    with call_soon_threadsafe so no loop thread ever blocks on the SDK.
+
+    Args:
+        loop: Loop that owns the future
+        future: Future to complete (ignored if already done)
+        value: Result value
+        exception: Exception to set instead of a result
+    """
+    def _complete():
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(value)
+
+    if loop.is_closed():
+        return
+    loop.call_soon_threadsafe(_complete)
+
+
+async def wait_for_signals(
+    signals: Iterable[Tuple[Any, Callable[[Any], Any]]],
+    trigger: Callable[[], Any],
+    timeout: Optional[float] = None
+) -> Any:
+    """
+    Start an SDK operation and await the first of several events
+
+    Handlers stay connected after the future resolves (SDK signals only
+    support disconnect_all), so each handler is a no-op once the future is
+    done.
+
+    Args:
+        signals: (EventSignal, mapper) pairs; the first event to fire resolves
+                 the future with mapper(evt)
+        trigger: Starts the operation (e.g. recognizer.recognize_once_async)
+        timeout: Seconds to wait before raising asyncio.TimeoutError
+
+    Returns:
+        The mapped value of the first event
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    for signal, mapper in signals:
+        def handler(evt, mapper=mapper):
+            if future.done():
+                return
+            try:
+                resolve_future(loop, future, mapper(evt))
+            except Exception as e:
+                resolve_future(loop, future, exception=e)
+        signal.connect(handler)
+
+    trigger()
+    if timeout is None:
+        return await future
+    return await asyncio.wait_for(future, timeout)
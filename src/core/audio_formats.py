@@ -0,0 +1,174 @@
+"""Synthesis output formats: parsing, encoding and decoding"""
+
+import io
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+logger = logging.getLogger(__name__)
+
+# Short names accepted wherever a SpeechSynthesisOutputFormat member name is
+AUDIO_FORMAT_PRESETS: Dict[str, str] = {
+    "pcm": "Riff16Khz16BitMonoPcm",
+    "pcm-24k": "Riff24Khz16BitMonoPcm",
+    "pcm-8k": "Riff8Khz16BitMonoPcm",
+    "raw": "Raw16Khz16BitMonoPcm",
+    "opus": "Ogg16Khz16BitMonoOpus",
+    "opus-24k": "Ogg24Khz16BitMonoOpus",
+    "mp3": "Audio16Khz32KBitRateMonoMp3",
+    "mp3-24k": "Audio24Khz48KBitRateMonoMp3",
+}
+
+_PCM = re.compile(r"(Riff|Raw)(\d+)(Khz|Hz)16BitMonoPcm")
+_OGG_OPUS = re.compile(r"Ogg(\d+)Khz16BitMonoOpus")
+_MP3 = re.compile(r"Audio(\d+)Khz(\d+)KBitRateMonoMp3")
+
+_MIME_TYPES = {"riff": "audio/wav", "raw": "audio/L16", "ogg": "audio/ogg", "mp3": "audio/mpeg"}
+# soundfile (format, subtype) used to encode each compressed container
+_SF_FORMATS = {"ogg": ("OGG", "OPUS"), "mp3": ("MP3", "MPEG_LAYER_III")}
+
+
+@dataclass(frozen=True)
+class AudioFormat:
+    """A synthesis output format the apps can produce and decode"""
+
+    name: str  # speechsdk.SpeechSynthesisOutputFormat member name
+    container: str  # 'riff', 'raw', 'ogg' or 'mp3'
+    sample_rate: int
+    bitrate_kbps: Optional[int] = None  # Nominal bitrate of compressed formats
+
+    @property
+    def compressed(self) -> bool:
+        return self.container in _SF_FORMATS
+
+    @property
+    def mime_type(self) -> str:
+        if self.container == "raw":
+            return f"audio/L16;rate={self.sample_rate}"
+        return _MIME_TYPES[self.container]
+
+
+def parse_audio_format(name: str) -> AudioFormat:
+    """
+    Resolve a preset or SpeechSynthesisOutputFormat member name
+
+    Args:
+        name: Preset (e.g. 'opus', 'mp3', 'pcm-8k') or SDK member name
+            (e.g. 'Ogg16Khz16BitMonoOpus')
+
+    Returns:
+        The AudioFormat
+
+    Raises:
+        ValueError: If the format is unknown or cannot be decoded by the apps
+    """
+    name = AUDIO_FORMAT_PRESETS.get(name, name)
+    match = _PCM.fullmatch(name)
+    if match:
+        sample_rate = int(match.group(2)) * (1000 if match.group(3) == "Khz" else 1)
+        return AudioFormat(name, match.group(1).lower(), sample_rate)
+    match = _OGG_OPUS.fullmatch(name)
+    if match:
+        return AudioFormat(name, "ogg", int(match.group(1)) * 1000)
+    match = _MP3.fullmatch(name)
+    if match:
+        return AudioFormat(name, "mp3", int(match.group(1)) * 1000, int(match.group(2)))
+    raise ValueError(
+        f"Unsupported synthesis output format: {name} "
+        f"(use one of {sorted(AUDIO_FORMAT_PRESETS)} or a 16-bit PCM, Ogg Opus or MP3 format name)"
+    )
+
+
+def sniff_audio_format(audio_bytes: bytes, sample_rate: int = 16000) -> AudioFormat:
+    """
+    Guess the format of synthesized audio from its header
+
+    Args:
+        audio_bytes: Encoded audio
+        sample_rate: Sample rate assumed for headerless (raw) PCM
+
+    Returns:
+        AudioFormat with the container set; sample rates of encoded formats
+        are read from the data when decoding
+    """
+    if audio_bytes[:4] == b"RIFF":
+        return AudioFormat("Riff", "riff", sample_rate)
+    if audio_bytes[:4] == b"OggS":
+        return AudioFormat("Ogg", "ogg", sample_rate)
+    if audio_bytes[:3] == b"ID3" or (len(audio_bytes) > 1 and audio_bytes[0] == 0xFF and audio_bytes[1] & 0xE0 == 0xE0):
+        return AudioFormat("Mp3", "mp3", sample_rate)
+    return AudioFormat("Raw", "raw", sample_rate)
+
+
+def decode_audio(
+    audio_bytes: bytes,
+    audio_format: Optional[AudioFormat] = None,
+    dtype: str = "float32"
+) -> Tuple[np.ndarray, int]:
+    """
+    Decode synthesized audio to samples
+
+    Args:
+        audio_bytes: Audio in a supported output format
+        audio_format: Format of the audio (sniffed from the header if None)
+        dtype: Sample type ('float32' in [-1, 1) or 'int16')
+
+    Returns:
+        Tuple of (samples, sample_rate); multi-channel audio is frames x channels
+    """
+    audio_format = audio_format or sniff_audio_format(audio_bytes)
+    if audio_format.container == "raw":
+        samples = np.frombuffer(audio_bytes, dtype="<i2")
+        if dtype != "int16":
+            samples = samples.astype(dtype) / 32768.0
+        return samples, audio_format.sample_rate
+
+    samples, sample_rate = sf.read(io.BytesIO(audio_bytes), dtype=dtype)
+    return samples, sample_rate
+
+
+def encode_audio(samples: np.ndarray, audio_format: AudioFormat) -> bytes:
+    """
+    Encode 16-bit mono samples at the format's sample rate
+
+    Args:
+        samples: int16 samples
+        audio_format: Target format
+
+    Returns:
+        Encoded audio bytes
+    """
+    samples = np.asarray(samples, dtype="<i2")
+    if audio_format.container == "raw":
+        return samples.tobytes()
+
+    buffer = io.BytesIO()
+    if audio_format.container == "riff":
+        sf.write(buffer, samples, audio_format.sample_rate, format="WAV", subtype="PCM_16")
+    else:
+        file_format, subtype = _SF_FORMATS[audio_format.container]
+        sf.write(buffer, samples, audio_format.sample_rate, format=file_format, subtype=subtype)
+    return buffer.getvalue()
+
+
+def concat_audio(clips: List[bytes], audio_format: AudioFormat) -> bytes:
+    """
+    Join separately synthesized clips into one clip
+
+    Args:
+        clips: Audio in audio_format, in playback order
+        audio_format: Format of every clip and of the result
+
+    Returns:
+        Encoded audio (headers and compressed frames are re-encoded, raw PCM is joined as is)
+    """
+    if len(clips) == 1:
+        return clips[0]
+    if audio_format.container == "raw":
+        return b"".join(clips)
+    samples = [decode_audio(clip, audio_format, dtype="int16")[0] for clip in clips]
+    return encode_audio(np.concatenate(samples), audio_format)
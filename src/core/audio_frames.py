@@ -0,0 +1,139 @@
+"""Binary WebSocket frames carrying audio, with a compact fixed header"""
+
+import struct
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional
+
+from src.core.audio_formats import AudioFormat
+
+# WebSocket subprotocols offered by clients; the server picks binary when it is offered
+BINARY_SUBPROTOCOL = "live-interpreter.binary.v1"
+JSON_SUBPROTOCOL = "live-interpreter.json.v1"
+
+FRAME_VERSION = 2  # 2: sample rate in Hz (uint16) instead of kHz
+
+# version, kind, flags, codec, sample rate (Hz), session id, utterance id, sequence, language length
+_HEADER = struct.Struct("!BBBBHIIIB")
+HEADER_SIZE = _HEADER.size
+
+FLAG_FINAL = 0x01  # Last frame of a language's audio stream
+FLAG_ERROR = 0x02  # Payload is a UTF-8 error message instead of audio
+
+# Container -> codec byte; 0 means the session's announced format
+_CODECS = {"riff": 1, "raw": 2, "ogg": 3, "mp3": 4}
+_CONTAINERS = {code: container for container, code in _CODECS.items()}
+
+
+class FrameKind(IntEnum):
+    """What a frame's payload is"""
+
+    CLIP = 1  # Complete synthesized audio for one language of a final result
+    CHUNK = 2  # Part of a streamed synthesis, in sequence order
+    SYNTHESIZING = 3  # Audio from the recognizer's synthesizing event
+    INPUT = 4  # Microphone audio uploaded by the client (16 kHz 16-bit mono PCM)
+
+
+@dataclass(frozen=True)
+class AudioFrame:
+    """A decoded binary frame"""
+
+    kind: FrameKind
+    payload: bytes
+    session_id: int = 0
+    utterance_id: int = 0
+    sequence: int = 0
+    language: str = ""
+    codec: Optional[str] = None  # Container ('riff', 'raw', 'ogg', 'mp3'), None if not given
+    sample_rate: int = 0
+    final: bool = False
+    error: Optional[str] = None
+
+
+def encode_frame(
+    kind: FrameKind,
+    payload: bytes = b"",
+    session_id: int = 0,
+    utterance_id: int = 0,
+    sequence: int = 0,
+    language: str = "",
+    audio_format: Optional[AudioFormat] = None,
+    final: bool = False,
+    error: Optional[str] = None
+) -> bytes:
+    """
+    Build a binary frame
+
+    Args:
+        kind: Payload kind
+        payload: Audio bytes (ignored when error is set)
+        session_id: Connection the frame belongs to
+        utterance_id: Final result the audio belongs to
+        sequence: Position of a chunk in its language's stream
+        language: Target language code (ASCII, at most 255 characters)
+        audio_format: Format of the payload, encoded as codec and sample rate
+        final: Marks the last frame of a stream
+        error: Error message sent in place of the payload
+
+    Returns:
+        Header followed by the language code and the payload
+
+    Raises:
+        ValueError: If a field does not fit the header
+    """
+    flags = (FLAG_FINAL if final else 0) | (FLAG_ERROR if error else 0)
+    if error:
+        payload = error.encode("utf-8")
+    language_bytes = language.encode("ascii")
+    codec, sample_rate = 0, 0
+    if audio_format is not None:
+        codec, sample_rate = _CODECS.get(audio_format.container, 0), audio_format.sample_rate
+    try:
+        header = _HEADER.pack(
+            FRAME_VERSION, kind, flags, codec, sample_rate, session_id, utterance_id, sequence, len(language_bytes)
+        )
+    except struct.error as e:
+        raise ValueError(f"Cannot encode audio frame: {e}") from e
+    return b"".join((header, language_bytes, payload))
+
+
+def decode_frame(data: bytes) -> AudioFrame:
+    """
+    Parse a binary frame
+
+    Args:
+        data: Frame as received
+
+    Returns:
+        The AudioFrame (payload is a copy of the bytes after the header)
+
+    Raises:
+        ValueError: If the frame is truncated, of another version or an unknown kind
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError(f"Audio frame too short: {len(data)} bytes")
+    version, kind, flags, codec, sample_rate, session_id, utterance_id, sequence, language_length = \
+        _HEADER.unpack_from(data)
+    if version != FRAME_VERSION:
+        raise ValueError(f"Unsupported audio frame version: {version}")
+    try:
+        kind = FrameKind(kind)
+    except ValueError:
+        raise ValueError(f"Unknown audio frame kind: {kind}") from None
+    payload_start = HEADER_SIZE + language_length
+    if len(data) < payload_start:
+        raise ValueError("Audio frame truncated in its language code")
+    payload = bytes(data[payload_start:])
+    error = payload.decode("utf-8", errors="replace") if flags & FLAG_ERROR else None
+    return AudioFrame(
+        kind=kind,
+        payload=b"" if error is not None else payload,
+        session_id=session_id,
+        utterance_id=utterance_id,
+        sequence=sequence,
+        language=bytes(data[HEADER_SIZE:payload_start]).decode("ascii"),
+        codec=_CONTAINERS.get(codec),
+        sample_rate=sample_rate,
+        final=bool(flags & FLAG_FINAL),
+        error=error
+    )
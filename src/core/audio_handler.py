@@ -8,6 +8,8 @@ import sounddevice as sd
 import soundfile as sf
 from datetime import datetime
 
+from .audio_formats import decode_audio, encode_audio, parse_audio_format, sniff_audio_format
+
 logger = logging.getLogger(__name__)
 
 
@@ -147,45 +149,20 @@ class AudioPlayer:
         except Exception as e:
             logger.error(f"Error playing file: {e}")
     
-    def play_bytes(self, audio_bytes: bytes, sample_rate: Optional[int] = None):
+    def play_bytes(self, audio_bytes: bytes, sample_rate: Optional[int] = None, output_format: Optional[str] = None):
         """
         Play audio from bytes
         
         Args:
-            audio_bytes: Audio data as bytes (supports WAV, raw PCM)
-            sample_rate: Sample rate (uses instance default if None)
+            audio_bytes: Audio data as bytes (WAV, raw PCM, Ogg Opus or MP3)
+            sample_rate: Sample rate of raw PCM (uses instance default if None)
+            output_format: Synthesis output format of the audio (sniffed from the header if None)
         """
         if sample_rate is None:
             sample_rate = self.sample_rate
         
         try:
-            # Check if it's a WAV file (has RIFF header)
-            if audio_bytes[:4] == b'RIFF':
-                # It's a WAV file with headers, use wave module to parse
-                import wave
-                import io
-                
-                wav_buffer = io.BytesIO(audio_bytes)
-                with wave.open(wav_buffer, 'rb') as wav_file:
-                    sample_rate = wav_file.getframerate()
-                    n_channels = wav_file.getnchannels()
-                    audio_data = wav_file.readframes(wav_file.getnframes())
-                    
-                    # Convert to numpy array
-                    if wav_file.getsampwidth() == 2:  # 16-bit
-                        audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-                    elif wav_file.getsampwidth() == 1:  # 8-bit
-                        audio_array = np.frombuffer(audio_data, dtype=np.uint8).astype(np.float32) / 128.0 - 1.0
-                    else:
-                        raise ValueError(f"Unsupported sample width: {wav_file.getsampwidth()}")
-                    
-                    # Reshape for multi-channel audio
-                    if n_channels > 1:
-                        audio_array = audio_array.reshape(-1, n_channels)
-            else:
-                # Assume raw 16-bit PCM audio
-                audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
-            
+            audio_array, sample_rate = AudioConverter.decode_bytes(audio_bytes, output_format, sample_rate)
             sd.play(audio_array, sample_rate)
             sd.wait()
             logger.info(f"Played audio: {len(audio_bytes)} bytes at {sample_rate}Hz")
@@ -213,20 +190,60 @@ class AudioConverter:
         logger.info(f"Converted NumPy array to WAV: {output_file}")
     
     @staticmethod
-    def wav_to_numpy(input_file: str) -> tuple[np.ndarray, int]:
+    def wav_to_numpy(input_file: str, dtype: str = 'float64') -> tuple[np.ndarray, int]:
         """
         Load WAV file to NumPy array
         
         Args:
             input_file: Input WAV filename
+            dtype: Sample type ('int16' keeps long recordings at a quarter of the memory)
             
         Returns:
             Tuple of (audio_data, sample_rate)
         """
-        audio_data, sample_rate = sf.read(input_file)
+        audio_data, sample_rate = sf.read(input_file, dtype=dtype)
         logger.info(f"Loaded WAV to NumPy array: {input_file}")
         return audio_data, sample_rate
     
+    @staticmethod
+    def decode_bytes(
+        audio_bytes: bytes,
+        output_format: Optional[str] = None,
+        sample_rate: int = 16000,
+        dtype: str = 'float32'
+    ) -> tuple[np.ndarray, int]:
+        """
+        Decode synthesized audio in any supported output format
+        
+        Args:
+            audio_bytes: WAV, raw 16-bit PCM, Ogg Opus or MP3 bytes
+            output_format: Synthesis output format preset or name (sniffed from the header if None)
+            sample_rate: Sample rate of raw PCM when output_format is None
+            dtype: Sample type ('float32' or 'int16')
+            
+        Returns:
+            Tuple of (audio_data, sample_rate)
+        """
+        if output_format:
+            audio_format = parse_audio_format(output_format)
+        else:
+            audio_format = sniff_audio_format(audio_bytes, sample_rate)
+        return decode_audio(audio_bytes, audio_format, dtype=dtype)
+    
+    @staticmethod
+    def encode_numpy(audio_data: np.ndarray, output_format: str) -> bytes:
+        """
+        Encode 16-bit mono audio in a synthesis output format
+        
+        Args:
+            audio_data: int16 samples at the format's sample rate
+            output_format: Synthesis output format preset or name
+            
+        Returns:
+            Encoded audio bytes
+        """
+        return encode_audio(audio_data, parse_audio_format(output_format))
+    
     @staticmethod
     def bytes_to_numpy(audio_bytes: bytes, dtype=np.int16) -> np.ndarray:
         """
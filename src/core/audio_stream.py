@@ -0,0 +1,121 @@
+"""Feed client-uploaded audio into a Speech SDK push stream"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AudioStreamFeeder:
+    """
+    Bounded, real-time paced writer from client audio chunks into a push stream
+
+    Chunks received over the WebSocket are queued (at most max_queued_chunks)
+    and written to the ``PushAudioInputStream`` by a single writer task. The
+    writer never runs more than max_lead_ms ahead of real time, so the SDK's
+    internal buffer stays small; when the queue is full, feed() waits, which
+    pushes back on the client through the socket.
+    """
+
+    def __init__(
+        self,
+        push_stream: Any,
+        sample_rate: int = 16000,
+        bits_per_sample: int = 16,
+        channels: int = 1,
+        max_queued_chunks: int = 50,
+        max_lead_ms: int = 1000
+    ):
+        """
+        Initialize the feeder
+
+        Args:
+            push_stream: speechsdk.audio.PushAudioInputStream to write into
+            sample_rate: PCM sample rate of the client audio
+            bits_per_sample: PCM sample width of the client audio
+            channels: PCM channel count of the client audio
+            max_queued_chunks: Chunks buffered before feed() applies backpressure
+            max_lead_ms: How far ahead of real time the writer may run
+        """
+        self.push_stream = push_stream
+        self.bytes_per_second = sample_rate * (bits_per_sample // 8) * channels
+        self.max_lead_ms = max_lead_ms
+        self._queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(maxsize=max_queued_chunks)
+        self._closed = False
+        self.bytes_written = 0
+        self.chunks_written = 0
+        self.backpressure_waits = 0
+
+    async def feed(self, chunk: bytes):
+        """
+        Queue an audio chunk, waiting if the buffer is full
+
+        Args:
+            chunk: Raw PCM bytes in the configured format
+
+        Raises:
+            RuntimeError: If the feeder has been closed
+        """
+        if self._closed:
+            raise RuntimeError("Audio stream is closed")
+        if not chunk:
+            return
+        if self._queue.full():
+            self.backpressure_waits += 1
+        await self._queue.put(chunk)
+
+    async def drain(self):
+        """Wait until every queued chunk has been written to the stream"""
+        await self._queue.join()
+
+    def close(self):
+        """Signal end of audio; the writer drains the queue then closes the stream"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # Writer is busy draining; it checks _closed once the queue empties
+            pass
+
+    async def run(self):
+        """Writer loop: pace queued chunks into the push stream until closed"""
+        start = time.monotonic()
+        try:
+            while True:
+                if self._closed and self._queue.empty():
+                    break
+                chunk = await self._queue.get()
+                if chunk is None:
+                    self._queue.task_done()
+                    break
+
+                # Stay at most max_lead_ms ahead of the wall clock
+                audio_seconds = self.bytes_written / self.bytes_per_second
+                lead = audio_seconds - (time.monotonic() - start)
+                excess = lead - self.max_lead_ms / 1000
+                if excess > 0:
+                    await asyncio.sleep(excess)
+
+                self.push_stream.write(chunk)
+                self.bytes_written += len(chunk)
+                self.chunks_written += 1
+                self._queue.task_done()
+        finally:
+            self.push_stream.close()
+            logger.info(
+                f"Closed client audio stream after {self.chunks_written} chunks "
+                f"({self.bytes_written / self.bytes_per_second:.1f}s of audio)"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get feeder counters"""
+        return {
+            "queued_chunks": self._queue.qsize(),
+            "chunks_written": self.chunks_written,
+            "bytes_written": self.bytes_written,
+            "backpressure_waits": self.backpressure_waits
+        }
@@ -0,0 +1,401 @@
+"""Batch translation of recorded audio files"""
+
+import asyncio
+import json
+import logging
+import time
+import wave
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import azure.cognitiveservices.speech as speechsdk
+
+from .async_bridge import wait_for_signals
+from .segmentation import Segment, load_pcm, plan_segments
+
+logger = logging.getLogger(__name__)
+
+TICKS_PER_MS = 10000  # SDK offsets and durations are in 100-nanosecond units
+
+
+@dataclass
+class UtteranceRecord:
+    """One recognized utterance in a transcript"""
+    file: str
+    index: int
+    offset_ms: int
+    duration_ms: int
+    original_text: str
+    detected_language: Optional[str]
+    translations: Dict[str, str]
+
+    def to_json(self) -> str:
+        """Serialize as one JSONL line (without the newline)"""
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+
+@dataclass
+class FileReport:
+    """Outcome of translating one file"""
+    file: str
+    audio_seconds: Optional[float]
+    elapsed_seconds: float = 0.0
+    utterances: int = 0
+    error: Optional[str] = None
+
+    @property
+    def real_time_factor(self) -> Optional[float]:
+        """Processing time divided by audio duration (below 1 is faster than real time)"""
+        if not self.audio_seconds:
+            return None
+        return self.elapsed_seconds / self.audio_seconds
+
+
+@dataclass
+class BatchReport:
+    """Outcome of a batch run"""
+    files: List[FileReport] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def audio_seconds(self) -> float:
+        """Total audio duration of files with a known duration"""
+        return sum(report.audio_seconds or 0.0 for report in self.files)
+
+    @property
+    def real_time_factor(self) -> Optional[float]:
+        """Wall-clock time of the batch divided by total audio duration"""
+        if not self.audio_seconds:
+            return None
+        return self.elapsed_seconds / self.audio_seconds
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """Audio seconds processed per wall-clock second"""
+        if not self.elapsed_seconds:
+            return None
+        return self.audio_seconds / self.elapsed_seconds
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the batch totals as a dict"""
+        return {
+            "files": len(self.files),
+            "failed": sum(1 for report in self.files if report.error),
+            "utterances": sum(report.utterances for report in self.files),
+            "audio_seconds": round(self.audio_seconds, 2),
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "real_time_factor": round(self.real_time_factor, 3) if self.real_time_factor else None,
+            "throughput": round(self.throughput, 2) if self.throughput else None
+        }
+
+
+def wav_duration(path: str) -> Optional[float]:
+    """
+    Read the duration of a WAV file from its header
+
+    Args:
+        path: WAV file path
+
+    Returns:
+        Duration in seconds, or None if the file is not a readable WAV
+    """
+    try:
+        with wave.open(str(path), "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+def find_audio_files(inputs: Iterable[str], pattern: str = "*.wav") -> List[Path]:
+    """
+    Expand files and directories into a sorted list of audio files
+
+    Args:
+        inputs: File or directory paths
+        pattern: Glob applied (recursively) inside directories
+
+    Returns:
+        Audio file paths
+    """
+    files = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.extend(sorted(path.rglob(pattern)))
+        else:
+            files.append(path)
+    return files
+
+
+class BatchTranslator:
+    """
+    Continuous translation of whole recordings with bounded concurrency
+
+    Each file gets its own recognizer and runs continuous recognition to the
+    end of the audio, so every utterance is transcribed (translate_once
+    stops after the first). Recognizers are driven by the asyncio API, so
+    concurrency costs no threads beyond the SDK's own.
+    """
+
+    def __init__(
+        self,
+        translator: Any,
+        max_concurrency: int = 4,
+        auto_detect_languages: Optional[List[str]] = None,
+        file_timeout_s: Optional[float] = None,
+        recognizer_factory: Optional[Callable[[str], Any]] = None,
+        segment_recognizer_factory: Optional[Callable[[bytes, int], Any]] = None
+    ):
+        """
+        Initialize the batch engine
+
+        Args:
+            translator: AzureSpeechTranslator providing configs and result parsing
+            max_concurrency: Files (recognizers) processed at once
+            auto_detect_languages: Candidate source languages, or None for the configured source
+            file_timeout_s: Give up on a file after this many seconds
+            recognizer_factory: Builds a recognizer for a file path (defaults to
+                                translator.create_recognizer_from_file)
+            segment_recognizer_factory: Builds a recognizer for (pcm_bytes, sample_rate)
+                                        of one segment (defaults to a push stream)
+        """
+        self.translator = translator
+        self.max_concurrency = max_concurrency
+        self.auto_detect_languages = auto_detect_languages
+        self.file_timeout_s = file_timeout_s
+        self._recognizer_factory = recognizer_factory or (
+            lambda path: translator.create_recognizer_from_file(path, auto_detect_languages)
+        )
+        self._segment_recognizer_factory = segment_recognizer_factory or self._create_segment_recognizer
+
+    def _create_segment_recognizer(self, pcm: bytes, sample_rate: int) -> Any:
+        """Recognizer over a push stream already holding the whole segment"""
+        push_stream = self.translator.create_push_stream(sample_rate=sample_rate)
+        push_stream.write(pcm)
+        push_stream.close()
+        return self.translator.create_recognizer_from_stream(push_stream, self.auto_detect_languages)
+
+    async def recognize_all(
+        self,
+        recognizer: Any,
+        label: str,
+        offset_ms: int = 0,
+        on_record: Optional[Callable[[UtteranceRecord], None]] = None,
+        timeout: Optional[float] = None
+    ) -> List[UtteranceRecord]:
+        """
+        Run continuous recognition until the recognizer's audio ends
+
+        Args:
+            recognizer: Recognizer over a finite audio source
+            label: Value for UtteranceRecord.file
+            offset_ms: Added to every utterance offset (for segments of a longer recording)
+            on_record: Called on the event loop for each utterance as it is recognized
+            timeout: Seconds to wait for the end of the audio
+
+        Returns:
+            Utterances in recognition order
+
+        Raises:
+            RuntimeError: If recognition is canceled with an error
+            asyncio.TimeoutError: If the audio does not finish within timeout
+        """
+        loop = asyncio.get_running_loop()
+        records: List[UtteranceRecord] = []
+
+        def deliver(record: UtteranceRecord):
+            record.index = len(records)
+            records.append(record)
+            if on_record:
+                on_record(record)
+
+        def on_recognized(evt):
+            result = evt.result
+            if result.reason not in (speechsdk.ResultReason.TranslatedSpeech, speechsdk.ResultReason.RecognizedSpeech):
+                return
+            final = self.translator._process_result(result)
+            if not final.original_text:
+                return
+            record = UtteranceRecord(
+                file=label,
+                index=0,
+                offset_ms=offset_ms + int(result.offset / TICKS_PER_MS),
+                duration_ms=final.duration_ms,
+                original_text=final.original_text,
+                detected_language=final.detected_language,
+                translations=final.translations
+            )
+            # Same queue as the end-of-audio future, so every record lands first
+            loop.call_soon_threadsafe(deliver, record)
+
+        def on_canceled(evt):
+            details = evt.cancellation_details
+            if details.reason == speechsdk.CancellationReason.EndOfStream:
+                return None
+            return f"{details.reason}: {details.error_details}"
+
+        recognizer.recognized.connect(on_recognized)
+        try:
+            error = await wait_for_signals(
+                [
+                    (recognizer.session_stopped, lambda evt: None),
+                    (recognizer.canceled, on_canceled)
+                ],
+                trigger=recognizer.start_continuous_recognition_async,
+                timeout=timeout
+            )
+        finally:
+            # Completion is signalled by events; the returned future is not awaited
+            recognizer.stop_continuous_recognition_async()
+
+        if error:
+            raise RuntimeError(f"Recognition canceled: {error}")
+        return records
+
+    async def translate_file(
+        self,
+        path: str,
+        on_record: Optional[Callable[[UtteranceRecord], None]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> FileReport:
+        """
+        Translate one recording
+
+        Args:
+            path: Audio file path
+            on_record: Called for each utterance as it is recognized
+            semaphore: Concurrency limit shared with other files
+
+        Returns:
+            FileReport (errors are recorded, not raised)
+        """
+        report = FileReport(file=str(path), audio_seconds=wav_duration(path))
+        async with semaphore or asyncio.Semaphore(1):
+            start = time.perf_counter()
+            try:
+                recognizer = self._recognizer_factory(str(path))
+                records = await self.recognize_all(recognizer, str(path), on_record=on_record, timeout=self.file_timeout_s)
+                report.utterances = len(records)
+            except asyncio.TimeoutError:
+                report.error = f"Timed out after {self.file_timeout_s}s"
+            except Exception as e:
+                report.error = str(e)
+            report.elapsed_seconds = time.perf_counter() - start
+
+        if report.error:
+            logger.error(f"Failed to translate {path}: {report.error}")
+        else:
+            rtf = report.real_time_factor
+            logger.info(
+                f"Translated {path}: {report.utterances} utterances in {report.elapsed_seconds:.1f}s"
+                + (f" (RTF {rtf:.2f})" if rtf is not None else "")
+            )
+        return report
+
+    async def translate_files(
+        self,
+        paths: Iterable[str],
+        on_record: Optional[Callable[[UtteranceRecord], None]] = None
+    ) -> BatchReport:
+        """
+        Translate many recordings, at most max_concurrency at a time
+
+        Args:
+            paths: Audio file paths
+            on_record: Called for each utterance as it is recognized
+
+        Returns:
+            BatchReport with per-file reports in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        start = time.perf_counter()
+        reports = await asyncio.gather(*(
+            self.translate_file(path, on_record, semaphore) for path in paths
+        ))
+        return BatchReport(files=list(reports), elapsed_seconds=time.perf_counter() - start)
+
+    async def translate_segmented(
+        self,
+        path: str,
+        on_record: Optional[Callable[[UtteranceRecord], None]] = None,
+        samples: Optional[Any] = None,
+        sample_rate: Optional[int] = None,
+        target_segment_s: float = 30.0,
+        max_segment_s: float = 60.0,
+        min_silence_ms: int = 500
+    ) -> FileReport:
+        """
+        Translate one long recording split at silences across parallel recognizers
+
+        The recording is cut into segments of about target_segment_s at
+        silences, up to max_concurrency segments are recognized at once, and
+        the results are stitched back in recording order with offsets relative
+        to the start of the file. on_record receives records in that order as
+        soon as every earlier segment has finished.
+
+        Args:
+            path: Audio file path (also the record label)
+            on_record: Called for each utterance, in recording order
+            samples: Mono int16 PCM already in memory (loaded from path if None)
+            sample_rate: Sample rate of samples
+            target_segment_s: Preferred segment length
+            max_segment_s: Hard upper bound on segment length
+            min_silence_ms: Shortest silence used as a cut point
+
+        Returns:
+            FileReport for the whole recording (failed segments are listed in error)
+        """
+        start = time.perf_counter()
+        if samples is None:
+            samples, sample_rate = await asyncio.get_running_loop().run_in_executor(None, load_pcm, str(path))
+        report = FileReport(file=str(path), audio_seconds=len(samples) / sample_rate)
+        segments = plan_segments(
+            samples, sample_rate,
+            target_segment_s=target_segment_s,
+            max_segment_s=max_segment_s,
+            min_silence_ms=min_silence_ms
+        )
+
+        results: Dict[int, Optional[List[UtteranceRecord]]] = {}
+        released = 0
+        emitted = 0
+        failures: Dict[int, str] = {}
+
+        def release_ready():
+            nonlocal released, emitted
+            while released in results:
+                for record in results.pop(released) or []:
+                    record.index = emitted
+                    emitted += 1
+                    if on_record:
+                        on_record(record)
+                released += 1
+
+        async def run_segment(number: int, segment: Segment, semaphore: asyncio.Semaphore):
+            async with semaphore:
+                try:
+                    pcm = samples[segment.start:segment.end].tobytes()
+                    recognizer = self._segment_recognizer_factory(pcm, sample_rate)
+                    results[number] = await self.recognize_all(
+                        recognizer, str(path), offset_ms=segment.offset_ms, timeout=self.file_timeout_s
+                    )
+                except asyncio.TimeoutError:
+                    failures[number] = f"segment {number} at {segment.offset_ms}ms: timed out"
+                    results[number] = None
+                except Exception as e:
+                    failures[number] = f"segment {number} at {segment.offset_ms}ms: {e}"
+                    results[number] = None
+            release_ready()
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(*(run_segment(n, segment, semaphore) for n, segment in enumerate(segments)))
+
+        report.utterances = emitted
+        report.error = "; ".join(failures[n] for n in sorted(failures)) or None
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            f"Translated {path} in {len(segments)} segments: {emitted} utterances in "
+            f"{report.elapsed_seconds:.1f}s (RTF {report.real_time_factor or 0:.2f})"
+        )
+        return report
@@ -1,6 +1,6 @@
 """Configuration management for the application"""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -42,6 +42,52 @@ class Settings(BaseSettings):
     voice_ja_jp: Optional[str] = None
     voice_ko_kr: Optional[str] = None
     
+    # Synthesis settings
+    synthesis_output_format: str = "Riff16Khz16BitMonoPcm"  # Preset (opus, mp3, pcm-8k, ...) or speechsdk.SpeechSynthesisOutputFormat member
+    synthesizer_pool_size: int = 2  # Idle synthesizers kept per (voice, format)
+    prewarm_synthesizers: bool = True  # Create and connect synthesizers when a session is configured
+    synthesis_max_workers: int = 3  # Concurrent syntheses per translator (one per target language)
+    synthesis_thread_budget: int = 16  # Synthesis threads shared by all translators in the process
+    
+    # Speculative synthesis: start synthesizing interim translations that stopped changing
+    speculative_synthesis: bool = False
+    speculative_stability_events: int = 3  # Consecutive interims a word prefix must survive
+    speculative_min_words: int = 3  # Smallest segment started from a stable prefix
+    speculative_quiet_ms: int = 400  # Pause after which the whole latest interim is synthesized (0 disables)
+    
+    # Synthesis cache (repeated phrases skip the speech service)
+    tts_cache_enabled: bool = True
+    tts_cache_memory_mb: int = 64
+    tts_cache_dir: Optional[str] = None  # Persistent disk tier, disabled when unset
+    tts_cache_disk_mb: Optional[int] = None  # Disk tier budget, unbounded when unset
+    
+    # Recognition callbacks run on a shared pool so Speech SDK event threads never block on synthesis
+    callback_workers: int = 8  # Process-wide callback threads (0 runs callbacks on the SDK event thread)
+    callback_queue_depth: int = 32  # Queued callbacks per session before synthesizing audio is dropped (finals never are)
+    
+    # Interim results: at most one per utterance every N ms, unchanged text dropped (0 disables)
+    interim_coalesce_ms: int = 150
+    
+    # Live Interpreter: narrow auto-detect candidates to the languages detected so far
+    adaptive_language_detection: bool = False
+    adaptive_language_min_observations: int = 3  # Final results before narrowing
+    adaptive_language_max_candidates: int = 4  # Largest narrowed candidate set
+    
+    # Recognizer connections kept open between recording bursts
+    recognizer_keep_warm: bool = True  # Pre-open at config time; stop pauses instead of tearing down
+    recognizer_idle_timeout_s: float = 60.0  # Paused recognizers close their connection after this
+    
+    # Speech engine: "azure" (Speech SDK) or "simulated" (local, no credentials used)
+    speech_engine: str = "azure"
+    simulated_latency_ms: float = 300.0  # End of utterance audio to final result
+    simulated_jitter_ms: float = 50.0  # Uniform +/- jitter on every simulated delay
+    simulated_error_rate: float = 0.0  # Chance an utterance or synthesis is canceled with an error
+    simulated_connect_ms: float = 150.0  # Handshake paid by recognizers/synthesizers without an open connection
+    simulated_synthesis_ms: float = 150.0  # Time to render one synthesis
+    simulated_seed: Optional[int] = 0  # Random seed; unset for nondeterministic runs
+    simulated_language_id_ms: float = 0.0  # Extra final latency per auto-detect candidate beyond the first
+    simulated_revision_rate: float = 0.0  # Chance a word is misheard in interims until the utterance's last one
+    
     # Application settings
     log_level: str = "INFO"
     audio_buffer_ms: int = 100
@@ -51,6 +97,11 @@ class Settings(BaseSettings):
     backend_host: str = "0.0.0.0"
     backend_port: int = 8000
     cors_origins: str = "http://localhost:5173,http://localhost:3000"
+    websocket_binary_frames: bool = True  # Send audio as binary frames to clients offering the binary subprotocol
+    room_max_listeners: int = 1000  # Listener connections per broadcast room
+    websocket_compression: bool = False  # permessage-deflate; costs CPU per connection and audio barely compresses
+    outbound_queue_max_messages: int = 256  # Messages waiting per connection before a slow client is disconnected
+    outbound_queue_max_mb: float = 16.0  # Megabytes waiting per connection before a slow client is disconnected
     
     # Streamlit
     streamlit_server_port: int = 8501
@@ -101,6 +152,53 @@ class Settings(BaseSettings):
         
         # Use helper function from module
         return get_voice_for_language(language_code, None)
+    
+    def for_session(
+        self,
+        source_language: Optional[str] = None,
+        target_languages: Optional[List[str]] = None,
+        voices: Optional[Dict[str, str]] = None
+    ) -> "SessionSettings":
+        """
+        Derive the settings of one client session, leaving these unchanged
+        
+        Args:
+            source_language: Spoken language (keeps the current one if None)
+            target_languages: Target languages, at most three are used (keeps
+                              the current ones if None or empty)
+            voices: Voice per language code, taking precedence over voice_* settings
+            
+        Returns:
+            Frozen SessionSettings
+        """
+        values = self.model_dump()
+        if source_language:
+            values["source_language"] = source_language
+        languages = [lang for lang in target_languages or [] if lang][:3]
+        if languages:
+            values["target_language"] = languages[0]
+            values["target_language_2"] = languages[1] if len(languages) > 1 else None
+            values["target_language_3"] = languages[2] if len(languages) > 2 else None
+        values["voice_overrides"] = {**values.get("voice_overrides", {}), **(voices or {})}
+        # Validate the loaded values; the environment and .env are not read again
+        return SessionSettings.model_validate(values)
+
+
+class SessionSettings(Settings):
+    """
+    Settings of one client session, derived with Settings.for_session()
+    
+    Frozen: sessions sharing a process each carry their own languages and
+    voices, and none of them can change another's or the base settings.
+    """
+    
+    model_config = SettingsConfigDict(frozen=True)
+    
+    voice_overrides: Dict[str, str] = {}  # Language code -> voice chosen by the client
+    
+    def get_voice_for_language(self, language_code: str) -> str:
+        """Get the client's voice for a language, falling back to the configured one"""
+        return self.voice_overrides.get(language_code) or super().get_voice_for_language(language_code)
 
 
 def get_settings() -> Settings:
@@ -0,0 +1,335 @@
+"""Process-wide bounded worker pools shared fairly between sessions"""
+
+import asyncio
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a session already has the maximum number of pending tasks"""
+
+
+class _Lane:
+    """Pending tasks and in-flight count for one key"""
+    __slots__ = ("pending", "running", "max_running", "scheduled", "idle_waiters")
+
+    def __init__(self, max_running: int):
+        self.pending: "deque[Tuple[Callable, tuple, Future, float]]" = deque()
+        self.running = 0
+        self.max_running = max_running
+        self.scheduled = False  # Whether the key is in the ready queue
+        self.idle_waiters: list = []
+
+
+class FairExecutor:
+    """
+    Bounded thread pool that schedules work round-robin across keys
+
+    Every task is submitted under a key (a recognizer, a translator, ...).
+    Each key runs at most max_running tasks at once, in submission order,
+    and keys with pending work take turns for free workers, so one busy
+    session cannot starve the others. At most max_workers threads exist no
+    matter how many keys are active; they are started on demand. With
+    max_pending_per_key set, submissions beyond that many queued tasks for
+    one key raise QueueFullError instead of growing the queue.
+
+    A key's bookkeeping is dropped as soon as it has nothing queued or
+    running, so short-lived sessions leave nothing behind.
+    """
+
+    def __init__(self, max_workers: int, max_pending_per_key: Optional[int] = None, name: str = "worker"):
+        """
+        Initialize the executor (no threads are started until work arrives)
+
+        Args:
+            max_workers: Upper bound on worker threads
+            max_pending_per_key: Queued (not yet running) tasks allowed per key (None for no limit)
+            name: Thread name prefix
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending_per_key = max_pending_per_key
+        self.name = name
+        self._lock = threading.Lock()
+        self._work_available = threading.Condition(self._lock)
+        self._lanes: Dict[Hashable, _Lane] = {}
+        self._ready: "deque[Hashable]" = deque()
+        self._threads: list = []
+        self._idle_workers = 0
+        self._busy = 0
+        self._local = threading.local()
+        self._shutdown = False
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.discarded = 0
+        self.max_queue_depth = 0
+        self._wait_ms: "deque[float]" = deque(maxlen=1000)
+
+    def submit(self, key: Hashable, fn: Callable, *args: Any, max_running: int = 1, bounded: bool = True) -> Future:
+        """
+        Queue fn(*args) under key
+
+        Args:
+            key: Session the task belongs to
+            fn: Callable to run on a worker thread
+            *args: Arguments for fn
+            max_running: Tasks of this key allowed to run at once (taken from
+                         the first submission while the key has work)
+            bounded: Subject to max_pending_per_key; False queues tasks that
+                     must not be lost however deep the queue is
+
+        Returns:
+            Future for fn's result
+
+        Raises:
+            QueueFullError: If the key already has max_pending_per_key queued tasks
+            RuntimeError: If the executor has been shut down
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError(f"{self.name} executor has been shut down")
+            lane = self._lanes.get(key)
+            if lane is None:
+                lane = self._lanes[key] = _Lane(max(1, max_running))
+            if bounded and self.max_pending_per_key is not None and len(lane.pending) >= self.max_pending_per_key:
+                self.rejected += 1
+                self._forget_if_idle(key, lane)
+                raise QueueFullError(f"{len(lane.pending)} {self.name} tasks already queued for this session")
+            lane.pending.append((fn, args, future, time.perf_counter()))
+            self.submitted += 1
+            self.max_queue_depth = max(self.max_queue_depth, len(lane.pending))
+            self._schedule(key, lane)
+        return future
+
+    def _schedule(self, key: Hashable, lane: _Lane):
+        """Put key in the ready queue if it has runnable work, starting a worker if none will take it (lock held)"""
+        if lane.pending and lane.running < lane.max_running and not lane.scheduled:
+            lane.scheduled = True
+            self._ready.append(key)
+            self._work_available.notify()
+            # A notified worker counts as idle until it wakes, and takes one ready key
+            if len(self._ready) > self._idle_workers and len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._worker, name=f"{self.name}-{len(self._threads)}", daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+
+    def _forget_if_idle(self, key: Hashable, lane: _Lane):
+        """Drop the key's bookkeeping and wake drain() callers once it has no work (lock held)"""
+        if lane.pending or lane.running:
+            return
+        del self._lanes[key]
+        for waiter in lane.idle_waiters:
+            if not waiter.done():  # drain_async() cancels its waiter on timeout
+                waiter.set_result(True)
+
+    def _worker(self):
+        """Run tasks, taking keys round-robin from the ready queue"""
+        while True:
+            with self._lock:
+                while not self._ready and not self._shutdown:
+                    self._idle_workers += 1
+                    self._work_available.wait()
+                    self._idle_workers -= 1
+                if not self._ready:
+                    return
+                key = self._ready.popleft()
+                lane = self._lanes[key]
+                lane.scheduled = False
+                fn, args, future, queued_at = lane.pending.popleft()
+                lane.running += 1
+                self._busy += 1
+                # Other tasks of this key may run alongside, up to max_running
+                self._schedule(key, lane)
+            self._wait_ms.append((time.perf_counter() - queued_at) * 1000)
+
+            ok = True
+            if future.set_running_or_notify_cancel():
+                self._local.key = key
+                try:
+                    future.set_result(fn(*args))
+                except Exception as e:
+                    ok = False
+                    logger.error(f"{self.name} task failed: {e}", exc_info=True)
+                    future.set_exception(e)
+                finally:
+                    self._local.key = None
+
+            with self._lock:
+                lane.running -= 1
+                self._busy -= 1
+                if ok:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+                self._schedule(key, lane)
+                self._forget_if_idle(key, lane)
+
+    def _idle_future(self, key: Hashable) -> Optional[Future]:
+        """Future resolved once key has no work, or None if it already has none"""
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is None:
+                return None
+            future: Future = Future()
+            lane.idle_waiters.append(future)
+            return future
+
+    def _in_task_of(self, key: Hashable) -> bool:
+        """Whether the calling thread is running one of key's tasks (which drain() would wait on)"""
+        return getattr(self._local, "key", None) == key
+
+    def drain(self, key: Hashable, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every task queued for key has run
+
+        Args:
+            key: Session to wait for
+            timeout: Seconds to wait (None for no limit)
+
+        Returns:
+            True if the key has no work left; False on timeout or when called
+            from one of key's own tasks
+        """
+        if self._in_task_of(key):
+            return False
+        future = self._idle_future(key)
+        if future is None:
+            return True
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return False
+
+    async def drain_async(self, key: Hashable, timeout: Optional[float] = None) -> bool:
+        """Await drain(key) without blocking the event loop"""
+        if self._in_task_of(key):
+            return False
+        future = self._idle_future(key)
+        if future is None:
+            return True
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+    def discard(self, key: Hashable) -> int:
+        """
+        Cancel key's queued tasks (running tasks finish normally)
+
+        Returns:
+            Number of tasks canceled
+        """
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is None:
+                return 0
+            canceled = 0
+            while lane.pending:
+                _, _, future, _ = lane.pending.popleft()
+                canceled += future.cancel()
+            if lane.scheduled:
+                lane.scheduled = False
+                self._ready.remove(key)
+            self.discarded += canceled
+            self._forget_if_idle(key, lane)
+            return canceled
+
+    def pending(self, key: Hashable) -> int:
+        """Queued plus running tasks for key"""
+        with self._lock:
+            lane = self._lanes.get(key)
+            return len(lane.pending) + lane.running if lane is not None else 0
+
+    def shutdown(self, wait: bool = True):
+        """Stop the workers once the queued tasks have run"""
+        with self._lock:
+            self._shutdown = True
+            self._work_available.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get thread, queue and latency metrics"""
+        with self._lock:
+            queued = sum(len(lane.pending) for lane in self._lanes.values())
+            waits = sorted(self._wait_ms)
+            return {
+                "workers": len(self._threads),
+                "max_workers": self.max_workers,
+                "busy": self._busy,
+                "sessions": len(self._lanes),
+                "queued": queued,
+                "max_queue_depth": self.max_queue_depth,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "discarded": self.discarded,
+                "mean_wait_ms": statistics.mean(waits) if waits else None,
+                "p95_wait_ms": waits[int(len(waits) * 0.95)] if waits else None,
+                "max_wait_ms": waits[-1] if waits else None
+            }
+
+
+_shared_executors: Dict[Tuple[str, int, Optional[int]], FairExecutor] = {}
+_shared_executors_lock = threading.Lock()
+
+
+def _shared_executor(name: str, max_workers: int, max_pending_per_key: Optional[int]) -> FairExecutor:
+    key = (name, max(1, max_workers), max_pending_per_key)
+    with _shared_executors_lock:
+        executor = _shared_executors.get(key)
+        if executor is None:
+            executor = FairExecutor(max_workers, max_pending_per_key=max_pending_per_key, name=name)
+            _shared_executors[key] = executor
+        return executor
+
+
+def get_callback_executor(settings: Settings) -> Optional[FairExecutor]:
+    """
+    Get the process-wide executor that runs recognition callbacks
+
+    Callbacks hand results to downstream work (synthesis, sockets) that may
+    block on the network; running them here keeps Speech SDK event threads
+    free. Tasks are keyed by recognizer and run one at a time per key, so a
+    session's callbacks keep their event order.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Shared FairExecutor, or None if callbacks run on the SDK event thread
+    """
+    if settings.callback_workers <= 0:
+        return None
+    return _shared_executor("callback", settings.callback_workers, max(1, settings.callback_queue_depth))
+
+
+def get_synthesis_executor(settings: Settings) -> FairExecutor:
+    """
+    Get the process-wide executor for synthesis requests
+
+    Each translator keys its tasks by itself.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Shared FairExecutor
+    """
+    return _shared_executor("synthesis", settings.synthesis_thread_budget, None)
@@ -0,0 +1,135 @@
+"""Coalescing of interim (recognizing) results before they reach callbacks"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class InterimCoalescer:
+    """
+    Latest-wins rate limiter for interim results
+
+    Emits at most one interim per interval_ms within an utterance, drops
+    updates whose text and translations match the last one sent, and holds
+    back superseded updates. A held update is sent when the interval
+    elapses (even if no further events arrive) or, at the latest, by
+    flush_final() just before the utterance's final result.
+
+    All emits happen under one lock and flush_final() cancels the pending
+    timer, so no interim is delivered after the final that follows it.
+    """
+
+    def __init__(self, emit: Callable[[Any], None], interval_ms: int = 150):
+        """
+        Initialize the coalescer
+
+        Args:
+            emit: Downstream interim callback
+            interval_ms: Minimum spacing between emitted interims
+        """
+        self._emit = emit
+        self.interval_s = interval_ms / 1000
+        self._lock = threading.RLock()
+        self._pending: Optional[Any] = None
+        self._timer: Optional[threading.Timer] = None
+        self._timer_generation = 0
+        self._last_key: Optional[tuple] = None
+        self._last_emit = float("-inf")
+        self.received = 0
+        self.emitted = 0
+        self.unchanged = 0
+        self.superseded = 0
+
+    @staticmethod
+    def _key(result: Any) -> tuple:
+        return (result.original_text, result.translations)
+
+    def push(self, result: Any):
+        """
+        Offer an interim result
+
+        Args:
+            result: InterimResult from a recognizing event
+        """
+        with self._lock:
+            self.received += 1
+            key = self._key(result)
+            if key == self._last_key:
+                self.unchanged += 1
+                return
+
+            if time.monotonic() - self._last_emit >= self.interval_s:
+                self._send(result, key)
+                return
+
+            if self._pending is not None:
+                self.superseded += 1
+            self._pending = result
+            if self._timer is None:
+                delay = self._last_emit + self.interval_s - time.monotonic()
+                self._timer_generation += 1
+                self._timer = threading.Timer(max(delay, 0), self._on_timer, args=(self._timer_generation,))
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _send(self, result: Any, key: tuple):
+        """Emit result now (lock held)"""
+        self._pending = None
+        self._last_key = key
+        self._last_emit = time.monotonic()
+        self.emitted += 1
+        self._emit(result)
+
+    def _on_timer(self, generation: int):
+        """Timer callback: send the held update once the interval has passed"""
+        with self._lock:
+            # A timer cancelled while waiting for the lock must not fire
+            if generation != self._timer_generation:
+                return
+            self._timer = None
+            self._flush_pending()
+
+    def _flush_pending(self):
+        """Send the held update unless it matches the last one sent (lock held)"""
+        with self._lock:
+            if self._pending is not None:
+                pending = self._pending
+                key = self._key(pending)
+                if key == self._last_key:
+                    self._pending = None
+                    self.unchanged += 1
+                else:
+                    self._send(pending, key)
+
+    def _cancel_timer(self):
+        self._timer_generation += 1
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def flush_final(self):
+        """Send any held interim, then start the next utterance with a clean slate"""
+        with self._lock:
+            self._cancel_timer()
+            self._flush_pending()
+            self._last_key = None
+            self._last_emit = float("-inf")
+
+    def close(self):
+        """Drop any held interim and stop the timer"""
+        with self._lock:
+            self._cancel_timer()
+            self._pending = None
+
+    def stats(self) -> Dict[str, int]:
+        """Get interim counters"""
+        with self._lock:
+            return {
+                "received": self.received,
+                "emitted": self.emitted,
+                "unchanged": self.unchanged,
+                "superseded": self.superseded
+            }
@@ -0,0 +1,147 @@
+"""Adaptive narrowing of auto-detect source language candidates"""
+
+import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Languages the service reports when no candidate matches
+UNKNOWN_LANGUAGES = {"Unknown", "unknown", ""}
+
+
+class LanguageCandidateTracker:
+    """
+    Learns which source languages a session actually uses
+
+    Starts with the full candidate list. Once min_observations final results
+    have been seen, the candidates are narrowed to the languages detected at
+    least min_detections times (most frequent first, at most max_candidates).
+    While narrowed, results with an unknown language or no recognized text
+    count as misses; fallback_misses consecutive misses widen the set back
+    to the full list (the slow path for a new language), after which the
+    session narrows again, now including the new language.
+
+    Every change bumps generation, so holders of a recognizer built for an
+    older candidate set know to rebuild it.
+    """
+
+    def __init__(
+        self,
+        full_candidates: List[str],
+        min_observations: int = 3,
+        min_detections: int = 2,
+        max_candidates: int = 4,
+        fallback_misses: int = 2
+    ):
+        """
+        Initialize the tracker
+
+        Args:
+            full_candidates: Candidate languages before anything is known
+            min_observations: Final results needed before (re-)narrowing
+            min_detections: Detections needed for a language to stay a candidate
+            max_candidates: Upper bound on the narrowed set (at-start language ID accepts 4)
+            fallback_misses: Consecutive misses that widen back to the full set
+        """
+        self.full_candidates = list(full_candidates)
+        self.min_observations = min_observations
+        self.min_detections = min_detections
+        self.max_candidates = max_candidates
+        self.fallback_misses = fallback_misses
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._narrowed: Optional[List[str]] = None
+        self._since_change = 0
+        self._misses = 0
+        self.generation = 0
+        self.narrowings = 0
+        self.widenings = 0
+
+    @property
+    def candidates(self) -> List[str]:
+        """Current candidate languages"""
+        with self._lock:
+            return list(self._narrowed or self.full_candidates)
+
+    @property
+    def narrowed(self) -> bool:
+        """Whether the candidates are currently narrowed"""
+        return self._narrowed is not None
+
+    def set_full_candidates(self, full_candidates: List[str]):
+        """
+        Replace the full candidate list, forgetting what was learned if it changed
+
+        Args:
+            full_candidates: New full candidate list
+        """
+        with self._lock:
+            if list(full_candidates) == self.full_candidates:
+                return
+            self.full_candidates = list(full_candidates)
+            self._counts.clear()
+            self._narrowed = None
+            self._since_change = 0
+            self._misses = 0
+            self.generation += 1
+
+    def observe(self, language: Optional[str], recognized: bool = True):
+        """
+        Record the outcome of one final result
+
+        Args:
+            language: Detected source language (None or "Unknown" if not identified)
+            recognized: Whether the result contained recognized text
+        """
+        with self._lock:
+            identified = language not in UNKNOWN_LANGUAGES and language is not None
+            if not (identified and recognized):
+                self._misses += 1
+                if self._narrowed is not None and self._misses >= self.fallback_misses:
+                    self._widen()
+                return
+
+            self._misses = 0
+            self._counts[language] += 1
+            self._since_change += 1
+            if self._since_change >= self.min_observations:
+                self._renarrow()
+
+    def _widen(self):
+        """Fall back to the full candidate list (lock held)"""
+        logger.info(f"Language detection missed {self._misses} times, widening candidates to {self.full_candidates}")
+        self._narrowed = None
+        self._since_change = 0
+        self._misses = 0
+        self.widenings += 1
+        self.generation += 1
+
+    def _renarrow(self):
+        """Narrow to the languages detected so far, if that changes the set (lock held)"""
+        detected = [
+            lang for lang, count in self._counts.most_common()
+            if count >= self.min_detections and lang in self.full_candidates
+        ][:self.max_candidates]
+        if not detected or len(detected) >= len(self.full_candidates):
+            return
+        if detected == self._narrowed:
+            return
+        logger.info(f"Narrowing language candidates from {len(self.full_candidates)} to {detected}")
+        self._narrowed = detected
+        self._since_change = 0
+        self.narrowings += 1
+        self.generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the detected language counts and narrowing counters"""
+        with self._lock:
+            return {
+                "candidates": list(self._narrowed or self.full_candidates),
+                "narrowed": self._narrowed is not None,
+                "detections": dict(self._counts),
+                "narrowings": self.narrowings,
+                "widenings": self.widenings,
+                "generation": self.generation
+            }
@@ -0,0 +1,146 @@
+"""Outbound WebSocket message encoding: fast JSON, optional MessagePack, serialize once"""
+
+import base64
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Union
+
+from src.core.audio_frames import BINARY_SUBPROTOCOL
+
+try:
+    import orjson
+except ImportError:  # Optional: the standard library encoder is used instead
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional: the MessagePack subprotocol is not offered without it
+    msgpack = None
+
+MSGPACK_SUBPROTOCOL = "live-interpreter.msgpack.v1"
+
+
+class EncodedMessage:
+    """A message serialized once, ready to send to any socket using the same codec"""
+    __slots__ = ("data", "type")
+
+    def __init__(self, data: Union[str, bytes], message_type: Optional[str] = None):
+        self.data = data  # str for text WebSocket messages, bytes for binary ones
+        self.type = message_type
+
+    @property
+    def binary(self) -> bool:
+        return isinstance(self.data, bytes)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+class MessageCodec(ABC):
+    """Serializes backend messages for one wire format"""
+
+    name = "json"
+    binary = False  # Sent as binary WebSocket messages
+    raw_audio = False  # Audio bytes may be embedded as is instead of base64
+    frames = False  # Audio goes in binary frames (src/core/audio_frames.py) outside messages
+
+    @abstractmethod
+    def encode(self, message: Dict[str, Any]) -> EncodedMessage:
+        """Serialize a message, keeping its type for the outbound drop policy"""
+
+    @abstractmethod
+    def decode(self, data: Union[str, bytes]) -> Dict[str, Any]:
+        """Parse a message received from a client"""
+
+    def audio(self, audio_bytes: bytes) -> Union[str, bytes]:
+        """Audio as a message field: raw bytes where the format allows, base64 otherwise"""
+        return audio_bytes if self.raw_audio else base64.b64encode(audio_bytes).decode("ascii")
+
+
+class JsonCodec(MessageCodec):
+    """
+    Compact JSON text, with orjson when it is installed
+
+    Output matches Starlette's send_json (no spaces, non-ASCII kept as
+    UTF-8). Without orjson one stdlib encoder instance is reused.
+    """
+
+    name = "json"
+
+    def __init__(self, fast: bool = True):
+        """
+        Initialize the codec
+
+        Args:
+            fast: Use orjson if it is installed
+        """
+        self.fast = fast and orjson is not None
+        self._encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+        if self.fast:
+            self.name = "orjson"
+
+    def encode(self, message: Dict[str, Any]) -> EncodedMessage:
+        if self.fast:
+            data = orjson.dumps(message).decode("utf-8")
+        else:
+            data = self._encoder.encode(message)
+        return EncodedMessage(data, message.get("type"))
+
+    def decode(self, data: Union[str, bytes]) -> Dict[str, Any]:
+        return orjson.loads(data) if self.fast else json.loads(data)
+
+
+class FramedJsonCodec(JsonCodec):
+    """JSON for control and text messages, binary frames for audio"""
+
+    frames = True
+
+
+class MsgpackCodec(MessageCodec):
+    """MessagePack binary messages; audio travels as raw bytes"""
+
+    name = "msgpack"
+    binary = True
+    raw_audio = True
+
+    def __init__(self):
+        if msgpack is None:
+            raise RuntimeError("MessagePack encoding needs the msgpack package")
+
+    def encode(self, message: Dict[str, Any]) -> EncodedMessage:
+        return EncodedMessage(msgpack.packb(message, use_bin_type=True), message.get("type"))
+
+    def decode(self, data: Union[str, bytes]) -> Dict[str, Any]:
+        return msgpack.unpackb(data, raw=False)
+
+
+def msgpack_available() -> bool:
+    """Whether the MessagePack subprotocol can be offered"""
+    return msgpack is not None
+
+
+_json_codec = JsonCodec()
+_framed_codec = FramedJsonCodec()
+_msgpack_codec: Optional[MsgpackCodec] = None
+
+
+def get_codec(subprotocol: Optional[str] = None) -> MessageCodec:
+    """
+    Get the shared codec for a negotiated subprotocol
+
+    Args:
+        subprotocol: Accepted WebSocket subprotocol (None or any other
+                     subprotocol means JSON)
+
+    Returns:
+        MsgpackCodec for the MessagePack subprotocol, FramedJsonCodec for
+        binary frames, the JSON codec otherwise
+    """
+    global _msgpack_codec
+    if subprotocol == BINARY_SUBPROTOCOL:
+        return _framed_codec
+    if subprotocol == MSGPACK_SUBPROTOCOL and msgpack is not None:
+        if _msgpack_codec is None:
+            _msgpack_codec = MsgpackCodec()
+        return _msgpack_codec
+    return _json_codec
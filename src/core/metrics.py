@@ -0,0 +1,169 @@
+"""Per-utterance latency histograms and Prometheus text exposition"""
+
+import bisect
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "live_interpreter"
+
+# Upper bounds in seconds; covers sub-10ms processing up to multi-second synthesis
+DEFAULT_BUCKETS_S: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Stages recorded between pipeline marks (time.perf_counter() seconds):
+#   recognition  speech_end -> recognized     service latency after the speaker stops
+#   translation  recognized -> translated     result parsing on the SDK event thread
+#   queue        translated -> synthesis start  callback pool and handler wait
+#   synthesis    synthesis start -> end       per target language (cache hits included)
+#   first_chunk  synthesis start -> first streamed chunk
+#   send         enqueued -> sent             event loop and socket write
+#   end_to_end   speech_end -> sent           what the listener waits, per target language
+STAGES = ("recognition", "translation", "queue", "synthesis", "first_chunk", "send", "end_to_end")
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram (not thread-safe; LatencyMetrics holds the lock)"""
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS_S):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value_s: float):
+        self.counts[bisect.bisect_left(self.bounds, value_s)] += 1
+        self.sum += value_s
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th observation (None when empty)"""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class LatencyMetrics:
+    """
+    Latency histograms keyed by (stage, language)
+
+    Recording is a bisect and three increments under one lock, cheap enough
+    to leave on for every utterance. Callers take time.perf_counter() marks
+    on the hot path and hand pairs of them to observe_interval().
+    """
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS_S):
+        """
+        Initialize empty histograms
+
+        Args:
+            bounds: Bucket upper bounds in seconds
+        """
+        self.bounds = bounds
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, language: Optional[str], value_s: float):
+        """
+        Record one latency
+
+        Args:
+            stage: Pipeline stage (see STAGES)
+            language: Language the stage ran for ("all" when not language specific)
+            value_s: Latency in seconds (negative values are clamped to 0)
+        """
+        key = (stage, language or "all")
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram(self.bounds)
+            histogram.observe(max(value_s, 0.0))
+
+    def observe_interval(self, stage: str, language: Optional[str], start: Optional[float], end: Optional[float]):
+        """Record end - start if both marks were taken"""
+        if start is not None and end is not None:
+            self.observe(stage, language, end - start)
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+        """Get count, mean and approximate p50/p95 (ms) per stage and language"""
+        with self._lock:
+            summary: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+            for (stage, language), histogram in sorted(self._histograms.items()):
+                p50, p95 = histogram.quantile(0.5), histogram.quantile(0.95)
+                summary.setdefault(stage, {})[language] = {
+                    "count": histogram.count,
+                    "mean_ms": histogram.sum / histogram.count * 1000 if histogram.count else None,
+                    "p50_ms": p50 * 1000 if p50 is not None else None,
+                    "p95_ms": p95 * 1000 if p95 is not None else None
+                }
+            return summary
+
+    def reset(self):
+        """Drop every histogram"""
+        with self._lock:
+            self._histograms.clear()
+
+    def render_prometheus(self) -> str:
+        """Render the histograms in the Prometheus text exposition format"""
+        name = f"{METRIC_PREFIX}_stage_latency_seconds"
+        lines = [
+            f"# HELP {name} Per-utterance pipeline stage latency",
+            f"# TYPE {name} histogram"
+        ]
+        with self._lock:
+            for (stage, language), histogram in sorted(self._histograms.items()):
+                labels = f'stage="{stage}",language="{_escape(language)}"'
+                cumulative = 0
+                for bound, count in zip(histogram.bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def render_metric(
+    name: str,
+    metric_type: str,
+    help_text: str,
+    samples: Iterable[Tuple[Dict[str, str], float]]
+) -> str:
+    """
+    Render one gauge or counter family in the Prometheus text format
+
+    Args:
+        name: Metric name without the prefix
+        metric_type: 'gauge' or 'counter'
+        help_text: HELP line
+        samples: (labels, value) pairs
+
+    Returns:
+        Exposition text ending in a newline
+    """
+    full_name = f"{METRIC_PREFIX}_{name}"
+    lines: List[str] = [f"# HELP {full_name} {help_text}", f"# TYPE {full_name} {metric_type}"]
+    for labels, value in samples:
+        label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+        lines.append(f"{full_name}{{{label_text}}} {value:g}" if label_text else f"{full_name} {value:g}")
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_metrics = LatencyMetrics()
+
+
+def get_latency_metrics() -> LatencyMetrics:
+    """The process-wide latency histograms"""
+    return _metrics
@@ -0,0 +1,232 @@
+"""Bounded per-connection outbound queues drained by a single writer task"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Iterable, Optional, Tuple, Union
+
+from src.core.message_codec import EncodedMessage
+
+logger = logging.getLogger(__name__)
+
+# A message or audio frame ready to send
+Outbound = Union[EncodedMessage, bytes]
+
+# Message types superseded by the next one of the same type: a queued interim
+# the client has not seen yet is stale once a newer interim arrives
+DROPPABLE_TYPES = frozenset({"recognizing"})
+
+SLOW_CONSUMER_CLOSE_CODE = 1013  # "Try again later"
+
+
+def is_droppable(item: Outbound) -> bool:
+    """Whether an item may be dropped under backpressure (interims; never finals or audio)"""
+    return isinstance(item, EncodedMessage) and item.type in DROPPABLE_TYPES
+
+
+def item_size(item: Outbound) -> int:
+    """Approximate bytes an item holds while queued"""
+    return len(item.data) if isinstance(item, EncodedMessage) else len(item)
+
+
+class OutboundStats:
+    """Process-wide outbound queue counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.dropped_stale = 0  # Interims replaced by a newer one before being sent
+        self.dropped_full = 0  # Interims refused because the queue was full
+        self.slow_disconnects = 0  # Connections closed for falling too far behind
+
+    def count(self, **increments: int):
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "sent": self.sent,
+                "dropped_stale": self.dropped_stale,
+                "dropped_full": self.dropped_full,
+                "slow_disconnects": self.slow_disconnects
+            }
+
+
+_stats = OutboundStats()
+
+
+def get_outbound_stats() -> OutboundStats:
+    """The process-wide outbound queue counters"""
+    return _stats
+
+
+class OutboundQueue:
+    """
+    Messages waiting to be written to one connection
+
+    Producers enqueue without waiting; one writer task sends items in order,
+    so a slow client never holds up the others or the code producing results.
+    Memory is bounded: a queued interim is replaced by the next one, interims
+    are refused while the queue is full, and a client whose finals and audio
+    overflow the queue is disconnected instead of buffering without limit.
+
+    Must be used from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Outbound], Awaitable[None]],
+        on_overflow: Callable[[], None],
+        max_messages: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+        stats: Optional[OutboundStats] = None
+    ):
+        """
+        Start the writer task
+
+        Args:
+            send: Writes one item to the connection
+            on_overflow: Called once when the client falls too far behind
+                         (the queue is already closed; it should close the connection)
+            max_messages: Items waiting before the queue is full
+            max_bytes: Bytes waiting before the queue is full
+            stats: Counters to update (the process-wide ones by default)
+        """
+        self._send = send
+        self._on_overflow = on_overflow
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self._stats = stats or _stats
+        self._items: Deque[Tuple[Outbound, Optional[Callable[[], None]]]] = deque()
+        self._interims = 0  # Droppable items in _items
+        self.queued_bytes = 0
+        self.peak_depth = 0
+        self.closed = False
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer = asyncio.create_task(self._write())
+
+    @property
+    def depth(self) -> int:
+        """Items waiting to be sent"""
+        return len(self._items)
+
+    @property
+    def full(self) -> bool:
+        """No room for another interim"""
+        return len(self._items) >= self.max_messages or self.queued_bytes >= self.max_bytes
+
+    def _over_limit(self) -> bool:
+        return len(self._items) > self.max_messages or self.queued_bytes > self.max_bytes
+
+    def put(self, item: Outbound, on_sent: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Queue an item for the writer
+
+        Args:
+            item: Encoded message or audio frame
+            on_sent: Called after the item is written
+
+        Returns:
+            False if the item was dropped or the connection is being closed
+        """
+        if self.closed:
+            return False
+        droppable = is_droppable(item)
+        if droppable:
+            # Only the newest interim is worth sending
+            if self._interims:
+                self._stats.count(dropped_stale=self._drop_interims())
+            if self.full:
+                self._stats.count(dropped_full=1)
+                return False
+        self._items.append((item, on_sent))
+        self.queued_bytes += item_size(item)
+        self._interims += droppable
+        if self._over_limit() and self._interims:
+            # Interims make way for finals and audio
+            self._stats.count(dropped_stale=self._drop_interims())
+        if self._over_limit() and len(self._items) > 1:
+            # One oversized message on an empty queue is sent; a backlog is not kept
+            logger.warning(
+                f"Client too slow: {len(self._items)} messages, {self.queued_bytes} bytes queued; disconnecting"
+            )
+            self._stats.count(slow_disconnects=1)
+            self.close()
+            self._on_overflow()
+            return False
+        self.peak_depth = max(self.peak_depth, len(self._items))
+        self._idle.clear()
+        self._ready.set()
+        return True
+
+    def put_all(self, items: Iterable[Outbound], on_sent: Optional[Callable[[], None]] = None) -> bool:
+        """Queue several items; on_sent is called after the last one is written"""
+        items = list(items)
+        for i, item in enumerate(items):
+            if not self.put(item, on_sent if i == len(items) - 1 else None) and not is_droppable(item):
+                return False
+        return True
+
+    def _drop_interims(self) -> int:
+        """Remove queued interims, returning how many were dropped"""
+        kept = deque()
+        dropped = 0
+        for entry in self._items:
+            if is_droppable(entry[0]):
+                self.queued_bytes -= item_size(entry[0])
+                dropped += 1
+            else:
+                kept.append(entry)
+        self._items = kept
+        self._interims = 0
+        return dropped
+
+    async def _write(self):
+        while True:
+            if not self._items:
+                self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            item, on_sent = self._items.popleft()
+            self.queued_bytes -= item_size(item)
+            self._interims -= is_droppable(item)
+            try:
+                await self._send(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The connection is gone; nothing more can be written to it
+                logger.info(f"Outbound writer stopped: {e}")
+                self.close()
+                return
+            self._stats.count(sent=1)
+            if on_sent is not None:
+                on_sent()
+
+    async def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued has been written; False on timeout"""
+        if self.closed:
+            return False
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def close(self):
+        """Stop the writer and discard anything still queued"""
+        if self.closed:
+            return
+        self.closed = True
+        self._items.clear()
+        self._interims = 0
+        self.queued_bytes = 0
+        self._idle.set()
+        if self._writer is not asyncio.current_task():
+            self._writer.cancel()
@@ -0,0 +1,162 @@
+"""Broadcast rooms: one presenter's translation session fanned out to many listeners"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RoomError(RuntimeError):
+    """Raised when a room cannot be presented to or joined"""
+
+
+class Room:
+    """
+    A presenter and the listeners of its translations
+
+    The presenter's connection owns the recognizer; every utterance is
+    recognized, translated and synthesized once for the room and sent to all
+    listeners. Listeners are kept in a tuple replaced on every change, so
+    recognition callbacks on worker threads can take a consistent snapshot
+    without locking.
+    """
+
+    def __init__(self, room_id: str):
+        self.room_id = room_id
+        self.presenter: Optional[Hashable] = None
+        self.listeners: Tuple[Hashable, ...] = ()
+        self.config: Optional[Dict[str, Any]] = None  # Presenter's confirmed config, sent to joining listeners
+        self.on_audience_change: Optional[Callable[[], None]] = None  # Set by the presenter
+        self.created_at = time.time()
+        self.utterances = 0
+        self.peak_listeners = 0
+
+    @property
+    def empty(self) -> bool:
+        """No presenter and no listeners"""
+        return self.presenter is None and not self.listeners
+
+    def audience(self, presenter: Hashable) -> Tuple[Hashable, ...]:
+        """The presenter followed by a snapshot of the listeners"""
+        return (presenter,) + self.listeners
+
+    def audience_changed(self):
+        """Tell the presenter that listeners joined, left or changed their subscriptions"""
+        callback = self.on_audience_change
+        if callback is not None:
+            callback()
+
+    def stats(self) -> Dict[str, Any]:
+        """Presenter state and listener counts"""
+        return {
+            "presenter": self.presenter is not None,
+            "listeners": len(self.listeners),
+            "peak_listeners": self.peak_listeners,
+            "utterances": self.utterances,
+            "age_s": round(time.time() - self.created_at, 1)
+        }
+
+
+class RoomRegistry:
+    """
+    Rooms by id, created on first use and dropped when empty
+
+    A room has at most one presenter; listeners may join before it arrives
+    and stay when it leaves, waiting for the next one.
+    """
+
+    def __init__(self):
+        self._rooms: Dict[str, Room] = {}
+        self._lock = threading.Lock()
+
+    def get(self, room_id: str) -> Optional[Room]:
+        """The room with this id, if it exists"""
+        return self._rooms.get(room_id)
+
+    def _room(self, room_id: str) -> Room:
+        room = self._rooms.get(room_id)
+        if room is None:
+            room = self._rooms[room_id] = Room(room_id)
+            logger.info(f"Room {room_id!r} created")
+        return room
+
+    def _drop_if_empty(self, room: Room):
+        if room.empty and self._rooms.get(room.room_id) is room:
+            del self._rooms[room.room_id]
+            logger.info(f"Room {room.room_id!r} closed")
+
+    def present(self, room_id: str, presenter: Hashable) -> Room:
+        """
+        Make a connection the room's presenter
+
+        Args:
+            room_id: Room to present to (created if needed)
+            presenter: Presenting connection
+
+        Returns:
+            The room
+
+        Raises:
+            RoomError: If another connection is presenting
+        """
+        if not room_id:
+            raise RoomError("Room id must not be empty")
+        with self._lock:
+            room = self._room(room_id)
+            if room.presenter is not None and room.presenter is not presenter:
+                raise RoomError(f"Room {room_id!r} already has a presenter")
+            room.presenter = presenter
+            return room
+
+    def release(self, room: Room, presenter: Hashable):
+        """Give up presenting; the listeners stay for the next presenter"""
+        with self._lock:
+            if room.presenter is presenter:
+                room.presenter = None
+                room.config = None
+                room.on_audience_change = None
+            self._drop_if_empty(room)
+
+    def join(self, room_id: str, listener: Hashable, max_listeners: int) -> Room:
+        """
+        Add a listener to a room
+
+        Args:
+            room_id: Room to listen to (created if needed)
+            listener: Listening connection
+            max_listeners: Listener limit for the room
+
+        Returns:
+            The room
+
+        Raises:
+            RoomError: If the room is full
+        """
+        if not room_id:
+            raise RoomError("Room id must not be empty")
+        with self._lock:
+            room = self._room(room_id)
+            if len(room.listeners) >= max_listeners:
+                self._drop_if_empty(room)
+                raise RoomError(f"Room {room_id!r} is full ({max_listeners} listeners)")
+            if listener not in room.listeners:
+                room.listeners = room.listeners + (listener,)
+                room.peak_listeners = max(room.peak_listeners, len(room.listeners))
+            return room
+
+    def leave(self, room: Room, listener: Hashable):
+        """Remove a listener from a room"""
+        with self._lock:
+            room.listeners = tuple(other for other in room.listeners if other is not listener)
+            self._drop_if_empty(room)
+
+    def stats(self) -> Dict[str, Any]:
+        """Room and listener totals with per-room details"""
+        rooms = dict(self._rooms)
+        return {
+            "rooms": len(rooms),
+            "listeners": sum(len(room.listeners) for room in rooms.values()),
+            "by_room": {room_id: room.stats() for room_id, room in rooms.items()}
+        }
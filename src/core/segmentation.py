@@ -0,0 +1,182 @@
+"""Silence-based segmentation of long recordings"""
+
+import logging
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Segment:
+    """A span of a recording, in samples"""
+    start: int
+    end: int
+    sample_rate: int
+
+    @property
+    def offset_ms(self) -> int:
+        """Start of the segment within the recording"""
+        return int(self.start * 1000 / self.sample_rate)
+
+    @property
+    def duration_s(self) -> float:
+        """Length of the segment"""
+        return (self.end - self.start) / self.sample_rate
+
+
+def to_mono_int16(samples: np.ndarray) -> np.ndarray:
+    """
+    Convert loaded audio to mono 16-bit PCM
+
+    Args:
+        samples: (frames,) or (frames, channels) array, int16 or float in [-1, 1]
+
+    Returns:
+        1-D int16 array
+    """
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1)
+    if samples.dtype == np.int16:
+        return samples
+    if np.issubdtype(samples.dtype, np.floating):
+        return (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+    return samples.astype(np.int16)
+
+
+def frame_levels_db(
+    samples: np.ndarray,
+    sample_rate: int,
+    frame_ms: int = 20,
+    block_frames: int = 3000
+) -> np.ndarray:
+    """
+    RMS level of each frame in dBFS
+
+    Frames are processed in blocks so a multi-hour recording never needs a
+    full-length float copy.
+
+    Args:
+        samples: 1-D int16 PCM
+        sample_rate: Sample rate in Hz
+        frame_ms: Analysis frame length
+        block_frames: Frames converted to float per block
+
+    Returns:
+        Array of per-frame levels (a trailing partial frame is ignored)
+    """
+    frame_len = max(1, sample_rate * frame_ms // 1000)
+    n_frames = len(samples) // frame_len
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+    levels = np.empty(n_frames, dtype=np.float32)
+    for start in range(0, n_frames, block_frames):
+        block = frames[start:start + block_frames].astype(np.float32) / 32768.0
+        rms = np.sqrt(np.mean(block * block, axis=1))
+        levels[start:start + block_frames] = 20 * np.log10(rms + 1e-10)
+    return levels
+
+
+def find_silence_cuts(
+    levels_db: np.ndarray,
+    threshold_db: float = -40.0,
+    min_silence_frames: int = 25
+) -> np.ndarray:
+    """
+    Frame indices at the middle of each long-enough silence
+
+    Args:
+        levels_db: Per-frame levels from frame_levels_db
+        threshold_db: Frames below this level are silent
+        min_silence_frames: Shortest silence that may be cut
+
+    Returns:
+        Sorted array of frame indices
+    """
+    silent = np.concatenate(([0], (levels_db < threshold_db).astype(np.int8), [0]))
+    edges = np.diff(silent)
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    long_runs = (run_ends - run_starts) >= min_silence_frames
+    return (run_starts[long_runs] + run_ends[long_runs]) // 2
+
+
+def plan_segments(
+    samples: np.ndarray,
+    sample_rate: int,
+    target_segment_s: float = 30.0,
+    max_segment_s: float = 60.0,
+    min_silence_ms: int = 500,
+    threshold_db: float = -40.0,
+    frame_ms: int = 20
+) -> List[Segment]:
+    """
+    Split a recording at silences into segments of about target_segment_s
+
+    A segment ends at the first silence after it reaches target_segment_s.
+    If speech runs past max_segment_s without a long enough silence, it is
+    cut at max_segment_s. Segments with no frame above threshold_db are
+    dropped, since they can't contain speech.
+
+    Args:
+        samples: 1-D int16 PCM
+        sample_rate: Sample rate in Hz
+        target_segment_s: Preferred segment length
+        max_segment_s: Hard upper bound on segment length
+        min_silence_ms: Shortest silence used as a cut point
+        threshold_db: Silence threshold in dBFS
+        frame_ms: Analysis frame length
+
+    Returns:
+        Segments in recording order
+    """
+    frame_len = max(1, sample_rate * frame_ms // 1000)
+    levels = frame_levels_db(samples, sample_rate, frame_ms)
+    cuts = find_silence_cuts(levels, threshold_db, max(1, min_silence_ms // frame_ms)) * frame_len
+
+    target = int(target_segment_s * sample_rate)
+    limit = int(max_segment_s * sample_rate)
+    total = len(samples)
+
+    boundaries = [0]
+    for cut in cuts:
+        while cut - boundaries[-1] > limit:
+            boundaries.append(boundaries[-1] + limit)
+        if cut - boundaries[-1] >= target:
+            boundaries.append(int(cut))
+    while total - boundaries[-1] > limit:
+        boundaries.append(boundaries[-1] + limit)
+    boundaries.append(total)
+
+    voiced = levels >= threshold_db
+    segments = []
+    for start, end in zip(boundaries, boundaries[1:]):
+        if end <= start:
+            continue
+        if not voiced[start // frame_len:max(start // frame_len + 1, end // frame_len)].any():
+            continue
+        segments.append(Segment(start, end, sample_rate))
+
+    logger.info(
+        f"Planned {len(segments)} segments over {total / sample_rate:.0f}s "
+        f"({len(cuts)} silences of {min_silence_ms}ms+)"
+    )
+    return segments
+
+
+def load_pcm(path: str) -> Tuple[np.ndarray, int]:
+    """
+    Load a recording as mono 16-bit PCM
+
+    Args:
+        path: WAV file path
+
+    Returns:
+        Tuple of (samples, sample_rate)
+    """
+    # audio_handler imports sounddevice, which needs PortAudio; only file loading needs it
+    from .audio_handler import AudioConverter
+
+    samples, sample_rate = AudioConverter.wav_to_numpy(path, dtype='int16')
+    return to_mono_int16(samples), sample_rate
@@ -0,0 +1,262 @@
+"""Translation sessions that own a recognizer and release it deterministically"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from .audio_stream import AudioStreamFeeder
+from .warm_recognizer import KeepWarmRecognizer
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationSession:
+    """
+    One client's translation session and everything attached to it
+
+    The session owns the recognizer (built by recognizer_factory), the
+    keep-warm wrapper with its event handlers and interim coalescer, the
+    push stream and feeder task for client-supplied audio and, when
+    owns_translator is set, the translator with its pooled synthesizers.
+    close()/close_async() (or leaving the ``with``/``async with`` block)
+    stops recognition, disconnects every handler, closes the connection,
+    flushes and closes the audio stream and releases the synthesizers.
+
+    Recording starts and stops with start()/pause(), which keep the
+    recognizer connected between bursts, or end_recording_async(), which
+    releases it; the next start builds a fresh one. A recognizer whose
+    adaptive language candidates went stale is rebuilt on the next start.
+    """
+
+    def __init__(
+        self,
+        translator: Any,
+        recognizer_factory: Callable[[Optional[Any]], Any],
+        stream_input: bool = False,
+        idle_timeout_s: Optional[float] = 60.0,
+        owns_translator: bool = True
+    ):
+        """
+        Initialize the session (no recognizer is built until needed)
+
+        Args:
+            translator: AzureSpeechTranslator used for recognition and synthesis
+            recognizer_factory: Builds a continuous recognizer; called with the
+                                push stream for stream input, None otherwise
+            stream_input: Feed client audio through a push stream (async use only)
+            idle_timeout_s: Seconds a paused recognizer stays connected (None for no limit)
+            owns_translator: Close the translator when the session closes
+        """
+        self.translator = translator
+        self.recognizer_factory = recognizer_factory
+        self.stream_input = stream_input
+        self.idle_timeout_s = idle_timeout_s
+        self.owns_translator = owns_translator
+        self.warm: Optional[KeepWarmRecognizer] = None
+        self.feeder: Optional[AudioStreamFeeder] = None
+        self._feeder_task: Optional[asyncio.Task] = None
+        self._callbacks: Dict[str, Optional[Callable]] = {}
+        self.closed = False
+        self.recognizers_created = 0
+        self.recognizers_released = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether recognition is running"""
+        return self.warm is not None and self.warm.running
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether the recognizer's service connection is open"""
+        return self.warm is not None and self.warm.is_warm
+
+    def _ensure_recognizer(self) -> KeepWarmRecognizer:
+        """Build the recognizer (and push stream) if there is none"""
+        if self.closed:
+            raise RuntimeError("Translation session is closed")
+        if self.warm is None:
+            push_stream = None
+            if self.stream_input:
+                push_stream = self.translator.create_push_stream()
+                self.feeder = AudioStreamFeeder(push_stream)
+                self._feeder_task = asyncio.get_running_loop().create_task(self.feeder.run())
+            recognizer = self.recognizer_factory(push_stream)
+            self.warm = KeepWarmRecognizer(self.translator, recognizer, idle_timeout_s=self.idle_timeout_s)
+            self.recognizers_created += 1
+            if self._callbacks:
+                # A rebuilt recognizer keeps delivering to the session's callbacks
+                self.warm.set_callbacks(**self._callbacks)
+        return self.warm
+
+    def _stale(self) -> bool:
+        return self.warm is not None and self.translator.language_candidates_stale(self.warm.recognizer)
+
+    def prewarm(self) -> bool:
+        """
+        Build the recognizer and open its service connection ahead of the first start
+
+        Returns:
+            True if the connection was opened
+        """
+        return self._ensure_recognizer().prewarm()
+
+    async def prewarm_async(self) -> bool:
+        """
+        Build the recognizer on the event loop, then open its connection in a worker thread
+
+        Returns:
+            True if the connection was opened
+        """
+        warm = self._ensure_recognizer()
+        return await asyncio.get_running_loop().run_in_executor(None, warm.prewarm)
+
+    def set_callbacks(self, **callbacks: Optional[Callable]):
+        """Set the callbacks used from the next start (see KeepWarmRecognizer.set_callbacks)"""
+        self._callbacks = callbacks
+        self._ensure_recognizer().set_callbacks(**callbacks)
+
+    def start(self, **callbacks: Optional[Callable]):
+        """
+        Start or resume continuous translation (blocking)
+
+        Args:
+            **callbacks: Callbacks for this burst, if they change
+        """
+        if self._stale():
+            logger.info("Language candidates changed, rebuilding recognizer")
+            self._release_recognizer()
+        if callbacks:
+            self.set_callbacks(**callbacks)
+        self._ensure_recognizer().start()
+
+    async def start_async(self, timeout: Optional[float] = 10.0, **callbacks: Optional[Callable]):
+        """
+        Start or resume continuous translation and await the session start
+
+        Args:
+            timeout: Seconds to wait for the service session to start
+            **callbacks: Callbacks for this burst, if they change
+        """
+        if self._stale():
+            logger.info("Language candidates changed, rebuilding recognizer")
+            await self._release_recognizer_async()
+        if callbacks:
+            self.set_callbacks(**callbacks)
+        await self._ensure_recognizer().start_async(timeout=timeout)
+
+    def pause(self):
+        """Stop recognition and keep the recognizer connected for the next start (blocking)"""
+        if self.warm is not None:
+            self.warm.pause()
+
+    async def pause_async(self, timeout: Optional[float] = 5.0):
+        """Let queued client audio reach the recognizer, then stop and keep it connected"""
+        if self.feeder is not None:
+            await self.feeder.drain()
+        if self.warm is not None:
+            await self.warm.pause_async(timeout=timeout)
+
+    async def end_recording_async(self):
+        """Flush client audio, stop recognition and release the recognizer"""
+        await self._release_recognizer_async()
+
+    def end_recording(self):
+        """Stop recognition and release the recognizer (blocking; microphone input)"""
+        self._release_recognizer()
+
+    async def feed(self, chunk: bytes):
+        """
+        Queue client audio for the recognizer
+
+        Args:
+            chunk: 16 kHz 16-bit mono PCM
+
+        Raises:
+            RuntimeError: If the session does not take stream input
+        """
+        if not self.stream_input:
+            raise RuntimeError("Translation session does not take stream input")
+        self._ensure_recognizer()
+        await self.feeder.feed(chunk)
+
+    async def _close_feeder(self):
+        """Let buffered audio reach the recognizer, then close the push stream"""
+        if self.feeder is None:
+            return
+        self.feeder.close()
+        await self._feeder_task
+        logger.info(f"Client audio stream stats: {self.feeder.stats()}")
+        self.feeder = None
+        self._feeder_task = None
+
+    def _drop_recognizer(self):
+        """Disconnect the recognizer's handlers and forget it"""
+        self.warm.release()
+        self.warm = None
+        self.recognizers_released += 1
+
+    def _release_recognizer(self):
+        """Stop and release the recognizer (blocking)"""
+        if self.feeder is not None:
+            # Blocking callers cannot await the writer task; end the stream now
+            self._feeder_task.cancel()
+            self.feeder.push_stream.close()
+            self.feeder = None
+            self._feeder_task = None
+        if self.warm is not None:
+            logger.info(f"Recognizer warm-up stats: {self.warm.stats()}")
+            self.warm.close()
+            self._drop_recognizer()
+
+    async def _release_recognizer_async(self):
+        """Flush client audio, stop and release the recognizer"""
+        await self._close_feeder()
+        if self.warm is not None:
+            logger.info(f"Recognizer warm-up stats: {self.warm.stats()}")
+            await self.warm.close_async()
+            self._drop_recognizer()
+
+    def close(self):
+        """Release the recognizer, its handlers and (if owned) the translator (blocking)"""
+        if self.closed:
+            return
+        try:
+            self._release_recognizer()
+        finally:
+            self._close_translator()
+
+    async def close_async(self):
+        """Release the recognizer, its handlers and (if owned) the translator"""
+        if self.closed:
+            return
+        try:
+            await self._release_recognizer_async()
+        finally:
+            self._close_translator()
+
+    def _close_translator(self):
+        self.closed = True
+        self._callbacks = {}
+        if self.owns_translator:
+            self.translator.close()
+
+    def __enter__(self) -> "TranslationSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def __aenter__(self) -> "TranslationSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close_async()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get recognizer lifecycle counters and the current recognizer's warm-up stats"""
+        return {
+            "recognizers_created": self.recognizers_created,
+            "recognizers_released": self.recognizers_released,
+            "running": self.running,
+            "recognizer": self.warm.stats() if self.warm is not None else None
+        }
@@ -0,0 +1,352 @@
+"""Speculative synthesis of interim translations that have stopped changing"""
+
+import logging
+import string
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Stripped before comparing words, so a final that only adds punctuation or
+# capitalization still matches what was speculated
+_PUNCTUATION = string.punctuation + "¿¡«»“”„…。、，！？"
+
+
+def _normalize(word: str) -> str:
+    return word.strip(_PUNCTUATION).casefold()
+
+
+def _common_prefix(history: "Deque[Tuple[str, ...]]") -> int:
+    """Number of leading words shared by every entry in history"""
+    length = min(len(words) for words in history)
+    first = history[0]
+    for i in range(length):
+        if any(words[i] != first[i] for words in history):
+            return i
+    return length
+
+
+class _Segment:
+    """A run of words submitted for synthesis ahead of the final result"""
+    __slots__ = ("start", "end", "words", "text", "future", "started_at", "done_at")
+
+    def __init__(self, start: int, end: int, words: Tuple[str, ...], text: str):
+        self.start = start  # Word index in the translation
+        self.end = end
+        self.words = words  # Normalized words, compared against later interims
+        self.text = text
+        self.future: Optional[Future] = None
+        self.started_at: Optional[float] = None  # When synthesis started (after any queueing)
+        self.done_at: Optional[float] = None
+
+    def run(self, synthesize: Callable[[str, str], bytes], language: str) -> bytes:
+        """Synthesize the segment, recording when rendering started and finished"""
+        self.started_at = time.perf_counter()
+        try:
+            return synthesize(self.text, language)
+        finally:
+            self.done_at = time.perf_counter()
+
+
+class _Utterance:
+    """Recent interims and speculated segments for one target language"""
+    __slots__ = ("history", "words", "normalized", "segments", "covered")
+
+    def __init__(self, stability_events: int):
+        self.history: "Deque[Tuple[str, ...]]" = deque(maxlen=stability_events)
+        self.words: List[str] = []
+        self.normalized: Tuple[str, ...] = ()
+        self.segments: List[_Segment] = []
+        self.covered = 0  # Words already speculated
+
+
+class SpeculativeMatch:
+    """Speculated segments that open a final translation, plus the words still to synthesize"""
+    __slots__ = ("language", "segments", "remainder")
+
+    def __init__(self, language: str, segments: List[_Segment], remainder: str):
+        self.language = language
+        self.segments = segments
+        self.remainder = remainder
+
+    @property
+    def futures(self) -> List[Future]:
+        return [segment.future for segment in self.segments]
+
+
+class SpeculationStats:
+    """Process-wide speculative synthesis counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Zero every counter"""
+        with self._lock:
+            self.segments_started = 0
+            self.segments_used = 0
+            self.segments_wasted = 0
+            self.finals = 0
+            self.finals_speculated = 0  # Finals whose audio was built from speculated segments
+            self.finals_complete = 0  # ... with nothing left to synthesize after the final
+            self.saved_s = 0.0
+            self.waited_s = 0.0
+
+    def count(self, **increments: float):
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get counters plus the two tuning figures
+
+        waste_ratio is wasted / (used + wasted) segments. mean_wait_ms is how
+        long a speculated final still waited for its audio, and
+        mean_saved_ms how much less that is than rendering it from scratch
+        (estimated by its longest segment, so conservative when synthesis
+        time grows with text length).
+        """
+        with self._lock:
+            resolved = self.segments_used + self.segments_wasted
+            return {
+                "segments_started": self.segments_started,
+                "segments_used": self.segments_used,
+                "segments_wasted": self.segments_wasted,
+                "waste_ratio": self.segments_wasted / resolved if resolved else None,
+                "finals": self.finals,
+                "finals_speculated": self.finals_speculated,
+                "finals_complete": self.finals_complete,
+                "hit_ratio": self.finals_speculated / self.finals if self.finals else None,
+                "saved_s_total": self.saved_s,
+                "mean_saved_ms": self.saved_s / self.finals_speculated * 1000 if self.finals_speculated else None,
+                "mean_wait_ms": self.waited_s / self.finals_speculated * 1000 if self.finals_speculated else None
+            }
+
+
+class SpeculativeSynthesizer:
+    """
+    Starts synthesizing interim translations before the final result
+
+    Each recognizing event's translations are compared word by word (case
+    and punctuation ignored) with the previous ones. Once a prefix has
+    survived stability_events consecutive interims and grown by at least
+    min_words past what is already speculated, the new words are submitted
+    for synthesis as a segment. When no interim arrives for quiet_ms the
+    speaker has probably paused, so the whole latest interim is submitted.
+
+    An interim that contradicts a segment cancels it and everything after
+    it. At the final result, the segments that still open the final text
+    are kept for claim(); the caller joins their audio with a synthesis of
+    the remaining words. Everything else is counted as wasted.
+
+    One recognizer at a time: interims and finals are expected in order
+    from the recognizer's event thread.
+    """
+
+    def __init__(
+        self,
+        synthesize: Callable[[str, str], bytes],
+        submit: Callable[..., Future],
+        stability_events: int = 3,
+        min_words: int = 3,
+        quiet_ms: int = 400,
+        max_pending_finals: int = 32,
+        stats: Optional[SpeculationStats] = None
+    ):
+        """
+        Initialize the speculator
+
+        Args:
+            synthesize: Renders (text, language) to audio bytes, raising on failure
+            submit: Runs fn(*args) on a worker and returns its Future
+            stability_events: Consecutive interims a word prefix must survive
+            min_words: Smallest segment started from a stable prefix
+            quiet_ms: Pause after which the whole latest interim is synthesized (0 disables)
+            max_pending_finals: Unclaimed finals kept before the oldest is dropped
+            stats: Counters to update (the process-wide ones by default)
+        """
+        self._synthesize = synthesize
+        self._submit = submit
+        self.stability_events = max(1, stability_events)
+        self.min_words = max(1, min_words)
+        self.quiet_s = quiet_ms / 1000
+        self.max_pending_finals = max_pending_finals
+        self.stats = stats or get_speculation_stats()
+        self._lock = threading.RLock()
+        self._utterances: Dict[str, _Utterance] = {}
+        self._matches: "OrderedDict[Tuple[str, str], SpeculativeMatch]" = OrderedDict()
+        self._timer: Optional[threading.Timer] = None
+        self._timer_generation = 0
+        self._last_interim = 0.0
+
+    def observe(self, translations: Dict[str, str]):
+        """
+        Offer the translations of a recognizing event
+
+        Args:
+            translations: Interim translation per target language
+        """
+        with self._lock:
+            for language, text in translations.items():
+                utterance = self._utterances.get(language)
+                if utterance is None:
+                    utterance = self._utterances[language] = _Utterance(self.stability_events)
+                utterance.words = text.split()
+                utterance.normalized = tuple(_normalize(word) for word in utterance.words)
+                self._invalidate(utterance)
+                utterance.history.append(utterance.normalized)
+                if len(utterance.history) == self.stability_events:
+                    self._speculate(language, utterance, _common_prefix(utterance.history), self.min_words)
+
+            self._last_interim = time.monotonic()
+            if self.quiet_s > 0 and self._timer is None:
+                self._start_timer(self.quiet_s)
+
+    def _invalidate(self, utterance: _Utterance):
+        """Cancel the first segment the latest interim contradicts and every segment after it (lock held)"""
+        for i, segment in enumerate(utterance.segments):
+            if utterance.normalized[segment.start:segment.end] != segment.words:
+                self._waste(utterance.segments[i:])
+                del utterance.segments[i:]
+                utterance.covered = segment.start
+                return
+
+    def _speculate(self, language: str, utterance: _Utterance, stable: int, min_words: int):
+        """Submit words covered..stable if there are at least min_words of them (lock held)"""
+        if stable - utterance.covered < min_words:
+            return
+        text = " ".join(utterance.words[utterance.covered:stable])
+        segment = _Segment(utterance.covered, stable, utterance.normalized[utterance.covered:stable], text)
+        try:
+            segment.future = self._submit(segment.run, self._synthesize, language)
+        except Exception as e:
+            logger.warning(f"Could not start speculative synthesis for {language}: {e}")
+            return
+        utterance.segments.append(segment)
+        utterance.covered = stable
+        self.stats.count(segments_started=1)
+        logger.debug(f"Speculating {language} words {utterance.segments[-1].start}-{stable}: '{text[:50]}'")
+
+    def _start_timer(self, delay: float):
+        """Arm the quiet-period timer (lock held)"""
+        self._timer_generation += 1
+        self._timer = threading.Timer(delay, self._on_quiet, args=(self._timer_generation,))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        self._timer_generation += 1
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_quiet(self, generation: int):
+        """Timer callback: speculate everything once no interim has arrived for quiet_ms"""
+        with self._lock:
+            if generation != self._timer_generation:
+                return
+            # One timer per pause rather than per interim: re-arm for the time left
+            remaining = self._last_interim + self.quiet_s - time.monotonic()
+            if remaining > 0:
+                self._start_timer(remaining)
+                return
+            self._timer = None
+            for language, utterance in self._utterances.items():
+                self._speculate(language, utterance, len(utterance.words), 1)
+
+    def _waste(self, segments: List[_Segment]):
+        for segment in segments:
+            segment.future.cancel()
+        if segments:
+            self.stats.count(segments_wasted=len(segments))
+
+    def finalize(self, translations: Dict[str, str]):
+        """
+        Reconcile speculated segments with a final result and start the next utterance
+
+        Args:
+            translations: Final translation per target language (empty for no match or cancellation)
+        """
+        with self._lock:
+            self._cancel_timer()
+            utterances, self._utterances = self._utterances, {}
+            self.stats.count(finals=sum(1 for text in translations.values() if text))
+            for language, utterance in utterances.items():
+                text = translations.get(language) or ""
+                words = text.split()
+                normalized = tuple(_normalize(word) for word in words)
+                used: List[_Segment] = []
+                for segment in utterance.segments:
+                    if normalized[segment.start:segment.end] != segment.words:
+                        break
+                    used.append(segment)
+                self._waste(utterance.segments[len(used):])
+                if not used:
+                    continue
+                key = (language, text)
+                if key in self._matches:
+                    self._waste(self._matches.pop(key).segments)
+                self._matches[key] = SpeculativeMatch(language, used, " ".join(words[used[-1].end:]))
+                while len(self._matches) > self.max_pending_finals:
+                    _, stale = self._matches.popitem(last=False)
+                    self._waste(stale.segments)
+
+    def claim(self, language: str, text: str) -> Optional[SpeculativeMatch]:
+        """
+        Take the speculated segments for a final translation
+
+        Args:
+            language: Target language code
+            text: Final translated text
+
+        Returns:
+            SpeculativeMatch, or None if nothing usable was speculated
+        """
+        with self._lock:
+            return self._matches.pop((language, text), None)
+
+    def record(self, match: SpeculativeMatch, used: bool, waited_s: float = 0.0):
+        """
+        Count a claimed match once its audio was (or could not be) used
+
+        Args:
+            match: Match returned by claim()
+            used: Whether the segments' audio went into the final audio
+            waited_s: Time from claim() until the joined audio was ready
+        """
+        if not used:
+            self._waste(match.segments)
+            return
+        # The longest segment render stands in for synthesizing the final from scratch
+        render_s = max(segment.done_at - segment.started_at for segment in match.segments)
+        self.stats.count(
+            segments_used=len(match.segments),
+            finals_speculated=1,
+            finals_complete=0 if match.remainder else 1,
+            saved_s=max(0.0, render_s - waited_s),
+            waited_s=waited_s
+        )
+
+    def close(self):
+        """Cancel pending speculation and drop unclaimed segments"""
+        with self._lock:
+            self._cancel_timer()
+            for utterance in self._utterances.values():
+                self._waste(utterance.segments)
+            self._utterances.clear()
+            for match in self._matches.values():
+                self._waste(match.segments)
+            self._matches.clear()
+
+
+_stats = SpeculationStats()
+
+
+def get_speculation_stats() -> SpeculationStats:
+    """The process-wide speculative synthesis counters"""
+    return _stats
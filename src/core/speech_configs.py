@@ -0,0 +1,173 @@
+"""Shared, cached Speech SDK configuration objects"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import azure.cognitiveservices.speech as speechsdk
+
+from .config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class SpeechConfigFactory:
+    """
+    Build-once cache for translation and auto-detect configs
+
+    Recognizers copy their configuration when they are created, so one
+    SpeechTranslationConfig can back every session with the same credentials,
+    source language, target set, voice and Live Interpreter mode. Configs
+    returned here are shared and must not be mutated by callers.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        """
+        Initialize the factory
+
+        Args:
+            max_entries: Configs kept per kind before least recently used are dropped
+        """
+        self.max_entries = max_entries
+        self._translation_configs: "OrderedDict[Tuple, speechsdk.translation.SpeechTranslationConfig]" = OrderedDict()
+        self._auto_detect_configs: "OrderedDict[Tuple[str, ...], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.built = 0
+        self.reused = 0
+
+    @staticmethod
+    def translation_key(
+        settings: Settings,
+        voice_name: Optional[str] = None,
+        live_interpreter: bool = False
+    ) -> Tuple:
+        """
+        Build the cache key for a translation config
+
+        Args:
+            settings: Settings providing credentials and languages
+            voice_name: Voice set on the config (None for no voice)
+            live_interpreter: Whether the config backs a Live Interpreter session
+
+        Returns:
+            Hashable key; target languages are order-insensitive
+        """
+        return (
+            settings.speech_endpoint,
+            settings.speech_region,
+            settings.speech_key,
+            settings.source_language,
+            tuple(sorted(set(settings.target_languages))),
+            voice_name,
+            live_interpreter
+        )
+
+    def _lookup(self, cache: OrderedDict, key: Any, build) -> Any:
+        """Return the cached entry for key, building and storing it on a miss"""
+        with self._lock:
+            config = cache.get(key)
+            if config is not None:
+                cache.move_to_end(key)
+                self.reused += 1
+                return config
+            config = build()
+            cache[key] = config
+            self.built += 1
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
+            return config
+
+    def translation_config(
+        self,
+        settings: Settings,
+        voice_name: Optional[str] = None,
+        live_interpreter: bool = False
+    ) -> speechsdk.translation.SpeechTranslationConfig:
+        """
+        Get a translation config for the given session setup
+
+        Args:
+            settings: Settings providing credentials and languages
+            voice_name: Voice to set on the config
+            live_interpreter: Whether the config backs a Live Interpreter session
+
+        Returns:
+            Shared SpeechTranslationConfig
+        """
+        key = self.translation_key(settings, voice_name, live_interpreter)
+        return self._lookup(
+            self._translation_configs, key,
+            lambda: self._build_translation_config(settings, key[4], voice_name)
+        )
+
+    def auto_detect_config(self, languages: Iterable[str]):
+        """
+        Get an auto-detect source language config for the candidate languages
+
+        Args:
+            languages: Candidate source languages
+
+        Returns:
+            Shared AutoDetectSourceLanguageConfig
+        """
+        key = tuple(languages)
+        return self._lookup(
+            self._auto_detect_configs, key,
+            lambda: speechsdk.languageconfig.AutoDetectSourceLanguageConfig(languages=list(key))
+        )
+
+    @staticmethod
+    def _build_translation_config(
+        settings: Settings,
+        target_languages: Tuple[str, ...],
+        voice_name: Optional[str]
+    ) -> speechsdk.translation.SpeechTranslationConfig:
+        """Create a translation config from settings"""
+        if settings.speech_endpoint:
+            config = speechsdk.translation.SpeechTranslationConfig(
+                endpoint=settings.speech_endpoint,
+                subscription=settings.speech_key
+            )
+        else:
+            config = speechsdk.translation.SpeechTranslationConfig(
+                subscription=settings.speech_key,
+                region=settings.speech_region
+            )
+
+        # Set source language (can be overridden by auto-detect)
+        config.speech_recognition_language = settings.source_language
+
+        for lang in target_languages:
+            config.add_target_language(lang)
+            logger.info(f"Added target language: {lang}")
+
+        if voice_name:
+            config.voice_name = voice_name
+            logger.info(f"Using voice: {voice_name}")
+
+        return config
+
+    def clear(self):
+        """Drop all cached configs"""
+        with self._lock:
+            self._translation_configs.clear()
+            self._auto_detect_configs.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get build/reuse counters"""
+        with self._lock:
+            return {
+                "built": self.built,
+                "reused": self.reused,
+                "translation_configs": len(self._translation_configs),
+                "auto_detect_configs": len(self._auto_detect_configs)
+            }
+
+
+_factory = SpeechConfigFactory()
+
+
+def get_config_factory() -> SpeechConfigFactory:
+    """The process-wide speech config factory"""
+    return _factory
@@ -0,0 +1,868 @@
+"""Speech engines: the Azure Speech SDK and a local simulated service"""
+
+import logging
+import random
+import threading
+import time
+import wave
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol
+
+import numpy as np
+import azure.cognitiveservices.speech as speechsdk
+
+from .audio_formats import encode_audio, parse_audio_format
+from .config import Settings
+from .speech_configs import get_config_factory
+from .synthesis import SynthesisError
+
+logger = logging.getLogger(__name__)
+
+TICKS_PER_SECOND = 10_000_000  # SDK offsets and durations are in 100-nanosecond units
+
+_AUTO_DETECT_LANGUAGE = speechsdk.PropertyId.SpeechServiceConnection_AutoDetectSourceLanguageResult
+
+
+@dataclass(frozen=True)
+class AudioSource:
+    """Where a recognizer reads its audio from"""
+    kind: str  # "microphone", "file" or "stream"
+    path: Optional[str] = None
+    stream: Any = None
+
+    @classmethod
+    def microphone(cls) -> "AudioSource":
+        """The default microphone"""
+        return cls("microphone")
+
+    @classmethod
+    def file(cls, path: str) -> "AudioSource":
+        """A WAV file"""
+        return cls("file", path=path)
+
+    @classmethod
+    def push_stream(cls, stream: Any) -> "AudioSource":
+        """A push stream from SpeechEngine.create_push_stream"""
+        return cls("stream", stream=stream)
+
+
+class SpeechEngine(Protocol):
+    """
+    Speech service backend used by the translators
+
+    Recognizers, synthesizers and connections returned by an engine expose
+    the Speech SDK's event signals, methods and result shapes (ResultReason,
+    CancellationReason, 100-nanosecond offsets), so session control, result
+    parsing and pooling are the same for every engine.
+    """
+
+    name: str
+
+    def create_recognizer(
+        self,
+        translation_config: speechsdk.translation.SpeechTranslationConfig,
+        source: AudioSource,
+        auto_detect_languages: Optional[List[str]] = None,
+        continuous_language_id: bool = False
+    ) -> Any:
+        """Create a translation recognizer for an audio source"""
+        ...
+
+    def create_push_stream(self, sample_rate: int = 16000, bits_per_sample: int = 16, channels: int = 1) -> Any:
+        """Create a stream the caller writes raw PCM into"""
+        ...
+
+    def create_synthesizer(self, voice_name: str, output_format: str) -> Any:
+        """Create a synthesizer for a voice and SpeechSynthesisOutputFormat member name"""
+        ...
+
+    def recognizer_connection(self, recognizer: Any) -> Any:
+        """Get the service connection of a recognizer"""
+        ...
+
+    def synthesizer_connection(self, synthesizer: Any) -> Any:
+        """Get the service connection of a synthesizer"""
+        ...
+
+    def iter_audio(self, result: Any, chunk_size: int) -> Iterator[bytes]:
+        """Read the audio of a started synthesis (start_speaking_text) as it is rendered"""
+        ...
+
+
+class AzureSpeechEngine:
+    """Speech engine backed by the Azure Speech SDK"""
+
+    name = "azure"
+
+    def __init__(self, settings: Settings):
+        """
+        Initialize the engine
+
+        Args:
+            settings: Settings providing Azure credentials
+        """
+        self.settings = settings
+        self.config_factory = get_config_factory()
+
+    def _create_speech_config(self) -> speechsdk.SpeechConfig:
+        """Create a speech config for synthesis from the configured credentials"""
+        if self.settings.speech_endpoint:
+            return speechsdk.SpeechConfig(
+                endpoint=self.settings.speech_endpoint,
+                subscription=self.settings.speech_key
+            )
+        return speechsdk.SpeechConfig(
+            subscription=self.settings.speech_key,
+            region=self.settings.speech_region
+        )
+
+    def create_recognizer(
+        self,
+        translation_config: speechsdk.translation.SpeechTranslationConfig,
+        source: AudioSource,
+        auto_detect_languages: Optional[List[str]] = None,
+        continuous_language_id: bool = False
+    ) -> speechsdk.translation.TranslationRecognizer:
+        """
+        Create a TranslationRecognizer
+
+        Args:
+            translation_config: Shared translation config
+            source: Audio source
+            auto_detect_languages: Candidate source languages, or None for the config's language
+            continuous_language_id: Re-detect the language throughout the session
+
+        Returns:
+            SDK translation recognizer
+        """
+        if source.kind == "microphone":
+            audio_config = speechsdk.audio.AudioConfig(use_default_microphone=True)
+        elif source.kind == "file":
+            audio_config = speechsdk.audio.AudioConfig(filename=source.path)
+        else:
+            audio_config = speechsdk.audio.AudioConfig(stream=source.stream)
+
+        if auto_detect_languages:
+            recognizer = speechsdk.translation.TranslationRecognizer(
+                translation_config=translation_config,
+                audio_config=audio_config,
+                auto_detect_source_language_config=self.config_factory.auto_detect_config(auto_detect_languages)
+            )
+        else:
+            recognizer = speechsdk.translation.TranslationRecognizer(
+                translation_config=translation_config,
+                audio_config=audio_config
+            )
+
+        if continuous_language_id:
+            recognizer.properties.set_property(
+                property_id=speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode,
+                value='Continuous'
+            )
+        return recognizer
+
+    def create_push_stream(
+        self,
+        sample_rate: int = 16000,
+        bits_per_sample: int = 16,
+        channels: int = 1
+    ) -> speechsdk.audio.PushAudioInputStream:
+        """Create an SDK push stream for raw PCM"""
+        stream_format = speechsdk.audio.AudioStreamFormat(
+            samples_per_second=sample_rate,
+            bits_per_sample=bits_per_sample,
+            channels=channels
+        )
+        return speechsdk.audio.PushAudioInputStream(stream_format=stream_format)
+
+    def create_synthesizer(self, voice_name: str, output_format: str) -> speechsdk.SpeechSynthesizer:
+        """Create a synthesizer with null output (audio data is returned directly)"""
+        speech_config = self._create_speech_config()
+        speech_config.speech_synthesis_voice_name = voice_name
+        speech_config.set_speech_synthesis_output_format(
+            getattr(speechsdk.SpeechSynthesisOutputFormat, output_format)
+        )
+        return speechsdk.SpeechSynthesizer(
+            speech_config=speech_config,
+            audio_config=None
+        )
+
+    def recognizer_connection(self, recognizer: Any) -> speechsdk.Connection:
+        """Get the SDK connection of a recognizer"""
+        return speechsdk.Connection.from_recognizer(recognizer)
+
+    def synthesizer_connection(self, synthesizer: Any) -> speechsdk.Connection:
+        """Get the SDK connection of a synthesizer"""
+        return speechsdk.Connection.from_speech_synthesizer(synthesizer)
+
+    def iter_audio(self, result: Any, chunk_size: int) -> Iterator[bytes]:
+        """
+        Read a started synthesis through an AudioDataStream
+
+        Raises:
+            SynthesisError: If the stream ends before all audio was delivered
+        """
+        stream = speechsdk.AudioDataStream(result)
+        buffer = bytes(chunk_size)
+        while True:
+            filled = stream.read_data(buffer)
+            if filled == 0:
+                break
+            yield buffer[:filled]
+
+        if stream.status != speechsdk.StreamStatus.AllData:
+            raise SynthesisError(f"Synthesis stream ended with status {stream.status}")
+
+
+# ---------------------------------------------------------------------------
+# Simulated engine
+# ---------------------------------------------------------------------------
+
+DEFAULT_SCRIPT = [
+    "Good morning everyone and welcome to the council meeting",
+    "The first item on the agenda is the approval of the minutes",
+    "All those in favor please raise your hand",
+    "The motion carries and we move on to public comment",
+    "Thank you for your patience while we set up the microphones"
+]
+
+
+class EventSignal:
+    """Event signal with the SDK's connect/disconnect_all interface"""
+
+    def __init__(self):
+        self._handlers: List[Callable[[Any], None]] = []
+
+    def connect(self, handler: Callable[[Any], None]):
+        self._handlers.append(handler)
+
+    def disconnect_all(self):
+        self._handlers = []
+
+    def signal(self, evt: Any):
+        for handler in list(self._handlers):
+            try:
+                handler(evt)
+            except Exception as e:
+                # The SDK logs and swallows handler errors on its callback thread
+                logger.error(f"Error in simulated event handler: {e}")
+
+
+class _Future:
+    """Result future with the SDK's blocking get()"""
+
+    def __init__(self, getter: Callable[[], Any]):
+        self._getter = getter
+
+    def get(self) -> Any:
+        return self._getter()
+
+
+class CancellationDetails:
+    """Cancellation reason and error text, shaped like the SDK's"""
+
+    def __init__(self, reason: speechsdk.CancellationReason, error_details: str = ""):
+        self.reason = reason
+        self.error_details = error_details
+        self.code = speechsdk.CancellationErrorCode.NoError if not error_details \
+            else speechsdk.CancellationErrorCode.ServiceError
+
+    def __str__(self) -> str:
+        return f"CancellationDetails(reason={self.reason}, error_details=\"{self.error_details}\")"
+
+
+class SimulatedResult:
+    """Recognition or synthesis result, shaped like the SDK's"""
+
+    def __init__(
+        self,
+        reason: speechsdk.ResultReason,
+        text: str = "",
+        translations: Optional[Dict[str, str]] = None,
+        detected_language: Optional[str] = None,
+        offset: int = 0,
+        duration: int = 0,
+        audio: bytes = b"",
+        cancellation_details: Optional[CancellationDetails] = None
+    ):
+        self.reason = reason
+        self.text = text
+        self.translations = translations if translations is not None else {}
+        self.properties = {_AUTO_DETECT_LANGUAGE: detected_language} if detected_language else {}
+        self.offset = offset
+        self.duration = duration
+        self.audio = audio
+        self.audio_data = audio
+        self.cancellation_details = cancellation_details
+        self.first_chunk_delay = 0.0  # Streaming synthesis: seconds before iter_audio yields
+
+
+class SimulatedPushStream:
+    """Push stream that tracks how much audio has been written"""
+
+    def __init__(self, sample_rate: int = 16000, bits_per_sample: int = 16, channels: int = 1):
+        self.bytes_per_second = sample_rate * bits_per_sample // 8 * channels
+        self.bytes_written = 0
+        self.closed = False
+        self._condition = threading.Condition()
+
+    def write(self, audio_buffer: bytes):
+        with self._condition:
+            self.bytes_written += len(audio_buffer)
+            self._condition.notify_all()
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    @property
+    def seconds(self) -> float:
+        return self.bytes_written / self.bytes_per_second
+
+    def wait(self, timeout: float):
+        """Block until more audio arrives, the stream closes or timeout passes"""
+        with self._condition:
+            self._condition.wait(timeout)
+
+
+def synthetic_audio(text: str, output_format: str) -> bytes:
+    """
+    Render a tone whose length follows the text, in a synthesis output format
+
+    Args:
+        text: Text being "spoken" (about 60 ms per character)
+        output_format: Preset or SpeechSynthesisOutputFormat member name
+                       (16-bit PCM, Ogg Opus or MP3)
+
+    Returns:
+        Audio encoded as the format specifies (raw PCM for Raw formats)
+
+    Raises:
+        ValueError: For formats the apps cannot decode
+    """
+    audio_format = parse_audio_format(output_format)
+    sample_rate = audio_format.sample_rate
+    seconds = max(0.2, 0.06 * len(text))
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    return encode_audio((np.sin(2 * np.pi * 220 * t) * 3000).astype("<i2"), audio_format)
+
+
+class _SimulatedClient:
+    """Connection state shared by simulated recognizers and synthesizers"""
+
+    def __init__(self, engine: "SimulatedSpeechEngine", seed: int):
+        self.engine = engine
+        self.rng = random.Random(seed)
+        self._connection_lock = threading.Lock()
+        self._ready_at: Optional[float] = None
+
+    def _delay(self, base_ms: float) -> float:
+        """base_ms plus uniform jitter, in seconds"""
+        jitter = self.engine.jitter_ms
+        return max(0.0, base_ms + self.rng.uniform(-jitter, jitter)) / 1000
+
+    def _failed(self) -> bool:
+        return self.rng.random() < self.engine.error_rate
+
+    def _begin_connect(self) -> float:
+        """Start (or join) a connection handshake and return when it completes"""
+        with self._connection_lock:
+            if self._ready_at is None:
+                self._ready_at = time.monotonic() + self._delay(self.engine.connect_ms)
+            return self._ready_at
+
+    def _await_connection(self, wait: Callable[[float], Any]):
+        """Pay whatever is left of the handshake"""
+        remaining = self._begin_connect() - time.monotonic()
+        if remaining > 0:
+            wait(remaining)
+
+    def _disconnect(self):
+        with self._connection_lock:
+            self._ready_at = None
+
+    @property
+    def connected(self) -> bool:
+        ready_at = self._ready_at
+        return ready_at is not None and time.monotonic() >= ready_at
+
+
+class SimulatedConnection:
+    """Connection with the SDK's open/close and connected/disconnected events"""
+
+    def __init__(self, client: _SimulatedClient):
+        self._client = client
+        self.connected = EventSignal()
+        self.disconnected = EventSignal()
+
+    def open(self, for_continuous_recognition: bool = True):
+        """Start the handshake; connected fires once it completes"""
+        ready_at = self._client._begin_connect()
+        timer = threading.Timer(
+            max(0.0, ready_at - time.monotonic()),
+            lambda: self.connected.signal(SimpleNamespace(session_id=""))
+        )
+        timer.daemon = True
+        timer.start()
+
+    def close(self):
+        self._client._disconnect()
+        self.disconnected.signal(SimpleNamespace(session_id=""))
+
+
+class _PropertyBag(dict):
+    """Recognizer property collection with the SDK's setters and getters"""
+
+    def set_property(self, property_id: Any, value: str):
+        self[property_id] = value
+
+    def get_property(self, property_id: Any, default_value: str = "") -> str:
+        return self.get(property_id, default_value)
+
+
+class SimulatedRecognizer(_SimulatedClient):
+    """
+    Translation recognizer that "hears" the engine's script
+
+    Audio is consumed at the rate the source provides it: in real time for
+    the microphone, as fast as written for push streams and all at once for
+    files. Each utterance covers engine.utterance_s of audio; its words are
+    revealed as recognizing events while that audio arrives, then the final
+    result follows after the engine's latency.
+    """
+
+    def __init__(
+        self,
+        engine: "SimulatedSpeechEngine",
+        translation_config: Any,
+        source: AudioSource,
+        auto_detect_languages: Optional[List[str]],
+        seed: int
+    ):
+        super().__init__(engine, seed)
+        self.source = source
+        self.source_language = translation_config.speech_recognition_language
+        self.target_languages = list(translation_config.target_languages)
+        self.voice_name = translation_config.voice_name or None
+        self.auto_detect_languages = auto_detect_languages
+        self.properties = _PropertyBag()
+        for name in ("recognizing", "recognized", "canceled", "session_started", "session_stopped", "synthesizing"):
+            setattr(self, name, EventSignal())
+
+        self._stop = threading.Event()
+        self._started = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._position = 0.0  # Seconds of source audio consumed
+        self._mic_base = 0.0
+        self._mic_started = 0.0
+        self._utterances = 0
+        self._last_result: Optional[SimulatedResult] = None
+        self._file_seconds = self._read_file_duration() if source.kind == "file" else None
+
+    def _read_file_duration(self) -> Optional[float]:
+        try:
+            with wave.open(str(self.source.path), "rb") as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError, OSError):
+            return None
+
+    # -- audio clock -------------------------------------------------------
+
+    def _wait_for_audio(self, until_s: float) -> str:
+        """Wait until the source has supplied audio up to until_s: 'ready', 'end' or 'stopped'"""
+        while True:
+            if self._stop.is_set():
+                return "stopped"
+            if self.source.kind == "microphone":
+                available = self._mic_base + (time.monotonic() - self._mic_started)
+                if available >= until_s:
+                    return "ready"
+                self._stop.wait(min(until_s - available, 0.05))
+            elif self.source.kind == "file":
+                return "ready" if until_s <= (self._file_seconds or 0.0) else "end"
+            else:
+                stream = self.source.stream
+                if stream.seconds >= until_s:
+                    return "ready"
+                if stream.closed:
+                    return "end"
+                stream.wait(0.05)
+
+    def _available(self) -> float:
+        if self.source.kind == "file":
+            return self._file_seconds or 0.0
+        if self.source.kind == "stream":
+            return self.source.stream.seconds
+        return float("inf")
+
+    # -- session -----------------------------------------------------------
+
+    def _event(self, result: SimulatedResult) -> SimpleNamespace:
+        return SimpleNamespace(
+            result=result,
+            cancellation_details=result.cancellation_details,
+            session_id="simulated"
+        )
+
+    def _cancel(self, reason: speechsdk.CancellationReason, error_details: str = ""):
+        result = SimulatedResult(
+            speechsdk.ResultReason.Canceled,
+            cancellation_details=CancellationDetails(reason, error_details)
+        )
+        self._last_result = result
+        self.canceled.signal(self._event(result))
+
+    def _language(self) -> Optional[str]:
+        """Detected language of the current utterance ("Unknown" if not a candidate)"""
+        spoken = self.engine.script_languages
+        if spoken:
+            language = spoken[self._utterances % len(spoken)]
+            if self.auto_detect_languages and language not in self.auto_detect_languages:
+                return "Unknown"
+            return language
+        if self.auto_detect_languages:
+            return self.auto_detect_languages[0]
+        return None
+
+    def _final_latency_ms(self) -> float:
+        """Final result latency, including language ID over the candidate set"""
+        extra_candidates = max(0, len(self.auto_detect_languages or []) - 1)
+        return self.engine.latency_ms + self.engine.language_id_ms * extra_candidates
+
+    def _emit_utterance(self) -> str:
+        """
+        Recognize the next utterance
+
+        Returns:
+            'ok', 'partial' (final sent, then the audio ended), 'end' (no
+            audio left), 'stopped' or 'error'
+        """
+        script = self.engine.script
+        words = script[self._utterances % len(script)].split()
+        start = self._position
+        length = self.engine.utterance_s
+        language = self._language()
+
+        # Misheard words stay wrong in interims until the last one, like late rescoring
+        misheard = set()
+        if self.engine.revision_rate > 0:
+            misheard = {i for i in range(len(words)) if self.rng.random() < self.engine.revision_rate}
+        revealed = 0
+        for k in range(1, len(words) + 1):
+            outcome = self._wait_for_audio(start + length * k / len(words))
+            if outcome == "stopped":
+                return outcome
+            if outcome == "end":
+                length = max(0.0, self._available() - start)
+                break
+            revealed = k
+            if misheard and k < len(words):
+                text = " ".join(word[::-1] if i in misheard else word for i, word in enumerate(words[:k]))
+            else:
+                text = " ".join(words[:k])
+            self.recognizing.signal(self._event(SimulatedResult(
+                speechsdk.ResultReason.TranslatingSpeech,
+                text=text,
+                translations=self.engine.translate(text, self.target_languages),
+                detected_language=language
+            )))
+        if revealed == 0:
+            return "end"
+
+        if self._failed():
+            self._cancel(speechsdk.CancellationReason.Error, "Simulated service error")
+            return "error"
+        if self._stop.wait(self._delay(self._final_latency_ms())):
+            return "stopped"
+
+        text = " ".join(words[:revealed])
+        result = SimulatedResult(
+            speechsdk.ResultReason.TranslatedSpeech,
+            text=text,
+            translations=self.engine.translate(text, self.target_languages),
+            detected_language=language,
+            offset=int(start * TICKS_PER_SECOND),
+            duration=int(length * TICKS_PER_SECOND)
+        )
+        self._utterances += 1
+        self._position = start + length
+        self._last_result = result
+        self.recognized.signal(self._event(result))
+        if self.voice_name:
+            audio = synthetic_audio(text, "Riff16Khz16BitMonoPcm")
+            self.synthesizing.signal(self._event(SimulatedResult(
+                speechsdk.ResultReason.SynthesizingAudio, audio=audio
+            )))
+        return "ok" if revealed == len(words) else "partial"
+
+    def _run(self, single_shot: bool):
+        self._await_connection(self._stop.wait)
+        if self._stop.is_set():
+            self._started.set()
+            self.session_stopped.signal(SimpleNamespace(session_id="simulated"))
+            return
+        if self.source.kind == "file" and self._file_seconds is None:
+            self._started.set()
+            self._cancel(speechsdk.CancellationReason.Error, f"Unable to read audio file {self.source.path}")
+            self.session_stopped.signal(SimpleNamespace(session_id="simulated"))
+            return
+
+        self._mic_base = self._position
+        self._mic_started = time.monotonic()
+        self.session_started.signal(SimpleNamespace(session_id="simulated"))
+        self._started.set()
+        try:
+            while True:
+                outcome = self._emit_utterance()
+                if outcome != "ok" or single_shot:
+                    break
+            if single_shot and outcome == "end":
+                self._last_result = SimulatedResult(speechsdk.ResultReason.NoMatch)
+                self.recognized.signal(self._event(self._last_result))
+            elif not single_shot and outcome in ("end", "partial"):
+                self._cancel(speechsdk.CancellationReason.EndOfStream)
+        finally:
+            self.session_stopped.signal(SimpleNamespace(session_id="simulated"))
+
+    def _launch(self, single_shot: bool):
+        self._join()
+        self._stop.clear()
+        self._started.clear()
+        self._last_result = None
+        self._thread = threading.Thread(target=self._run, args=(single_shot,), daemon=True, name="simulated-recognizer")
+        self._thread.start()
+
+    def _join(self):
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def start_continuous_recognition_async(self) -> _Future:
+        self._launch(single_shot=False)
+        return _Future(lambda: None)
+
+    def start_continuous_recognition(self):
+        self._launch(single_shot=False)
+        self._started.wait()
+
+    def stop_continuous_recognition_async(self) -> _Future:
+        self._stop.set()
+        return _Future(self._join)
+
+    def stop_continuous_recognition(self):
+        self._stop.set()
+        self._join()
+
+    def recognize_once_async(self) -> _Future:
+        self._launch(single_shot=True)
+
+        def result():
+            self._join()
+            return self._last_result
+        return _Future(result)
+
+    def recognize_once(self) -> SimulatedResult:
+        return self.recognize_once_async().get()
+
+
+class SimulatedSynthesizer(_SimulatedClient):
+    """Speech synthesizer that renders a tone in the requested PCM, Ogg Opus or MP3 format"""
+
+    def __init__(self, engine: "SimulatedSpeechEngine", voice_name: str, output_format: str, seed: int):
+        super().__init__(engine, seed)
+        self.voice_name = voice_name
+        self.output_format = output_format
+        for name in ("synthesis_started", "synthesizing", "synthesis_completed", "synthesis_canceled"):
+            setattr(self, name, EventSignal())
+
+    def _render(self, text: str, wait_for_render: bool = True) -> SimulatedResult:
+        self._await_connection(time.sleep)
+        delay = self._delay(self.engine.synthesis_ms)
+        if self._failed():
+            time.sleep(delay)
+            return SimulatedResult(
+                speechsdk.ResultReason.Canceled,
+                cancellation_details=CancellationDetails(
+                    speechsdk.CancellationReason.Error, "Simulated synthesis error"
+                )
+            )
+        try:
+            audio = synthetic_audio(text, self.output_format)
+        except ValueError as e:
+            return SimulatedResult(
+                speechsdk.ResultReason.Canceled,
+                cancellation_details=CancellationDetails(speechsdk.CancellationReason.Error, str(e))
+            )
+        if wait_for_render:
+            time.sleep(delay)
+            return SimulatedResult(speechsdk.ResultReason.SynthesizingAudioCompleted, audio=audio)
+        result = SimulatedResult(speechsdk.ResultReason.SynthesizingAudioStarted, audio=audio)
+        result.first_chunk_delay = delay / 4  # Streaming delivers the first chunk early
+        return result
+
+    def speak_text(self, text: str) -> SimulatedResult:
+        return self._render(text)
+
+    def speak_text_async(self, text: str) -> _Future:
+        done = threading.Event()
+        holder: Dict[str, SimulatedResult] = {}
+
+        def run():
+            result = self._render(text)
+            holder["result"] = result
+            done.set()
+            signal = self.synthesis_completed if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted \
+                else self.synthesis_canceled
+            signal.signal(SimpleNamespace(result=result))
+
+        threading.Thread(target=run, daemon=True, name="simulated-synthesizer").start()
+
+        def result():
+            done.wait()
+            return holder["result"]
+        return _Future(result)
+
+    def start_speaking_text(self, text: str) -> SimulatedResult:
+        return self._render(text, wait_for_render=False)
+
+    def stop_speaking(self):
+        pass
+
+
+class SimulatedSpeechEngine:
+    """
+    Deterministic local stand-in for the speech service
+
+    Recognizers emit recognizing/recognized/synthesizing events for a fixed
+    script with configurable connection, recognition and synthesis latency,
+    uniform jitter and error rate; synthesizers return a tone encoded in the
+    requested output format (16-bit PCM, Ogg Opus or MP3). Each recognizer and synthesizer draws from its own
+    random generator seeded from seed and its creation order, so a run is
+    reproducible regardless of thread timing. Translations are the source
+    text tagged with the target language.
+    """
+
+    name = "simulated"
+
+    def __init__(
+        self,
+        latency_ms: float = 300.0,
+        jitter_ms: float = 50.0,
+        error_rate: float = 0.0,
+        connect_ms: float = 150.0,
+        synthesis_ms: float = 150.0,
+        utterance_s: float = 2.0,
+        script: Optional[List[str]] = None,
+        seed: Optional[int] = 0,
+        language_id_ms: float = 0.0,
+        script_languages: Optional[List[str]] = None,
+        revision_rate: float = 0.0
+    ):
+        """
+        Initialize the simulated engine
+
+        Args:
+            latency_ms: Delay between the end of an utterance's audio and its final result
+            jitter_ms: Uniform +/- jitter added to every delay
+            error_rate: Probability that an utterance or synthesis is canceled with an error
+            connect_ms: Handshake time paid by clients without an open connection
+            synthesis_ms: Time to render one synthesis
+            utterance_s: Source audio covered by each utterance
+            script: Utterance texts, used in order and repeated
+            seed: Base random seed (None for nondeterministic runs)
+            language_id_ms: Extra final latency per auto-detect candidate beyond the first
+            script_languages: Spoken language of each script line (defaults to the first candidate)
+            revision_rate: Chance each word is misheard in interims and corrected only in the
+                           utterance's last interim and final
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.connect_ms = connect_ms
+        self.synthesis_ms = synthesis_ms
+        self.utterance_s = utterance_s
+        self.script = script or DEFAULT_SCRIPT
+        self.language_id_ms = language_id_ms
+        self.script_languages = script_languages
+        self.revision_rate = revision_rate
+        self._seed = seed if seed is not None else random.randrange(2 ** 32)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SimulatedSpeechEngine":
+        """Create an engine from the simulated_* settings"""
+        return cls(
+            latency_ms=settings.simulated_latency_ms,
+            jitter_ms=settings.simulated_jitter_ms,
+            error_rate=settings.simulated_error_rate,
+            connect_ms=settings.simulated_connect_ms,
+            synthesis_ms=settings.simulated_synthesis_ms,
+            seed=settings.simulated_seed,
+            language_id_ms=settings.simulated_language_id_ms,
+            revision_rate=settings.simulated_revision_rate
+        )
+
+    def _next_seed(self) -> int:
+        with self._lock:
+            self._created += 1
+            return self._seed + self._created
+
+    @staticmethod
+    def translate(text: str, target_languages: List[str]) -> Dict[str, str]:
+        """Deterministic stand-in translations"""
+        return {lang: f"[{lang}] {text}" for lang in target_languages}
+
+    def create_recognizer(
+        self,
+        translation_config: Any,
+        source: AudioSource,
+        auto_detect_languages: Optional[List[str]] = None,
+        continuous_language_id: bool = False
+    ) -> SimulatedRecognizer:
+        """Create a simulated recognizer reading the config's languages and voice"""
+        recognizer = SimulatedRecognizer(self, translation_config, source, auto_detect_languages, self._next_seed())
+        if continuous_language_id:
+            recognizer.properties.set_property(speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode, 'Continuous')
+        return recognizer
+
+    def create_push_stream(self, sample_rate: int = 16000, bits_per_sample: int = 16, channels: int = 1) -> SimulatedPushStream:
+        return SimulatedPushStream(sample_rate, bits_per_sample, channels)
+
+    def create_synthesizer(self, voice_name: str, output_format: str) -> SimulatedSynthesizer:
+        return SimulatedSynthesizer(self, voice_name, output_format, self._next_seed())
+
+    def recognizer_connection(self, recognizer: SimulatedRecognizer) -> SimulatedConnection:
+        return SimulatedConnection(recognizer)
+
+    def synthesizer_connection(self, synthesizer: SimulatedSynthesizer) -> SimulatedConnection:
+        return SimulatedConnection(synthesizer)
+
+    def iter_audio(self, result: SimulatedResult, chunk_size: int) -> Iterator[bytes]:
+        if result.first_chunk_delay:
+            time.sleep(result.first_chunk_delay)
+        for i in range(0, len(result.audio_data), chunk_size):
+            yield result.audio_data[i:i + chunk_size]
+
+
+def create_speech_engine(settings: Settings) -> SpeechEngine:
+    """
+    Create the engine selected by settings.speech_engine
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        AzureSpeechEngine ("azure") or SimulatedSpeechEngine ("simulated")
+
+    Raises:
+        ValueError: For an unknown engine name
+    """
+    if settings.speech_engine == "azure":
+        return AzureSpeechEngine(settings)
+    if settings.speech_engine == "simulated":
+        logger.info("Using the simulated speech engine (no Azure connection)")
+        return SimulatedSpeechEngine.from_settings(settings)
+    raise ValueError(f"Unknown speech engine: {settings.speech_engine}")
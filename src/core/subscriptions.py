@@ -0,0 +1,121 @@
+"""Per-client language subscriptions: which translations and audio a connection receives"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Subscription:
+    """
+    Languages a client receives text and audio for
+
+    Frozen and hashable, so messages are serialized once per codec and
+    subscription however many clients share them.
+    """
+
+    languages: Optional[FrozenSet[str]] = None  # None: every target language
+    audio: bool = True  # False: text only
+
+    def includes(self, language: str) -> bool:
+        """Whether the client gets this language's text"""
+        return self.languages is None or language in self.languages
+
+    def wants_audio(self, language: str) -> bool:
+        """Whether the client plays this language's audio"""
+        return self.audio and self.includes(language)
+
+    def translations(self, translations: Dict[str, T]) -> Dict[str, T]:
+        """The subscribed part of a per-language mapping"""
+        if self.languages is None:
+            return translations
+        return {lang: value for lang, value in translations.items() if lang in self.languages}
+
+    def audio_for(self, audio: Dict[str, T]) -> Dict[str, T]:
+        """The subscribed part of per-language audio"""
+        return self.translations(audio) if self.audio else {}
+
+    @classmethod
+    def from_message(cls, data: Any) -> "Subscription":
+        """
+        Parse a subscribe message's data
+
+        Args:
+            data: {"languages": [...], "audio": bool}; a missing or empty
+                  language list means every language
+
+        Returns:
+            The Subscription
+
+        Raises:
+            ValueError: If the fields have the wrong types
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Subscription must be an object")
+        languages = data.get("languages")
+        if languages is not None and (
+            not isinstance(languages, list) or not all(isinstance(lang, str) for lang in languages)
+        ):
+            raise ValueError("Subscription languages must be a list of language codes")
+        audio = data.get("audio", True)
+        if not isinstance(audio, bool):
+            raise ValueError("Subscription audio must be true or false")
+        return cls(frozenset(languages) if languages else None, audio)
+
+    def describe(self) -> Dict[str, Any]:
+        """JSON-friendly form, as confirmed to the client"""
+        return {
+            "languages": sorted(self.languages) if self.languages is not None else None,
+            "audio": self.audio
+        }
+
+
+ALL_LANGUAGES = Subscription()
+
+
+def audio_languages(subscriptions: Iterable[Subscription]) -> Optional[FrozenSet[str]]:
+    """
+    Languages at least one subscriber plays
+
+    Args:
+        subscriptions: Subscriptions of everyone receiving a session's results
+
+    Returns:
+        The languages to synthesize, or None when someone plays every language
+    """
+    wanted = set()
+    for subscription in set(subscriptions):
+        if not subscription.audio:
+            continue
+        if subscription.languages is None:
+            return None
+        wanted |= subscription.languages
+    return frozenset(wanted)
+
+
+class SynthesisDemand:
+    """Process-wide counts of final translations synthesized and skipped for lack of listeners"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.synthesized = 0
+        self.skipped = 0
+
+    def count(self, synthesized: int, skipped: int):
+        with self._lock:
+            self.synthesized += synthesized
+            self.skipped += skipped
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"synthesized": self.synthesized, "skipped": self.skipped}
+
+
+_demand = SynthesisDemand()
+
+
+def get_synthesis_demand() -> SynthesisDemand:
+    """The process-wide synthesis demand counters"""
+    return _demand
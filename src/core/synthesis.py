@@ -0,0 +1,174 @@
+"""Speech synthesis helpers: synthesizer pooling and per-language outcomes"""
+
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (voice name, output format name)
+SynthesizerKey = Tuple[str, str]
+
+
+class SynthesisError(Exception):
+    """Raised when the speech service does not return synthesized audio"""
+
+
+@dataclass
+class SynthesisOutcome:
+    """Per-language result of a multi-language synthesis request"""
+    language: str
+    audio_data: Optional[bytes] = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True when audio was synthesized"""
+        return self.audio_data is not None
+
+
+class SynthesizerPool:
+    """
+    Pool of reusable speech synthesizers keyed by voice and output format
+
+    Creating a ``SpeechSynthesizer`` costs a config build plus a service
+    handshake before the first audio byte. The pool keeps idle synthesizers
+    (and their open connections) around so later utterances in the same
+    voice skip that setup.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str, str], Any],
+        connect: Optional[Callable[[Any], Any]] = None,
+        max_idle_per_key: int = 2
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            factory: Creates a synthesizer for (voice_name, output_format)
+            connect: Optional hook that pre-opens a synthesizer's connection;
+                     its return value is kept alive alongside the synthesizer
+            max_idle_per_key: Idle synthesizers retained per key (0 disables reuse)
+        """
+        self._factory = factory
+        self._connect = connect
+        self.max_idle_per_key = max_idle_per_key
+        self._idle: Dict[SynthesizerKey, List[Any]] = defaultdict(list)
+        self._connections: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def _create(self, key: SynthesizerKey) -> Any:
+        """Create a new synthesizer for key and pre-open its connection"""
+        voice_name, output_format = key
+        synthesizer = self._factory(voice_name, output_format)
+        if self._connect:
+            try:
+                connection = self._connect(synthesizer)
+                if connection is not None:
+                    with self._lock:
+                        self._connections[id(synthesizer)] = connection
+            except Exception as e:
+                logger.warning(f"Could not pre-connect synthesizer for {voice_name}: {e}")
+        with self._lock:
+            self.created += 1
+        logger.debug(f"Created synthesizer for {voice_name} ({output_format})")
+        return synthesizer
+
+    def acquire(self, voice_name: str, output_format: str) -> Any:
+        """
+        Take an idle synthesizer for the voice/format, creating one if needed
+
+        Args:
+            voice_name: Synthesis voice name
+            output_format: Synthesis output format name
+
+        Returns:
+            Synthesizer owned by the caller until release() or discard()
+        """
+        key = (voice_name, output_format)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.reused += 1
+                return idle.pop()
+        return self._create(key)
+
+    def release(self, voice_name: str, output_format: str, synthesizer: Any):
+        """
+        Return a synthesizer to the pool for reuse
+
+        Args:
+            voice_name: Voice the synthesizer was acquired for
+            output_format: Output format the synthesizer was acquired for
+            synthesizer: Synthesizer previously returned by acquire()
+        """
+        key = (voice_name, output_format)
+        with self._lock:
+            idle = self._idle[key]
+            if len(idle) < self.max_idle_per_key:
+                idle.append(synthesizer)
+                return
+        self.discard(synthesizer)
+
+    def discard(self, synthesizer: Any):
+        """
+        Drop a synthesizer instead of returning it (e.g. after a canceled result)
+
+        Args:
+            synthesizer: Synthesizer previously returned by acquire()
+        """
+        with self._lock:
+            connection = self._connections.pop(id(synthesizer), None)
+            self.discarded += 1
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def warm(self, keys: Iterable[SynthesizerKey]):
+        """
+        Pre-create and pre-connect one synthesizer per key
+
+        Args:
+            keys: (voice_name, output_format) pairs to warm
+        """
+        for voice_name, output_format in dict.fromkeys(keys):
+            key = (voice_name, output_format)
+            with self._lock:
+                if self._idle.get(key) or self.max_idle_per_key <= 0:
+                    continue
+            self.release(voice_name, output_format, self._create(key))
+            logger.info(f"Warmed synthesizer for {voice_name} ({output_format})")
+
+    def idle_count(self, voice_name: Optional[str] = None, output_format: Optional[str] = None) -> int:
+        """Number of idle synthesizers, optionally filtered to one key"""
+        with self._lock:
+            if voice_name is not None and output_format is not None:
+                return len(self._idle.get((voice_name, output_format), []))
+            return sum(len(idle) for idle in self._idle.values())
+
+    def clear(self):
+        """Drop every idle synthesizer and close pre-opened connections"""
+        with self._lock:
+            idle = [synth for synths in self._idle.values() for synth in synths]
+            self._idle.clear()
+        for synthesizer in idle:
+            self.discard(synthesizer)
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool counters"""
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "idle": self.idle_count()
+        }
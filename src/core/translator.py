@@ -1,16 +1,37 @@
 """Azure Speech Translation Service with Live Interpreter support"""
 
+import asyncio
 import logging
-from typing import Callable, Dict, List, Optional
+import time
+import weakref
+from concurrent.futures import Future, as_completed
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 import azure.cognitiveservices.speech as speechsdk
 from pydantic import BaseModel
 from .config import Settings
+from .synthesis import SynthesisError, SynthesisOutcome, SynthesizerPool
+from .tts_cache import get_synthesis_cache
+from .speech_configs import get_config_factory
+from .async_bridge import resolve_future, wait_for_signals
+from .interim import InterimCoalescer
+from .speech_engine import TICKS_PER_SECOND, AudioSource, SpeechEngine, create_speech_engine
+from .language_candidates import LanguageCandidateTracker
+from .audio_formats import AudioFormat, concat_audio, parse_audio_format
+from .executor import QueueFullError, get_callback_executor, get_synthesis_executor
+from .metrics import get_latency_metrics
+from .speculative import SpeculativeSynthesizer
 
 logger = logging.getLogger(__name__)
 
 
+_AUTO_DETECT_LANGUAGE = speechsdk.PropertyId.SpeechServiceConnection_AutoDetectSourceLanguageResult
+
+# Live Interpreter candidates when the caller doesn't name any
+DEFAULT_AUTO_DETECT_LANGUAGES = ["en-US", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR", "zh-CN", "ja-JP", "ko-KR"]
+
+
 class TranslationResult(BaseModel):
     """Translation result data structure"""
     original_text: str
@@ -19,56 +40,298 @@ class TranslationResult(BaseModel):
     timestamp: datetime
     audio_data: Optional[bytes] = None
     duration_ms: int = 0
+    # time.perf_counter() of pipeline events: speech_end, recognized, translated
+    marks: Dict[str, float] = {}
+
+
+class InterimResult:
+    """
+    Interim (recognizing) translation result
+    
+    Recognizing events arrive several times per second, so interims skip
+    pydantic validation and wall-clock timestamps; only final results are
+    TranslationResult models. Attribute names match TranslationResult.
+    """
+    __slots__ = ("original_text", "translations", "detected_language", "received_at")
+    
+    def __init__(
+        self,
+        original_text: str,
+        translations: Dict[str, str],
+        detected_language: Optional[str] = None,
+        received_at: float = 0.0
+    ):
+        self.original_text = original_text
+        self.translations = translations
+        self.detected_language = detected_language
+        self.received_at = received_at  # time.monotonic() when the event was processed
+    
+    def __repr__(self) -> str:
+        return f"InterimResult(original_text={self.original_text!r}, translations={self.translations!r})"
+
 
 @dataclass
 class AzureSpeechTranslator:
     """Azure Speech Translation service with Live Interpreter support"""
     
-    def __init__(self, settings: Settings):
+    live_interpreter_mode = False
+    
+    def __init__(self, settings: Settings, engine: Optional[SpeechEngine] = None):
         """
         Initialize the translator with Azure credentials
         
         Args:
             settings: Application settings containing Azure credentials
+            engine: Speech engine, defaults to the one selected by settings.speech_engine
         """
         self.settings = settings
+        self.engine = engine or create_speech_engine(settings)
         self.translation_config: Optional[speechsdk.translation.SpeechTranslationConfig] = None
-        self.recognizer: Optional[speechsdk.translation.TranslationRecognizer] = None
+        self.recognizer: Optional[Any] = None
+        self.synthesizer_pool = SynthesizerPool(
+            factory=self._create_synthesizer,
+            connect=self._open_synthesizer_connection,
+            max_idle_per_key=settings.synthesizer_pool_size
+        )
+        # Translators are rebuilt for every session, so the worker pools, synthesis cache,
+        # config factory and metrics are process-wide and outlast them. This translator's
+        # synthesis tasks are keyed by _executor_key
+        self.synthesis_executor = get_synthesis_executor(settings)
+        self.callback_executor = get_callback_executor(settings)
+        self._executor_key = object()
+        self.synthesis_cache = get_synthesis_cache(settings)
+        self.audio_format = parse_audio_format(settings.synthesis_output_format)
+        # Pooled synthesizer -> completion callback of the pending async synthesis
+        self._synthesis_waiters: "weakref.WeakKeyDictionary[Any, Optional[Callable]]" = weakref.WeakKeyDictionary()
+        self.config_factory = get_config_factory()
+        self.interim_coalescer: Optional[InterimCoalescer] = None
+        self.language_tracker: Optional[LanguageCandidateTracker] = None
+        # Recognizer -> tracker generation its candidate languages came from
+        self._recognizer_generations: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+        # Recognizer -> handler of the pending async start/stop, called with (event_name, evt)
+        self._session_waiters: "weakref.WeakKeyDictionary[Any, Optional[Callable]]" = weakref.WeakKeyDictionary()
+        # Recognizers whose interims already reach _process_interim, and so the speculator
+        self._interim_feeds: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        # Recognizer -> (perf_counter and wall clock at session start, audio offset at
+        # session start, end of the latest result), offsets in 100 ns ticks
+        self._audio_clocks: "weakref.WeakKeyDictionary[Any, Tuple[float, datetime, int, int]]" = weakref.WeakKeyDictionary()
+        self.latency_metrics = get_latency_metrics()
+        # Languages someone plays audio in; None synthesizes every target language
+        self.synthesis_languages: Optional[FrozenSet[str]] = None
+        self.speculator: Optional[SpeculativeSynthesizer] = None
+        if settings.speculative_synthesis:
+            self.speculator = SpeculativeSynthesizer(
+                self._synthesize,
+                self._submit_synthesis,
+                stability_events=settings.speculative_stability_events,
+                min_words=settings.speculative_min_words,
+                quiet_ms=settings.speculative_quiet_ms
+            )
         self._setup_translation_config()
         
     def _setup_translation_config(self):
         """Set up Azure Speech Translation configuration"""
         try:
-            # Create translation config
-            if self.settings.speech_endpoint:
-                self.translation_config = speechsdk.translation.SpeechTranslationConfig(
-                    endpoint=self.settings.speech_endpoint,
-                    subscription=self.settings.speech_key
-                )
-            else:
-                self.translation_config = speechsdk.translation.SpeechTranslationConfig(
-                    subscription=self.settings.speech_key,
-                    region=self.settings.speech_region
-                )
+            # Sessions with the same languages and voice share one config
+            self.translation_config = self.config_factory.translation_config(
+                self.settings,
+                voice_name=self._translation_voice_name(),
+                live_interpreter=self.live_interpreter_mode
+            )
+            logger.info("Translation configuration initialized successfully")
             
-            # Set source language (can be overridden by auto-detect)
-            self.translation_config.speech_recognition_language = self.settings.source_language
+        except Exception as e:
+            logger.error(f"Failed to initialize translation config: {e}")
+            raise
+    
+    def _translation_voice_name(self) -> Optional[str]:
+        """Voice to set on the translation config"""
+        return self.settings.voice_name
+    
+    def set_audio_format(self, output_format: str) -> AudioFormat:
+        """
+        Choose the synthesis output format for this translator's session
+        
+        Args:
+            output_format: Preset ('opus', 'mp3', 'pcm-8k', ...) or
+                           speechsdk.SpeechSynthesisOutputFormat member name
             
-            # Add target languages
-            for lang in self.settings.target_languages:
-                self.translation_config.add_target_language(lang)
-                logger.info(f"Added target language: {lang}")
+        Returns:
+            The resolved AudioFormat
             
-            # Set voice for synthesis
-            if self.settings.voice_name:
-                self.translation_config.voice_name = self.settings.voice_name
-                logger.info(f"Using voice: {self.settings.voice_name}")
+        Raises:
+            ValueError: If the format is not supported
+        """
+        self.audio_format = parse_audio_format(output_format)
+        logger.info(f"Synthesis output format: {self.audio_format.name}")
+        return self.audio_format
+    
+    def set_synthesis_languages(self, languages: Optional[Iterable[str]]):
+        """
+        Synthesize (and speculate) only the languages someone listens to
+        
+        Args:
+            languages: Languages to synthesize, None for every target language
+        """
+        self.synthesis_languages = None if languages is None else frozenset(languages)
+    
+    def synthesis_targets(self, translations: Dict[str, str]) -> Dict[str, str]:
+        """
+        The translations to synthesize under set_synthesis_languages
+        
+        Args:
+            translations: Mapping of target language code to translated text
             
-            logger.info("Translation configuration initialized successfully")
+        Returns:
+            The translations in languages someone listens to
+        """
+        if self.synthesis_languages is None:
+            return translations
+        return {lang: text for lang, text in translations.items() if lang in self.synthesis_languages}
+    
+    def _create_synthesizer(self, voice_name: str, output_format: str) -> Any:
+        """
+        Create a synthesizer for a voice and output format
+        
+        Args:
+            voice_name: Neural voice name (e.g., 'es-ES-ElviraNeural')
+            output_format: speechsdk.SpeechSynthesisOutputFormat member name
             
-        except Exception as e:
-            logger.error(f"Failed to initialize translation config: {e}")
+        Returns:
+            Engine synthesizer with null output (audio data is returned directly)
+        """
+        return self.engine.create_synthesizer(voice_name, output_format)
+    
+    def _open_synthesizer_connection(self, synthesizer: Any) -> Any:
+        """Pre-open the service connection so the first utterance skips the handshake"""
+        connection = self.engine.synthesizer_connection(synthesizer)
+        connection.open(True)
+        return connection
+    
+    def warm_synthesizers(self, target_languages: Optional[List[str]] = None):
+        """
+        Pre-create pooled synthesizers for the voices of the given languages
+        
+        Args:
+            target_languages: Languages to warm, defaults to the configured targets
+        """
+        languages = target_languages or self.settings.target_languages
+        output_format = self.audio_format.name
+        self.synthesizer_pool.warm(
+            (self.settings.get_voice_for_language(lang), output_format)
+            for lang in languages if lang
+        )
+    
+    def _synthesize(self, text: str, target_language: str) -> bytes:
+        """
+        Synthesize text with a pooled synthesizer, raising on failure
+        
+        Args:
+            text: Translated text to synthesize
+            target_language: Target language code (e.g., 'es-ES')
+            
+        Returns:
+            Synthesized audio bytes
+            
+        Raises:
+            SynthesisError: If the service canceled or returned no audio
+        """
+        if self.speculator is not None:
+            audio = self._speculative_audio(text, target_language)
+            if audio is not None:
+                return audio
+        
+        started = time.perf_counter()
+        # Get appropriate voice for target language
+        voice_name = self.settings.get_voice_for_language(target_language)
+        output_format = self.audio_format.name
+        
+        if self.synthesis_cache is not None:
+            cached = self.synthesis_cache.get(text, voice_name, output_format)
+            if cached is not None:
+                logger.debug(f"TTS cache hit for '{text[:50]}' ({voice_name})")
+                self.latency_metrics.observe("synthesis", target_language, time.perf_counter() - started)
+                return cached
+        
+        logger.info(f"Using voice {voice_name} for language {target_language}")
+        synthesizer = self.synthesizer_pool.acquire(voice_name, output_format)
+        try:
+            result = synthesizer.speak_text(text)
+        except Exception:
+            self.synthesizer_pool.discard(synthesizer)
             raise
+        
+        if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+            self.synthesizer_pool.release(voice_name, output_format, synthesizer)
+            logger.info(f"Synthesized {len(result.audio_data)} bytes for '{text[:50]}...' using {voice_name}")
+            if self.synthesis_cache is not None:
+                self.synthesis_cache.put(text, voice_name, output_format, result.audio_data)
+            self.latency_metrics.observe("synthesis", target_language, time.perf_counter() - started)
+            return result.audio_data
+        
+        # Don't hand a synthesizer with a failed connection to the next caller
+        self.synthesizer_pool.discard(synthesizer)
+        if result.reason == speechsdk.ResultReason.Canceled:
+            cancellation = result.cancellation_details
+            message = f"Synthesis canceled: {cancellation.reason}"
+            if cancellation.reason == speechsdk.CancellationReason.Error:
+                message = f"{message} ({cancellation.error_details})"
+            raise SynthesisError(message)
+        raise SynthesisError(f"Synthesis result: {result.reason}")
+    
+    def _speculative_audio(self, text: str, target_language: str) -> Optional[bytes]:
+        """
+        Build a final translation's audio from its speculated segments
+        
+        Waits for the segments, synthesizes the words they don't cover and
+        joins the clips.
+        
+        Returns:
+            Audio bytes, or None if nothing usable was speculated
+        """
+        match = self.speculator.claim(target_language, text)
+        if match is None:
+            return None
+        claimed = time.perf_counter()
+        try:
+            clips = [future.result() for future in match.futures]
+            if match.remainder:
+                clips.append(self._synthesize(match.remainder, target_language))
+            audio = concat_audio(clips, self.audio_format)
+        except Exception as e:
+            logger.warning(f"Speculative audio for {target_language} unusable, synthesizing the final: {e}")
+            self.speculator.record(match, used=False)
+            return None
+        self.speculator.record(match, used=True, waited_s=time.perf_counter() - claimed)
+        return self._cache_speculative_audio(text, target_language, audio)
+    
+    async def _speculative_audio_async(self, text: str, target_language: str) -> Optional[bytes]:
+        """Await the speculated segments of a final translation (see _speculative_audio)"""
+        match = self.speculator.claim(target_language, text)
+        if match is None:
+            return None
+        claimed = time.perf_counter()
+        try:
+            clips = [await asyncio.wrap_future(future) for future in match.futures]
+            if match.remainder:
+                remainder = await self.synthesize_translation_async(match.remainder, target_language)
+                if remainder is None:
+                    raise SynthesisError(f"Synthesis of '{match.remainder[:50]}' failed")
+                clips.append(remainder)
+            audio = concat_audio(clips, self.audio_format)
+        except Exception as e:
+            logger.warning(f"Speculative audio for {target_language} unusable, synthesizing the final: {e}")
+            self.speculator.record(match, used=False)
+            return None
+        self.speculator.record(match, used=True, waited_s=time.perf_counter() - claimed)
+        return self._cache_speculative_audio(text, target_language, audio)
+    
+    def _cache_speculative_audio(self, text: str, target_language: str, audio: bytes) -> bytes:
+        """Cache joined speculative audio under the final text, so repeats skip the join"""
+        if self.synthesis_cache is not None:
+            voice_name = self.settings.get_voice_for_language(target_language)
+            self.synthesis_cache.put(text, voice_name, self.audio_format.name, audio)
+        return audio
     
     def synthesize_translation(
         self,
@@ -78,6 +341,9 @@ class AzureSpeechTranslator:
         """
         Synthesize translated text to speech audio
         
+        Uses a pooled synthesizer for the language's voice, so repeated calls
+        skip speech config and connection setup.
+        
         Args:
             text: Translated text to synthesize
             target_language: Target language code (e.g., 'es-ES')
@@ -86,53 +352,335 @@ class AzureSpeechTranslator:
             Audio bytes or None if synthesis fails
         """
         try:
-            # Create speech config for synthesis
-            if self.settings.speech_endpoint:
-                speech_config = speechsdk.SpeechConfig(
-                    endpoint=self.settings.speech_endpoint,
-                    subscription=self.settings.speech_key
-                )
-            else:
-                speech_config = speechsdk.SpeechConfig(
-                    subscription=self.settings.speech_key,
-                    region=self.settings.speech_region
-                )
+            return self._synthesize(text, target_language)
+        except Exception as e:
+            logger.error(f"Synthesis error: {e}")
+            return None
+    
+    def _wire_async_synthesizer(self, synthesizer: Any):
+        """
+        Connect completion handlers to a pooled synthesizer once
+        
+        Handlers dispatch to whichever async call currently owns the
+        synthesizer, so reuse never piles up extra handlers.
+        """
+        if synthesizer in self._synthesis_waiters:
+            return
+        self._synthesis_waiters[synthesizer] = None
+        waiters = self._synthesis_waiters
+        synthesizer_ref = weakref.ref(synthesizer)
+        
+        def dispatch(evt):
+            owner = synthesizer_ref()
+            waiter = waiters.get(owner) if owner is not None else None
+            if waiter is not None:
+                waiter(evt.result)
+        
+        synthesizer.synthesis_completed.connect(dispatch)
+        synthesizer.synthesis_canceled.connect(dispatch)
+    
+    async def synthesize_translation_async(
+        self,
+        text: str,
+        target_language: str
+    ) -> Optional[bytes]:
+        """
+        Synthesize translated text without blocking the event loop
+        
+        Starts speak_text_async and awaits the synthesizer's completion
+        event, so no thread is held while the service renders.
+        
+        Args:
+            text: Translated text to synthesize
+            target_language: Target language code (e.g., 'es-ES')
             
-            # Get appropriate voice for target language
-            voice_name = self.settings.get_voice_for_language(target_language)
-            logger.info(f"Using voice {voice_name} for language {target_language}")
-            speech_config.speech_synthesis_voice_name = voice_name
+        Returns:
+            Audio bytes or None if synthesis fails
+        """
+        if self.speculator is not None:
+            audio = await self._speculative_audio_async(text, target_language)
+            if audio is not None:
+                return audio
+        
+        started = time.perf_counter()
+        voice_name = self.settings.get_voice_for_language(target_language)
+        output_format = self.audio_format.name
+        
+        if self.synthesis_cache is not None:
+            cached = self.synthesis_cache.get(text, voice_name, output_format)
+            if cached is not None:
+                self.latency_metrics.observe("synthesis", target_language, time.perf_counter() - started)
+                return cached
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        synthesizer = self.synthesizer_pool.acquire(voice_name, output_format)
+        try:
+            self._wire_async_synthesizer(synthesizer)
+            self._synthesis_waiters[synthesizer] = lambda result: resolve_future(loop, future, result)
+            synthesizer.speak_text_async(text)
+            result = await future
+        except BaseException as e:
+            self._synthesis_waiters[synthesizer] = None
+            self.synthesizer_pool.discard(synthesizer)
+            if isinstance(e, Exception):
+                logger.error(f"Synthesis error: {e}")
+                return None
+            raise
+        self._synthesis_waiters[synthesizer] = None
+        
+        if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+            self.synthesizer_pool.release(voice_name, output_format, synthesizer)
+            if self.synthesis_cache is not None:
+                self.synthesis_cache.put(text, voice_name, output_format, result.audio_data)
+            self.latency_metrics.observe("synthesis", target_language, time.perf_counter() - started)
+            return result.audio_data
+        
+        self.synthesizer_pool.discard(synthesizer)
+        if result.reason == speechsdk.ResultReason.Canceled:
+            logger.error(f"Synthesis canceled: {result.cancellation_details.reason}")
+        else:
+            logger.warning(f"Synthesis result: {result.reason}")
+        return None
+    
+    async def synthesize_translations_async(self, translations: Dict[str, str]) -> Dict[str, Optional[bytes]]:
+        """
+        Synthesize all translations concurrently on the event loop
+        
+        Args:
+            translations: Mapping of target language code to translated text
             
-            # Create synthesizer with null output (we'll get the audio data directly)
-            synthesizer = speechsdk.SpeechSynthesizer(
-                speech_config=speech_config,
-                audio_config=None
-            )
+        Returns:
+            Audio bytes (or None on failure) per language
+        """
+        items = [(lang, text) for lang, text in translations.items() if text]
+        audio = await asyncio.gather(*(self.synthesize_translation_async(text, lang) for lang, text in items))
+        return {lang: data for (lang, _), data in zip(items, audio)}
+    
+    def iter_synthesis_chunks(
+        self,
+        text: str,
+        target_language: str,
+        chunk_size: int = 4096
+    ) -> Iterator[bytes]:
+        """
+        Stream synthesized audio, yielding chunks as the service produces them
+        
+        Starts synthesis with start_speaking_text and reads the result's
+        audio through the engine, so the first chunk is available long before the
+        whole utterance is rendered. The concatenated chunks equal the audio
+        synthesize_translation would return.
+        
+        Args:
+            text: Translated text to synthesize
+            target_language: Target language code (e.g., 'es-ES')
+            chunk_size: Maximum bytes per yielded chunk
             
-            # Synthesize
-            result = synthesizer.speak_text(text)
+        Yields:
+            Audio chunks in the configured synthesis output format
             
-            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                logger.info(f"Synthesized {len(result.audio_data)} bytes for '{text[:50]}...' using {voice_name}")
-                return result.audio_data
-            elif result.reason == speechsdk.ResultReason.Canceled:
+        Raises:
+            SynthesisError: If the service canceled the synthesis
+        """
+        voice_name = self.settings.get_voice_for_language(target_language)
+        output_format = self.audio_format.name
+        
+        cached = None
+        if self.speculator is not None:
+            # Speculated audio is already rendered, so it goes out like a cache hit
+            cached = self._speculative_audio(text, target_language)
+        if cached is None and self.synthesis_cache is not None:
+            cached = self.synthesis_cache.get(text, voice_name, output_format)
+        if cached is not None:
+            for i in range(0, len(cached), chunk_size):
+                yield cached[i:i + chunk_size]
+            return
+        
+        synthesizer = self.synthesizer_pool.acquire(voice_name, output_format)
+        completed = False
+        try:
+            result = synthesizer.start_speaking_text(text)
+            if result.reason == speechsdk.ResultReason.Canceled:
                 cancellation = result.cancellation_details
-                logger.error(f"Synthesis canceled: {cancellation.reason}")
-                if cancellation.reason == speechsdk.CancellationReason.Error:
-                    logger.error(f"Error: {cancellation.error_details}")
-                return None
+                raise SynthesisError(f"Synthesis canceled: {cancellation.reason}")
+            
+            chunks: List[bytes] = []
+            for chunk in self.engine.iter_audio(result, chunk_size):
+                chunks.append(chunk)
+                yield chunk
+            completed = True
+        finally:
+            if completed:
+                self.synthesizer_pool.release(voice_name, output_format, synthesizer)
             else:
-                logger.warning(f"Synthesis result: {result.reason}")
-                return None
-                
+                # Consumer stopped early or the service failed mid-stream
+                try:
+                    synthesizer.stop_speaking()
+                except Exception:
+                    pass
+                self.synthesizer_pool.discard(synthesizer)
+        
+        audio_data = b"".join(chunks)
+        logger.info(f"Streamed {len(audio_data)} bytes in {len(chunks)} chunks for '{text[:50]}...' using {voice_name}")
+        if self.synthesis_cache is not None:
+            self.synthesis_cache.put(text, voice_name, output_format, audio_data)
+    
+    def _stream_outcome(
+        self,
+        target_language: str,
+        text: str,
+        chunk_callback: Callable[[str, int, bytes], None]
+    ) -> SynthesisOutcome:
+        """Stream one language to chunk_callback, capturing full audio or error"""
+        start = time.perf_counter()
+        chunks: List[bytes] = []
+        try:
+            for sequence, chunk in enumerate(self.iter_synthesis_chunks(text, target_language)):
+                if sequence == 0:
+                    self.latency_metrics.observe("first_chunk", target_language, time.perf_counter() - start)
+                chunks.append(chunk)
+                chunk_callback(target_language, sequence, chunk)
+            audio_data, error = b"".join(chunks), None
+            self.latency_metrics.observe("synthesis", target_language, time.perf_counter() - start)
         except Exception as e:
-            logger.error(f"Synthesis error: {e}")
-            return None
+            logger.error(f"Streaming synthesis error for {target_language}: {e}")
+            audio_data, error = None, str(e)
+        return SynthesisOutcome(
+            language=target_language,
+            audio_data=audio_data,
+            error=error,
+            elapsed_ms=(time.perf_counter() - start) * 1000
+        )
+    
+    def stream_synthesized_translations(
+        self,
+        translations: Dict[str, str],
+        chunk_callback: Callable[[str, int, bytes], None]
+    ) -> Dict[str, SynthesisOutcome]:
+        """
+        Stream synthesis for all languages concurrently
+        
+        Args:
+            translations: Mapping of target language code to translated text
+            chunk_callback: Called with (language, sequence, chunk) as each chunk
+                            arrives; called from worker threads
+            
+        Returns:
+            SynthesisOutcome per language once every stream has finished
+        """
+        items = [(lang, text) for lang, text in translations.items() if text]
+        futures = {
+            lang: self._submit_synthesis(self._stream_outcome, lang, text, chunk_callback)
+            for lang, text in items
+        }
+        return {lang: future.result() for lang, future in futures.items()}
+    
+    def _synthesize_outcome(self, target_language: str, text: str) -> SynthesisOutcome:
+        """Synthesize one language, capturing audio or error and elapsed time"""
+        start = time.perf_counter()
+        try:
+            audio_data = self._synthesize(text, target_language)
+            error = None
+        except Exception as e:
+            logger.error(f"Synthesis error for {target_language}: {e}")
+            audio_data, error = None, str(e)
+        return SynthesisOutcome(
+            language=target_language,
+            audio_data=audio_data,
+            error=error,
+            elapsed_ms=(time.perf_counter() - start) * 1000
+        )
+    
+    def _submit_synthesis(self, fn: Callable, *args: Any) -> Future:
+        """Run a synthesis task on the shared pool, at most synthesis_max_workers at once for this translator"""
+        return self.synthesis_executor.submit(
+            self._executor_key, fn, *args, max_running=max(1, self.settings.synthesis_max_workers)
+        )
+    
+    def iter_synthesized_translations(
+        self,
+        translations: Dict[str, str]
+    ) -> Iterator[Tuple[str, SynthesisOutcome]]:
+        """
+        Synthesize several languages concurrently, yielding each as it completes
+        
+        Args:
+            translations: Mapping of target language code to translated text
+            
+        Yields:
+            (language, SynthesisOutcome) in completion order
+        """
+        items = [(lang, text) for lang, text in translations.items() if text]
+        if len(items) == 1:
+            lang, text = items[0]
+            yield lang, self._synthesize_outcome(lang, text)
+            return
+        
+        futures = [self._submit_synthesis(self._synthesize_outcome, lang, text) for lang, text in items]
+        for future in as_completed(futures):
+            outcome = future.result()
+            yield outcome.language, outcome
+    
+    def synthesize_translations(self, translations: Dict[str, str]) -> Dict[str, SynthesisOutcome]:
+        """
+        Synthesize all translations concurrently
+        
+        Wall-clock time approaches the slowest single synthesis rather than
+        the sum across languages.
+        
+        Args:
+            translations: Mapping of target language code to translated text
+            
+        Returns:
+            SynthesisOutcome per language (audio or error)
+        """
+        outcomes = dict(self.iter_synthesized_translations(translations))
+        return {lang: outcomes[lang] for lang in translations if lang in outcomes}
+    
+    def warm_synthesis_cache(self, phrases: Dict[str, List[str]]) -> Dict[str, int]:
+        """
+        Pre-render phrases into the synthesis cache
+        
+        Args:
+            phrases: Mapping of language code to phrases already in that language
+            
+        Returns:
+            Count of phrases rendered per language (cached phrases are skipped)
+        """
+        if self.synthesis_cache is None:
+            logger.warning("Synthesis cache is disabled, nothing to warm")
+            return {}
+        
+        output_format = self.audio_format.name
+        rendered: Dict[str, int] = {}
+        for lang, texts in phrases.items():
+            voice_name = self.settings.get_voice_for_language(lang)
+            missing = [
+                text for text in dict.fromkeys(texts)
+                if self.synthesis_cache.get(text, voice_name, output_format) is None
+            ]
+            rendered[lang] = 0
+            # Render a batch of one language's phrases concurrently
+            batch_size = max(1, self.settings.synthesis_max_workers)
+            for i in range(0, len(missing), batch_size):
+                futures = [
+                    self._submit_synthesis(self._synthesize_outcome, lang, text)
+                    for text in missing[i:i + batch_size]
+                ]
+                rendered[lang] += sum(1 for future in futures if future.result().ok)
+            logger.info(f"Warmed TTS cache for {lang} ({voice_name}): {rendered[lang]} phrase(s) rendered")
+        return rendered
+    
+    def close(self):
+        """Release pooled synthesizers (the shared synthesis threads outlive the translator)"""
+        if self.speculator is not None:
+            self.speculator.close()
+        self.synthesizer_pool.clear()
     
     def create_recognizer_from_microphone(
         self,
         auto_detect_languages: Optional[List[str]] = None
-    ) -> speechsdk.translation.TranslationRecognizer:
+    ) -> Any:
         """
         Create a translation recognizer from default microphone
         
@@ -142,24 +690,14 @@ class AzureSpeechTranslator:
         Returns:
             Translation recognizer configured for microphone input
         """
-        audio_config = speechsdk.audio.AudioConfig(use_default_microphone=True)
-        
         if auto_detect_languages and self.settings.enable_auto_detect:
             # Enable automatic language detection
-            auto_detect_config = speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-                languages=auto_detect_languages
-            )
-            recognizer = speechsdk.translation.TranslationRecognizer(
-                translation_config=self.translation_config,
-                audio_config=audio_config,
-                auto_detect_source_language_config=auto_detect_config
+            recognizer = self.engine.create_recognizer(
+                self.translation_config, AudioSource.microphone(), auto_detect_languages
             )
             logger.info(f"Created recognizer with auto-detection for: {auto_detect_languages}")
         else:
-            recognizer = speechsdk.translation.TranslationRecognizer(
-                translation_config=self.translation_config,
-                audio_config=audio_config
-            )
+            recognizer = self.engine.create_recognizer(self.translation_config, AudioSource.microphone())
             logger.info("Created recognizer with fixed source language")
         
         return recognizer
@@ -168,7 +706,7 @@ class AzureSpeechTranslator:
         self,
         audio_file_path: str,
         auto_detect_languages: Optional[List[str]] = None
-    ) -> speechsdk.translation.TranslationRecognizer:
+    ) -> Any:
         """
         Create a translation recognizer from audio file
         
@@ -179,29 +717,84 @@ class AzureSpeechTranslator:
         Returns:
             Translation recognizer configured for file input
         """
-        audio_config = speechsdk.audio.AudioConfig(filename=audio_file_path)
-        
-        if auto_detect_languages and self.settings.enable_auto_detect:
-            auto_detect_config = speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-                languages=auto_detect_languages
-            )
-            recognizer = speechsdk.translation.TranslationRecognizer(
-                translation_config=self.translation_config,
-                audio_config=audio_config,
-                auto_detect_source_language_config=auto_detect_config
-            )
-        else:
-            recognizer = speechsdk.translation.TranslationRecognizer(
-                translation_config=self.translation_config,
-                audio_config=audio_config
-            )
+        languages = auto_detect_languages if self.settings.enable_auto_detect else None
+        recognizer = self.engine.create_recognizer(
+            self.translation_config, AudioSource.file(audio_file_path), languages or None
+        )
         
         logger.info(f"Created recognizer for file: {audio_file_path}")
         return recognizer
     
+    def create_push_stream(
+        self,
+        sample_rate: int = 16000,
+        bits_per_sample: int = 16,
+        channels: int = 1
+    ) -> Any:
+        """
+        Create a push stream for raw PCM audio supplied by the caller
+        
+        Args:
+            sample_rate: PCM sample rate in Hz
+            bits_per_sample: PCM sample width
+            channels: Number of interleaved channels
+            
+        Returns:
+            Push stream to write client audio into
+        """
+        return self.engine.create_push_stream(sample_rate, bits_per_sample, channels)
+    
+    def create_recognizer_from_stream(
+        self,
+        push_stream: Any,
+        auto_detect_languages: Optional[List[str]] = None
+    ) -> Any:
+        """
+        Create a translation recognizer fed from a push stream
+        
+        Args:
+            push_stream: Stream created with create_push_stream
+            auto_detect_languages: List of languages to detect automatically
+            
+        Returns:
+            Translation recognizer configured for pushed audio
+        """
+        languages = auto_detect_languages if self.settings.enable_auto_detect else None
+        recognizer = self.engine.create_recognizer(
+            self.translation_config, AudioSource.push_stream(push_stream), languages or None
+        )
+        
+        logger.info("Created recognizer for pushed audio stream")
+        return recognizer
+    
+    async def recognize_once_async(
+        self,
+        recognizer: Any,
+        timeout: Optional[float] = None
+    ) -> TranslationResult:
+        """
+        Recognize and translate one utterance without blocking the event loop
+        
+        Args:
+            recognizer: Recognizer to use
+            timeout: Seconds to wait for a result (None waits indefinitely)
+            
+        Returns:
+            TranslationResult with recognized and translated text
+        """
+        result = await wait_for_signals(
+            [
+                (recognizer.recognized, lambda evt: evt.result),
+                (recognizer.canceled, lambda evt: evt.result)
+            ],
+            trigger=recognizer.recognize_once_async,
+            timeout=timeout
+        )
+        return self._process_result(result)
+    
     async def translate_once(
         self,
-        recognizer: Optional[speechsdk.translation.TranslationRecognizer] = None
+        recognizer: Optional[Any] = None
     ) -> TranslationResult:
         """
         Perform single-shot translation
@@ -216,86 +809,447 @@ class AzureSpeechTranslator:
             recognizer = self.create_recognizer_from_microphone()
         
         logger.info("Starting single-shot recognition...")
-        result = recognizer.recognize_once()
+        return await self.recognize_once_async(recognizer)
+    
+    def dispatch_callback(self, recognizer: Any, callback: Callable, *args: Any, droppable: bool = False):
+        """
+        Hand a recognition callback to the shared callback pool
         
-        return self._process_result(result)
+        Called from Speech SDK event threads, which return immediately
+        instead of waiting on whatever the callback does (synthesis, network
+        sends). Callbacks of one recognizer run one at a time in event order.
+        Runs the callback inline when callback_workers is 0.
+        
+        Args:
+            recognizer: Recognizer the event came from (its id is the session key)
+            callback: Callback to run
+            *args: Callback arguments
+            droppable: Drop the callback when the session already has
+                       callback_queue_depth queued (streamed synthesizing
+                       audio); finals and session events are always queued
+        """
+        if self.callback_executor is None:
+            callback(*args)
+            return
+        try:
+            self.callback_executor.submit(id(recognizer), callback, *args, bounded=droppable)
+        except QueueFullError as e:
+            logger.warning(f"Dropped {getattr(callback, '__name__', 'callback')}: {e}")
     
-    def start_continuous_translation(
+    def wait_for_callbacks(self, recognizer: Any, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until the recognizer's queued callbacks have run
+        
+        Args:
+            recognizer: Recognizer whose callbacks to wait for
+            timeout: Seconds to wait
+            
+        Returns:
+            True if none are left (always True when callbacks run inline)
+        """
+        if self.callback_executor is None:
+            return True
+        return self.callback_executor.drain(id(recognizer), timeout)
+    
+    async def wait_for_callbacks_async(self, recognizer: Any, timeout: Optional[float] = 5.0) -> bool:
+        """Await wait_for_callbacks() without blocking the event loop"""
+        if self.callback_executor is None:
+            return True
+        return await self.callback_executor.drain_async(id(recognizer), timeout)
+    
+    def _connect_callbacks(
         self,
-        recognizer: speechsdk.translation.TranslationRecognizer,
-        recognizing_callback: Optional[Callable[[TranslationResult], None]] = None,
+        recognizer: Any,
+        recognizing_callback: Optional[Callable[[InterimResult], None]] = None,
         recognized_callback: Optional[Callable[[TranslationResult], None]] = None,
         synthesizing_callback: Optional[Callable[[bytes], None]] = None,
         canceled_callback: Optional[Callable[[str], None]] = None,
         session_stopped_callback: Optional[Callable[[], None]] = None
     ):
-        """
-        Start continuous translation with callbacks
-        
-        Args:
-            recognizer: Translation recognizer to use
-            recognizing_callback: Called for interim results
-            recognized_callback: Called for final results
-            synthesizing_callback: Called when audio is synthesized
-            canceled_callback: Called on cancellation
-            session_stopped_callback: Called when session stops
-        """
-        # Connect event handlers
+        """Connect continuous translation callbacks to recognizer events"""
+        coalescer = None
         if recognizing_callback:
+            coalescer = self.create_interim_coalescer(recognizing_callback)
+            self.interim_coalescer = coalescer
+            on_interim = coalescer.push if coalescer else recognizing_callback
             recognizer.recognizing.connect(
-                lambda evt: recognizing_callback(self._process_result(evt.result))
+                lambda evt: on_interim(self._process_interim(evt.result))
             )
+        elif self.speculator is not None and recognizer not in self._interim_feeds:
+            # Interims still feed speculative synthesis, through one handler per recognizer
+            self.register_interim_feed(recognizer)
+            recognizer.recognizing.connect(lambda evt: self._process_interim(evt.result))
         
-        if recognized_callback:
-            recognizer.recognized.connect(
-                lambda evt: recognized_callback(self._process_result(evt.result))
-            )
+        if recognized_callback or coalescer:
+            def on_final(evt):
+                received_at = time.perf_counter()
+                # The latest interim always goes out before its final
+                if coalescer:
+                    coalescer.flush_final()
+                if recognized_callback:
+                    self.dispatch_callback(
+                        recognizer, recognized_callback, self._process_result(evt.result, recognizer, received_at)
+                    )
+            recognizer.recognized.connect(on_final)
         
         if synthesizing_callback:
             recognizer.synthesizing.connect(
-                lambda evt: synthesizing_callback(evt.result.audio)
+                lambda evt: self.dispatch_callback(recognizer, synthesizing_callback, evt.result.audio, droppable=True)
             )
         
         if canceled_callback:
             recognizer.canceled.connect(
-                lambda evt: canceled_callback(str(evt.cancellation_details))
+                lambda evt: self.dispatch_callback(recognizer, canceled_callback, str(evt.cancellation_details))
             )
         
+        if coalescer:
+            recognizer.session_stopped.connect(lambda evt: coalescer.close())
+        
         if session_stopped_callback:
             recognizer.session_stopped.connect(
-                lambda evt: session_stopped_callback()
+                lambda evt: self.dispatch_callback(recognizer, session_stopped_callback)
             )
+    
+    def register_interim_feed(self, recognizer: Any):
+        """
+        Record that a recognizer's interims already reach _process_interim
+        
+        Starting such a recognizer without a recognizing callback does not
+        connect another handler feeding the speculator, so every interim is
+        observed exactly once however often it is started.
+        
+        Args:
+            recognizer: Recognizer with its own recognizing handler (e.g. a KeepWarmRecognizer's)
+        """
+        self._interim_feeds.add(recognizer)
+    
+    def create_interim_coalescer(
+        self,
+        recognizing_callback: Callable[[InterimResult], None]
+    ) -> Optional[InterimCoalescer]:
+        """
+        Rate-limit an interim callback according to settings.interim_coalesce_ms
+        
+        Args:
+            recognizing_callback: Downstream interim callback
+            
+        Returns:
+            InterimCoalescer feeding the callback, or None if coalescing is disabled
+        """
+        if self.settings.interim_coalesce_ms <= 0:
+            return None
+        return InterimCoalescer(recognizing_callback, interval_ms=self.settings.interim_coalesce_ms)
+    
+    def language_candidates_stale(self, recognizer: Any) -> bool:
+        """
+        Check whether the adaptive candidate languages changed since a recognizer was built
+        
+        Args:
+            recognizer: Recognizer created by this translator
+            
+        Returns:
+            True if the recognizer should be rebuilt to pick up the current candidates
+        """
+        if self.language_tracker is None or recognizer not in self._recognizer_generations:
+            return False
+        return self._recognizer_generations[recognizer] != self.language_tracker.generation
+    
+    def start_continuous_translation(
+        self,
+        recognizer: Any,
+        recognizing_callback: Optional[Callable[[InterimResult], None]] = None,
+        recognized_callback: Optional[Callable[[TranslationResult], None]] = None,
+        synthesizing_callback: Optional[Callable[[bytes], None]] = None,
+        canceled_callback: Optional[Callable[[str], None]] = None,
+        session_stopped_callback: Optional[Callable[[], None]] = None
+    ):
+        """
+        Start continuous translation with callbacks
+        
+        Args:
+            recognizer: Translation recognizer to use
+            recognizing_callback: Called for interim results
+            recognized_callback: Called for final results
+            synthesizing_callback: Called when audio is synthesized
+            canceled_callback: Called on cancellation
+            session_stopped_callback: Called when session stops
+        """
+        self._connect_callbacks(
+            recognizer,
+            recognizing_callback,
+            recognized_callback,
+            synthesizing_callback,
+            canceled_callback,
+            session_stopped_callback
+        )
+        
+        self._wire_session_events(recognizer)
         
         # Start continuous recognition
         recognizer.start_continuous_recognition()
         logger.info("Started continuous translation")
     
+    async def start_continuous_translation_async(
+        self,
+        recognizer: Any,
+        recognizing_callback: Optional[Callable[[InterimResult], None]] = None,
+        recognized_callback: Optional[Callable[[TranslationResult], None]] = None,
+        synthesizing_callback: Optional[Callable[[bytes], None]] = None,
+        canceled_callback: Optional[Callable[[str], None]] = None,
+        session_stopped_callback: Optional[Callable[[], None]] = None,
+        timeout: Optional[float] = 10.0
+    ):
+        """
+        Start continuous translation and await the session start event
+        
+        Same callbacks as start_continuous_translation. Returns once the
+        service session has started; raises if it is canceled first.
+        
+        Args:
+            timeout: Seconds to wait for the session to start
+            
+        Raises:
+            RuntimeError: If recognition is canceled before the session starts
+        """
+        self._connect_callbacks(
+            recognizer,
+            recognizing_callback,
+            recognized_callback,
+            synthesizing_callback,
+            canceled_callback,
+            session_stopped_callback
+        )
+        
+        started, details = await self._await_session_event(
+            recognizer,
+            {
+                "session_started": lambda evt: (True, None),
+                "canceled": lambda evt: (False, evt.cancellation_details)
+            },
+            trigger=recognizer.start_continuous_recognition_async,
+            timeout=timeout
+        )
+        if not started:
+            raise RuntimeError(f"Continuous translation canceled before start: {details}")
+        logger.info("Started continuous translation")
+    
+    def _wire_session_events(self, recognizer: Any):
+        """
+        Connect session event handlers once per recognizer
+        
+        Handlers dispatch to whichever async start/stop is pending, so a
+        recognizer started and stopped many times never piles up handlers.
+        Session starts also re-anchor the recognizer's audio clock.
+        """
+        if recognizer in self._session_waiters:
+            return
+        self._session_waiters[recognizer] = None
+        waiters = self._session_waiters
+        recognizer_ref = weakref.ref(recognizer)
+        
+        def dispatcher(name: str):
+            def dispatch(evt):
+                owner = recognizer_ref()
+                if owner is None:
+                    return
+                if name == "session_started":
+                    self._start_audio_clock(owner)
+                waiter = waiters.get(owner)
+                if waiter is not None:
+                    waiter(name, evt)
+            return dispatch
+        
+        for name in ("session_started", "session_stopped", "canceled"):
+            getattr(recognizer, name).connect(dispatcher(name))
+    
+    async def _await_session_event(
+        self,
+        recognizer: Any,
+        mappers: Dict[str, Callable[[Any], Any]],
+        trigger: Callable[[], Any],
+        timeout: Optional[float]
+    ) -> Any:
+        """
+        Start an operation and await the first of the given session events
+        
+        Args:
+            recognizer: Recognizer whose events to await
+            mappers: Event name -> mapper; the first event resolves to mapper(evt)
+            trigger: Starts the operation
+            timeout: Seconds to wait before raising asyncio.TimeoutError
+            
+        Returns:
+            The mapped value of the first event
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def waiter(name, evt):
+            mapper = mappers.get(name)
+            if mapper is None or future.done():
+                return
+            try:
+                resolve_future(loop, future, mapper(evt))
+            except Exception as e:
+                resolve_future(loop, future, exception=e)
+        
+        self._wire_session_events(recognizer)
+        self._session_waiters[recognizer] = waiter
+        try:
+            trigger()
+            if timeout is None:
+                return await future
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            if self._session_waiters.get(recognizer) is waiter:
+                self._session_waiters[recognizer] = None
+    
+    def release_recognizer(self, recognizer: Any):
+        """
+        Disconnect every event handler from a recognizer and forget it
+        
+        Call once the recognizer is stopped and will not be used again, so
+        the callbacks and everything they close over can be collected.
+        
+        Args:
+            recognizer: Recognizer created by this translator
+        """
+        for name in ("recognizing", "recognized", "synthesizing", "canceled", "session_started", "session_stopped"):
+            signal = getattr(recognizer, name, None)
+            if signal is not None:
+                signal.disconnect_all()
+        self._session_waiters.pop(recognizer, None)
+        self._recognizer_generations.pop(recognizer, None)
+        self._audio_clocks.pop(recognizer, None)
+        if self.callback_executor is not None:
+            self.callback_executor.discard(id(recognizer))
+    
     def stop_continuous_translation(
         self,
-        recognizer: speechsdk.translation.TranslationRecognizer
+        recognizer: Any,
+        timeout: Optional[float] = 5.0
     ):
         """
-        Stop continuous translation
+        Stop continuous translation and wait for callbacks still queued
         
         Args:
             recognizer: Translation recognizer to stop
+            timeout: Seconds to wait for queued callbacks
         """
         recognizer.stop_continuous_recognition()
+        if not self.wait_for_callbacks(recognizer, timeout):
+            logger.warning("Callbacks still pending after stopping continuous translation")
         logger.info("Stopped continuous translation")
     
+    async def stop_continuous_translation_async(
+        self,
+        recognizer: Any,
+        timeout: Optional[float] = 5.0
+    ):
+        """
+        Stop continuous translation, await the session stop event and queued callbacks
+        
+        Args:
+            recognizer: Translation recognizer to stop
+            timeout: Seconds to wait for the session to stop, and again for callbacks
+        """
+        try:
+            await self._await_session_event(
+                recognizer,
+                {"session_stopped": lambda evt: None},
+                trigger=recognizer.stop_continuous_recognition_async,
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Timed out waiting for the translation session to stop")
+        if not await self.wait_for_callbacks_async(recognizer, timeout):
+            logger.warning("Callbacks still pending after stopping continuous translation")
+        logger.info("Stopped continuous translation")
+    
+    def _process_interim(
+        self,
+        result: Any
+    ) -> InterimResult:
+        """
+        Convert a recognizing event result into an InterimResult
+        
+        Hot path: no validation, logging or exception handling. The SDK
+        builds a fresh translations dict and property dict per result, so
+        both are used without copying. With speculative synthesis on, the
+        translations are also offered to the speculator.
+        
+        Args:
+            result: Speech SDK translation result from a recognizing event
+            
+        Returns:
+            InterimResult
+        """
+        if self.speculator is not None:
+            self.speculator.observe(self.synthesis_targets(result.translations))
+        return InterimResult(
+            result.text,
+            result.translations,
+            result.properties.get(_AUTO_DETECT_LANGUAGE),
+            time.monotonic()
+        )
+    
+    def _start_audio_clock(self, recognizer: Any):
+        """Anchor result offsets to the time the recognizer's session started"""
+        # Offsets may continue from the previous session (push streams) or restart at 0
+        clock = self._audio_clocks.get(recognizer)
+        audio_end = clock[3] if clock is not None else 0
+        self._audio_clocks[recognizer] = (time.perf_counter(), datetime.now(), audio_end, audio_end)
+    
+    def _speech_timing(self, recognizer: Any, result: Any) -> Optional[Tuple[datetime, float]]:
+        """
+        Map a result's audio offset and duration onto the clock
+        
+        Assumes audio arrives in real time from the session start (microphone
+        or live client stream).
+        
+        Returns:
+            (wall-clock speech start, perf_counter speech end), or None if the
+            recognizer's session start was not observed
+        """
+        try:
+            clock = self._audio_clocks.get(recognizer)
+        except TypeError:
+            # Not weakly referenceable, so never anchored
+            return None
+        offset = getattr(result, "offset", None)
+        duration = getattr(result, "duration", None)
+        if clock is None or not isinstance(offset, int) or not isinstance(duration, int):
+            return None
+        started_perf, started_wall, base, _ = clock
+        if offset < base:
+            # Offsets restarted with this session
+            base = 0
+        self._audio_clocks[recognizer] = (started_perf, started_wall, base, offset + duration)
+        start_s = (offset - base) / TICKS_PER_SECOND
+        return started_wall + timedelta(seconds=start_s), started_perf + start_s + duration / TICKS_PER_SECOND
+    
     def _process_result(
         self,
-        result: speechsdk.translation.TranslationRecognitionResult
+        result: Any,
+        recognizer: Optional[Any] = None,
+        received_at: Optional[float] = None
     ) -> TranslationResult:
         """
         Process Speech SDK result into TranslationResult
         
+        With the recognizer, the timestamp is when the utterance started
+        (from the result's audio offset) and the recognition and translation
+        stage latencies are recorded.
+        
         Args:
             result: Speech SDK translation result
+            recognizer: Recognizer the result came from
+            received_at: time.perf_counter() when the recognized event arrived
             
         Returns:
             Processed TranslationResult
         """
+        received_at = received_at or time.perf_counter()
         detected_language = None
         original_text = ""
         translations = {}
@@ -313,6 +1267,9 @@ class AzureSpeechTranslator:
             except Exception:
                 detected_language = self.settings.source_language
             
+            if self.language_tracker is not None:
+                self.language_tracker.observe(detected_language, recognized=bool(original_text))
+            
             # Get audio if available
             try:
                 audio_data = result.audio
@@ -327,6 +1284,8 @@ class AzureSpeechTranslator:
             
         elif result.reason == speechsdk.ResultReason.NoMatch:
             logger.warning("No speech could be recognized")
+            if self.language_tracker is not None:
+                self.language_tracker.observe(None, recognized=False)
             
         elif result.reason == speechsdk.ResultReason.Canceled:
             details = result.cancellation_details
@@ -334,13 +1293,30 @@ class AzureSpeechTranslator:
             if details.reason == speechsdk.CancellationReason.Error:
                 logger.error(f"Error details: {details.error_details}")
         
+        timestamp = None
+        marks = {"recognized": received_at}
+        timing = self._speech_timing(recognizer, result) if recognizer is not None and original_text else None
+        if timing is not None:
+            timestamp, speech_end = timing
+            # A stream fed faster than real time can be recognized "before" it was spoken
+            marks["speech_end"] = min(speech_end, received_at)
+        marks["translated"] = time.perf_counter()
+        if self.speculator is not None:
+            # Before any callback can ask for this result's audio
+            self.speculator.finalize(self.synthesis_targets(translations))
+        if original_text:
+            language = detected_language or self.settings.source_language
+            self.latency_metrics.observe_interval("recognition", language, marks.get("speech_end"), received_at)
+            self.latency_metrics.observe("translation", language, marks["translated"] - received_at)
+        
         return TranslationResult(
             original_text=original_text,
             detected_language=detected_language,
             translations=translations,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             audio_data=audio_data,
-            duration_ms=int(result.duration / 10000) if result.duration else 0  # duration is in 100-nanosecond units
+            duration_ms=int(result.duration / 10000) if result.duration else 0,  # duration is in 100-nanosecond units
+            marks=marks
         )
 
 
@@ -358,7 +1334,14 @@ class LiveInterpreterTranslator(AzureSpeechTranslator):
     - Otherwise, uses the specified prebuilt neural voice
     """
     
-    def __init__(self, settings: Settings, use_personal_voice: Optional[bool] = None):
+    live_interpreter_mode = True
+    
+    def __init__(
+        self,
+        settings: Settings,
+        use_personal_voice: Optional[bool] = None,
+        engine: Optional[SpeechEngine] = None
+    ):
         """
         Initialize Live Interpreter translator
         
@@ -367,64 +1350,84 @@ class LiveInterpreterTranslator(AzureSpeechTranslator):
             use_personal_voice: Override voice mode. If None, determined from settings.voice_name.
                               If True, use personal voice (requires approval).
                               If False, use prebuilt neural voice specified in settings.
+            engine: Speech engine, defaults to the one selected by settings.speech_engine
         """
         if not settings.enable_live_interpreter:
             raise ValueError("Live Interpreter is not enabled in settings")
         
-        super().__init__(settings)
-        # Determine voice mode from settings or override
+        # Determine voice mode from settings or override (needed to pick the shared config)
         self.use_personal_voice = use_personal_voice if use_personal_voice is not None else settings.use_personal_voice
-        self._configure_live_interpreter()
+        super().__init__(settings, engine)
+        logger.info(f"Voice mode: {'Personal' if self.use_personal_voice else 'Prebuilt Neural'}")
+        
+        if settings.adaptive_language_detection:
+            # Narrow auto-detect candidates to the languages the session actually uses
+            self.language_tracker = LanguageCandidateTracker(
+                DEFAULT_AUTO_DETECT_LANGUAGES,
+                min_observations=settings.adaptive_language_min_observations,
+                max_candidates=settings.adaptive_language_max_candidates
+            )
+    
+    def _candidate_languages(self, auto_detect_languages: Optional[List[str]]) -> List[str]:
+        """
+        Resolve the auto-detect candidates for a new recognizer
+        
+        Args:
+            auto_detect_languages: Caller's candidates, or None for the defaults
+            
+        Returns:
+            The caller's (or default) list, narrowed by the language tracker when adaptive
+        """
+        full_candidates = auto_detect_languages or DEFAULT_AUTO_DETECT_LANGUAGES
+        if self.language_tracker is None:
+            return full_candidates
+        self.language_tracker.set_full_candidates(full_candidates)
+        return self.language_tracker.candidates
+    
+    def _track_recognizer(self, recognizer: Any):
+        """Remember which candidate generation a recognizer was built with"""
+        if self.language_tracker is not None:
+            self._recognizer_generations[recognizer] = self.language_tracker.generation
     
-    def _configure_live_interpreter(self):
-        """Configure Live Interpreter specific settings"""
+    def _translation_voice_name(self) -> Optional[str]:
+        """Choose the Live Interpreter voice for the translation config"""
         # Note: Continuous language ID mode is only for continuous recognition scenarios
         # For single-shot (file-based) recognition, we'll use at-start detection
         # This will be set per-recognizer in create_recognizer methods
         
-        # Choose voice mode
         if self.use_personal_voice:
             # Use personal voice for natural speaker style preservation
             # Note: Requires approval from Azure
-            self.translation_config.voice_name = "personal-voice"
             logger.info("Live Interpreter mode configured with personal voice (requires Azure approval)")
-        else:
-            # Use prebuilt neural voice specified in settings
-            # This works immediately without special approval
-            if self.settings.voice_name and self.settings.voice_name != "personal-voice":
-                self.translation_config.voice_name = self.settings.voice_name
-                logger.info(f"Live Interpreter mode configured with prebuilt neural voice: {self.settings.voice_name}")
-            else:
-                logger.warning("No prebuilt voice specified, using default voice")
+            return "personal-voice"
         
-        logger.info(f"Voice mode: {'Personal' if self.use_personal_voice else 'Prebuilt Neural'}")
+        # Use prebuilt neural voice specified in settings
+        # This works immediately without special approval
+        if self.settings.voice_name and self.settings.voice_name != "personal-voice":
+            logger.info(f"Live Interpreter mode configured with prebuilt neural voice: {self.settings.voice_name}")
+            return self.settings.voice_name
+        
+        logger.warning("No prebuilt voice specified, using default voice")
+        return None
     
     def create_recognizer_from_file(
         self,
         audio_file_path: str,
         auto_detect_languages: Optional[List[str]] = None
-    ) -> speechsdk.translation.TranslationRecognizer:
+    ) -> Any:
         """
         Create Live Interpreter recognizer from audio file
         
         For file-based recognition, uses at-start language detection
         """
-        audio_config = speechsdk.audio.AudioConfig(filename=audio_file_path)
-        
         # For file-based single-shot recognition, use at-start detection
         # If no languages specified, use a reasonable set of common languages
-        if auto_detect_languages is None or len(auto_detect_languages) == 0:
-            auto_detect_languages = ["en-US", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR", "zh-CN", "ja-JP", "ko-KR"]
-        
-        auto_detect_config = speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-            languages=auto_detect_languages
-        )
+        auto_detect_languages = self._candidate_languages(auto_detect_languages)
         
-        recognizer = speechsdk.translation.TranslationRecognizer(
-            translation_config=self.translation_config,
-            audio_config=audio_config,
-            auto_detect_source_language_config=auto_detect_config
+        recognizer = self.engine.create_recognizer(
+            self.translation_config, AudioSource.file(audio_file_path), auto_detect_languages
         )
+        self._track_recognizer(recognizer)
         
         logger.info(f"Created Live Interpreter recognizer for file: {audio_file_path}")
         return recognizer
@@ -433,7 +1436,7 @@ class LiveInterpreterTranslator(AzureSpeechTranslator):
         self,
         auto_detect_languages: Optional[List[str]] = None,
         use_continuous_mode: bool = True
-    ) -> speechsdk.translation.TranslationRecognizer:
+    ) -> Any:
         """
         Create Live Interpreter recognizer from microphone
         
@@ -444,28 +1447,43 @@ class LiveInterpreterTranslator(AzureSpeechTranslator):
             use_continuous_mode: If True, enables continuous language ID (for continuous recognition)
                                 If False, uses at-start detection (for single-shot)
         """
-        # If no languages specified, use a reasonable set of common languages
-        if auto_detect_languages is None or len(auto_detect_languages) == 0:
-            auto_detect_languages = ["en-US", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR", "zh-CN", "ja-JP", "ko-KR"]
-        
-        auto_detect_config = speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-            languages=auto_detect_languages
-        )
+        return self._create_live_recognizer(AudioSource.microphone(), auto_detect_languages, use_continuous_mode)
+    
+    def create_recognizer_from_stream(
+        self,
+        push_stream: Any,
+        auto_detect_languages: Optional[List[str]] = None,
+        use_continuous_mode: bool = True
+    ) -> Any:
+        """
+        Create Live Interpreter recognizer fed from a push stream
         
-        audio_config = speechsdk.audio.AudioConfig(use_default_microphone=True)
+        Args:
+            push_stream: Stream created with create_push_stream
+            auto_detect_languages: List of languages to detect, or None for common languages
+            use_continuous_mode: If True, enables continuous language ID (for continuous recognition)
+                                If False, uses at-start detection (for single-shot)
+        """
+        return self._create_live_recognizer(AudioSource.push_stream(push_stream), auto_detect_languages, use_continuous_mode)
+    
+    def _create_live_recognizer(
+        self,
+        source: AudioSource,
+        auto_detect_languages: Optional[List[str]],
+        use_continuous_mode: bool
+    ) -> Any:
+        """Create an auto-detecting Live Interpreter recognizer for any audio source"""
+        # If no languages specified, use a reasonable set of common languages
+        auto_detect_languages = self._candidate_languages(auto_detect_languages)
         
-        recognizer = speechsdk.translation.TranslationRecognizer(
-            translation_config=self.translation_config,
-            audio_config=audio_config,
-            auto_detect_source_language_config=auto_detect_config
+        # Set continuous language ID mode only for continuous recognition
+        recognizer = self.engine.create_recognizer(
+            self.translation_config, source, auto_detect_languages,
+            continuous_language_id=use_continuous_mode
         )
+        self._track_recognizer(recognizer)
         
-        # Set continuous language ID mode only for continuous recognition
         if use_continuous_mode:
-            recognizer.properties.set_property(
-                property_id=speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode,
-                value='Continuous'
-            )
             logger.info(f"Created Live Interpreter recognizer with continuous language detection for: {auto_detect_languages}")
         else:
             logger.info(f"Created Live Interpreter recognizer with at-start language detection for: {auto_detect_languages}")
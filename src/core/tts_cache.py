@@ -0,0 +1,257 @@
+"""Content-addressed cache for synthesized translation audio"""
+
+import hashlib
+import logging
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for cache lookup
+
+    Collapses whitespace and applies Unicode NFC so trivially different
+    renderings of the same phrase share an entry. Case and punctuation are
+    kept because they change prosody.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(text: str, voice_name: str, output_format: str) -> str:
+    """
+    Build the content address for a synthesis request
+
+    Args:
+        text: Text to synthesize
+        voice_name: Synthesis voice name
+        output_format: Synthesis output format name
+
+    Returns:
+        Hex SHA-256 digest of (normalized text, voice, format)
+    """
+    payload = "\x1f".join((normalize_text(text), voice_name, output_format))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SynthesisCache:
+    """
+    Two-tier TTS cache: size-bounded in-memory LRU plus optional disk tier
+
+    Procedural phrases ("motion carries", "next item on the agenda") repeat
+    all meeting long; a hit returns the stored audio without calling the
+    speech service.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        max_disk_bytes: Optional[int] = None
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_memory_bytes: Upper bound on audio bytes held in memory
+            disk_dir: Directory for the persistent tier (None disables it)
+            max_disk_bytes: Upper bound on audio bytes kept on disk (None for unbounded)
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(path.stat().st_size for path in self._disk_entries())
+            logger.info(f"TTS disk cache at {self.disk_dir} ({self._disk_bytes} bytes)")
+
+    def _disk_path(self, key: str) -> Path:
+        """Path of a disk entry, sharded by the first two hex digits"""
+        return self.disk_dir / key[:2] / f"{key}.audio"
+
+    def _disk_entries(self):
+        """All audio files in the disk tier"""
+        return self.disk_dir.glob("*/*.audio")
+
+    def get(self, text: str, voice_name: str, output_format: str) -> Optional[bytes]:
+        """
+        Look up synthesized audio
+
+        Args:
+            text: Text that was synthesized
+            voice_name: Synthesis voice name
+            output_format: Synthesis output format name
+
+        Returns:
+            Cached audio bytes, or None on a miss
+        """
+        key = cache_key(text, voice_name, output_format)
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return audio
+
+        if self.disk_dir:
+            try:
+                audio = self._disk_path(key).read_bytes()
+            except OSError:
+                audio = None
+            if audio is not None:
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                    self._store_memory(key, audio)
+                return audio
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, text: str, voice_name: str, output_format: str, audio: bytes):
+        """
+        Store synthesized audio in both tiers
+
+        Args:
+            text: Text that was synthesized
+            voice_name: Synthesis voice name
+            output_format: Synthesis output format name
+            audio: Synthesized audio bytes
+        """
+        if not audio:
+            return
+        key = cache_key(text, voice_name, output_format)
+        with self._lock:
+            self._store_memory(key, audio)
+        if self.disk_dir:
+            self._store_disk(key, audio)
+
+    def _store_memory(self, key: str, audio: bytes):
+        """Insert into the LRU and evict least recently used entries (lock held)"""
+        if len(audio) > self.max_memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    def _store_disk(self, key: str, audio: bytes):
+        """Write an entry atomically and prune the oldest files if over budget"""
+        path = self._disk_path(key)
+        if path.exists():
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write TTS cache entry {key[:12]}: {e}")
+            return
+        with self._lock:
+            self._disk_bytes += len(audio)
+            over_budget = self.max_disk_bytes is not None and self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """Delete least recently written disk entries until under budget"""
+        entries = sorted(
+            ((entry.stat().st_mtime, entry) for entry in self._disk_entries()),
+            key=lambda item: item[0]
+        )
+        for _, entry in entries:
+            with self._lock:
+                if self._disk_bytes <= self.max_disk_bytes:
+                    return
+            try:
+                size = entry.stat().st_size
+                entry.unlink()
+            except OSError:
+                continue
+            with self._lock:
+                self._disk_bytes -= size
+                self.disk_evictions += 1
+
+    def clear(self, include_disk: bool = False):
+        """
+        Drop cached entries
+
+        Args:
+            include_disk: Also delete the persistent tier
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        if include_disk and self.disk_dir:
+            for entry in self._disk_entries():
+                entry.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_evictions": self.disk_evictions,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes
+            }
+
+
+_shared_caches: Dict[Tuple[int, Optional[str], Optional[int]], SynthesisCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_synthesis_cache(settings: Settings) -> Optional[SynthesisCache]:
+    """
+    Get the process-wide synthesis cache for the given settings
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Shared SynthesisCache, or None if caching is disabled
+    """
+    if not settings.tts_cache_enabled:
+        return None
+    max_disk_bytes = settings.tts_cache_disk_mb * 1024 * 1024 if settings.tts_cache_disk_mb else None
+    key = (settings.tts_cache_memory_mb, settings.tts_cache_dir, max_disk_bytes)
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = SynthesisCache(
+                max_memory_bytes=settings.tts_cache_memory_mb * 1024 * 1024,
+                disk_dir=settings.tts_cache_dir,
+                max_disk_bytes=max_disk_bytes
+            )
+            _shared_caches[key] = cache
+        return cache
@@ -0,0 +1,305 @@
+"""Continuous recognizers kept connected across start/pause cycles"""
+
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class KeepWarmRecognizer:
+    """
+    Continuous translation recognizer that survives pause/resume
+
+    The service connection is opened ahead of the first start (prewarm) and
+    re-opened after each pause, so resuming skips the handshake that a fresh
+    recognizer pays before its first interim result. A paused recognizer that
+    is not resumed within idle_timeout_s closes its connection and goes cold.
+
+    Event handlers are connected once; set_callbacks() swaps the targets
+    before each start. Session-stopped events caused by pause() are not
+    forwarded, since the session is expected to resume.
+    """
+
+    def __init__(
+        self,
+        translator: Any,
+        recognizer: Any,
+        idle_timeout_s: Optional[float] = 60.0,
+        connection_factory: Optional[Callable[[Any], Any]] = None
+    ):
+        """
+        Initialize the keep-warm wrapper
+
+        Args:
+            translator: AzureSpeechTranslator that owns session control and result parsing
+            recognizer: Continuous translation recognizer to keep warm
+            idle_timeout_s: Seconds a paused recognizer stays connected (None for no limit)
+            connection_factory: Builds the Connection for the recognizer
+                                (defaults to the translator's speech engine)
+        """
+        self.translator = translator
+        self.recognizer = recognizer
+        self.idle_timeout_s = idle_timeout_s
+        self._connection_factory = connection_factory or translator.engine.recognizer_connection
+        self._connection = None
+        self._connected = False
+        self._callbacks: Dict[str, Optional[Callable]] = {}
+        self._coalescer = None
+        self._wired = False
+        self._idle_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._paused = False
+        self._released = False
+        self.running = False
+
+        # Time-to-first-interim instrumentation
+        self._start_time: Optional[float] = None
+        self._start_warm = False
+        self._awaiting_first_interim = False
+        # Most recent starts only, so a long-lived recognizer doesn't grow without bound
+        self.timings: "deque[Dict[str, Any]]" = deque(maxlen=200)
+        self.starts = 0
+        self.warm_starts = 0
+        self.expirations = 0
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether the service connection is currently open"""
+        return self._connected
+
+    def set_callbacks(
+        self,
+        recognizing_callback: Optional[Callable] = None,
+        recognized_callback: Optional[Callable] = None,
+        synthesizing_callback: Optional[Callable[[bytes], None]] = None,
+        canceled_callback: Optional[Callable[[str], None]] = None,
+        session_stopped_callback: Optional[Callable[[], None]] = None
+    ):
+        """Set the callbacks used from the next start (same signatures as start_continuous_translation)"""
+        self._callbacks = {
+            "recognizing": recognizing_callback,
+            "recognized": recognized_callback,
+            "synthesizing": synthesizing_callback,
+            "canceled": canceled_callback,
+            "session_stopped": session_stopped_callback
+        }
+        if self._coalescer is not None:
+            self._coalescer.close()
+        self._coalescer = (
+            self.translator.create_interim_coalescer(recognizing_callback) if recognizing_callback else None
+        )
+        if not self._wired:
+            self._wire()
+
+    def _wire(self):
+        """Connect one dispatcher per recognizer event"""
+        self.recognizer.recognizing.connect(self._on_recognizing)
+        self.recognizer.recognized.connect(self._on_recognized)
+        self.recognizer.synthesizing.connect(
+            lambda evt: self._dispatch("synthesizing", lambda: evt.result.audio)
+        )
+        self.recognizer.canceled.connect(
+            lambda evt: self._dispatch("canceled", lambda: str(evt.cancellation_details))
+        )
+        self.recognizer.session_stopped.connect(self._on_session_stopped)
+        # _on_recognizing feeds the speculator; starts must not connect another feed
+        self.translator.register_interim_feed(self.recognizer)
+        self._wired = True
+
+    def _dispatch(self, name: str, build_arg: Callable[[], Any]):
+        """Hand an event to the current callback, if any, via the translator's callback pool"""
+        callback = self._callbacks.get(name)
+        if callback:
+            self.translator.dispatch_callback(self.recognizer, callback, build_arg(), droppable=name == "synthesizing")
+
+    def _on_recognizing(self, evt):
+        """Record time-to-first-interim, then forward the interim result"""
+        if self._awaiting_first_interim:
+            self._awaiting_first_interim = False
+            elapsed_ms = (time.perf_counter() - self._start_time) * 1000
+            self.timings.append({"warm": self._start_warm, "first_interim_ms": elapsed_ms})
+            self.starts += 1
+            self.warm_starts += self._start_warm
+            logger.info(f"First interim after {elapsed_ms:.0f}ms ({'warm' if self._start_warm else 'cold'} start)")
+        if self._coalescer is not None:
+            self._coalescer.push(self.translator._process_interim(evt.result))
+        elif self._callbacks.get("recognizing"):
+            # Interims stay on the event thread: they are frequent and their callbacks cheap
+            self._callbacks["recognizing"](self.translator._process_interim(evt.result))
+        elif self.translator.speculator is not None:
+            # Interims still feed speculative synthesis
+            self.translator._process_interim(evt.result)
+
+    def _on_recognized(self, evt):
+        """Flush the latest interim, then forward the final result"""
+        received_at = time.perf_counter()
+        if self._coalescer is not None:
+            self._coalescer.flush_final()
+        self._dispatch("recognized", lambda: self.translator._process_result(evt.result, self.recognizer, received_at))
+
+    def _on_session_stopped(self, evt):
+        """Forward session stops that are not caused by pause()"""
+        callback = self._callbacks.get("session_stopped")
+        if callback and not self._paused:
+            self.translator.dispatch_callback(self.recognizer, callback)
+
+    def _on_connected(self, evt):
+        self._connected = True
+
+    def _on_disconnected(self, evt):
+        self._connected = False
+
+    def _ensure_connection(self):
+        """Create the Connection and track its state (without opening it)"""
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._connection_factory(self.recognizer)
+                self._connection.connected.connect(self._on_connected)
+                self._connection.disconnected.connect(self._on_disconnected)
+
+    def prewarm(self) -> bool:
+        """
+        Open the service connection ahead of recognition
+
+        Returns:
+            True if the connection was opened (or is already open)
+        """
+        try:
+            self._ensure_connection()
+            with self._lock:
+                self._connection.open(True)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not pre-open recognizer connection: {e}")
+            return False
+
+    def _begin_start(self):
+        """Cancel any idle expiry and arm the first-interim timer"""
+        if self._released:
+            raise RuntimeError("Recognizer has been released")
+        self._cancel_idle_timer()
+        try:
+            # Observe the connection the start opens, so a later resume counts as warm
+            self._ensure_connection()
+        except Exception as e:
+            logger.warning(f"Could not track recognizer connection: {e}")
+        self._paused = False
+        self._start_warm = self.is_warm
+        self._start_time = time.perf_counter()
+        self._awaiting_first_interim = True
+
+    def start(self):
+        """Start or resume continuous translation (blocking)"""
+        self._begin_start()
+        self.translator.start_continuous_translation(self.recognizer)
+        self.running = True
+
+    async def start_async(self, timeout: Optional[float] = 10.0):
+        """Start or resume continuous translation and await the session start"""
+        self._begin_start()
+        await self.translator.start_continuous_translation_async(self.recognizer, timeout=timeout)
+        self.running = True
+
+    def pause(self):
+        """Stop recognition but keep the recognizer and its connection (blocking)"""
+        if not self.running:
+            return
+        self._paused = True
+        self.translator.stop_continuous_translation(self.recognizer)
+        self._after_pause()
+
+    async def pause_async(self, timeout: Optional[float] = 5.0):
+        """Stop recognition but keep the recognizer and its connection"""
+        if not self.running:
+            return
+        self._paused = True
+        await self.translator.stop_continuous_translation_async(self.recognizer, timeout=timeout)
+        self._after_pause()
+
+    def _after_pause(self):
+        """Re-open the connection and start the idle timer"""
+        self.running = False
+        self._awaiting_first_interim = False
+        if self._coalescer is not None:
+            # The next burst starts a new utterance
+            self._coalescer.flush_final()
+        self.prewarm()
+        if self.idle_timeout_s is not None:
+            self._idle_timer = threading.Timer(self.idle_timeout_s, self._expire)
+            self._idle_timer.daemon = True
+            self._idle_timer.start()
+
+    def _cancel_idle_timer(self):
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _expire(self):
+        """Idle timeout: close the connection so the next start is cold"""
+        if self.running:
+            return
+        self.expirations += 1
+        logger.info(f"Recognizer idle for {self.idle_timeout_s}s, closing its connection")
+        self._close_connection()
+
+    def _close_connection(self):
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._connection.close()
+                except Exception as e:
+                    logger.warning(f"Error closing recognizer connection: {e}")
+            self._connected = False
+
+    def close(self):
+        """Stop recognition and close the connection (blocking)"""
+        self._cancel_idle_timer()
+        if self.running:
+            self.running = False
+            self.translator.stop_continuous_translation(self.recognizer)
+        self._close_connection()
+
+    async def close_async(self, timeout: Optional[float] = 5.0):
+        """Stop recognition and close the connection"""
+        self._cancel_idle_timer()
+        if self.running:
+            self.running = False
+            await self.translator.stop_continuous_translation_async(self.recognizer, timeout=timeout)
+        self._close_connection()
+
+    def release(self):
+        """
+        Disconnect every handler and drop the callbacks (after close)
+
+        The recognizer, its connection and whatever the callbacks close over
+        become collectable; the wrapper cannot be started again.
+        """
+        self._cancel_idle_timer()
+        if self._coalescer is not None:
+            self._coalescer.close()
+            self._coalescer = None
+        self._callbacks = {}
+        with self._lock:
+            if self._connection is not None:
+                self._connection.connected.disconnect_all()
+                self._connection.disconnected.disconnect_all()
+                self._connection = None
+        self.translator.release_recognizer(self.recognizer)
+        self._wired = False
+        self._released = True
+
+    def stats(self) -> Dict[str, Any]:
+        """Get start counts and mean cold/warm time-to-first-interim over recent starts"""
+        cold = [t["first_interim_ms"] for t in self.timings if not t["warm"]]
+        warm = [t["first_interim_ms"] for t in self.timings if t["warm"]]
+        return {
+            "starts": self.starts,
+            "warm_starts": self.warm_starts,
+            "expirations": self.expirations,
+            "cold_first_interim_ms": statistics.mean(cold) if cold else None,
+            "warm_first_interim_ms": statistics.mean(warm) if warm else None
+        }
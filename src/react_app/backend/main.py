@@ -5,20 +5,33 @@ Provides WebSocket support for real-time audio streaming and translation
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict
+from typing import Callable, Iterable, List, Optional, Dict, Set, Tuple, Union
 import logging
 import sys
 from pathlib import Path
 import asyncio
+import base64
+import itertools
+import json
+import time
 
 # Add parent directories to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from src.core.config import get_settings, SUPPORTED_LANGUAGES, NEURAL_VOICES
-from src.core.translator import AzureSpeechTranslator, LiveInterpreterTranslator, TranslationResult
-import azure.cognitiveservices.speech as speechsdk
+from src.core.audio_formats import parse_audio_format
+from src.core.audio_frames import BINARY_SUBPROTOCOL, JSON_SUBPROTOCOL, FrameKind, decode_frame, encode_frame
+from src.core.message_codec import MSGPACK_SUBPROTOCOL, EncodedMessage, MessageCodec, get_codec, msgpack_available
+from src.core.translator import AzureSpeechTranslator, InterimResult, LiveInterpreterTranslator, TranslationResult
+from src.core.session import TranslationSession
+from src.core.executor import get_callback_executor, get_synthesis_executor
+from src.core.metrics import get_latency_metrics, render_metric
+from src.core.speculative import get_speculation_stats
+from src.core.rooms import Room, RoomError, RoomRegistry
+from src.core.subscriptions import ALL_LANGUAGES, Subscription, audio_languages, get_synthesis_demand
+from src.core.outbound import SLOW_CONSUMER_CLOSE_CODE, Outbound, OutboundQueue, get_outbound_stats
 
 # Configure logging
 logging.basicConfig(
@@ -59,6 +72,8 @@ class LanguageConfig(BaseModel):
     use_live_interpreter: bool = False
     use_continuous_mode: bool = True
     voice_preferences: Optional[Dict[str, str]] = None
+    stream_audio: bool = False  # Send synthesized audio as audio_chunk messages while it renders
+    audio_source: str = "microphone"  # "stream" to translate audio chunks sent by the client
 
 class TranslationResponse(BaseModel):
     """Translation result response"""
@@ -68,6 +83,7 @@ class TranslationResponse(BaseModel):
     timestamp: str
     duration_ms: int
     synthesized_audio: Optional[Dict[str, str]] = None  # Base64 encoded audio per language
+    utterance_id: Optional[int] = None  # Correlates streamed audio_chunk messages
 
 class HealthResponse(BaseModel):
     """Health check response"""
@@ -76,36 +92,228 @@ class HealthResponse(BaseModel):
     azure_region: str
     live_interpreter_enabled: bool
 
+# Recipients with the encoded messages and audio frames each gets
+Deliveries = List[Tuple[WebSocket, List[Outbound]]]
+# Builds what one codec and subscription get: a message, an audio frame, or a list of both
+MessageBuilder = Callable[[MessageCodec, Subscription], Union[dict, bytes, List[Union[dict, bytes]]]]
+
 # In-memory connection manager
 class ConnectionManager:
     """Manage WebSocket connections"""
     
     def __init__(self):
         self.active_connections: List[WebSocket] = []
-        self.translators: Dict[WebSocket, AzureSpeechTranslator] = {}
+        self.sessions: Dict[WebSocket, TranslationSession] = {}
+        self.codecs: Dict[WebSocket, MessageCodec] = {}
+        self.subscriptions: Dict[WebSocket, Subscription] = {}
+        self.rooms = RoomRegistry()
+        self.outbound: Dict[WebSocket, OutboundQueue] = {}
+        self.closing: Set[asyncio.Task] = set()  # Slow connections being closed, kept until done
+    
+    def supported_subprotocols(self) -> List[str]:
+        """Subprotocols this server can speak"""
+        subprotocols = [JSON_SUBPROTOCOL]
+        if settings.websocket_binary_frames:
+            subprotocols.append(BINARY_SUBPROTOCOL)
+        if msgpack_available():
+            subprotocols.append(MSGPACK_SUBPROTOCOL)
+        return subprotocols
     
-    async def connect(self, websocket: WebSocket):
-        """Accept new WebSocket connection"""
-        await websocket.accept()
+    async def connect(self, websocket: WebSocket) -> bool:
+        """
+        Accept new WebSocket connection, negotiating its wire format
+        
+        The first subprotocol the client offered that the server supports is
+        accepted; a client offering none gets plain JSON. A client offering
+        only unsupported subprotocols is refused rather than being sent JSON
+        under a name it would decode differently (clients should also offer
+        live-interpreter.json.v1 as a fallback).
+        
+        Returns:
+            False if the handshake was refused
+        """
+        offered = websocket.scope.get("subprotocols", [])
+        supported = self.supported_subprotocols()
+        subprotocol = next((name for name in offered if name in supported), None)
+        if subprotocol is None and offered:
+            logger.warning(f"Refused connection offering only unsupported subprotocols: {offered}")
+            await websocket.close(code=1002)
+            return False
+        await websocket.accept(subprotocol=subprotocol)
         self.active_connections.append(websocket)
-        logger.info(f"New connection. Total connections: {len(self.active_connections)}")
+        self.codecs[websocket] = get_codec(subprotocol)
+        # Everything sent to the connection goes through its queue and single writer
+        self.outbound[websocket] = OutboundQueue(
+            lambda item: self._write(websocket, item),
+            lambda: self._track(asyncio.create_task(self._close_slow(websocket))),
+            max_messages=settings.outbound_queue_max_messages,
+            max_bytes=int(settings.outbound_queue_max_mb * 1024 * 1024)
+        )
+        logger.info(f"New connection ({subprotocol or 'json'}). Total connections: {len(self.active_connections)}")
+        return True
     
     def disconnect(self, websocket: WebSocket):
-        """Remove WebSocket connection"""
+        """Remove WebSocket connection (its session is closed by the endpoint)"""
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
-        if websocket in self.translators:
-            del self.translators[websocket]
+        self.sessions.pop(websocket, None)
+        self.codecs.pop(websocket, None)
+        self.subscriptions.pop(websocket, None)
+        queue = self.outbound.pop(websocket, None)
+        if queue is not None:
+            queue.close()
         logger.info(f"Connection closed. Total connections: {len(self.active_connections)}")
     
-    async def send_message(self, websocket: WebSocket, message: dict):
-        """Send message to specific websocket"""
+    def codec(self, websocket: WebSocket) -> MessageCodec:
+        """Codec negotiated for a websocket"""
+        return self.codecs.get(websocket) or get_codec()
+    
+    def subscription(self, websocket: WebSocket) -> Subscription:
+        """Languages a websocket receives (every language until it subscribes)"""
+        return self.subscriptions.get(websocket, ALL_LANGUAGES)
+    
+    def subscribe(self, websocket: WebSocket, subscription: Subscription):
+        """Set the languages a websocket receives text and audio for"""
+        self.subscriptions[websocket] = subscription
+    
+    def encode(self, websocket: WebSocket, message: dict) -> EncodedMessage:
+        """Serialize a message for a websocket; safe to call from worker threads to keep the loop free"""
+        return self.codec(websocket).encode(message)
+    
+    async def send_message(self, websocket: WebSocket, message: Union[dict, EncodedMessage]):
+        """Queue message (a dict or one already encoded for this websocket's codec) for specific websocket"""
+        if isinstance(message, dict):
+            message = self.encode(websocket, message)
+        self.enqueue([(websocket, [message])])
+    
+    def prepare(self, websockets: Iterable[WebSocket], message: Union[dict, MessageBuilder]) -> Deliveries:
+        """
+        Serialize a message once per codec and subscription for several websockets
+        
+        Safe to call from worker threads, which keeps serialization off the event loop.
+        
+        Args:
+            websockets: Recipients
+            message: The message, or a function building it for a codec and
+                     subscription: a message, an audio frame, or a list of
+                     both to send in order (empty to send nothing)
+        
+        Returns:
+            Each websocket with the encoded messages and frames it gets
+        """
+        encoded: Dict[object, List[Outbound]] = {}
+        deliveries = []
+        for websocket in websockets:
+            codec = self.codec(websocket)
+            if callable(message):
+                subscription = self.subscription(websocket)
+                key = (codec, subscription)
+            else:
+                key = codec
+            if key not in encoded:
+                built = message(codec, subscription) if callable(message) else message
+                encoded[key] = [
+                    codec.encode(item) if isinstance(item, dict) else item
+                    for item in (built if isinstance(built, list) else [built])
+                ]
+            if encoded[key]:
+                deliveries.append((websocket, encoded[key]))
+        return deliveries
+    
+    def enqueue(self, deliveries: Deliveries, on_sent: Optional[Callable[[], None]] = None):
+        """
+        Queue prepared messages for their recipients without waiting for them to be written
+        
+        Must run on the event loop; worker threads hand deliveries over with
+        loop.call_soon_threadsafe, so nothing piles up but the bounded queues.
+        
+        Args:
+            deliveries: Recipients and their messages, from prepare
+            on_sent: Called once the first recipient's messages are written
+        """
+        for i, (websocket, items) in enumerate(deliveries):
+            queue = self.outbound.get(websocket)
+            if queue is not None:
+                queue.put_all(items, on_sent if i == 0 else None)
+    
+    async def deliver(self, deliveries: Deliveries):
+        """Queue prepared messages for all recipients"""
+        self.enqueue(deliveries)
+    
+    async def broadcast(self, websockets: Iterable[WebSocket], message: Union[dict, MessageBuilder]):
+        """
+        Send one message to several websockets, serializing it once per codec
+        
+        Args:
+            websockets: Recipients
+            message: The message, or a function building it for a codec and
+                     subscription (for fields such as audio that differ)
+        """
+        await self.deliver(self.prepare(websockets, message))
+    
+    def send_timed(
+        self,
+        deliveries: Deliveries,
+        enqueued_at: float,
+        speech_end: Optional[float] = None,
+        languages: Iterable[str] = ()
+    ):
+        """
+        Queue prepared messages, recording send latency and end-to-end latency for the languages they carry
+        
+        Latency is taken when the first recipient (the presenter) has been sent
+        its copy; listeners' writers proceed at their own pace.
+        """
+        def on_sent():
+            sent_at = time.perf_counter()
+            latency_metrics.observe("send", None, sent_at - enqueued_at)
+            for lang in languages:
+                latency_metrics.observe_interval("end_to_end", lang, speech_end, sent_at)
+        
+        self.enqueue(deliveries, on_sent)
+    
+    async def flush(self, websocket: WebSocket, timeout: float = 5.0) -> bool:
+        """Wait until a websocket's queued messages are written, e.g. before closing it"""
+        queue = self.outbound.get(websocket)
+        return queue is not None and await queue.flush(timeout)
+    
+    async def _write(self, websocket: WebSocket, item: Outbound):
+        """Write one message or frame; only the connection's outbound writer calls this"""
+        if isinstance(item, bytes):
+            await websocket.send_bytes(item)
+        elif item.binary:
+            await websocket.send_bytes(item.data)
+        else:
+            await websocket.send_text(item.data)
+    
+    def _track(self, task: asyncio.Task):
+        """Keep a background task referenced until it finishes"""
+        self.closing.add(task)
+        task.add_done_callback(self.closing.discard)
+    
+    async def _close_slow(self, websocket: WebSocket):
+        """Close a connection whose outbound queue overflowed; its endpoint then cleans up"""
         try:
-            await websocket.send_json(message)
+            await asyncio.wait_for(websocket.close(code=SLOW_CONSUMER_CLOSE_CODE), timeout=5)
         except Exception as e:
-            logger.error(f"Error sending message: {e}")
+            logger.info(f"Error closing slow connection: {e}")
+    
+    def outbound_stats(self) -> Dict[str, int]:
+        """Queued messages and bytes across connections, plus the process-wide send and drop counters"""
+        queues = list(self.outbound.values())
+        return {
+            "queued_messages": sum(queue.depth for queue in queues),
+            "queued_bytes": sum(queue.queued_bytes for queue in queues),
+            "max_depth": max((queue.depth for queue in queues), default=0),
+            "peak_depth": max((queue.peak_depth for queue in queues), default=0),
+            **get_outbound_stats().stats()
+        }
 
 manager = ConnectionManager()
+latency_metrics = get_latency_metrics()
+synthesis_demand = get_synthesis_demand()
+session_ids = itertools.count(1)  # Identifies connections in binary frame headers
+PCM16_FORMAT = parse_audio_format("raw")  # Recognizer synthesizing events carry 16 kHz 16-bit mono PCM
 
 # REST API Endpoints
 @app.get("/", response_model=HealthResponse)
@@ -148,6 +356,98 @@ async def get_config():
         "auto_detect_enabled": settings.enable_auto_detect
     }
 
+@app.get("/stats")
+async def get_stats():
+    """Get connection counts, shared worker pool metrics, outbound queues and speculative synthesis counters"""
+    callback_executor = get_callback_executor(settings)
+    return {
+        "connections": len(manager.active_connections),
+        "sessions": len(manager.sessions),
+        "rooms": manager.rooms.stats(),
+        "process_cpu_s": time.process_time(),
+        "callback_executor": callback_executor.stats() if callback_executor else None,
+        "synthesis_executor": get_synthesis_executor(settings).stats(),
+        "speculative_synthesis": get_speculation_stats().stats() if settings.speculative_synthesis else None,
+        "synthesis_demand": synthesis_demand.stats(),
+        "outbound": manager.outbound_stats()
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus metrics: per-utterance stage latency histograms, worker pools and connections"""
+    executors = {"synthesis": get_synthesis_executor(settings)}
+    callback_executor = get_callback_executor(settings)
+    if callback_executor is not None:
+        executors["callback"] = callback_executor
+    executor_stats = {name: executor.stats() for name, executor in executors.items()}
+    outbound = manager.outbound_stats()
+    
+    parts = [
+        latency_metrics.render_prometheus(),
+        render_metric("connections", "gauge", "Open WebSocket connections", [({}, len(manager.active_connections))]),
+        render_metric("room_listeners", "gauge", "Listeners subscribed to broadcast rooms",
+                      [({}, manager.rooms.stats()["listeners"])]),
+        render_metric("final_syntheses_total", "counter", "Final translations by whether anyone subscribed to their audio", [
+            ({"outcome": outcome}, count) for outcome, count in synthesis_demand.stats().items()
+        ]),
+        render_metric("outbound_queued_messages", "gauge", "Messages waiting in connections' outbound queues",
+                      [({}, outbound["queued_messages"])]),
+        render_metric("outbound_queued_bytes", "gauge", "Bytes waiting in connections' outbound queues",
+                      [({}, outbound["queued_bytes"])]),
+        render_metric("outbound_queue_max_depth", "gauge", "Messages waiting in the deepest outbound queue",
+                      [({}, outbound["max_depth"])]),
+        render_metric("outbound_messages_sent_total", "counter", "Messages and frames written by outbound writers",
+                      [({}, outbound["sent"])]),
+        render_metric("outbound_dropped_total", "counter", "Interim results dropped before sending", [
+            ({"reason": "stale"}, outbound["dropped_stale"]),
+            ({"reason": "queue_full"}, outbound["dropped_full"])
+        ]),
+        render_metric("outbound_slow_disconnects_total", "counter", "Connections closed for falling too far behind",
+                      [({}, outbound["slow_disconnects"])]),
+        render_metric("executor_workers", "gauge", "Worker threads per shared executor",
+                      [({"executor": name}, stats["workers"]) for name, stats in executor_stats.items()]),
+        render_metric("executor_busy", "gauge", "Tasks running per shared executor",
+                      [({"executor": name}, stats["busy"]) for name, stats in executor_stats.items()]),
+        render_metric("executor_queued", "gauge", "Tasks waiting per shared executor",
+                      [({"executor": name}, stats["queued"]) for name, stats in executor_stats.items()]),
+        render_metric("executor_tasks_total", "counter", "Tasks by outcome per shared executor", [
+            ({"executor": name, "outcome": outcome}, stats[outcome])
+            for name, stats in executor_stats.items()
+            for outcome in ("completed", "failed", "rejected", "discarded")
+        ])
+    ]
+    if settings.speculative_synthesis:
+        speculation = get_speculation_stats().stats()
+        parts += [
+            render_metric("speculative_segments_total", "counter", "Speculatively synthesized segments by outcome", [
+                ({"outcome": outcome}, speculation[f"segments_{outcome}"]) for outcome in ("started", "used", "wasted")
+            ]),
+            render_metric("speculative_finals_total", "counter", "Final translations by speculation result", [
+                ({"result": result}, speculation[name])
+                for result, name in (("all", "finals"), ("speculated", "finals_speculated"), ("complete", "finals_complete"))
+            ]),
+            render_metric("speculative_saved_seconds_total", "counter", "Estimated synthesis wait removed by speculation",
+                          [({}, speculation["saved_s_total"])])
+        ]
+    return PlainTextResponse("".join(parts), media_type="text/plain; version=0.0.4")
+
+async def handle_subscribe(websocket: WebSocket, data) -> bool:
+    """Apply a subscribe message and confirm it, or tell the client why it was refused"""
+    try:
+        subscription = Subscription.from_message(data)
+    except ValueError as e:
+        await manager.send_message(websocket, {
+            "type": "error",
+            "data": {"message": str(e)}
+        })
+        return False
+    manager.subscribe(websocket, subscription)
+    await manager.send_message(websocket, {
+        "type": "subscribed",
+        "data": subscription.describe()
+    })
+    return True
+
 # WebSocket endpoint for real-time translation
 @app.websocket("/ws/translate")
 async def websocket_translate(websocket: WebSocket):
@@ -158,13 +458,85 @@ async def websocket_translate(websocket: WebSocket):
     1. Client connects
     2. Client sends config: {"type": "config", "data": {...}}
     3. Client sends audio chunks: {"type": "audio", "data": <base64 audio>}
+       (16 kHz 16-bit mono PCM, used when the config has "audio_source": "stream";
+       otherwise the server's default microphone is used)
     4. Server sends translations: {"type": "translation", "data": {...}}
     5. Server sends audio: {"type": "audio", "data": <base64 audio>}
+       With RECOGNIZER_KEEP_WARM, the recognizer connection is opened at config
+       time and "stop_recording" pauses it, so the next "start_recording"
+       resumes without a new service handshake
+    6. With "stream_audio" in the config, synthesized audio follows each
+       "recognized" message as {"type": "audio_chunk", "data": {"utterance_id",
+       "language", "sequence", "audio", "format", "final"}} messages
+    7. "audio_format" in the config picks the synthesis output format for the
+       session ("opus", "mp3", "pcm-8k", ... or an SDK format name); results
+       carry "audio_format" and "audio_mime_type" for decoding
+    8. Clients offering the "live-interpreter.binary.v1" subprotocol get audio
+       as binary frames (see src/core/audio_frames.py) instead of base64 in
+       JSON: one CLIP frame per language after each "recognized" message,
+       CHUNK frames in place of "audio_chunk" and SYNTHESIZING frames in place
+       of "audio". They may upload INPUT frames instead of "audio" messages.
+       JSON stays for control and text messages; "connected" reports the
+       choice as "binary_frames" along with the frames' "session_id"
+    9. With msgpack installed, clients offering "live-interpreter.msgpack.v1"
+       exchange every message as MessagePack in binary WebSocket messages, with
+       audio fields as raw bytes instead of base64. "connected" reports the
+       wire format as "encoding"
+    10. "room" in the config presents this session to a broadcast room: its
+       interim and final results and audio also go to every connection on
+       /ws/listen/{room}, each in its own negotiated format. Recognition,
+       translation and synthesis happen once for the whole room
+    11. {"type": "subscribe", "data": {"languages": [...], "audio": bool}}
+       limits the text and audio this client gets to those languages (all
+       languages, with audio, until it subscribes). Only languages some
+       client in the session or room plays are synthesized
+    12. Messages to each client wait in a bounded queue drained by one writer.
+       A queued "recognizing" message is replaced by the next one and dropped
+       while the queue is full; a client whose finals and audio exceed
+       OUTBOUND_QUEUE_MAX_MESSAGES or OUTBOUND_QUEUE_MAX_MB is closed with
+       code 1013
     """
-    await manager.connect(websocket)
+    if not await manager.connect(websocket):
+        return
+    codec = manager.codec(websocket)
+    session_id = next(session_ids)
     
+    # The session owns the translator, recognizer, handlers and client audio stream
+    session: Optional[TranslationSession] = None
     translator: Optional[AzureSpeechTranslator] = None
-    recognizer: Optional[speechsdk.translation.TranslationRecognizer] = None
+    stream_audio = False
+    utterance_ids = itertools.count(1)
+    room: Optional[Room] = None  # Broadcast room this connection presents to
+    
+    def audience():
+        """Recipients of results: this connection and its room's listeners"""
+        return room.audience(websocket) if room is not None else (websocket,)
+    
+    def update_synthesis_languages():
+        """Synthesize only the languages someone in the audience plays"""
+        if translator is not None:
+            translator.set_synthesis_languages(audio_languages(manager.subscription(ws) for ws in audience()))
+    
+    def create_recognizer(push_stream):
+        """Build a recognizer for the configured audio source"""
+        if push_stream is not None:
+            # Client uploads PCM; the session's feeder buffers it into the push stream
+            return translator.create_recognizer_from_stream(push_stream)
+        return translator.create_recognizer_from_microphone()
+    
+    async def feed_audio(audio: bytes):
+        """Pass uploaded microphone audio to the session's stream"""
+        if session is None or not session.stream_input:
+            await manager.send_message(websocket, {
+                "type": "error",
+                "data": {"message": "Not recording from a client audio stream"}
+            })
+            return
+        if not session.running:
+            # Paused: audio between bursts is not translated
+            return
+        # Waits while the buffer is full, which throttles the receive loop
+        await session.feed(audio)
     
     try:
         # Send welcome message
@@ -172,13 +544,36 @@ async def websocket_translate(websocket: WebSocket):
             "type": "connected",
             "data": {
                 "message": "Connected to Azure Live Interpreter API",
-                "server_version": "1.0.0"
+                "server_version": "1.0.0",
+                "session_id": session_id,
+                "binary_frames": codec.frames,
+                "encoding": codec.name
             }
         })
         
         while True:
             # Receive message from client
-            data = await websocket.receive_json()
+            received = await websocket.receive()
+            if received["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(received.get("code", 1000))
+            if received.get("bytes") is not None and codec.binary:
+                data = codec.decode(received["bytes"])
+            elif received.get("bytes") is not None:
+                try:
+                    frame = decode_frame(received["bytes"])
+                except ValueError as e:
+                    await manager.send_message(websocket, {
+                        "type": "error",
+                        "data": {"message": str(e)}
+                    })
+                    continue
+                if frame.kind == FrameKind.INPUT:
+                    await feed_audio(frame.payload)
+                else:
+                    logger.warning(f"Unexpected audio frame from client: {frame.kind.name}")
+                continue
+            else:
+                data = json.loads(received["text"])
             message_type = data.get("type")
             message_data = data.get("data", {})
             
@@ -189,146 +584,322 @@ async def websocket_translate(websocket: WebSocket):
                 use_live_interpreter = message_data.get("use_live_interpreter", False)
                 use_continuous_mode = message_data.get("use_continuous_mode", True)
                 source_lang = message_data.get("source_language")
-                target_langs = message_data.get("target_languages", [settings.target_language])[:3]  # Max 3 languages
+                target_langs = message_data.get("target_languages") or []
                 voice_preferences = message_data.get("voice_preferences", {})
+                stream_audio = message_data.get("stream_audio", False)
+                audio_source = message_data.get("audio_source", "microphone")
+                audio_format = message_data.get("audio_format")
+                room_id = message_data.get("room")
+                
+                # Present to a broadcast room; another presenter keeps it
+                if room_id and (room is None or room.room_id != str(room_id)):
+                    try:
+                        new_room = manager.rooms.present(str(room_id), websocket)
+                    except RoomError as e:
+                        await manager.send_message(websocket, {
+                            "type": "error",
+                            "data": {"message": str(e)}
+                        })
+                        continue
+                    if room is not None:
+                        manager.rooms.release(room, websocket)
+                    room = new_room
+                    # Listeners joining, leaving or subscribing change what is synthesized
+                    room.on_audience_change = update_synthesis_languages
+                elif not room_id and room is not None:
+                    manager.rooms.release(room, websocket)
+                    room = None
                 
-                # Update settings temporarily for this connection
-                settings.source_language = source_lang or settings.source_language
-                settings.target_language = target_langs[0] if target_langs else settings.target_language
-                settings.target_language_2 = target_langs[1] if len(target_langs) > 1 else None
-                settings.target_language_3 = target_langs[2] if len(target_langs) > 2 else None
+                # This connection's languages and voices; the shared settings stay untouched
+                session_settings = settings.for_session(
+                    source_language=source_lang,
+                    target_languages=target_langs,
+                    voices=voice_preferences
+                )
+                target_langs = session_settings.target_languages  # Max 3 languages
                 
-                # Apply voice preferences
-                for lang, voice in voice_preferences.items():
-                    voice_attr = f"voice_{lang.lower().replace('-', '_')}"
-                    if hasattr(settings, voice_attr):
-                        setattr(settings, voice_attr, voice)
-                        logger.info(f"Set voice for {lang}: {voice}")
+                # Release the previous session's recognizer and synthesizers before replacing them
+                if session is not None:
+                    await session.close_async()
+                    session = None
                 
                 # Create translator
-                if use_live_interpreter and settings.enable_live_interpreter:
-                    translator = LiveInterpreterTranslator(settings)
+                if use_live_interpreter and session_settings.enable_live_interpreter:
+                    translator = LiveInterpreterTranslator(session_settings)
                     logger.info(f"Created Live Interpreter translator with {len(target_langs)} target languages")
                 else:
-                    translator = AzureSpeechTranslator(settings)
+                    translator = AzureSpeechTranslator(session_settings)
                     logger.info("Created standard translator")
                 
-                manager.translators[websocket] = translator
+                if audio_format:
+                    try:
+                        translator.set_audio_format(audio_format)
+                    except ValueError as e:
+                        # Keep the server default and tell the client
+                        await manager.send_message(websocket, {
+                            "type": "error",
+                            "data": {"message": str(e)}
+                        })
+                
+                update_synthesis_languages()
                 
+                session = TranslationSession(
+                    translator,
+                    create_recognizer,
+                    stream_input=audio_source == "stream",
+                    idle_timeout_s=session_settings.recognizer_idle_timeout_s
+                )
+                manager.sessions[websocket] = session
+                logger.info(f"Speech config factory: {translator.config_factory.stats()}")
+                
+                # Pre-create synthesizers so the first utterance skips connection setup
+                if session_settings.prewarm_synthesizers:
+                    await asyncio.get_event_loop().run_in_executor(
+                        None, translator.warm_synthesizers, target_langs
+                    )
+                
+                # Open the recognizer's service connection before the first start
+                if session_settings.recognizer_keep_warm:
+                    await session.prewarm_async()
+                
+                confirmed = {
+                    "use_live_interpreter": use_live_interpreter,
+                    "use_continuous_mode": use_continuous_mode,
+                    "source_language": session_settings.source_language,
+                    "target_languages": target_langs,
+                    "stream_audio": stream_audio,
+                    "audio_source": audio_source,
+                    "audio_format": translator.audio_format.name,
+                    "audio_mime_type": translator.audio_format.mime_type,
+                    "room": room.room_id if room is not None else None
+                }
                 await manager.send_message(websocket, {
                     "type": "config_confirmed",
-                    "data": {
-                        "use_live_interpreter": use_live_interpreter,
-                        "use_continuous_mode": use_continuous_mode,
-                        "source_language": settings.source_language,
-                        "target_languages": target_langs
-                    }
+                    "data": confirmed
                 })
+                if room is not None:
+                    # Listeners need the languages and audio format to follow along
+                    room.config = {**confirmed, "session_id": session_id}
+                    await manager.broadcast(room.listeners, {"type": "room_config", "data": room.config})
             
             elif message_type == "start_recording":
                 # Start continuous translation
                 logger.info("Starting continuous translation")
                 
-                if translator is None:
+                if session is None:
                     await manager.send_message(websocket, {
                         "type": "error",
                         "data": {"message": "Translator not configured. Send config first."}
                     })
                     continue
                 
-                # Create recognizer
-                recognizer = translator.create_recognizer_from_microphone()
+                if session.running:
+                    await manager.send_message(websocket, {
+                        "type": "error",
+                        "data": {"message": "Recording already started"}
+                    })
+                    continue
+                
+                # The session reuses the pre-opened or paused recognizer, rebuilding it
+                # when the adaptive language candidates changed since the last burst
+                was_warm = session.is_warm
                 
                 # Get the event loop for callbacks
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 
                 # Set up callbacks
-                def on_recognizing(result: TranslationResult):
+                # Callbacks run on worker threads: messages are serialized there and
+                # handed to the event loop only to be queued for each connection's writer
+                # Results go to the room's listeners too, serialized once per codec and
+                # subscription; each client gets only the languages it subscribed to
+                def on_recognizing(result: InterimResult):
                     """Send interim results"""
-                    asyncio.run_coroutine_threadsafe(
-                        manager.send_message(websocket, {
+                    loop.call_soon_threadsafe(
+                        manager.enqueue,
+                        manager.prepare(audience(), lambda codec, subscription: {
                             "type": "recognizing",
                             "data": {
                                 "original_text": result.original_text,
-                                "translations": result.translations,
+                                "translations": subscription.translations(result.translations),
                                 "detected_language": result.detected_language
                             }
-                        }),
-                        loop
+                        })
                     )
                 
                 def on_recognized(result: TranslationResult):
                     """Send final results"""
-                    # Synthesize audio for translations
-                    synthesized_audio = {}
-                    if result.translations:
-                        logger.info(f"Synthesizing audio for {len(result.translations)} translations")
-                        for lang, text in result.translations.items():
-                            try:
-                                audio_bytes = translator.synthesize_translation(text, lang)
-                                if audio_bytes:
-                                    import base64
-                                    synthesized_audio[lang] = base64.b64encode(audio_bytes).decode('utf-8')
-                                    logger.info(f"Synthesized {len(audio_bytes)} bytes for {lang}")
-                            except Exception as e:
-                                logger.error(f"Error synthesizing audio for {lang}: {e}")
+                    utterance_id = next(utterance_ids)
+                    speech_end = result.marks.get("speech_end")
+                    source_language = result.detected_language or translator.settings.source_language
+                    if room is not None:
+                        room.utterances += 1
+                    # Languages nobody plays are not synthesized
+                    targets = translator.synthesis_targets(result.translations)
+                    synthesis_demand.count(
+                        sum(1 for text in targets.values() if text),
+                        sum(1 for lang, text in result.translations.items() if text and lang not in targets)
+                    )
                     
-                    asyncio.run_coroutine_threadsafe(
-                        manager.send_message(websocket, {
+                    def recognized_message(
+                        subscription: Subscription,
+                        synthesized_audio: Dict[str, Union[str, bytes]]
+                    ) -> dict:
+                        return {
                             "type": "recognized",
                             "data": {
+                                "utterance_id": utterance_id,
                                 "original_text": result.original_text,
-                                "translations": result.translations,
+                                "translations": subscription.translations(result.translations),
                                 "detected_language": result.detected_language,
                                 "timestamp": result.timestamp.isoformat(),
                                 "duration_ms": result.duration_ms,
-                                "synthesized_audio": synthesized_audio
+                                "synthesized_audio": synthesized_audio,
+                                "audio_format": translator.audio_format.name,
+                                "audio_mime_type": translator.audio_format.mime_type
                             }
-                        }),
-                        loop
-                    )
+                        }
+                    
+                    def send_audio_chunk(lang: str, sequence: int, chunk: bytes, final: bool = False, error: Optional[str] = None):
+                        # The first chunk of a language is when its listeners start hearing it
+                        first_audio = sequence == 0 and bool(chunk)
+                        
+                        def chunk_message(codec: MessageCodec, subscription: Subscription) -> Union[dict, bytes, list]:
+                            if not subscription.wants_audio(lang):
+                                return []
+                            if codec.frames:
+                                return encode_frame(
+                                    FrameKind.CHUNK, chunk, session_id, utterance_id, sequence, lang,
+                                    translator.audio_format, final=final, error=error
+                                )
+                            return {
+                                "type": "audio_chunk",
+                                "data": {
+                                    "utterance_id": utterance_id,
+                                    "language": lang,
+                                    "sequence": sequence,
+                                    "audio": codec.audio(chunk),
+                                    "format": translator.audio_format.name,
+                                    "mime_type": translator.audio_format.mime_type,
+                                    "final": final,
+                                    "error": error
+                                }
+                            }
+                        
+                        loop.call_soon_threadsafe(
+                            manager.send_timed,
+                            manager.prepare(audience(), chunk_message), time.perf_counter(),
+                            speech_end, [lang] if first_audio else ()
+                        )
+                    
+                    if stream_audio and result.translations:
+                        # Runs on a shared callback worker, so blocking on synthesis here
+                        # does not hold up the SDK event thread.
+                        # Text goes out immediately; audio follows chunk by chunk as it renders
+                        latency_metrics.observe_interval(
+                            "queue", source_language, result.marks.get("translated"), time.perf_counter()
+                        )
+                        loop.call_soon_threadsafe(
+                            manager.send_timed,
+                            manager.prepare(audience(), lambda codec, subscription: recognized_message(subscription, {})),
+                            time.perf_counter()
+                        )
+                        chunk_counts: Dict[str, int] = {}
+                        
+                        def forward_chunk(lang: str, sequence: int, chunk: bytes):
+                            chunk_counts[lang] = sequence + 1
+                            send_audio_chunk(lang, sequence, chunk)
+                        
+                        outcomes = translator.stream_synthesized_translations(targets, forward_chunk)
+                        for lang, outcome in outcomes.items():
+                            # Empty final chunk marks the end of this language's stream
+                            send_audio_chunk(lang, chunk_counts.get(lang, 0), b"", final=True, error=outcome.error)
+                        return
+                    
+                    async def synthesize_and_send():
+                        # Runs on the event loop: synthesis is awaited, not blocked on
+                        latency_metrics.observe_interval(
+                            "queue", source_language, result.marks.get("translated"), time.perf_counter()
+                        )
+                        clips: Dict[str, bytes] = {}
+                        if targets:
+                            logger.info(f"Synthesizing audio for {len(targets)} translations")
+                            # All languages are synthesized concurrently
+                            audio = await translator.synthesize_translations_async(targets)
+                            for lang, audio_bytes in audio.items():
+                                if audio_bytes:
+                                    clips[lang] = audio_bytes
+                                    logger.info(f"Synthesized {len(audio_bytes)} bytes for {lang}")
+                                else:
+                                    logger.error(f"Error synthesizing audio for {lang}")
+                        
+                        def final_messages(
+                            codec: MessageCodec,
+                            subscription: Subscription
+                        ) -> Union[dict, List[Union[dict, bytes]]]:
+                            subscribed_clips = subscription.audio_for(clips)
+                            if not codec.frames:
+                                return recognized_message(
+                                    subscription, {lang: codec.audio(clip) for lang, clip in subscribed_clips.items()}
+                                )
+                            # Text first, then each language's audio as its own frame
+                            return [recognized_message(subscription, {})] + [
+                                encode_frame(FrameKind.CLIP, clip, session_id, utterance_id, 0, lang,
+                                             translator.audio_format, final=True)
+                                for lang, clip in subscribed_clips.items()
+                            ]
+                        
+                        if clips:
+                            # Audio makes the messages large; serialize them off the event loop
+                            deliveries = await asyncio.to_thread(manager.prepare, audience(), final_messages)
+                        else:
+                            deliveries = manager.prepare(audience(), final_messages)
+                        manager.send_timed(deliveries, time.perf_counter(), speech_end, targets)
+                    
+                    # Synthesis runs on the event loop, but this session's callback lane waits
+                    # for it: finals go out in order, and stopping waits until they are queued
+                    try:
+                        asyncio.run_coroutine_threadsafe(synthesize_and_send(), loop).result()
+                    except Exception as e:
+                        logger.error(f"Error sending final result {utterance_id}: {e}")
                 
                 def on_synthesizing(audio_data: bytes):
                     """Send synthesized audio"""
                     if audio_data and len(audio_data) > 0:
-                        # Convert to base64 for JSON transmission
-                        import base64
-                        audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-                        asyncio.run_coroutine_threadsafe(
-                            manager.send_message(websocket, {
+                        def synthesizing_message(codec: MessageCodec, subscription: Subscription) -> Union[dict, bytes, list]:
+                            if not subscription.audio:
+                                return []
+                            if codec.frames:
+                                return encode_frame(
+                                    FrameKind.SYNTHESIZING, audio_data, session_id, audio_format=PCM16_FORMAT
+                                )
+                            # Base64 for JSON transmission, raw bytes for MessagePack
+                            return {
                                 "type": "audio",
                                 "data": {
-                                    "audio": audio_base64,
+                                    "audio": codec.audio(audio_data),
                                     "format": "pcm16",
                                     "sample_rate": 16000
                                 }
-                            }),
-                            loop
-                        )
+                            }
+                        
+                        loop.call_soon_threadsafe(manager.enqueue, manager.prepare(audience(), synthesizing_message))
                 
                 def on_canceled(error: str):
                     """Send error"""
-                    asyncio.run_coroutine_threadsafe(
-                        manager.send_message(websocket, {
-                            "type": "error",
-                            "data": {"message": f"Translation canceled: {error}"}
-                        }),
-                        loop
-                    )
+                    loop.call_soon_threadsafe(manager.enqueue, manager.prepare([websocket], {
+                        "type": "error",
+                        "data": {"message": f"Translation canceled: {error}"}
+                    }))
                 
                 def on_stopped():
                     """Send stopped notification"""
-                    asyncio.run_coroutine_threadsafe(
-                        manager.send_message(websocket, {
-                            "type": "stopped",
-                            "data": {"message": "Translation stopped"}
-                        }),
-                        loop
-                    )
+                    loop.call_soon_threadsafe(manager.enqueue, manager.prepare([websocket], {
+                        "type": "stopped",
+                        "data": {"message": "Translation stopped"}
+                    }))
                 
-                # Start continuous recognition with callbacks
-                translator.start_continuous_translation(
-                    recognizer=recognizer,
+                # Start (or resume) continuous recognition with callbacks
+                await session.start_async(
                     recognizing_callback=on_recognizing,
                     recognized_callback=on_recognized,
                     synthesizing_callback=on_synthesizing,
@@ -338,22 +909,35 @@ async def websocket_translate(websocket: WebSocket):
                 
                 await manager.send_message(websocket, {
                     "type": "started",
-                    "data": {"message": "Recording started"}
+                    "data": {"message": "Recording started", "warm": was_warm}
                 })
             
+            elif message_type == "audio":
+                audio = message_data.get("audio") if isinstance(message_data, dict) else message_data
+                # MessagePack clients send raw bytes, JSON clients base64
+                await feed_audio(audio if isinstance(audio, bytes) else base64.b64decode(audio or ""))
+            
             elif message_type == "stop_recording":
                 # Stop continuous translation
                 logger.info("Stopping continuous translation")
                 
-                if recognizer:
-                    translator.stop_continuous_translation(recognizer)
-                    recognizer = None
+                if session is not None and session.translator.settings.recognizer_keep_warm and session.running:
+                    # Keep the recognizer and its connection for the next start
+                    await session.pause_async()
+                    logger.info(f"Translation session stats: {session.stats()}")
+                elif session is not None:
+                    await session.end_recording_async()
                 
                 await manager.send_message(websocket, {
                     "type": "stopped",
                     "data": {"message": "Recording stopped"}
                 })
             
+            elif message_type == "subscribe":
+                # Receive only some languages' text and audio; synthesis follows demand
+                await handle_subscribe(websocket, message_data)
+                update_synthesis_languages()
+            
             elif message_type == "ping":
                 # Respond to ping
                 await manager.send_message(websocket, {
@@ -379,17 +963,109 @@ async def websocket_translate(websocket: WebSocket):
                 "type": "error",
                 "data": {"message": f"Server error: {str(e)}"}
             })
+            await manager.flush(websocket, timeout=1.0)
         except Exception:
             pass
         manager.disconnect(websocket)
     
     finally:
-        # Clean up
-        if recognizer:
+        # Release the recognizer, its handlers, the audio stream and the synthesizers
+        manager.disconnect(websocket)
+        if session is not None:
             try:
-                translator.stop_continuous_translation(recognizer)
-            except Exception:
-                pass
+                await session.close_async()
+            except Exception as e:
+                logger.warning(f"Error closing translation session: {e}")
+        if room is not None:
+            # Listeners stay in the room and wait for the next presenter
+            manager.rooms.release(room, websocket)
+            await manager.broadcast(room.listeners, {
+                "type": "presenter_left",
+                "data": {"room": room.room_id}
+            })
+
+# WebSocket endpoint for broadcast room listeners
+@app.websocket("/ws/listen/{room_id}")
+async def websocket_listen(websocket: WebSocket, room_id: str):
+    """
+    WebSocket endpoint for listening to a broadcast room
+    
+    Protocol:
+    1. Client connects, negotiating its format as on /ws/translate
+    2. Server sends "connected" with the room's "presenter" state, then
+       "room_config" (languages and audio format) whenever a presenter
+       configures the room, including on joining if one already has
+    3. Server sends the presenter's "recognizing", "recognized" and audio
+       messages or frames, and "presenter_left" when the presenter goes
+    4. Client may send "subscribe" (as on /ws/translate) to get only some
+       languages, and "ping"; listeners cannot send audio or config
+    """
+    if not await manager.connect(websocket):
+        return
+    codec = manager.codec(websocket)
+    room: Optional[Room] = None
+    
+    try:
+        try:
+            room = manager.rooms.join(room_id, websocket, settings.room_max_listeners)
+            room.audience_changed()
+        except RoomError as e:
+            await manager.send_message(websocket, {
+                "type": "error",
+                "data": {"message": str(e)}
+            })
+            await manager.flush(websocket)
+            await websocket.close(code=1008)
+            return
+        
+        await manager.send_message(websocket, {
+            "type": "connected",
+            "data": {
+                "message": f"Listening to room {room_id}",
+                "server_version": "1.0.0",
+                "room": room_id,
+                "presenter": room.presenter is not None,
+                "listeners": len(room.listeners),
+                "binary_frames": codec.frames,
+                "encoding": codec.name
+            }
+        })
+        if room.config is not None:
+            await manager.send_message(websocket, {"type": "room_config", "data": room.config})
+        
+        while True:
+            received = await websocket.receive()
+            if received["type"] == "websocket.disconnect":
+                break
+            raw = received.get("bytes") if codec.binary else received.get("text")
+            if raw is None:
+                continue  # Listeners have no audio to upload
+            data = codec.decode(raw)
+            if data.get("type") == "subscribe":
+                await handle_subscribe(websocket, data.get("data"))
+                room.audience_changed()
+            elif data.get("type") == "ping":
+                await manager.send_message(websocket, {
+                    "type": "pong",
+                    "data": {"timestamp": (data.get("data") or {}).get("timestamp")}
+                })
+            else:
+                await manager.send_message(websocket, {
+                    "type": "error",
+                    "data": {"message": f"Listeners cannot send {data.get('type')} messages"}
+                })
+    
+    except WebSocketDisconnect:
+        logger.info("Listener disconnected")
+    
+    except Exception as e:
+        logger.error(f"Listener WebSocket error: {e}", exc_info=True)
+    
+    finally:
+        manager.disconnect(websocket)
+        if room is not None:
+            manager.rooms.leave(room, websocket)
+            room.audience_changed()
 
 # Error handlers
 @app.exception_handler(HTTPException)
@@ -432,5 +1108,6 @@ if __name__ == "__main__":
         app,
         host=settings.backend_host,
         port=settings.backend_port,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        ws_per_message_deflate=settings.websocket_compression
     )
@@ -1,16 +1,37 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import './App.css';
 import { useWebSocket } from './hooks/useWebSocket';
-import { LanguageConfig, TranslationResult, RecordingStatus } from './types/translation';
+import { AudioPayload, LanguageConfig, TranslationResult, RecordingStatus } from './types/translation';
 import ConnectionStatus from './components/ConnectionStatus';
 import AudioRecorder from './components/AudioRecorder';
 import LanguageSelector from './components/LanguageSelector';
 import TranslationDisplay from './components/TranslationDisplay';
 
 function App() {
-  const { connectionStatus, lastMessage, sendMessage } = useWebSocket();
-  const [recordingStatus, setRecordingStatus] = useState<RecordingStatus>('idle');
   const [translations, setTranslations] = useState<TranslationResult[]>([]);
+  // Streamed audio can finish before its 'recognized' result reaches state
+  const pendingAudioRef = useRef<Record<number, Record<string, AudioPayload>>>({});
+  const { connectionStatus, lastMessage, sendMessage } = useWebSocket({
+    // Attach streamed audio to the result it belongs to
+    onStreamedAudio: ({ utterance_id, language, audio }) => {
+      pendingAudioRef.current[utterance_id] = {
+        ...pendingAudioRef.current[utterance_id],
+        [language]: audio,
+      };
+      // Results older than a few utterances have long since reached state
+      for (const id of Object.keys(pendingAudioRef.current)) {
+        if (Number(id) < utterance_id - 10) delete pendingAudioRef.current[Number(id)];
+      }
+      setTranslations((prev) =>
+        prev.map((t) =>
+          t.utterance_id === utterance_id
+            ? { ...t, synthesized_audio: { ...t.synthesized_audio, [language]: audio } }
+            : t
+        )
+      );
+    },
+  });
+  const [recordingStatus, setRecordingStatus] = useState<RecordingStatus>('idle');
   const [interimText, setInterimText] = useState<string>('');
   const [interimTranslations, setInterimTranslations] = useState<Record<string, string>>({});
   const [config, setConfig] = useState<LanguageConfig>({
@@ -19,6 +40,8 @@ function App() {
     use_live_interpreter: true,
     use_continuous_mode: true,
     voice_preferences: {},
+    stream_audio: true,
+    audio_format: 'mp3',  // About a tenth of the bytes of 16 kHz PCM
   });
 
   // Handle incoming WebSocket messages
@@ -46,6 +69,13 @@ function App() {
       case 'recognized':
         // Final result
         const result: TranslationResult = lastMessage.data;
+        if (result.utterance_id !== undefined && pendingAudioRef.current[result.utterance_id]) {
+          result.synthesized_audio = {
+            ...result.synthesized_audio,
+            ...pendingAudioRef.current[result.utterance_id],
+          };
+          delete pendingAudioRef.current[result.utterance_id];
+        }
         setTranslations((prev) => [result, ...prev]);
         setInterimText('');
         setInterimTranslations({});
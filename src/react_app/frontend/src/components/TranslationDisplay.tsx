@@ -1,4 +1,4 @@
-import { TranslationResult } from '../types/translation';
+import { AudioPayload, TranslationResult } from '../types/translation';
 import { useState, useEffect } from 'react';
 
 interface Props {
@@ -33,18 +33,23 @@ const TranslationDisplay = ({ translations, interimText, interimTranslations, is
     }
   }, [translations]);
 
-  const playAudio = (audioBase64: string, lang: string) => {
+  const playAudio = (audioData: AudioPayload, lang: string) => {
     setPlayingAudio(lang);
     try {
-      // Decode base64 to binary
-      const binaryString = atob(audioBase64);
-      const bytes = new Uint8Array(binaryString.length);
-      for (let i = 0; i < binaryString.length; i++) {
-        bytes[i] = binaryString.charCodeAt(i);
+      // Binary frames arrive as bytes; JSON messages carry base64
+      let bytes: Uint8Array<ArrayBuffer>;
+      if (typeof audioData === 'string') {
+        const binaryString = atob(audioData);
+        bytes = new Uint8Array(binaryString.length);
+        for (let i = 0; i < binaryString.length; i++) {
+          bytes[i] = binaryString.charCodeAt(i);
+        }
+      } else {
+        bytes = audioData;
       }
       
       // Create audio blob and play
-      const blob = new Blob([bytes], { type: 'audio/wav' });
+      const blob = new Blob([bytes], { type: translations[0]?.audio_mime_type ?? 'audio/wav' });
       const audio = new Audio(URL.createObjectURL(blob));
       
       audio.onended = () => {
@@ -3,15 +3,150 @@
  */
 
 import { useEffect, useRef, useState, useCallback } from 'react';
-import { WebSocketMessage, ConnectionStatus } from '../types/translation';
+import { WebSocketMessage, ConnectionStatus, AudioChunk, AudioFrame, AudioPayload, StreamedAudio } from '../types/translation';
 
 const WS_URL = 'ws://localhost:8000/ws/translate';
 
-export const useWebSocket = () => {
+// Offered at connect time; the server answers with the binary one unless it has them disabled
+const BINARY_SUBPROTOCOL = 'live-interpreter.binary.v1';
+const JSON_SUBPROTOCOL = 'live-interpreter.json.v1';
+
+// Binary frame layout (big-endian): version, kind, flags, codec, sample rate (Hz, u16),
+// session id (u32), utterance id (u32), sequence (u32), language length, language, payload
+const FRAME_VERSION = 2;
+const FRAME_HEADER_SIZE = 19;
+const FRAME_CLIP = 1;
+const FRAME_CHUNK = 2;
+const FRAME_SYNTHESIZING = 3;
+const FRAME_INPUT = 4;
+const FLAG_FINAL = 0x01;
+const FLAG_ERROR = 0x02;
+
+const textDecoder = new TextDecoder();
+
+export const decodeFrame = (buffer: ArrayBuffer): AudioFrame => {
+  const view = new DataView(buffer);
+  if (buffer.byteLength < FRAME_HEADER_SIZE || view.getUint8(0) !== FRAME_VERSION) {
+    throw new Error('Unsupported audio frame');
+  }
+  const flags = view.getUint8(2);
+  const languageLength = view.getUint8(18);
+  const payload = new Uint8Array(buffer, FRAME_HEADER_SIZE + languageLength);
+  const failed = (flags & FLAG_ERROR) !== 0;
+  return {
+    kind: view.getUint8(1),
+    session_id: view.getUint32(6),
+    utterance_id: view.getUint32(10),
+    sequence: view.getUint32(14),
+    language: textDecoder.decode(new Uint8Array(buffer, FRAME_HEADER_SIZE, languageLength)),
+    codec: view.getUint8(3),
+    sample_rate: view.getUint16(4),
+    final: (flags & FLAG_FINAL) !== 0,
+    error: failed ? textDecoder.decode(payload) : null,
+    payload: failed ? new Uint8Array(0) : payload,
+  };
+};
+
+const encodeInputFrame = (sessionId: number, sequence: number, pcm: ArrayBuffer): ArrayBuffer => {
+  const frame = new Uint8Array(FRAME_HEADER_SIZE + pcm.byteLength);
+  const view = new DataView(frame.buffer);
+  view.setUint8(0, FRAME_VERSION);
+  view.setUint8(1, FRAME_INPUT);
+  view.setUint16(4, 16000);  // 16 kHz 16-bit mono PCM
+  view.setUint32(6, sessionId);
+  view.setUint32(14, sequence);
+  frame.set(new Uint8Array(pcm), FRAME_HEADER_SIZE);
+  return frame.buffer;
+};
+
+// Join chunks in order: base64 text from JSON messages, bytes from binary frames
+const joinAudio = (parts: AudioPayload[]): AudioPayload => {
+  if (parts.every((part) => typeof part === 'string')) {
+    // Join the decoded chunks, then re-encode as a single base64 clip
+    return btoa((parts as (string | undefined)[]).map((part) => atob(part ?? '')).join(''));
+  }
+  const bytes = (parts as (Uint8Array<ArrayBuffer> | undefined)[]).map((part) => part ?? new Uint8Array(0));
+  const joined = new Uint8Array(bytes.reduce((total, part) => total + part.length, 0));
+  let offset = 0;
+  for (const part of bytes) {
+    joined.set(part, offset);
+    offset += part.length;
+  }
+  return joined;
+};
+
+interface UseWebSocketOptions {
+  // Called once per language when its streamed audio is complete
+  onStreamedAudio?: (audio: StreamedAudio) => void;
+}
+
+export const useWebSocket = (options: UseWebSocketOptions = {}) => {
   const [connectionStatus, setConnectionStatus] = useState<ConnectionStatus>('disconnected');
   const [lastMessage, setLastMessage] = useState<WebSocketMessage | null>(null);
   const wsRef = useRef<WebSocket | null>(null);
   const reconnectTimeoutRef = useRef<number | undefined>(undefined);
+  // Audio chunks are assembled here rather than in React state, so a burst
+  // of chunk messages never triggers a render per chunk
+  const audioChunksRef = useRef<Map<string, AudioPayload[]>>(new Map());
+  const onStreamedAudioRef = useRef(options.onStreamedAudio);
+  onStreamedAudioRef.current = options.onStreamedAudio;
+  // Binary framing state, set from the handshake and the server's replies
+  const binaryFramesRef = useRef(false);
+  const sessionIdRef = useRef(0);
+  const inputSequenceRef = useRef(0);
+  const audioFormatRef = useRef<{ format: string; mime_type?: string }>({ format: '' });
+
+  const handleAudioChunk = (chunk: AudioChunk) => {
+    const key = `${chunk.utterance_id}:${chunk.language}`;
+    const chunks = audioChunksRef.current.get(key) ?? [];
+    if (!chunk.final) {
+      chunks[chunk.sequence] = chunk.audio;
+      audioChunksRef.current.set(key, chunks);
+      return;
+    }
+    audioChunksRef.current.delete(key);
+    if (chunk.error || chunks.length === 0) {
+      console.error(`Audio stream for ${chunk.language} failed:`, chunk.error);
+      return;
+    }
+    onStreamedAudioRef.current?.({
+      utterance_id: chunk.utterance_id,
+      language: chunk.language,
+      audio: joinAudio(chunks),
+      format: chunk.format,
+      mime_type: chunk.mime_type,
+    });
+  };
+
+  const handleFrame = (frame: AudioFrame) => {
+    const { format, mime_type } = audioFormatRef.current;
+    if (frame.kind === FRAME_CLIP) {
+      // Whole clip of a 'recognized' result, sent right after it
+      onStreamedAudioRef.current?.({
+        utterance_id: frame.utterance_id,
+        language: frame.language,
+        audio: frame.payload,
+        format,
+        mime_type,
+      });
+    } else if (frame.kind === FRAME_CHUNK) {
+      handleAudioChunk({
+        utterance_id: frame.utterance_id,
+        language: frame.language,
+        sequence: frame.sequence,
+        audio: frame.payload,
+        format,
+        mime_type,
+        final: frame.final,
+        error: frame.error,
+      });
+    } else if (frame.kind === FRAME_SYNTHESIZING) {
+      setLastMessage({
+        type: 'audio',
+        data: { audio: frame.payload, format: 'pcm16', sample_rate: frame.sample_rate },
+      });
+    }
+  };
 
   const connect = useCallback(() => {
     if (wsRef.current?.readyState === WebSocket.OPEN) {
@@ -19,16 +154,32 @@ export const useWebSocket = () => {
     }
 
     setConnectionStatus('connecting');
-    const ws = new WebSocket(WS_URL);
+    const ws = new WebSocket(WS_URL, [BINARY_SUBPROTOCOL, JSON_SUBPROTOCOL]);
+    ws.binaryType = 'arraybuffer';
 
     ws.onopen = () => {
-      console.log('WebSocket connected');
+      binaryFramesRef.current = ws.protocol === BINARY_SUBPROTOCOL;
+      inputSequenceRef.current = 0;
+      console.log(`WebSocket connected (${binaryFramesRef.current ? 'binary' : 'JSON'} audio)`);
       setConnectionStatus('connected');
     };
 
     ws.onmessage = (event) => {
       try {
+        if (event.data instanceof ArrayBuffer) {
+          handleFrame(decodeFrame(event.data));
+          return;
+        }
         const message: WebSocketMessage = JSON.parse(event.data);
+        if (message.type === 'audio_chunk') {
+          handleAudioChunk(message.data as AudioChunk);
+          return;
+        }
+        if (message.type === 'connected') {
+          sessionIdRef.current = message.data.session_id ?? 0;
+        } else if (message.type === 'config_confirmed') {
+          audioFormatRef.current = { format: message.data.audio_format, mime_type: message.data.audio_mime_type };
+        }
         console.log('Received message:', message.type);
         setLastMessage(message);
       } catch (error) {
@@ -76,6 +227,24 @@ export const useWebSocket = () => {
     }
   }, []);
 
+  // Upload 16 kHz 16-bit mono PCM for configs with audio_source 'stream'
+  const sendAudio = useCallback((pcm: ArrayBuffer) => {
+    if (wsRef.current?.readyState !== WebSocket.OPEN) {
+      console.error('WebSocket is not connected');
+      return;
+    }
+    if (binaryFramesRef.current) {
+      wsRef.current.send(encodeInputFrame(sessionIdRef.current, inputSequenceRef.current++, pcm));
+      return;
+    }
+    let binary = '';
+    const bytes = new Uint8Array(pcm);
+    for (let i = 0; i < bytes.length; i++) {
+      binary += String.fromCharCode(bytes[i]);
+    }
+    wsRef.current.send(JSON.stringify({ type: 'audio', data: { audio: btoa(binary) } }));
+  }, []);
+
   useEffect(() => {
     connect();
 
@@ -88,6 +257,7 @@ export const useWebSocket = () => {
     connectionStatus,
     lastMessage,
     sendMessage,
+    sendAudio,
     connect,
     disconnect,
   };
@@ -2,13 +2,19 @@
  * Translation-related TypeScript types
  */
 
+// Synthesized audio: base64 from JSON messages, raw bytes from binary frames
+export type AudioPayload = string | Uint8Array<ArrayBuffer>;
+
 export interface TranslationResult {
   original_text: string;
   detected_language?: string;
   translations: Record<string, string>;
   timestamp: string;
   duration_ms: number;
-  synthesized_audio?: Record<string, string>;  // Base64 encoded audio per language
+  synthesized_audio?: Record<string, AudioPayload>;  // Audio per language
+  audio_format?: string;  // Synthesis output format of synthesized_audio
+  audio_mime_type?: string;  // MIME type for playing synthesized_audio
+  utterance_id?: number;  // Correlates streamed audio chunks with this result
   speaker?: string;  // Optional speaker name for demo mode
 }
 
@@ -18,10 +24,13 @@ export interface LanguageConfig {
   use_live_interpreter: boolean;
   use_continuous_mode?: boolean;
   voice_preferences?: Record<string, string>;
+  stream_audio?: boolean;  // Receive synthesized audio as audio_chunk messages
+  audio_source?: 'microphone' | 'stream';  // 'stream' translates audio messages sent by the client
+  audio_format?: string;  // Synthesis output format: 'opus', 'mp3', 'pcm', 'pcm-8k' or an SDK format name
 }
 
 export interface WebSocketMessage {
-  type: 'connected' | 'config_confirmed' | 'recognizing' | 'recognized' | 'audio' | 'started' | 'stopped' | 'error' | 'pong';
+  type: 'connected' | 'config_confirmed' | 'recognizing' | 'recognized' | 'audio' | 'audio_chunk' | 'started' | 'stopped' | 'error' | 'pong';
   data: any;
 }
 
@@ -31,6 +40,38 @@ export interface AudioData {
   sample_rate: number;
 }
 
+export interface AudioChunk {
+  utterance_id: number;
+  language: string;
+  sequence: number;
+  audio: AudioPayload; // Empty on the final chunk
+  format: string;
+  mime_type?: string;
+  final: boolean;
+  error?: string | null;
+}
+
+export interface StreamedAudio {
+  utterance_id: number;
+  language: string;
+  audio: AudioPayload; // All chunks joined in sequence order
+  format: string;
+  mime_type?: string;
+}
+
+export interface AudioFrame {
+  kind: number;  // 1 clip, 2 chunk, 3 synthesizing, 4 input (see src/core/audio_frames.py)
+  session_id: number;
+  utterance_id: number;
+  sequence: number;
+  language: string;
+  codec: number;  // 0 session format, 1 WAV, 2 raw PCM, 3 Ogg Opus, 4 MP3
+  sample_rate: number;
+  final: boolean;
+  error: string | null;
+  payload: Uint8Array<ArrayBuffer>;
+}
+
 export interface ServerConfig {
   source_language: string;
   target_languages: string[];
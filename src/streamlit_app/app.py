@@ -19,12 +19,16 @@ sys.path.insert(0, str(project_root))
 # Import after path setup
 from src.core.config import get_settings, SUPPORTED_LANGUAGES, NEURAL_VOICES  # noqa: E402
 from src.core.translator import AzureSpeechTranslator, LiveInterpreterTranslator  # noqa: E402
+from src.core.session import TranslationSession  # noqa: E402
 from src.core.audio_handler import AudioRecorder, AudioPlayer  # noqa: E402
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Candidate languages for continuous Live Interpreter sessions
+CONTINUOUS_DETECT_LANGUAGES = ["en-US", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR"]
+
 # Page configuration
 st.set_page_config(
     page_title="Azure Live Interpreter Demo",
@@ -114,8 +118,12 @@ if 'last_error' not in st.session_state:
 if 'use_continuous_mode' not in st.session_state:
     st.session_state.use_continuous_mode = True  # Default to continuous mode
 
-if 'continuous_recognizer' not in st.session_state:
-    st.session_state.continuous_recognizer = None
+if 'continuous_session' not in st.session_state:
+    st.session_state.continuous_session = None
+
+# Languages/voices the kept-warm recognizer was built for
+if 'continuous_setup' not in st.session_state:
+    st.session_state.continuous_setup = None
 
 if 'continuous_active' not in st.session_state:
     st.session_state.continuous_active = False
@@ -343,22 +351,15 @@ def create_callbacks(translation_queue, translator):
             if translator and result.translations:
                 logger.info(f"[CALLBACK] Translator available, synthesizing for {len(result.translations)} translations")
                 add_log_to_ui(translation_queue, f"[CALLBACK] Synthesizing audio for {len(result.translations)} language(s)...")
-                for lang, text in result.translations.items():
-                    try:
-                        logger.info(f"[CALLBACK] Synthesizing audio for {lang}: {text[:50]}...")
-                        audio_bytes = translator.synthesize_translation(text, lang)
-                        if audio_bytes:
-                            synthesized_audio[lang] = audio_bytes
-                            logger.info(f"[CALLBACK] ✓ Synthesized {len(audio_bytes)} bytes for {lang}")
-                            add_log_to_ui(translation_queue, f"[CALLBACK] ✓ Synthesized audio for {lang}")
-                        else:
-                            logger.warning(f"[CALLBACK] ✗ No audio synthesized for {lang}")
-                            add_log_to_ui(translation_queue, f"[CALLBACK] ✗ No audio for {lang}")
-                    except Exception as e:
-                        logger.error(f"[CALLBACK] ✗ Error synthesizing audio for {lang}: {e}")
-                        add_log_to_ui(translation_queue, f"[CALLBACK] ✗ Error synthesizing {lang}")
-                        import traceback
-                        traceback.print_exc()
+                # Languages are synthesized concurrently and reported as they finish
+                for lang, outcome in translator.iter_synthesized_translations(result.translations):
+                    if outcome.ok:
+                        synthesized_audio[lang] = outcome.audio_data
+                        logger.info(f"[CALLBACK] ✓ Synthesized {len(outcome.audio_data)} bytes for {lang}")
+                        add_log_to_ui(translation_queue, f"[CALLBACK] ✓ Synthesized audio for {lang}")
+                    else:
+                        logger.warning(f"[CALLBACK] ✗ No audio synthesized for {lang}: {outcome.error}")
+                        add_log_to_ui(translation_queue, f"[CALLBACK] ✗ No audio for {lang}")
             else:
                 logger.warning(f"[CALLBACK] Translator available: {translator is not None}, Translations: {len(result.translations) if result.translations else 0}")
             
@@ -455,24 +456,8 @@ with col1:
             st.session_state.current_status = "Recording"
             st.session_state.last_error = None
             
-            # Update settings with selected target languages
-            settings = st.session_state.settings
-            settings.target_language = target_langs[0]
-            if len(target_langs) > 1:
-                settings.target_language_2 = target_langs[1]
-            else:
-                settings.target_language_2 = None
-            
-            if len(target_langs) > 2:
-                settings.target_language_3 = target_langs[2]
-            else:
-                settings.target_language_3 = None
-            
-            # Apply voice preferences to settings
-            for lang, voice in voice_selections.items():
-                voice_attr = f"voice_{lang.lower().replace('-', '_')}"
-                setattr(settings, voice_attr, voice)
-                logger.info(f"Set voice for {lang}: {voice}")
+            # Settings for the selected target languages and voices (the loaded settings stay as they are)
+            settings = st.session_state.settings.for_session(target_languages=target_langs, voices=voice_selections)
             
             logger.info(f"Target languages configured: {target_langs}")
             logger.info(f"Settings target languages: {settings.target_languages}")
@@ -482,18 +467,40 @@ with col1:
             if use_live_interpreter and st.session_state.use_continuous_mode:
                 # Continuous translation mode
                 try:
-                    # Create translator with updated settings
-                    translator = LiveInterpreterTranslator(settings)
-                    st.session_state.translator = translator
-                    
-                    logger.info(f"Translator initialized with target languages: {translator.settings.target_languages}")
+                    setup = (tuple(target_langs), tuple(sorted(voice_selections.items())))
+                    session = st.session_state.continuous_session
                     
-                    # Create recognizer with continuous language detection
-                    recognizer = translator.create_recognizer_from_microphone(
-                        auto_detect_languages=["en-US", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR"],
-                        use_continuous_mode=True
-                    )
-                    st.session_state.continuous_recognizer = recognizer
+                    if session is not None and st.session_state.continuous_setup == setup:
+                        # Resume the paused recognizer; its connection is still open (the session
+                        # rebuilds it if the adaptive language candidates changed)
+                        translator = session.translator
+                        logger.info(f"Resuming kept-warm recognizer (warm={session.is_warm})")
+                    else:
+                        if session is not None:
+                            # Releases the recognizer, its handlers and the pooled synthesizers
+                            session.close()
+                        
+                        # Create translator with updated settings
+                        translator = LiveInterpreterTranslator(settings)
+                        st.session_state.translator = translator
+                        
+                        logger.info(f"Translator initialized with target languages: {translator.settings.target_languages}")
+                        
+                        # Pre-create synthesizers for the selected voices
+                        if settings.prewarm_synthesizers:
+                            translator.warm_synthesizers(target_langs)
+                        
+                        # Recognizers use continuous language detection
+                        session = TranslationSession(
+                            translator,
+                            lambda push_stream: translator.create_recognizer_from_microphone(
+                                auto_detect_languages=CONTINUOUS_DETECT_LANGUAGES,
+                                use_continuous_mode=True
+                            ),
+                            idle_timeout_s=settings.recognizer_idle_timeout_s
+                        )
+                        st.session_state.continuous_session = session
+                        st.session_state.continuous_setup = setup
                     
                     # Create callbacks that close over queue and translator (no st.* calls)
                     on_recognizing, on_recognized, on_synthesizing, on_session_stopped, on_canceled = create_callbacks(
@@ -502,8 +509,7 @@ with col1:
                     )
                     
                     # Start continuous translation
-                    translator.start_continuous_translation(
-                        recognizer=recognizer,
+                    session.start(
                         recognizing_callback=on_recognizing,
                         recognized_callback=on_recognized,
                         synthesizing_callback=on_synthesizing,
@@ -536,18 +542,25 @@ with col1:
                 # Stop continuous translation
                 st.session_state.current_status = "Idle"
                 
-                if st.session_state.continuous_recognizer and st.session_state.translator:
+                session = st.session_state.continuous_session
+                keep_warm = st.session_state.settings.recognizer_keep_warm
+                if session is not None:
                     try:
-                        st.session_state.translator.stop_continuous_translation(
-                            st.session_state.continuous_recognizer
-                        )
-                        logger.info("Stopped continuous translation")
+                        if keep_warm:
+                            # Pause: the next Start resumes without a new handshake
+                            session.pause()
+                            logger.info(f"Paused continuous translation: {session.stats()}")
+                        else:
+                            session.close()
+                            logger.info("Stopped continuous translation")
                     except Exception as e:
                         logger.error(f"Error stopping continuous translation: {e}")
                 
                 st.session_state.continuous_active = False
-                st.session_state.continuous_recognizer = None
-                st.session_state.translator = None
+                if not keep_warm:
+                    st.session_state.continuous_session = None
+                    st.session_state.continuous_setup = None
+                    st.session_state.translator = None
                 st.rerun()
                 
             elif st.session_state.audio_recorder:
@@ -559,24 +572,8 @@ with col1:
                 st.session_state.recorded_audio = audio_data
                 logger.info(f"Stopped recording: {len(audio_data)} samples")
                 
-                # Update settings with selected target languages
-                settings = st.session_state.settings
-                settings.target_language = target_langs[0]
-                if len(target_langs) > 1:
-                    settings.target_language_2 = target_langs[1]
-                else:
-                    settings.target_language_2 = None
-                
-                if len(target_langs) > 2:
-                    settings.target_language_3 = target_langs[2]
-                else:
-                    settings.target_language_3 = None
-                
-                # Apply voice preferences to settings
-                for lang, voice in voice_selections.items():
-                    voice_attr = f"voice_{lang.lower().replace('-', '_')}"
-                    setattr(settings, voice_attr, voice)
-                    logger.info(f"Set voice for {lang}: {voice}")
+                # Settings for the selected target languages and voices (the loaded settings stay as they are)
+                settings = st.session_state.settings.for_session(target_languages=target_langs, voices=voice_selections)
                 
                 # Perform translation
                 try:
@@ -604,14 +601,12 @@ with col1:
                     if result.original_text:
                         # Synthesize audio for each translation
                         synthesized_audio = {}
-                        for lang, text in result.translations.items():
-                            logger.info(f"Synthesizing audio for {lang}: {text}")
-                            audio_bytes = translator.synthesize_translation(text, lang)
-                            if audio_bytes:
-                                synthesized_audio[lang] = audio_bytes
-                                logger.info(f"Synthesized audio for {lang}: {len(audio_bytes)} bytes")
+                        for lang, outcome in translator.synthesize_translations(result.translations).items():
+                            if outcome.ok:
+                                synthesized_audio[lang] = outcome.audio_data
+                                logger.info(f"Synthesized audio for {lang}: {len(outcome.audio_data)} bytes")
                             else:
-                                logger.warning(f"No audio synthesized for {lang}")
+                                logger.warning(f"No audio synthesized for {lang}: {outcome.error}")
                         
                         translation_entry = {
                             "original": result.original_text,
@@ -831,7 +826,9 @@ with col2:
                     if st.button(f"▶️ {lang_name}", key=f"play_{lang}_{latest['timestamp']}", use_container_width=True):
                         try:
                             with st.spinner(f"Playing {lang_name}..."):
-                                st.session_state.audio_player.play_bytes(audio_bytes)
+                                st.session_state.audio_player.play_bytes(
+                                    audio_bytes, output_format=st.session_state.settings.synthesis_output_format
+                                )
                             st.success(f"✓ Played {lang_name}")
                         except Exception as e:
                             st.error(f"Playback error: {str(e)}")
@@ -882,7 +879,9 @@ if st.session_state.translation_history:
                             if st.button(f"▶️ {lang_name}", key=f"play_hist_{entry_num}_{lang}", use_container_width=True):
                                 try:
                                     with st.spinner(f"Playing {lang_name}..."):
-                                        st.session_state.audio_player.play_bytes(audio_bytes)
+                                        st.session_state.audio_player.play_bytes(
+                                            audio_bytes, output_format=st.session_state.settings.synthesis_output_format
+                                        )
                                     st.success("✓ Played")
                                 except Exception as e:
                                     st.error(f"Error: {str(e)}")
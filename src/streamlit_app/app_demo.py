@@ -239,16 +239,8 @@ def translate_and_synthesize(text: str, source_lang: str, target_langs: list, vo
     """Translate text to target languages and synthesize audio"""
     results = {}
     
-    # Update settings
-    settings = st.session_state.settings
-    settings.target_language = target_langs[0]
-    if len(target_langs) > 1:
-        settings.target_language_2 = target_langs[1]
-    
-    # Apply voice preferences
-    for lang, voice in voice_prefs.items():
-        voice_attr = f"voice_{lang.lower().replace('-', '_')}"
-        setattr(settings, voice_attr, voice)
+    # Settings for this request's languages and voices
+    settings = st.session_state.settings.for_session(target_languages=target_langs, voices=voice_prefs)
     
     try:
         # Create translator
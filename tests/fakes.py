@@ -0,0 +1,93 @@
+"""Test doubles for Speech SDK objects and WebSocket connections shared by the pytest modules"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import azure.cognitiveservices.speech as speechsdk
+
+RECOGNIZER_EVENTS = ('recognizing', 'recognized', 'canceled', 'session_started', 'session_stopped', 'synthesizing')
+
+
+class FakeSignal:
+    """Minimal stand-in for an SDK EventSignal"""
+
+    def __init__(self):
+        self.handlers = []
+
+    def connect(self, handler):
+        self.handlers.append(handler)
+
+    def fire(self, evt=None):
+        for handler in list(self.handlers):
+            handler(evt)
+
+
+def translation_result(text, reason=speechsdk.ResultReason.TranslatedSpeech, **fields):
+    """SDK-shaped translation result translating text to es-ES as itself"""
+    result = dict(reason=reason, text=text, translations={'es-ES': text}, properties={}, duration=0, audio=None)
+    result.update(fields)
+    return SimpleNamespace(**result)
+
+
+class FakeRecognizer:
+    """Recognizer with a signal per SDK event; fire() delivers a result to an event's handlers"""
+
+    def __init__(self):
+        for name in RECOGNIZER_EVENTS:
+            setattr(self, name, FakeSignal())
+
+    def fire(self, name, text="", reason=speechsdk.ResultReason.TranslatedSpeech):
+        getattr(self, name).fire(SimpleNamespace(result=translation_result(text, reason), cancellation_details="canceled"))
+
+
+class FakeFileRecognizer:
+    """Recognizer that 'plays' scripted (offset_ms, text) utterances of a file on a worker thread"""
+
+    def __init__(self, utterances, delay=0.05, error=None):
+        self.utterances = utterances
+        self.delay = delay
+        self.error = error
+        for name in ('recognized', 'canceled', 'session_stopped'):
+            setattr(self, name, FakeSignal())
+        self.stopped = False
+
+    def _play(self):
+        time.sleep(self.delay)
+        for offset_ms, text in self.utterances:
+            result = translation_result(
+                text, translations={'es-ES': f"es:{text}"}, offset=offset_ms * 10000, duration=5000000
+            )
+            self.recognized.fire(SimpleNamespace(result=result))
+        reason = speechsdk.CancellationReason.Error if self.error else speechsdk.CancellationReason.EndOfStream
+        self.canceled.fire(SimpleNamespace(
+            cancellation_details=SimpleNamespace(reason=reason, error_details=self.error)
+        ))
+        self.session_stopped.fire(SimpleNamespace())
+
+    def start_continuous_recognition_async(self):
+        threading.Thread(target=self._play, daemon=True).start()
+
+    def stop_continuous_recognition_async(self):
+        self.stopped = True
+
+
+class FakeWebSocket:
+    """A connection whose client reads everything"""
+
+    def __init__(self):
+        self.scope = {}
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self, subprotocol=None):
+        pass
+
+    async def send_text(self, data: str):
+        self.sent.append(data)
+
+    async def send_bytes(self, data: bytes):
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
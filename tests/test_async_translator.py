@@ -0,0 +1,193 @@
+"""Pytest unit tests for the asyncio translator API"""
+
+import asyncio
+import gc
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.core.config import Settings
+from src.core.synthesis import SynthesizerPool
+from src.core.translator import AzureSpeechTranslator
+from tests.fakes import FakeRecognizer, FakeSignal, translation_result
+
+
+class FakeSynthesizer:
+    """Synthesizer whose speak_text_async completes on another thread after a delay"""
+
+    def __init__(self, delay=0.05, reason=speechsdk.ResultReason.SynthesizingAudioCompleted):
+        self.delay = delay
+        self.reason = reason
+        self.synthesis_completed = FakeSignal()
+        self.synthesis_canceled = FakeSignal()
+
+    def speak_text_async(self, text):
+        result = SimpleNamespace(
+            reason=self.reason,
+            audio_data=text.encode(),
+            cancellation_details=SimpleNamespace(reason='Error')
+        )
+        signal = self.synthesis_completed if self.reason != speechsdk.ResultReason.Canceled else self.synthesis_canceled
+        threading.Timer(self.delay, signal.fire, args=(SimpleNamespace(result=result),)).start()
+
+    def speak_text(self, text):
+        raise AssertionError("blocking speak_text must not be used by the async API")
+
+
+class TimerRecognizer(FakeRecognizer):
+    """Recognizer that answers async calls by firing events from a timer thread"""
+
+    def __init__(self, delay=0.05):
+        super().__init__()
+        self.delay = delay
+
+    def _later(self, signal, evt):
+        threading.Timer(self.delay, signal.fire, args=(evt,)).start()
+
+    def recognize_once_async(self):
+        result = translation_result("Hello", translations={'es-ES': 'Hola'}, duration=10000000)
+        self._later(self.recognized, SimpleNamespace(result=result))
+
+    def start_continuous_recognition_async(self):
+        self._later(self.session_started, SimpleNamespace())
+
+    def stop_continuous_recognition_async(self):
+        self._later(self.session_stopped, SimpleNamespace())
+
+    def recognize_once(self):
+        raise AssertionError("blocking recognize_once must not be used by the async API")
+
+
+@pytest.fixture
+def translator():
+    """Translator with fake pooled synthesizers and no cache"""
+    settings = Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False)
+    translator = AzureSpeechTranslator(settings)
+    translator.synthesizer_pool = SynthesizerPool(lambda voice, fmt: FakeSynthesizer())
+    yield translator
+    translator.close()
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Return the worst delay beyond interval seen while sleeping on the loop"""
+    # Garbage left by earlier tests would otherwise trigger a full collection mid-measurement
+    gc.collect()
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+class TestAsyncSynthesis:
+    """Tests for synthesize_translation_async"""
+
+    def test_returns_audio(self, translator):
+        """Test async synthesis returns the completed audio"""
+        audio = asyncio.run(translator.synthesize_translation_async("Hola", "es-ES"))
+
+        assert audio == b"Hola"
+
+    def test_canceled_returns_none_and_discards(self, translator):
+        """Test a canceled synthesis returns None and drops the synthesizer"""
+        translator.synthesizer_pool = SynthesizerPool(
+            lambda voice, fmt: FakeSynthesizer(reason=speechsdk.ResultReason.Canceled)
+        )
+
+        assert asyncio.run(translator.synthesize_translation_async("Hola", "es-ES")) is None
+        assert translator.synthesizer_pool.idle_count() == 0
+
+    def test_reused_synthesizer_keeps_one_handler(self, translator):
+        """Test pooled reuse doesn't accumulate completion handlers"""
+        async def run():
+            for _ in range(5):
+                await translator.synthesize_translation_async("Hola", "es-ES")
+
+        asyncio.run(run())
+        synthesizer = translator.synthesizer_pool.acquire(
+            translator.settings.get_voice_for_language('es-ES'), translator.settings.synthesis_output_format
+        )
+
+        assert len(synthesizer.synthesis_completed.handlers) == 1
+
+    def test_concurrent_calls_do_not_stall_loop(self, translator):
+        """Test many concurrent syntheses overlap and leave the loop responsive"""
+        async def run():
+            stop = asyncio.Event()
+            lag_task = asyncio.create_task(measure_loop_lag(stop))
+            start = time.perf_counter()
+            results = await asyncio.gather(*(
+                translator.synthesize_translation_async(f"frase {i}", "es-ES") for i in range(50)
+            ))
+            elapsed = time.perf_counter() - start
+            stop.set()
+            return results, elapsed, await lag_task
+
+        results, elapsed, worst_lag = asyncio.run(run())
+
+        assert all(results)
+        assert elapsed < 1.0  # 50 x 50ms serialized would take 2.5s
+        assert worst_lag < 0.05
+
+    def test_synthesize_translations_async(self, translator):
+        """Test the async multi-language helper returns audio per language"""
+        audio = asyncio.run(translator.synthesize_translations_async({'es-ES': 'Hola', 'fr-FR': 'Salut'}))
+
+        assert audio == {'es-ES': b'Hola', 'fr-FR': b'Salut'}
+
+
+class TestAsyncRecognition:
+    """Tests for async recognition and continuous session control"""
+
+    def test_recognize_once_async(self, translator):
+        """Test single-shot recognition resolves from the recognized event"""
+        result = asyncio.run(translator.recognize_once_async(TimerRecognizer()))
+
+        assert result.original_text == "Hello"
+        assert result.translations == {'es-ES': 'Hola'}
+
+    def test_translate_once_is_non_blocking(self, translator):
+        """Test translate_once no longer calls blocking recognize_once"""
+        result = asyncio.run(translator.translate_once(TimerRecognizer()))
+
+        assert result.original_text == "Hello"
+
+    def test_concurrent_sessions_share_one_loop(self, translator):
+        """Test many sessions start and stop concurrently without loop stalls"""
+        async def session():
+            recognizer = TimerRecognizer()
+            await translator.start_continuous_translation_async(recognizer)
+            await translator.stop_continuous_translation_async(recognizer)
+
+        async def run():
+            stop = asyncio.Event()
+            lag_task = asyncio.create_task(measure_loop_lag(stop))
+            start = time.perf_counter()
+            await asyncio.gather(*(session() for _ in range(20)))
+            elapsed = time.perf_counter() - start
+            stop.set()
+            return elapsed, await lag_task
+
+        elapsed, worst_lag = asyncio.run(run())
+
+        assert elapsed < 1.0
+        assert worst_lag < 0.05
+
+    def test_start_canceled_raises(self, translator):
+        """Test a cancellation before session start raises"""
+        recognizer = TimerRecognizer()
+        recognizer.start_continuous_recognition_async = lambda: recognizer._later(
+            recognizer.canceled, SimpleNamespace(cancellation_details="auth failed")
+        )
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(translator.start_continuous_translation_async(recognizer))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
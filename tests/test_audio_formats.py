@@ -0,0 +1,120 @@
+"""Pytest unit tests for synthesis output formats"""
+
+import numpy as np
+import pytest
+
+from src.core.audio_formats import (
+    AUDIO_FORMAT_PRESETS,
+    decode_audio,
+    encode_audio,
+    parse_audio_format,
+    sniff_audio_format,
+)
+from src.core.config import Settings
+from src.core.speech_engine import SimulatedSpeechEngine
+from src.core.translator import AzureSpeechTranslator
+
+
+@pytest.fixture
+def tone():
+    """One second of a 440 Hz tone at 16 kHz"""
+    t = np.arange(16000) / 16000
+    return (np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16)
+
+
+@pytest.fixture
+def translator():
+    """Translator on a fast simulated engine"""
+    settings = Settings(speech_key='test_key', speech_region='eastus', speech_engine='simulated', tts_cache_enabled=False)
+    translator = AzureSpeechTranslator(
+        settings, engine=SimulatedSpeechEngine(synthesis_ms=1, connect_ms=1, jitter_ms=0)
+    )
+    yield translator
+    translator.close()
+
+
+class TestParseAudioFormat:
+    """Tests for resolving format names"""
+
+    def test_presets(self):
+        """Test every preset resolves to an SDK format name"""
+        for preset, name in AUDIO_FORMAT_PRESETS.items():
+            assert parse_audio_format(preset).name == name
+
+    def test_sdk_names(self):
+        """Test containers, rates and bitrates are read from SDK names"""
+        mp3 = parse_audio_format("Audio24Khz48KBitRateMonoMp3")
+        opus = parse_audio_format("Ogg16Khz16BitMonoOpus")
+        pcm = parse_audio_format("Riff22050Hz16BitMonoPcm")
+        raw = parse_audio_format("Raw8Khz16BitMonoPcm")
+
+        assert (mp3.container, mp3.sample_rate, mp3.bitrate_kbps, mp3.mime_type) == ("mp3", 24000, 48, "audio/mpeg")
+        assert (opus.container, opus.sample_rate, opus.mime_type) == ("ogg", 16000, "audio/ogg")
+        assert (pcm.container, pcm.sample_rate, pcm.compressed) == ("riff", 22050, False)
+        assert raw.mime_type == "audio/L16;rate=8000"
+
+    def test_unsupported(self):
+        """Test formats the apps cannot decode are rejected"""
+        for name in ["Riff16Khz16KbpsMonoSiren", "Webm16Khz16BitMonoOpus", "Raw8Khz8BitMonoMULaw", "flac"]:
+            with pytest.raises(ValueError):
+                parse_audio_format(name)
+
+
+class TestEncodeDecode:
+    """Tests for encoding and decoding audio"""
+
+    @pytest.mark.parametrize("preset", ["pcm", "pcm-8k", "raw", "opus", "mp3"])
+    def test_round_trip(self, preset, tone):
+        """Test encoded audio decodes to about the same duration and rate"""
+        audio_format = parse_audio_format(preset)
+        samples = tone[::16000 // audio_format.sample_rate]
+
+        decoded, sample_rate = decode_audio(encode_audio(samples, audio_format), audio_format, dtype="int16")
+
+        assert sample_rate == audio_format.sample_rate
+        assert abs(len(decoded) - len(samples)) < audio_format.sample_rate * 0.1
+
+    def test_sniffed_formats(self, tone):
+        """Test headers identify the container when the format is not given"""
+        for preset, container in [("pcm", "riff"), ("opus", "ogg"), ("mp3", "mp3")]:
+            audio = encode_audio(tone, parse_audio_format(preset))
+            assert sniff_audio_format(audio).container == container
+            samples, sample_rate = decode_audio(audio)
+            assert sample_rate == 16000
+            assert samples.dtype == np.float32
+
+    def test_raw_uses_given_rate(self, tone):
+        """Test headerless PCM decodes at the assumed rate"""
+        samples, sample_rate = decode_audio(tone.tobytes(), sniff_audio_format(tone.tobytes(), 8000))
+
+        assert sample_rate == 8000
+        assert np.abs(samples).max() < 1.0
+
+
+class TestTranslatorFormats:
+    """Tests for per-session output formats on the translator"""
+
+    def test_default_from_settings(self, translator):
+        """Test the settings format is used until the session picks one"""
+        assert translator.audio_format.name == "Riff16Khz16BitMonoPcm"
+
+    def test_compressed_session_audio(self, translator):
+        """Test a compressed session format cuts synthesized bytes several times over"""
+        pcm = translator.synthesize_translation("The council will now hear public comment", "es-ES")
+        translator.set_audio_format("opus")
+        opus = translator.synthesize_translation("The council will now hear public comment", "es-ES")
+
+        assert opus[:4] == b"OggS"
+        assert len(pcm) / len(opus) > 5
+        assert translator.synthesizer_pool.stats()["created"] == 2  # One pooled synthesizer per format
+
+    def test_invalid_format_keeps_current(self, translator):
+        """Test an unsupported format raises and leaves the session format unchanged"""
+        with pytest.raises(ValueError):
+            translator.set_audio_format("Riff16Khz16KbpsMonoSiren")
+
+        assert translator.audio_format.name == "Riff16Khz16BitMonoPcm"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
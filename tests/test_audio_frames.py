@@ -0,0 +1,176 @@
+"""Pytest tests for binary WebSocket audio frames"""
+
+import importlib
+import json
+import logging
+
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from src.core.audio_formats import parse_audio_format
+from src.core.audio_frames import (
+    BINARY_SUBPROTOCOL, HEADER_SIZE, JSON_SUBPROTOCOL, FrameKind, decode_frame, encode_frame
+)
+from src.core.config import Settings
+from src.core.speech_engine import synthetic_audio
+
+PCM_CHUNK = b"\x00" * 6400  # 200 ms of 16 kHz 16-bit mono
+
+
+class TestFrameCodec:
+    """Tests for encoding and decoding frames"""
+
+    def test_round_trip(self):
+        """Test every header field and the payload survive encoding"""
+        mp3 = parse_audio_format("mp3")
+        frame = decode_frame(encode_frame(FrameKind.CHUNK, b"audio", 7, 42, 3, "es-ES", mp3, final=True))
+
+        assert frame.kind == FrameKind.CHUNK
+        assert frame.payload == b"audio"
+        assert (frame.session_id, frame.utterance_id, frame.sequence) == (7, 42, 3)
+        assert frame.language == "es-ES"
+        assert (frame.codec, frame.sample_rate) == ("mp3", 16000)
+        assert frame.final and frame.error is None
+
+    @pytest.mark.parametrize("name, rate", [
+        ("Riff22050Hz16BitMonoPcm", 22050), ("Raw44100Hz16BitMonoPcm", 44100), ("Raw48Khz16BitMonoPcm", 48000)
+    ])
+    def test_sample_rate_round_trip(self, name, rate):
+        """Test rates that are not whole kilohertz keep their exact value"""
+        frame = decode_frame(encode_frame(FrameKind.CLIP, b"audio", audio_format=parse_audio_format(name)))
+
+        assert frame.sample_rate == rate
+
+    def test_header_is_compact(self):
+        """Test the overhead is the fixed header plus the language code"""
+        data = encode_frame(FrameKind.CLIP, b"x" * 1000, language="es-ES")
+
+        assert len(data) == HEADER_SIZE + len("es-ES") + 1000
+        assert HEADER_SIZE <= 20
+
+    def test_error_replaces_payload(self):
+        """Test an error is carried in place of audio"""
+        frame = decode_frame(encode_frame(FrameKind.CHUNK, b"ignored", final=True, error="Synthesis failed"))
+
+        assert frame.error == "Synthesis failed"
+        assert frame.payload == b""
+
+    @pytest.mark.parametrize("data", [b"\x01\x01", b"\x09" + b"\x00" * 20, b"\x02\x63" + b"\x00" * 20])
+    def test_malformed_frames_raise(self, data):
+        """Test truncated frames, other versions and unknown kinds are rejected"""
+        with pytest.raises(ValueError):
+            decode_frame(data)
+
+    def test_field_overflow_raises(self):
+        """Test values that do not fit the header raise ValueError"""
+        with pytest.raises(ValueError):
+            encode_frame(FrameKind.CHUNK, sequence=2 ** 32)
+
+
+@pytest.fixture
+def main():
+    """Backend module; its import-time logging setup is undone afterwards so other tests stay quiet"""
+    handlers, level = list(logging.root.handlers), logging.root.level
+    yield importlib.import_module("src.react_app.backend.main")
+    logging.root.handlers[:] = handlers
+    logging.root.setLevel(level)
+
+
+@pytest.fixture
+def client(main, monkeypatch):
+    """Backend on a fast simulated engine"""
+    settings = Settings(speech_key='test_key', speech_region='eastus', speech_engine='simulated',
+                        target_language='es-ES', target_language_2=None, tts_cache_enabled=False,
+                        simulated_latency_ms=20, simulated_jitter_ms=0, simulated_connect_ms=10,
+                        simulated_synthesis_ms=5)
+    monkeypatch.setattr(main, "settings", settings)
+    with TestClient(main.app) as client:
+        yield client
+
+
+def receive(ws):
+    """Next message: a decoded frame for binary messages, the parsed JSON otherwise"""
+    message = ws.receive()
+    if message.get("bytes") is not None:
+        return decode_frame(message["bytes"])
+    return json.loads(message["text"])
+
+
+def receive_until(ws, message_type: str) -> dict:
+    """Read messages until a JSON message of the given type arrives, skipping frames"""
+    while True:
+        message = receive(ws)
+        if isinstance(message, dict) and message["type"] == message_type:
+            return message
+        assert not isinstance(message, dict) or message["type"] != "error", message
+
+
+class TestBackendBinaryFrames:
+    """Tests for binary frames over the backend WebSocket"""
+
+    def test_negotiated_at_connect(self, client):
+        """Test the subprotocol decides the framing, and JSON stays the default"""
+        with client.websocket_connect("/ws/translate", subprotocols=[BINARY_SUBPROTOCOL, JSON_SUBPROTOCOL]) as ws:
+            assert ws.accepted_subprotocol == BINARY_SUBPROTOCOL
+            assert ws.receive_json()["data"]["binary_frames"] is True
+        with client.websocket_connect("/ws/translate", subprotocols=[JSON_SUBPROTOCOL]) as ws:
+            assert ws.accepted_subprotocol == JSON_SUBPROTOCOL
+            assert ws.receive_json()["data"]["binary_frames"] is False
+        with client.websocket_connect("/ws/translate") as ws:
+            assert ws.receive_json()["data"]["binary_frames"] is False
+
+    def test_disabled_by_setting(self, main, client, monkeypatch):
+        """Test WEBSOCKET_BINARY_FRAMES=false keeps offering clients on JSON"""
+        monkeypatch.setattr(main.settings, "websocket_binary_frames", False)
+        with client.websocket_connect("/ws/translate", subprotocols=[BINARY_SUBPROTOCOL, JSON_SUBPROTOCOL]) as ws:
+            assert ws.accepted_subprotocol == JSON_SUBPROTOCOL
+
+    def test_unsupported_subprotocols_are_refused(self, main, client, monkeypatch):
+        """Test a client offering only subprotocols the server cannot speak is refused, not sent JSON"""
+        monkeypatch.setattr(main.settings, "websocket_binary_frames", False)
+        for offered in (["live-interpreter.unknown.v1"], [BINARY_SUBPROTOCOL]):
+            with pytest.raises(WebSocketDisconnect) as refused:
+                with client.websocket_connect("/ws/translate", subprotocols=offered):
+                    pass
+            assert refused.value.code == 1002
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/ws/listen/council", subprotocols=["live-interpreter.unknown.v1"]):
+                pass
+
+    @pytest.mark.parametrize("stream_audio", [False, True])
+    def test_audio_arrives_as_frames(self, client, stream_audio):
+        """Test uploaded frames are translated and synthesized audio comes back in frames, not JSON"""
+        with client.websocket_connect("/ws/translate", subprotocols=[BINARY_SUBPROTOCOL]) as ws:
+            session_id = receive_until(ws, "connected")["data"]["session_id"]
+            ws.send_json({"type": "config", "data": {
+                "target_languages": ["es-ES"], "audio_source": "stream", "stream_audio": stream_audio, "audio_format": "mp3"
+            }})
+            receive_until(ws, "config_confirmed")
+            ws.send_json({"type": "start_recording"})
+            for sequence in range(12):
+                ws.send_bytes(encode_frame(FrameKind.INPUT, PCM_CHUNK, session_id, sequence=sequence))
+
+            recognized = receive_until(ws, "recognized")["data"]
+            audio = b""
+            while True:
+                frame = receive(ws)
+                if isinstance(frame, dict):
+                    assert frame["type"] == "recognizing", frame  # Audio never comes as JSON
+                    continue
+                assert frame.session_id == session_id
+                assert frame.utterance_id == recognized["utterance_id"]
+                assert frame.language == "es-ES"
+                assert frame.codec == "mp3"
+                audio += frame.payload
+                if frame.final:
+                    break
+            ws.send_json({"type": "stop_recording"})
+            receive_until(ws, "stopped")
+
+        assert recognized["synthesized_audio"] == {}
+        assert audio == synthetic_audio(recognized["translations"]["es-ES"], "mp3")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
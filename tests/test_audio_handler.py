@@ -266,7 +266,7 @@ class TestAudioConverter:
         
         assert isinstance(audio_data, np.ndarray)
         assert sample_rate == 16000
-        mock_read.assert_called_once_with("test.wav")
+        mock_read.assert_called_once_with("test.wav", dtype='float64')
     
     @patch('soundfile.write')
     def test_numpy_to_wav(self, mock_write, sample_audio_data):
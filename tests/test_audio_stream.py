@@ -0,0 +1,138 @@
+"""Pytest unit tests for client audio streaming into push-stream recognizers"""
+
+import asyncio
+import time
+
+import pytest
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.core.audio_stream import AudioStreamFeeder
+from src.core.config import Settings
+from src.core.translator import AzureSpeechTranslator, LiveInterpreterTranslator
+
+
+class RecordingPushStream:
+    """Push stream stand-in that records writes"""
+
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+
+    def write(self, chunk):
+        assert not self.closed
+        self.chunks.append(chunk)
+
+    def close(self):
+        self.closed = True
+
+
+class TestAudioStreamFeeder:
+    """Tests for bounded, paced feeding of client audio"""
+
+    def test_writes_chunks_in_order_then_closes(self):
+        """Test queued chunks reach the stream in order before it closes"""
+        stream = RecordingPushStream()
+
+        async def run():
+            feeder = AudioStreamFeeder(stream)
+            task = asyncio.create_task(feeder.run())
+            for i in range(5):
+                await feeder.feed(bytes([i]) * 320)
+            feeder.close()
+            await task
+            return feeder
+
+        feeder = asyncio.run(run())
+
+        assert [chunk[0] for chunk in stream.chunks] == [0, 1, 2, 3, 4]
+        assert stream.closed
+        assert feeder.stats()['bytes_written'] == 1600
+
+    def test_full_queue_applies_backpressure(self):
+        """Test feed waits once max_queued_chunks are buffered"""
+        stream = RecordingPushStream()
+
+        async def run():
+            feeder = AudioStreamFeeder(stream, max_queued_chunks=2)
+            await feeder.feed(b'\x00' * 320)
+            await feeder.feed(b'\x00' * 320)
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(feeder.feed(b'\x00' * 320), timeout=0.05)
+            return feeder
+
+        feeder = asyncio.run(run())
+
+        assert feeder.backpressure_waits == 1
+        assert stream.chunks == []
+
+    def test_writer_paces_to_real_time(self):
+        """Test the writer stays within max_lead_ms of real time"""
+        stream = RecordingPushStream()
+        one_second = b'\x00' * 32000
+
+        async def run():
+            feeder = AudioStreamFeeder(stream, max_lead_ms=100)
+            task = asyncio.create_task(feeder.run())
+            start = time.perf_counter()
+            for _ in range(3):
+                await feeder.feed(one_second[:16000])  # 500 ms each
+            feeder.close()
+            await task
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+
+        # Third chunk starts at 1.0s of audio, so it may be written at 0.9s at the earliest
+        assert elapsed >= 0.85
+
+    def test_feed_after_close_raises(self):
+        """Test feeding a closed stream is an error"""
+        async def run():
+            feeder = AudioStreamFeeder(RecordingPushStream())
+            feeder.close()
+            await feeder.feed(b'\x00')
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(run())
+
+
+class TestStreamRecognizers:
+    """Tests for push-stream recognizer construction (no network needed)"""
+
+    @pytest.fixture
+    def settings(self):
+        return Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False)
+
+    def test_create_push_stream(self, settings):
+        """Test the push stream is created for 16 kHz mono PCM"""
+        stream = AzureSpeechTranslator(settings).create_push_stream()
+
+        assert isinstance(stream, speechsdk.audio.PushAudioInputStream)
+        stream.close()
+
+    def test_create_recognizer_from_stream(self, settings):
+        """Test a standard translator builds a push-stream recognizer"""
+        translator = AzureSpeechTranslator(settings)
+        stream = translator.create_push_stream()
+
+        recognizer = translator.create_recognizer_from_stream(stream, auto_detect_languages=['en-US', 'es-ES'])
+
+        assert isinstance(recognizer, speechsdk.translation.TranslationRecognizer)
+        translator.close()
+
+    def test_live_interpreter_stream_uses_continuous_language_id(self, settings):
+        """Test the Live Interpreter stream recognizer enables continuous language ID"""
+        settings.enable_live_interpreter = True
+        translator = LiveInterpreterTranslator(settings)
+
+        recognizer = translator.create_recognizer_from_stream(translator.create_push_stream())
+
+        assert recognizer.properties.get_property(
+            speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode
+        ) == 'Continuous'
+        translator.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
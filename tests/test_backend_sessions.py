@@ -0,0 +1,165 @@
+"""Pytest tests for per-connection session configuration in the WebSocket backend"""
+
+import asyncio
+import base64
+import importlib
+import logging
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.config import Settings
+from src.core.translator import AzureSpeechTranslator
+
+SESSIONS = 12
+LANGUAGE_SETS = [
+    ["es-ES"], ["fr-FR", "de-DE"], ["it-IT", "pt-BR", "ja-JP"], ["zh-CN"], ["ko-KR", "es-ES"], ["de-DE", "fr-FR", "it-IT"]
+]
+AUDIO_CHUNK = base64.b64encode(b"\x00" * 6400).decode()  # 200 ms of 16 kHz 16-bit mono
+
+
+@pytest.fixture
+def main():
+    """Backend module; its import-time logging setup is undone afterwards so other tests stay quiet"""
+    handlers, level = list(logging.root.handlers), logging.root.level
+    yield importlib.import_module("src.react_app.backend.main")
+    logging.root.handlers[:] = handlers
+    logging.root.setLevel(level)
+
+
+@pytest.fixture
+def client(main, monkeypatch):
+    """Backend on the simulated engine with fast handshakes and results"""
+    settings = Settings(
+        speech_key='test_key',
+        speech_region='eastus',
+        speech_engine='simulated',
+        source_language='en-US',
+        target_language='es-ES',
+        target_language_2=None,
+        tts_cache_enabled=False,
+        simulated_latency_ms=20,
+        simulated_jitter_ms=0,
+        simulated_connect_ms=10,
+        simulated_synthesis_ms=5
+    )
+    monkeypatch.setattr(main, "settings", settings)
+    with TestClient(main.app) as client:
+        yield client
+
+
+def receive_until(ws, message_type: str) -> dict:
+    """Read messages until one of the given type arrives"""
+    while True:
+        message = ws.receive_json()
+        if message["type"] == message_type:
+            return message
+        assert message["type"] != "error", message
+
+
+class TestConcurrentSessions:
+    """Tests that simultaneous connections keep their own languages and voices"""
+
+    def test_sessions_do_not_share_configuration(self, main, client):
+        """Test many clients configured at once each get their own languages, voices and translations"""
+        configured = threading.Barrier(SESSIONS + 1, timeout=30)
+        checked = threading.Barrier(SESSIONS + 1, timeout=30)
+        results = {}
+        errors = []
+
+        def run_client(i: int):
+            languages = LANGUAGE_SETS[i % len(LANGUAGE_SETS)]
+            voice = f"{languages[0]}-Session{i}Neural"
+            try:
+                with client.websocket_connect("/ws/translate") as ws:
+                    receive_until(ws, "connected")
+                    ws.send_json({"type": "config", "data": {
+                        "target_languages": languages,
+                        "voice_preferences": {languages[0]: voice},
+                        "audio_source": "stream"
+                    }})
+                    confirmed = receive_until(ws, "config_confirmed")["data"]
+                    configured.wait()
+                    checked.wait()
+
+                    ws.send_json({"type": "start_recording"})
+                    for _ in range(12):
+                        ws.send_json({"type": "audio", "data": AUDIO_CHUNK})
+                    recognized = receive_until(ws, "recognized")["data"]
+                    ws.send_json({"type": "stop_recording"})
+                    receive_until(ws, "stopped")
+                results[i] = (languages, confirmed, recognized)
+            except Exception as e:
+                errors.append(e)
+                configured.abort()
+                checked.abort()
+
+        threads = [threading.Thread(target=run_client, args=(i,)) for i in range(SESSIONS)]
+        for thread in threads:
+            thread.start()
+
+        # Every connection is configured before any of them records
+        configured.wait()
+        sessions = {
+            tuple(session.translator.settings.target_languages): session.translator.settings
+            for session in main.manager.sessions.values()
+        }
+        checked.wait()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        assert not errors, errors
+        assert len(results) == SESSIONS
+        assert set(sessions) == {tuple(languages) for languages in LANGUAGE_SETS}
+        for languages, session_settings in sessions.items():
+            assert session_settings.get_voice_for_language(languages[0]).startswith(f"{languages[0]}-Session")
+        for languages, confirmed, recognized in results.values():
+            assert confirmed["target_languages"] == languages
+            assert set(recognized["translations"]) == set(languages)
+        assert main.settings.target_languages == ['es-ES']
+        assert main.settings.voice_es_es is None
+
+
+class TestFinalResults:
+    """Tests for delivering final results"""
+
+    def test_finals_arrive_in_order(self, client, monkeypatch):
+        """Test a final whose audio takes long to synthesize is still sent before the next one"""
+        synthesize = AzureSpeechTranslator.synthesize_translations_async
+        calls = []
+
+        async def slow_first(self, translations):
+            calls.append(translations)
+            if len(calls) == 1:
+                await asyncio.sleep(2.5)  # Renders until after the next final (2 s of audio later) arrives
+            return await synthesize(self, translations)
+
+        monkeypatch.setattr(AzureSpeechTranslator, "synthesize_translations_async", slow_first)
+        received = []
+        with client.websocket_connect("/ws/translate") as ws:
+            receive_until(ws, "connected")
+            ws.send_json({"type": "config", "data": {"target_languages": ["es-ES"], "audio_source": "stream"}})
+            receive_until(ws, "config_confirmed")
+            ws.send_json({"type": "start_recording"})
+            for _ in range(40):
+                ws.send_json({"type": "audio", "data": AUDIO_CHUNK})
+            received.append(receive_until(ws, "recognized")["data"])
+            received.append(receive_until(ws, "recognized")["data"])
+            ws.send_json({"type": "stop_recording"})
+            while True:
+                message = ws.receive_json()
+                if message["type"] == "stopped":
+                    break
+                if message["type"] == "recognized":
+                    received.append(message["data"])
+
+        ids = [data["utterance_id"] for data in received]
+        assert len(calls) >= 2
+        assert ids == sorted(ids)
+        assert all(data["synthesized_audio"] for data in received)
+        assert len(received) == len(calls)  # Every synthesized final was sent before "stopped"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
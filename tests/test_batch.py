@@ -0,0 +1,166 @@
+"""Pytest unit tests for batch file translation"""
+
+import asyncio
+import json
+import threading
+import time
+import wave
+
+import pytest
+
+from src.core.batch import BatchReport, BatchTranslator, FileReport, find_audio_files, wav_duration
+from src.core.config import Settings
+from src.core.translator import AzureSpeechTranslator
+from tests.fakes import FakeFileRecognizer
+
+
+def write_wav(path, seconds):
+    """Write a silent 16 kHz mono WAV"""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\x00\x00" * int(16000 * seconds))
+
+
+@pytest.fixture
+def translator():
+    """Translator used for result parsing"""
+    translator = AzureSpeechTranslator(
+        Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False)
+    )
+    yield translator
+    translator.close()
+
+
+class TestBatchTranslator:
+    """Tests for continuous whole-file recognition and batching"""
+
+    def test_all_utterances_with_offsets(self, translator):
+        """Test every utterance of a file is returned with its offset"""
+        recognizer = FakeFileRecognizer([(0, "Good morning."), (2500, "Let's begin."), (7000, "Item one.")])
+        engine = BatchTranslator(translator)
+
+        records = asyncio.run(engine.recognize_all(recognizer, "meeting.wav"))
+
+        assert [r.original_text for r in records] == ["Good morning.", "Let's begin.", "Item one."]
+        assert [r.offset_ms for r in records] == [0, 2500, 7000]
+        assert [r.index for r in records] == [0, 1, 2]
+        assert records[1].translations == {'es-ES': "es:Let's begin."}
+        assert recognizer.stopped
+
+    def test_offset_base_is_added(self, translator):
+        """Test segment offsets are shifted by offset_ms"""
+        engine = BatchTranslator(translator)
+
+        records = asyncio.run(engine.recognize_all(FakeFileRecognizer([(100, "Hi.")]), "seg", offset_ms=60000))
+
+        assert records[0].offset_ms == 60100
+
+    def test_error_cancellation_raises(self, translator):
+        """Test a service error fails the file"""
+        engine = BatchTranslator(translator)
+
+        with pytest.raises(RuntimeError, match="auth"):
+            asyncio.run(engine.recognize_all(FakeFileRecognizer([], error="auth failed"), "x.wav"))
+
+    def test_bounded_concurrency(self, translator, tmp_path):
+        """Test files overlap up to max_concurrency"""
+        active = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        class CountingRecognizer(FakeFileRecognizer):
+            def _play(self):
+                with lock:
+                    active['now'] += 1
+                    active['peak'] = max(active['peak'], active['now'])
+                time.sleep(0.1)
+                with lock:
+                    active['now'] -= 1
+                super()._play()
+
+        paths = [str(tmp_path / f"m{i}.wav") for i in range(6)]
+        engine = BatchTranslator(
+            translator, max_concurrency=3,
+            recognizer_factory=lambda path: CountingRecognizer([(0, path)], delay=0)
+        )
+
+        start = time.perf_counter()
+        report = asyncio.run(engine.translate_files(paths))
+        elapsed = time.perf_counter() - start
+
+        assert active['peak'] == 3
+        assert elapsed < 0.5  # 6 x 100ms serialized would take 0.6s
+        assert [f.file for f in report.files] == paths
+
+    def test_failures_are_reported_per_file(self, translator, tmp_path):
+        """Test one failing file doesn't stop the batch"""
+        def factory(path):
+            return FakeFileRecognizer([], error="bad audio") if path.endswith("bad.wav") else FakeFileRecognizer([(0, "Ok.")])
+        engine = BatchTranslator(translator, recognizer_factory=factory)
+
+        report = asyncio.run(engine.translate_files([str(tmp_path / "good.wav"), str(tmp_path / "bad.wav")]))
+
+        assert report.files[0].error is None
+        assert "bad audio" in report.files[1].error
+        assert report.summary()['failed'] == 1
+
+    def test_timeout(self, translator, tmp_path):
+        """Test a file that never ends times out"""
+        engine = BatchTranslator(
+            translator, file_timeout_s=0.05,
+            recognizer_factory=lambda path: FakeFileRecognizer([], delay=1.0)
+        )
+
+        report = asyncio.run(engine.translate_files([str(tmp_path / "slow.wav")]))
+
+        assert "Timed out" in report.files[0].error
+
+    def test_jsonl_records_stream_as_recognized(self, translator, tmp_path):
+        """Test on_record gets each utterance as a JSONL-serializable record"""
+        lines = []
+        engine = BatchTranslator(translator, recognizer_factory=lambda path: FakeFileRecognizer([(0, "Uno."), (900, "Dos.")]))
+
+        asyncio.run(engine.translate_files([str(tmp_path / "a.wav")], on_record=lambda r: lines.append(r.to_json())))
+
+        parsed = [json.loads(line) for line in lines]
+        assert [p['original_text'] for p in parsed] == ["Uno.", "Dos."]
+        assert parsed[1]['offset_ms'] == 900
+
+
+class TestReports:
+    """Tests for real-time factor and throughput"""
+
+    def test_wav_duration(self, tmp_path):
+        """Test WAV durations are read from the header"""
+        write_wav(tmp_path / "a.wav", 1.5)
+
+        assert wav_duration(tmp_path / "a.wav") == pytest.approx(1.5)
+        assert wav_duration(tmp_path / "missing.wav") is None
+
+    def test_real_time_factor_and_throughput(self):
+        """Test batch totals"""
+        report = BatchReport(
+            files=[FileReport("a.wav", 60.0, 10.0, 5), FileReport("b.wav", 120.0, 20.0, 9)],
+            elapsed_seconds=30.0
+        )
+
+        assert report.files[0].real_time_factor == pytest.approx(1 / 6)
+        assert report.real_time_factor == pytest.approx(30 / 180)
+        assert report.throughput == pytest.approx(6.0)
+        assert report.summary()['utterances'] == 14
+
+    def test_find_audio_files(self, tmp_path):
+        """Test directories are expanded recursively"""
+        (tmp_path / "2024").mkdir()
+        write_wav(tmp_path / "2024" / "jan.wav", 0.1)
+        write_wav(tmp_path / "feb.wav", 0.1)
+        (tmp_path / "notes.txt").write_text("x")
+
+        found = find_audio_files([str(tmp_path)])
+
+        assert sorted(p.name for p in found) == ["feb.wav", "jan.wav"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
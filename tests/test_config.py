@@ -3,7 +3,9 @@
 import pytest
 from unittest.mock import patch
 
-from src.core.config import Settings
+from pydantic import ValidationError
+
+from src.core.config import SessionSettings, Settings
 from src.core.translator import LiveInterpreterTranslator
 
 
@@ -215,5 +217,53 @@ class TestConfigEdgeCases:
         assert voice is not None or voice is None  # Either configured or None
 
 
+
+class TestSessionSettings:
+    """Tests for per-session settings derived from the process settings"""
+    
+    @pytest.fixture
+    def base(self):
+        """Process-wide settings"""
+        return Settings(speech_key='test_key', speech_region='eastus', source_language='en-US',
+                        target_language='es-ES', target_language_2='fr-FR', voice_es_es='es-ES-AlvaroNeural')
+    
+    def test_derivation_leaves_base_unchanged(self, base):
+        """Test a session's languages and voices never reach the base settings"""
+        session = base.for_session(source_language='de-DE', target_languages=['it-IT'],
+                                   voices={'it-IT': 'it-IT-IsabellaNeural', 'es-ES': 'es-ES-ElviraNeural'})
+        
+        assert isinstance(session, SessionSettings)
+        assert session.source_language == 'de-DE'
+        assert session.target_languages == ['it-IT']
+        assert session.get_voice_for_language('it-IT') == 'it-IT-IsabellaNeural'
+        assert session.get_voice_for_language('es-ES') == 'es-ES-ElviraNeural'
+        assert base.source_language == 'en-US'
+        assert base.target_languages == ['es-ES', 'fr-FR']
+        assert base.get_voice_for_language('es-ES') == 'es-ES-AlvaroNeural'
+    
+    def test_session_settings_are_frozen(self, base):
+        """Test a session cannot change its settings after creation"""
+        session = base.for_session(target_languages=['it-IT'])
+        
+        with pytest.raises(ValidationError):
+            session.target_language = 'fr-FR'
+    
+    def test_unset_values_are_inherited(self, base):
+        """Test omitted languages keep the base values and at most three targets are used"""
+        assert base.for_session().target_languages == ['es-ES', 'fr-FR']
+        assert base.for_session(target_languages=[]).source_language == 'en-US'
+        assert base.for_session(target_languages=['a-A', 'b-B', 'c-C', 'd-D']).target_languages == ['a-A', 'b-B', 'c-C']
+        assert base.for_session().get_voice_for_language('es-ES') == 'es-ES-AlvaroNeural'
+    
+    def test_derive_from_session(self, base):
+        """Test deriving again merges voice choices"""
+        first = base.for_session(voices={'es-ES': 'es-ES-ElviraNeural'})
+        second = first.for_session(voices={'fr-FR': 'fr-FR-HenriNeural'})
+        
+        assert second.get_voice_for_language('es-ES') == 'es-ES-ElviraNeural'
+        assert second.get_voice_for_language('fr-FR') == 'fr-FR-HenriNeural'
+        assert first.get_voice_for_language('fr-FR') != 'fr-FR-HenriNeural'
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
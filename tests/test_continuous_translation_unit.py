@@ -2,7 +2,11 @@
 
 import pytest
 from datetime import datetime
-from src.core.translator import TranslationResult, LiveInterpreterTranslator
+from types import SimpleNamespace
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.core.translator import InterimResult, TranslationResult, LiveInterpreterTranslator
 from src.core.config import Settings
 
 
@@ -260,5 +264,67 @@ class TestContinuousModeTiming:
         assert isinstance(result.duration_ms, int)
 
 
+
+class TestInterimResult:
+    """Tests for the lightweight interim result path"""
+    
+    @staticmethod
+    def make_sdk_result(reason=speechsdk.ResultReason.TranslatingSpeech):
+        """Build an object shaped like an SDK translation result"""
+        return SimpleNamespace(
+            reason=reason,
+            text="Hello wor",
+            translations={'es-ES': 'Hola mun'},
+            properties={speechsdk.PropertyId.SpeechServiceConnection_AutoDetectSourceLanguageResult: 'en-US'},
+            duration=0
+        )
+    
+    def test_interim_has_no_instance_dict(self):
+        """Test InterimResult uses slots"""
+        result = InterimResult("Hello", {'es-ES': 'Hola'})
+        
+        assert not hasattr(result, '__dict__')
+        with pytest.raises(AttributeError):
+            result.extra = 1
+    
+    def test_process_interim_reads_translating_events(self, mock_settings):
+        """Test recognizing events keep their partial text and translations"""
+        translator = LiveInterpreterTranslator(mock_settings)
+        
+        result = translator._process_interim(self.make_sdk_result())
+        
+        assert isinstance(result, InterimResult)
+        assert result.original_text == "Hello wor"
+        assert result.translations == {'es-ES': 'Hola mun'}
+        assert result.detected_language == 'en-US'
+        assert result.received_at > 0
+    
+    def test_process_interim_without_detected_language(self, mock_settings):
+        """Test a missing auto-detect property yields None"""
+        translator = LiveInterpreterTranslator(mock_settings)
+        sdk_result = self.make_sdk_result()
+        sdk_result.properties = {}
+        
+        assert translator._process_interim(sdk_result).detected_language is None
+    
+    def test_recognizing_events_use_interim_path(self, mock_settings):
+        """Test _connect_callbacks routes recognizing events to InterimResult"""
+        translator = LiveInterpreterTranslator(mock_settings)
+        handlers = {}
+        recognizer = SimpleNamespace(
+            recognizing=SimpleNamespace(connect=lambda h: handlers.setdefault('recognizing', h)),
+            recognized=SimpleNamespace(connect=lambda h: handlers.setdefault('recognized', h)),
+            session_stopped=SimpleNamespace(connect=lambda h: handlers.setdefault('session_stopped', h))
+        )
+        received = []
+        
+        translator._connect_callbacks(recognizer, recognizing_callback=received.append, recognized_callback=received.append)
+        handlers['recognizing'](SimpleNamespace(result=self.make_sdk_result()))
+        handlers['recognized'](SimpleNamespace(result=self.make_sdk_result(speechsdk.ResultReason.TranslatedSpeech)))
+        translator.wait_for_callbacks(recognizer)
+        
+        assert isinstance(received[0], InterimResult)
+        assert isinstance(received[1], TranslationResult)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,259 @@
+"""Pytest unit tests for the shared fair executors and callback offloading"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.core.config import Settings
+from src.core.executor import FairExecutor, QueueFullError
+from src.core.translator import AzureSpeechTranslator
+from tests.fakes import FakeRecognizer
+
+
+@pytest.fixture
+def executor():
+    """Executor with two workers, shut down after the test"""
+    executor = FairExecutor(2, max_pending_per_key=4, name="test")
+    yield executor
+    executor.shutdown()
+
+
+class TestFairExecutor:
+    """Tests for ordering, fairness, limits and bookkeeping"""
+
+    def test_key_tasks_run_in_order(self, executor):
+        """Test one key's tasks run one at a time in submission order"""
+        order = []
+        futures = [executor.submit("a", lambda i=i: (time.sleep(0.005), order.append(i))) for i in range(4)]
+
+        for future in futures:
+            future.result(timeout=2)
+
+        assert order == [0, 1, 2, 3]
+
+    def test_busy_key_does_not_starve_others(self):
+        """Test a key submitted behind a long backlog is served before the backlog finishes"""
+        executor = FairExecutor(1, name="test")
+        finished = []
+        for i in range(10):
+            executor.submit("busy", lambda i=i: (time.sleep(0.01), finished.append(("busy", i))))
+        executor.submit("quiet", lambda: finished.append(("quiet", 0))).result(timeout=2)
+
+        assert finished.index(("quiet", 0)) <= 2
+        executor.shutdown()
+
+    def test_threads_are_bounded(self, executor):
+        """Test many keys share at most max_workers threads"""
+        names = set()
+        futures = [
+            executor.submit(key, lambda: (time.sleep(0.002), names.add(threading.current_thread().name)))
+            for key in range(50)
+        ]
+        for future in futures:
+            future.result(timeout=5)
+
+        assert executor.stats()["workers"] == 2
+        assert len(names) <= 2
+
+    def test_max_running_per_key(self, executor):
+        """Test a key may run several tasks at once when allowed"""
+        barrier = threading.Barrier(2, timeout=2)
+        futures = [executor.submit("a", barrier.wait, max_running=2) for _ in range(2)]
+
+        for future in futures:
+            future.result(timeout=2)
+
+    def test_idle_worker_does_not_serialize_burst(self, executor):
+        """Test a burst submitted while one worker idles still starts a second worker"""
+        executor.submit("warm", lambda: None).result(timeout=2)
+        time.sleep(0.05)  # The only worker is now waiting for work
+        barrier = threading.Barrier(2, timeout=2)
+        futures = [executor.submit("a", barrier.wait, max_running=2) for _ in range(2)]
+
+        for future in futures:
+            future.result(timeout=2)
+
+    def test_queue_depth_limit(self, executor):
+        """Test submissions beyond the per-key limit are rejected and counted"""
+        release = threading.Event()
+        executor.submit("a", release.wait)
+        time.sleep(0.05)  # Let the first task start
+        for _ in range(4):
+            executor.submit("a", lambda: None)
+
+        with pytest.raises(QueueFullError):
+            executor.submit("a", lambda: None)
+        executor.submit("b", lambda: None).result(timeout=2)  # Other keys are unaffected
+        release.set()
+
+        assert executor.drain("a", timeout=2)
+        stats = executor.stats()
+        assert stats["rejected"] == 1
+        assert stats["max_queue_depth"] == 4
+
+    def test_unbounded_submissions_are_kept(self, executor):
+        """Test tasks submitted with bounded=False are queued past the per-key limit"""
+        release = threading.Event()
+        executor.submit("a", release.wait)
+        time.sleep(0.05)
+        futures = [executor.submit("a", lambda i=i: i, bounded=False) for i in range(6)]
+        release.set()
+
+        assert [future.result(timeout=2) for future in futures] == list(range(6))
+        assert executor.stats()["rejected"] == 0
+
+    def test_failures_are_counted(self, executor):
+        """Test a raising task fails its future without stopping the worker"""
+        failed = executor.submit("a", lambda: 1 / 0)
+        ok = executor.submit("a", lambda: "ok")
+
+        with pytest.raises(ZeroDivisionError):
+            failed.result(timeout=2)
+        assert ok.result(timeout=2) == "ok"
+        assert executor.stats()["failed"] == 1
+
+    def test_drain_and_discard(self, executor):
+        """Test drain waits for queued work and discard cancels it"""
+        release = threading.Event()
+        executor.submit("a", release.wait)
+        queued = [executor.submit("a", lambda: None) for _ in range(3)]
+
+        assert not executor.drain("a", timeout=0.05)
+        assert executor.discard("a") == 3
+        assert all(future.cancelled() for future in queued)
+        release.set()
+        assert executor.drain("a", timeout=2)
+        assert executor.stats()["sessions"] == 0
+
+    def test_drain_async(self, executor):
+        """Test drain_async waits without blocking the event loop"""
+        executor.submit("a", time.sleep, 0.05)
+
+        async def run():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+            ticker = asyncio.create_task(tick())
+            drained = await executor.drain_async("a", timeout=2)
+            ticker.cancel()
+            return drained, ticks
+
+        drained, ticks = asyncio.run(run())
+
+        assert drained
+        assert ticks > 3
+
+    def test_drain_from_own_task_returns(self, executor):
+        """Test a task that drains its own key does not wait on itself"""
+        result = executor.submit("a", lambda: executor.drain("a", timeout=5))
+
+        assert result.result(timeout=2) is False
+
+
+class TestCallbackOffloading:
+    """Tests for handing recognition callbacks to the shared pool"""
+
+    def test_sdk_thread_does_not_block(self):
+        """Test firing a final returns before a slow callback finishes, and callbacks keep event order"""
+        translator = AzureSpeechTranslator(
+            Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False, interim_coalesce_ms=0)
+        )
+        recognizer = FakeRecognizer()
+        events = []
+
+        def on_final(result):
+            time.sleep(0.1)
+            events.append(("final", result.original_text, threading.current_thread().name))
+
+        translator._connect_callbacks(
+            recognizer,
+            recognized_callback=on_final,
+            canceled_callback=lambda details: events.append(("canceled", details, None)),
+            session_stopped_callback=lambda: events.append(("stopped", None, None))
+        )
+        start = time.perf_counter()
+        recognizer.fire('recognized', "One.")
+        recognizer.fire('recognized', "Two.")
+        recognizer.fire('canceled')
+        recognizer.fire('session_stopped')
+        fire_ms = (time.perf_counter() - start) * 1000
+
+        assert translator.wait_for_callbacks(recognizer)
+        assert fire_ms < 50
+        assert [event[:2] for event in events] == [
+            ("final", "One."), ("final", "Two."), ("canceled", "canceled"), ("stopped", None)
+        ]
+        assert events[0][2].startswith("callback")
+
+    def test_finals_are_never_dropped(self):
+        """Test a full callback queue drops synthesizing audio but keeps every final"""
+        translator = AzureSpeechTranslator(
+            Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False,
+                     interim_coalesce_ms=0, callback_queue_depth=2)
+        )
+        recognizer = FakeRecognizer()
+        finals, audio = [], []
+        release = threading.Event()
+
+        def on_final(result):
+            release.wait(2)
+            finals.append(result.original_text)
+
+        translator._connect_callbacks(recognizer, recognized_callback=on_final,
+                                      synthesizing_callback=lambda data: audio.append(data))
+        for i in range(8):
+            recognizer.fire('recognized', f"Final {i}.")
+        for _ in range(4):
+            recognizer.fire('synthesizing')
+        release.set()
+
+        assert translator.wait_for_callbacks(recognizer)
+        assert finals == [f"Final {i}." for i in range(8)]
+        assert audio == []
+
+    def test_inline_when_disabled(self):
+        """Test callback_workers=0 runs callbacks on the event thread"""
+        translator = AzureSpeechTranslator(
+            Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False, callback_workers=0)
+        )
+        recognizer = FakeRecognizer()
+        threads = []
+        translator._connect_callbacks(recognizer, recognized_callback=lambda r: threads.append(threading.current_thread()))
+
+        recognizer.fire('recognized', "Hello.")
+
+        assert threads == [threading.current_thread()]
+
+    def test_sessions_share_bounded_threads(self):
+        """Test callbacks from many recognizers run on at most callback_workers threads"""
+        settings = Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False,
+                            interim_coalesce_ms=0, callback_workers=3)
+        translator = AzureSpeechTranslator(settings)
+        names = set()
+        lock = threading.Lock()
+
+        def on_final(result):
+            time.sleep(0.01)
+            with lock:
+                names.add(threading.current_thread().name)
+
+        recognizers = [FakeRecognizer() for _ in range(20)]
+        for recognizer in recognizers:
+            translator._connect_callbacks(recognizer, recognized_callback=on_final)
+        for recognizer in recognizers:
+            recognizer.fire('recognized', "Hello.")
+        for recognizer in recognizers:
+            assert translator.wait_for_callbacks(recognizer)
+
+        assert 1 <= len(names) <= 3
+        assert translator.callback_executor.stats()["workers"] <= 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
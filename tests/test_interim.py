@@ -0,0 +1,154 @@
+"""Pytest unit tests for interim result coalescing"""
+
+import threading
+import time
+
+import pytest
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.core.config import Settings
+from src.core.interim import InterimCoalescer
+from src.core.translator import AzureSpeechTranslator, InterimResult
+from tests.fakes import FakeRecognizer
+
+
+def interim(text, translations=None):
+    """Build an InterimResult"""
+    return InterimResult(text, translations if translations is not None else {'es-ES': text})
+
+
+class TestInterimCoalescer:
+    """Tests for rate limiting, dedup and final flushing"""
+
+    def test_first_interim_is_immediate(self):
+        """Test the first update of an utterance is emitted without delay"""
+        emitted = []
+        coalescer = InterimCoalescer(emitted.append, interval_ms=1000)
+
+        coalescer.push(interim("Hel"))
+
+        assert [r.original_text for r in emitted] == ["Hel"]
+
+    def test_unchanged_text_is_dropped(self):
+        """Test repeated identical updates are not emitted again"""
+        emitted = []
+        coalescer = InterimCoalescer(emitted.append, interval_ms=0)
+
+        for _ in range(5):
+            coalescer.push(interim("Hello"))
+
+        assert len(emitted) == 1
+        assert coalescer.stats()['unchanged'] == 4
+
+    def test_burst_keeps_only_latest(self):
+        """Test updates inside the interval are superseded by the newest"""
+        emitted = []
+        coalescer = InterimCoalescer(emitted.append, interval_ms=1000)
+
+        for text in ["H", "He", "Hel", "Hell"]:
+            coalescer.push(interim(text))
+        coalescer.flush_final()
+
+        assert [r.original_text for r in emitted] == ["H", "Hell"]
+        assert coalescer.stats()['superseded'] == 2
+
+    def test_trailing_update_sent_after_interval(self):
+        """Test a held update is sent when the interval elapses without new events"""
+        emitted = []
+        coalescer = InterimCoalescer(emitted.append, interval_ms=30)
+
+        coalescer.push(interim("He"))
+        coalescer.push(interim("Hello"))
+        time.sleep(0.1)
+
+        assert [r.original_text for r in emitted] == ["He", "Hello"]
+
+    def test_no_interim_after_final(self):
+        """Test flush_final cancels the trailing timer"""
+        events = []
+        coalescer = InterimCoalescer(lambda r: events.append(('interim', r.original_text)), interval_ms=30)
+
+        coalescer.push(interim("He"))
+        coalescer.push(interim("Hello"))
+        coalescer.flush_final()
+        events.append(('final', "Hello world"))
+        time.sleep(0.1)
+
+        assert events == [('interim', "He"), ('interim', "Hello"), ('final', "Hello world")]
+
+    def test_next_utterance_starts_fresh(self):
+        """Test the same text after a final is emitted again, immediately"""
+        emitted = []
+        coalescer = InterimCoalescer(emitted.append, interval_ms=1000)
+
+        coalescer.push(interim("Yes"))
+        coalescer.flush_final()
+        coalescer.push(interim("Yes"))
+
+        assert len(emitted) == 2
+
+    def test_long_utterance_volume(self):
+        """Test a 1s utterance with 100 interim events emits about one per interval"""
+        emitted = []
+        coalescer = InterimCoalescer(emitted.append, interval_ms=150)
+
+        words = []
+        for i in range(100):
+            if i % 3 == 0:
+                words.append(f"w{i}")
+            coalescer.push(interim(" ".join(words)))
+            time.sleep(0.01)
+        coalescer.flush_final()
+
+        assert len(emitted) <= 12
+        assert emitted[-1].original_text == " ".join(words)
+
+
+class TestTranslatorCoalescing:
+    """Tests for coalescing in continuous translation callbacks"""
+
+    def test_interims_coalesced_and_flushed_before_final(self):
+        """Test the translator forwards coalesced interims, then the final"""
+        translator = AzureSpeechTranslator(
+            Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False, interim_coalesce_ms=1000)
+        )
+        recognizer = FakeRecognizer()
+        events = []
+        lock = threading.Lock()
+
+        def record(kind):
+            def callback(result):
+                with lock:
+                    events.append((kind, result.original_text))
+            return callback
+
+        translator._connect_callbacks(recognizer, record('interim'), record('final'))
+        for text in ["H", "He", "Hel", "Hello"]:
+            recognizer.fire('recognizing', text, speechsdk.ResultReason.TranslatingSpeech)
+        recognizer.fire('recognized', "Hello.", speechsdk.ResultReason.TranslatedSpeech)
+        translator.wait_for_callbacks(recognizer)
+
+        assert events == [('interim', "H"), ('interim', "Hello"), ('final', "Hello.")]
+        assert translator.interim_coalescer.stats()['received'] == 4
+        translator.close()
+
+    def test_coalescing_disabled(self):
+        """Test interim_coalesce_ms=0 forwards every interim"""
+        translator = AzureSpeechTranslator(
+            Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False, interim_coalesce_ms=0)
+        )
+        recognizer = FakeRecognizer()
+        interims = []
+
+        translator._connect_callbacks(recognizer, interims.append)
+        for text in ["H", "H", "He"]:
+            recognizer.fire('recognizing', text, speechsdk.ResultReason.TranslatingSpeech)
+
+        assert len(interims) == 3
+        assert translator.interim_coalescer is None
+        translator.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
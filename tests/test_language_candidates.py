@@ -0,0 +1,187 @@
+"""Pytest unit tests for adaptive auto-detect language candidates"""
+
+import threading
+
+import pytest
+
+from src.core.config import Settings
+from src.core.language_candidates import LanguageCandidateTracker
+from src.core.speech_engine import AudioSource, SimulatedSpeechEngine
+from src.core.translator import DEFAULT_AUTO_DETECT_LANGUAGES, LiveInterpreterTranslator
+
+FULL = ["en-US", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR"]
+
+
+@pytest.fixture
+def tracker():
+    """Tracker that narrows after three observations"""
+    return LanguageCandidateTracker(FULL, min_observations=3, min_detections=2, max_candidates=4, fallback_misses=2)
+
+
+@pytest.fixture
+def settings():
+    """Settings with adaptive language detection on the simulated engine"""
+    return Settings(
+        speech_key='test_key',
+        speech_region='eastus',
+        speech_engine='simulated',
+        target_language='es-ES',
+        tts_cache_enabled=False,
+        interim_coalesce_ms=0,
+        adaptive_language_detection=True,
+        adaptive_language_min_observations=3
+    )
+
+
+class TestLanguageCandidateTracker:
+    """Tests for narrowing and widening the candidate set"""
+
+    def test_starts_with_full_set(self, tracker):
+        """Test nothing is narrowed before enough observations"""
+        tracker.observe("en-US")
+        tracker.observe("en-US")
+
+        assert tracker.candidates == FULL
+        assert not tracker.narrowed
+        assert tracker.generation == 0
+
+    def test_narrows_to_detected_languages(self, tracker):
+        """Test the set narrows to repeatedly detected languages, most frequent first"""
+        for language in ["es-ES", "en-US", "es-ES"]:
+            tracker.observe(language)
+        assert tracker.candidates == ["es-ES"]
+
+        for language in ["en-US", "en-US", "en-US"]:
+            tracker.observe(language)
+
+        assert tracker.candidates == ["en-US", "es-ES"]
+        assert tracker.narrowings == 2
+        assert tracker.generation == 2
+
+    def test_misses_widen_to_full_set(self, tracker):
+        """Test consecutive unknown results fall back to the full candidate list"""
+        for _ in range(3):
+            tracker.observe("en-US")
+        assert tracker.narrowed
+
+        tracker.observe("Unknown")
+        assert tracker.narrowed
+        tracker.observe(None, recognized=False)
+
+        assert tracker.candidates == FULL
+        assert tracker.widenings == 1
+
+    def test_isolated_miss_does_not_widen(self, tracker):
+        """Test a detection between misses resets the miss count"""
+        for _ in range(3):
+            tracker.observe("en-US")
+        tracker.observe("Unknown")
+        tracker.observe("en-US")
+        tracker.observe("Unknown")
+
+        assert tracker.candidates == ["en-US"]
+
+    def test_new_language_joins_after_widening(self, tracker):
+        """Test a new language is picked up through the slow path"""
+        for _ in range(3):
+            tracker.observe("en-US")
+        tracker.observe("Unknown")
+        tracker.observe("Unknown")
+        for language in ["fr-FR", "fr-FR", "en-US"]:
+            tracker.observe(language)
+
+        assert tracker.candidates == ["en-US", "fr-FR"]
+
+    def test_max_candidates_and_unknown_languages(self):
+        """Test the narrowed set is bounded and ignores languages outside the full list"""
+        tracker = LanguageCandidateTracker(FULL, min_observations=8, min_detections=1, max_candidates=2)
+        for language in ["en-US", "en-US", "en-US", "es-ES", "es-ES", "fr-FR", "ja-JP", "ja-JP"]:
+            tracker.observe(language)
+
+        assert tracker.candidates == ["en-US", "es-ES"]
+
+    def test_set_full_candidates_resets(self, tracker):
+        """Test a different full list forgets learned languages"""
+        for _ in range(3):
+            tracker.observe("en-US")
+        generation = tracker.generation
+
+        tracker.set_full_candidates(FULL)
+        assert tracker.narrowed
+
+        tracker.set_full_candidates(["en-US", "ja-JP"])
+        assert tracker.candidates == ["en-US", "ja-JP"]
+        assert tracker.generation == generation + 1
+        assert tracker.stats()["detections"] == {}
+
+    def test_concurrent_observations(self, tracker):
+        """Test observations from several SDK threads are all counted"""
+        threads = [
+            threading.Thread(target=lambda: [tracker.observe("de-DE") for _ in range(200)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tracker.stats()["detections"] == {"de-DE": 800}
+
+
+class TestTranslatorIntegration:
+    """Tests for narrowing recognizers built by LiveInterpreterTranslator"""
+
+    def test_disabled_by_default(self):
+        """Test recognizers keep the full list when the setting is off"""
+        settings = Settings(speech_key='test_key', speech_region='eastus', speech_engine='simulated', tts_cache_enabled=False)
+        translator = LiveInterpreterTranslator(settings, use_personal_voice=False)
+        recognizer = translator.create_recognizer_from_microphone()
+
+        assert translator.language_tracker is None
+        assert recognizer.auto_detect_languages == DEFAULT_AUTO_DETECT_LANGUAGES
+        assert not translator.language_candidates_stale(recognizer)
+        translator.close()
+
+    def test_rebuilt_recognizer_uses_narrowed_candidates(self, settings):
+        """Test finals feed the tracker and a stale recognizer is rebuilt narrowed"""
+        engine = SimulatedSpeechEngine(
+            latency_ms=1, jitter_ms=0, connect_ms=1, utterance_s=0.1,
+            script=["hola", "hello"], script_languages=["es-ES", "en-US"]
+        )
+        translator = LiveInterpreterTranslator(settings, use_personal_voice=False, engine=engine)
+        stream = translator.create_push_stream()
+        recognizer = translator.create_recognizer_from_stream(stream, FULL)
+        stopped = threading.Event()
+
+        translator.start_continuous_translation(
+            recognizer, recognized_callback=lambda result: None, session_stopped_callback=stopped.set
+        )
+        stream.write(b"\x00" * int(32000 * 0.6))
+        stream.close()
+        assert stopped.wait(2)
+
+        assert translator.language_candidates_stale(recognizer)
+        rebuilt = translator.create_recognizer_from_stream(translator.create_push_stream(), FULL)
+        assert sorted(rebuilt.auto_detect_languages) == ["en-US", "es-ES"]
+        assert not translator.language_candidates_stale(rebuilt)
+        translator.close()
+
+    def test_narrowing_reduces_simulated_latency(self):
+        """Test the simulated engine charges language ID per candidate"""
+        engine = SimulatedSpeechEngine(latency_ms=100, language_id_ms=10)
+        full = engine.create_recognizer(_Config(), AudioSource.microphone(), FULL)
+        narrowed = engine.create_recognizer(_Config(), AudioSource.microphone(), ["en-US"])
+
+        assert full._final_latency_ms() == 150
+        assert narrowed._final_latency_ms() == 100
+
+
+class _Config:
+    """Minimal translation config for direct engine calls"""
+    speech_recognition_language = "en-US"
+    target_languages = ("es-ES",)
+    voice_name = ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,189 @@
+"""Pytest tests for outbound WebSocket message encoding"""
+
+import asyncio
+import base64
+import importlib
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core import message_codec
+from src.core.audio_frames import JSON_SUBPROTOCOL
+from src.core.config import Settings
+from src.core.message_codec import MSGPACK_SUBPROTOCOL, JsonCodec, get_codec
+from tests.fakes import FakeWebSocket
+
+MESSAGE = {
+    "type": "recognized",
+    "data": {
+        "utterance_id": 3,
+        "original_text": "Good morning",
+        "translations": {"es-ES": "Buenos días", "ja-JP": "おはようございます"},
+        "synthesized_audio": {},
+        "duration_ms": 1200
+    }
+}
+
+
+def compact_json(message: dict) -> str:
+    """What Starlette's send_json puts on the wire"""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class TestJsonCodec:
+    """Tests for the JSON codec"""
+
+    def test_matches_send_json(self):
+        """Test the output is what send_json produced before, non-ASCII included"""
+        encoded = get_codec().encode(MESSAGE)
+
+        assert not encoded.binary
+        assert json.loads(encoded.data) == MESSAGE
+        assert encoded.type == "recognized"
+        assert "Buenos días" in encoded.data
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test the codec works without orjson installed"""
+        monkeypatch.setattr(message_codec, "orjson", None)
+        codec = JsonCodec()
+
+        assert codec.name == "json"
+        assert codec.encode(MESSAGE).data == compact_json(MESSAGE)
+        assert codec.decode(compact_json(MESSAGE)) == MESSAGE
+
+    def test_audio_is_base64(self):
+        """Test audio fields are base64 text in JSON"""
+        assert get_codec().audio(b"\x00\xff") == base64.b64encode(b"\x00\xff").decode("ascii")
+
+    def test_incomplete_codec_cannot_be_created(self):
+        """Test a codec missing decode fails when it is created, not on its first message"""
+        class EncodeOnly(message_codec.MessageCodec):
+            def encode(self, message):
+                return message_codec.EncodedMessage("{}")
+
+        with pytest.raises(TypeError):
+            EncodeOnly()
+
+    def test_unknown_subprotocol_is_json(self):
+        """Test no subprotocol or another one selects the JSON codec"""
+        assert get_codec(None) is get_codec(JSON_SUBPROTOCOL)
+        assert not get_codec("live-interpreter.binary.v1").binary
+
+
+class TestMsgpackCodec:
+    """Tests for the MessagePack codec (skipped without msgpack)"""
+
+    def test_round_trip_with_raw_audio(self):
+        """Test messages round-trip with audio kept as bytes"""
+        msgpack = pytest.importorskip("msgpack")
+        codec = get_codec(MSGPACK_SUBPROTOCOL)
+        message = {"type": "audio", "data": {"audio": codec.audio(b"\x00\x01" * 100)}}
+        encoded = codec.encode(message)
+
+        assert encoded.binary
+        assert msgpack.unpackb(encoded.data, raw=False) == message
+        assert codec.decode(encoded.data)["data"]["audio"] == b"\x00\x01" * 100
+
+
+@pytest.fixture
+def main():
+    """Backend module; its import-time logging setup is undone afterwards so other tests stay quiet"""
+    handlers, level = list(logging.root.handlers), logging.root.level
+    yield importlib.import_module("src.react_app.backend.main")
+    logging.root.handlers[:] = handlers
+    logging.root.setLevel(level)
+
+
+class TestBroadcast:
+    """Tests for serialize-once delivery to several sockets"""
+
+    def test_encodes_once_per_codec(self, main, monkeypatch):
+        """Test a message sent to many sockets is serialized once and shared"""
+        manager = main.ConnectionManager()
+        codec = JsonCodec()
+        calls = []
+        encode = codec.encode
+        monkeypatch.setattr(codec, "encode", lambda message: calls.append(message) or encode(message))
+        websockets = [FakeWebSocket() for _ in range(20)]
+
+        async def broadcast():
+            for websocket in websockets:
+                await manager.connect(websocket)
+                manager.codecs[websocket] = codec
+            await manager.broadcast(websockets, MESSAGE)
+            for websocket in websockets:
+                await manager.flush(websocket)
+
+        asyncio.run(broadcast())
+
+        assert len(calls) == 1
+        assert all(websocket.sent == [compact_json(MESSAGE)] for websocket in websockets)
+        assert len({id(websocket.sent[0]) for websocket in websockets}) == 1
+
+    def test_builder_gets_each_codec(self, main):
+        """Test a builder is called once per codec so audio fields can differ"""
+        manager = main.ConnectionManager()
+        plain, fast = JsonCodec(fast=False), JsonCodec()
+        websockets = [FakeWebSocket() for _ in range(4)]
+        built = []
+
+        async def broadcast():
+            for i, websocket in enumerate(websockets):
+                await manager.connect(websocket)
+                manager.codecs[websocket] = plain if i % 2 else fast
+            await manager.broadcast(websockets, lambda codec, subscription: built.append(codec) or {"type": "audio"})
+            for websocket in websockets:
+                await manager.flush(websocket)
+
+        asyncio.run(broadcast())
+
+        assert len(built) == 2
+        assert all(json.loads(websocket.sent[0]) == {"type": "audio"} for websocket in websockets)
+
+
+class TestBackendEncoding:
+    """Tests for the negotiated encoding over the backend WebSocket"""
+
+    @pytest.fixture
+    def client(self, main, monkeypatch):
+        """Backend on a fast simulated engine"""
+        settings = Settings(speech_key='test_key', speech_region='eastus', speech_engine='simulated',
+                            target_language='es-ES', target_language_2=None, tts_cache_enabled=False,
+                            simulated_latency_ms=20, simulated_jitter_ms=0, simulated_connect_ms=10,
+                            simulated_synthesis_ms=5)
+        monkeypatch.setattr(main, "settings", settings)
+        with TestClient(main.app) as client:
+            yield client
+
+    def test_msgpack_falls_back_to_json(self, client, monkeypatch):
+        """Test clients offering MessagePack get JSON when msgpack is not installed"""
+        monkeypatch.setattr(message_codec, "msgpack", None)
+        with client.websocket_connect("/ws/translate", subprotocols=[MSGPACK_SUBPROTOCOL, JSON_SUBPROTOCOL]) as ws:
+            assert ws.accepted_subprotocol == JSON_SUBPROTOCOL
+            assert ws.receive_json()["data"]["encoding"] in ("json", "orjson")
+
+    def test_msgpack_session(self, client):
+        """Test a MessagePack client gets binary messages and can send raw audio"""
+        msgpack = pytest.importorskip("msgpack")
+        with client.websocket_connect("/ws/translate", subprotocols=[MSGPACK_SUBPROTOCOL]) as ws:
+            assert ws.accepted_subprotocol == MSGPACK_SUBPROTOCOL
+            assert msgpack.unpackb(ws.receive_bytes())["data"]["encoding"] == "msgpack"
+            ws.send_bytes(msgpack.packb({"type": "config", "data": {
+                "target_languages": ["es-ES"], "audio_source": "stream"
+            }}))
+            assert msgpack.unpackb(ws.receive_bytes())["type"] == "config_confirmed"
+            ws.send_bytes(msgpack.packb({"type": "start_recording"}))
+            for _ in range(12):
+                ws.send_bytes(msgpack.packb({"type": "audio", "data": b"\x00" * 6400}, use_bin_type=True))
+            while True:
+                message = msgpack.unpackb(ws.receive_bytes(), raw=False)
+                assert message["type"] != "error", message
+                if message["type"] == "recognized":
+                    break
+            assert isinstance(message["data"]["synthesized_audio"]["es-ES"], bytes)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,152 @@
+"""Pytest unit tests for latency histograms and per-utterance timing"""
+
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.core.config import Settings
+from src.core.metrics import LatencyHistogram, LatencyMetrics, get_latency_metrics, render_metric
+from src.core.speech_engine import SimulatedSpeechEngine
+from src.core.translator import AzureSpeechTranslator
+
+
+class TestLatencyHistogram:
+    """Tests for bucketing and quantiles"""
+
+    def test_buckets_are_upper_inclusive(self):
+        """Test a value equal to a bound lands in that bucket, larger values in +Inf"""
+        histogram = LatencyHistogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(2.65)
+
+    def test_quantile(self):
+        """Test quantiles report the bucket bound holding the rank"""
+        histogram = LatencyHistogram((0.1, 1.0))
+        for value in [0.05] * 90 + [0.5] * 10:
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.95) == 1.0
+        assert LatencyHistogram().quantile(0.5) is None
+
+
+class TestLatencyMetrics:
+    """Tests for the keyed histogram registry and its exposition"""
+
+    def test_prometheus_text(self):
+        """Test histograms render cumulative buckets, sum and count per stage and language"""
+        metrics = LatencyMetrics(bounds=(0.1, 1.0))
+        metrics.observe("synthesis", "es-ES", 0.05)
+        metrics.observe("synthesis", "es-ES", 0.5)
+        metrics.observe("send", None, 0.001)
+
+        text = metrics.render_prometheus()
+
+        assert "# TYPE live_interpreter_stage_latency_seconds histogram" in text
+        assert 'live_interpreter_stage_latency_seconds_bucket{stage="synthesis",language="es-ES",le="0.1"} 1' in text
+        assert 'live_interpreter_stage_latency_seconds_bucket{stage="synthesis",language="es-ES",le="1"} 2' in text
+        assert 'live_interpreter_stage_latency_seconds_bucket{stage="synthesis",language="es-ES",le="+Inf"} 2' in text
+        assert 'live_interpreter_stage_latency_seconds_sum{stage="synthesis",language="es-ES"} 0.550000' in text
+        assert 'live_interpreter_stage_latency_seconds_count{stage="send",language="all"} 1' in text
+
+    def test_interval_needs_both_marks(self):
+        """Test intervals with a missing mark are skipped and negative ones clamped"""
+        metrics = LatencyMetrics()
+        metrics.observe_interval("recognition", "en-US", None, 1.0)
+        metrics.observe_interval("send", None, 2.0, 1.0)
+
+        stats = metrics.stats()
+        assert "recognition" not in stats
+        assert stats["send"]["all"]["count"] == 1
+        assert stats["send"]["all"]["mean_ms"] == 0
+
+    def test_render_metric(self):
+        """Test gauge families render labels and values"""
+        text = render_metric("executor_queued", "gauge", "Queued tasks", [({"executor": "callback"}, 3), ({}, 1.5)])
+
+        assert "# TYPE live_interpreter_executor_queued gauge" in text
+        assert 'live_interpreter_executor_queued{executor="callback"} 3' in text
+        assert "live_interpreter_executor_queued 1.5" in text
+
+    def test_recording_overhead(self):
+        """Test recording costs a few microseconds, so it can stay on in production"""
+        metrics = LatencyMetrics()
+        n = 50_000
+        start = time.perf_counter()
+        for i in range(n):
+            metrics.observe("synthesis", "es-ES", (i % 100) / 1000)
+        per_observe_us = (time.perf_counter() - start) / n * 1e6
+
+        assert per_observe_us < 20
+
+    def test_shared_instance(self):
+        """Test every caller gets the same process-wide histograms"""
+        assert get_latency_metrics() is get_latency_metrics()
+
+
+class TestTranslatorTiming:
+    """Tests for timing hooks in the translator"""
+
+    @pytest.fixture
+    def translator(self):
+        """Translator on a fast simulated engine with fresh histograms"""
+        settings = Settings(speech_key='test_key', speech_region='eastus', speech_engine='simulated',
+                            target_language='es-ES', tts_cache_enabled=False, interim_coalesce_ms=0)
+        engine = SimulatedSpeechEngine(latency_ms=20, jitter_ms=0, connect_ms=0, synthesis_ms=5, utterance_s=0.1)
+        translator = AzureSpeechTranslator(settings, engine=engine)
+        translator.latency_metrics = LatencyMetrics()
+        yield translator
+        translator.close()
+
+    def test_results_carry_speech_timing(self, translator):
+        """Test final results are stamped from their audio offset and record recognition latency"""
+        recognizer = translator.create_recognizer_from_microphone()
+        finals = []
+        started = datetime.now()
+        translator.start_continuous_translation(recognizer, recognized_callback=finals.append)
+        time.sleep(0.45)
+        translator.stop_continuous_translation(recognizer)
+
+        assert len(finals) >= 2
+        first, second = finals[0], finals[1]
+        # Utterances are 0.1 s of audio; stamps follow the audio, not processing time
+        assert first.timestamp - started < timedelta(milliseconds=60)
+        assert second.timestamp - first.timestamp == pytest.approx(timedelta(milliseconds=100), abs=timedelta(milliseconds=5))
+        for result in finals:
+            assert result.marks["speech_end"] <= result.marks["recognized"] <= result.marks["translated"]
+
+        recognition = translator.latency_metrics.stats()["recognition"]["en-US"]
+        assert recognition["count"] == len(finals)
+        assert 15 <= recognition["mean_ms"] <= 150
+        translator.release_recognizer(recognizer)
+
+    def test_results_without_session_clock(self, translator):
+        """Test results from recognizers whose session start was not seen are stamped on arrival"""
+        sdk_result = SimpleNamespace(
+            reason=speechsdk.ResultReason.TranslatedSpeech, text="Hello", translations={'es-ES': 'Hola'},
+            properties={}, audio=None, offset=50_000_000, duration=10_000_000
+        )
+        result = translator._process_result(sdk_result, recognizer=translator.create_recognizer_from_microphone())
+
+        assert "speech_end" not in result.marks
+        assert datetime.now() - result.timestamp < timedelta(seconds=1)
+
+    def test_synthesis_recorded_per_language(self, translator):
+        """Test each synthesized language gets its own synthesis histogram"""
+        translator.synthesize_translations({'es-ES': 'Hola', 'fr-FR': 'Bonjour'})
+
+        stats = translator.latency_metrics.stats()["synthesis"]
+        assert stats["es-ES"]["count"] == 1
+        assert stats["fr-FR"]["count"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
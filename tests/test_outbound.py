@@ -0,0 +1,215 @@
+"""Pytest tests for bounded outbound queues and their drop policy"""
+
+import asyncio
+import importlib
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.config import Settings
+from src.core.message_codec import EncodedMessage
+from src.core.outbound import SLOW_CONSUMER_CLOSE_CODE, OutboundQueue, OutboundStats
+from tests.fakes import FakeWebSocket
+
+
+def interim(text: str) -> EncodedMessage:
+    return EncodedMessage(f'{{"type":"recognizing","data":"{text}"}}', "recognizing")
+
+
+def final(text: str) -> EncodedMessage:
+    return EncodedMessage(f'{{"type":"recognized","data":"{text}"}}', "recognized")
+
+
+class StalledClient:
+    """A client that reads nothing until released"""
+
+    def __init__(self):
+        self.sent = []
+        self.released = asyncio.Event()
+
+    async def send(self, item):
+        await self.released.wait()
+        self.sent.append(item if isinstance(item, bytes) else item.data)
+
+
+def make_queue(client: StalledClient, overflows: list, max_messages: int = 4, max_bytes: int = 1 << 20):
+    stats = OutboundStats()
+    queue = OutboundQueue(client.send, lambda: overflows.append(True),
+                          max_messages=max_messages, max_bytes=max_bytes, stats=stats)
+    return queue, stats
+
+
+class TestOutboundQueue:
+    """Tests for the queue and its single writer"""
+
+    def test_sends_in_order(self):
+        """Test messages and frames are written in order and on_sent follows the write"""
+        async def run():
+            client = StalledClient()
+            client.released.set()
+            queue, stats = make_queue(client, [])
+            written = []
+            queue.put_all([final("a"), b"\x01\x02", final("b")], on_sent=lambda: written.append(list(client.sent)))
+            assert await queue.flush()
+            return client.sent, written, stats.stats()
+
+        sent, written, stats = asyncio.run(run())
+
+        assert sent == [final("a").data, b"\x01\x02", final("b").data]
+        assert written == [sent]
+        assert stats["sent"] == 3
+
+    def test_stale_interims_are_replaced(self):
+        """Test a queued interim is replaced by the next one, even across a final, while finals stay"""
+        async def run():
+            client = StalledClient()
+            queue, stats = make_queue(client, [], max_messages=10)
+            queue.put(final("first"))  # Taken by the writer, which blocks on the client
+            await asyncio.sleep(0)
+            for text in ("Good", "Good morning", "Good morning all"):
+                queue.put(interim(text))
+            queue.put(final("Good morning all."))
+            queue.put(interim("Next"))
+            client.released.set()
+            await queue.flush()
+            return client.sent, stats.stats()
+
+        sent, stats = asyncio.run(run())
+
+        assert sent == [final("first").data, final("Good morning all.").data, interim("Next").data]
+        assert stats["dropped_stale"] == 3
+
+    def test_full_queue_refuses_interims(self):
+        """Test interims are dropped while the queue is full and make way for finals"""
+        async def run():
+            client = StalledClient()
+            overflows = []
+            queue, stats = make_queue(client, overflows, max_messages=3)
+            queue.put(final("0"))
+            await asyncio.sleep(0)
+            queue.put(interim("a"))
+            queue.put(final("1"))
+            queue.put(final("2"))
+            queue.put(final("3"))  # Over the limit: the queued interim goes first
+            refused = queue.put(interim("b"))
+            return refused, queue.depth, overflows, stats.stats()
+
+        refused, depth, overflows, stats = asyncio.run(run())
+
+        assert refused is False
+        assert depth == 3
+        assert not overflows
+        assert stats["dropped_full"] == 1
+        assert stats["dropped_stale"] == 1
+
+    def test_laggard_is_disconnected(self):
+        """Test a client whose finals overflow the queue is cut off and its backlog freed"""
+        async def run():
+            client = StalledClient()
+            overflows = []
+            queue, stats = make_queue(client, overflows, max_messages=100, max_bytes=1000)
+            results = [queue.put(b"\x00" * 300) for _ in range(5)]
+            return results, queue, overflows, stats.stats()
+
+        results, queue, overflows, stats = asyncio.run(run())
+
+        assert results == [True, True, True, False, False]
+        assert queue.closed and queue.queued_bytes == 0 and queue.depth == 0
+        assert overflows == [True]
+        assert stats["slow_disconnects"] == 1
+        assert queue.put(final("late")) is False
+
+    def test_one_large_message_is_sent(self):
+        """Test a single message over the byte limit is not treated as a backlog"""
+        async def run():
+            client = StalledClient()
+            client.released.set()
+            overflows = []
+            queue, _ = make_queue(client, overflows, max_bytes=100)
+            accepted = queue.put(b"\x00" * 1000)
+            await queue.flush()
+            return accepted, client.sent, overflows
+
+        accepted, sent, overflows = asyncio.run(run())
+
+        assert accepted
+        assert sent == [b"\x00" * 1000]
+        assert not overflows
+
+    def test_send_error_stops_writer(self):
+        """Test a failed write closes the queue instead of retrying a dead connection"""
+        async def fail(item):
+            raise RuntimeError("connection reset")
+
+        async def run():
+            queue = OutboundQueue(fail, lambda: None, stats=OutboundStats())
+            queue.put(final("a"))
+            await asyncio.sleep(0.01)
+            return queue
+
+        assert asyncio.run(run()).closed
+
+
+@pytest.fixture
+def main():
+    """Backend module; its import-time logging setup is undone afterwards so other tests stay quiet"""
+    handlers, level = list(logging.root.handlers), logging.root.level
+    yield importlib.import_module("src.react_app.backend.main")
+    logging.root.handlers[:] = handlers
+    logging.root.setLevel(level)
+
+
+class StalledWebSocket(FakeWebSocket):
+    """A connection whose client stopped reading"""
+
+    async def send_text(self, data: str):
+        await asyncio.Event().wait()
+
+
+class TestBackendOutbound:
+    """Tests for outbound queues in the backend"""
+
+    def test_slow_listener_is_closed(self, main, monkeypatch):
+        """Test a stalled listener is closed with 1013 while other recipients keep receiving"""
+        monkeypatch.setattr(main, "settings", Settings(speech_key='test_key', speech_region='eastus',
+                                                       outbound_queue_max_messages=5))
+        manager = main.ConnectionManager()
+
+        async def run():
+            reader, stalled = FakeWebSocket(), StalledWebSocket()
+            await manager.connect(reader)
+            await manager.connect(stalled)
+            for i in range(10):
+                await manager.broadcast([reader, stalled], {"type": "recognized", "data": {"utterance_id": i}})
+                await asyncio.sleep(0)  # Results arrive as separate loop callbacks, letting writers run
+            await manager.flush(reader)
+            await asyncio.sleep(0.01)
+            return reader, stalled, manager.outbound_stats()
+
+        reader, stalled, stats = asyncio.run(run())
+
+        assert stalled.closed_with == SLOW_CONSUMER_CLOSE_CODE
+        assert not manager.closing  # The close task was kept until it finished
+        assert len(reader.sent) == 10 and reader.closed_with is None
+        assert stats["queued_messages"] == 0
+
+    def test_stats_and_metrics(self, main, monkeypatch):
+        """Test queue depth and drop counters are exported"""
+        monkeypatch.setattr(main, "settings", Settings(speech_key='test_key', speech_region='eastus',
+                                                       speech_engine='simulated', tts_cache_enabled=False))
+        with TestClient(main.app) as client:
+            with client.websocket_connect("/ws/translate") as ws:
+                ws.receive_json()
+                outbound = client.get("/stats").json()["outbound"]
+                metrics = client.get("/metrics").text
+
+        assert {"queued_messages", "queued_bytes", "max_depth", "sent", "dropped_stale",
+                "dropped_full", "slow_disconnects"} <= set(outbound)
+        assert outbound["sent"] >= 1
+        assert 'outbound_dropped_total{reason="stale"}' in metrics
+        assert "outbound_slow_disconnects_total" in metrics
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,177 @@
+"""Pytest tests for broadcast rooms: one presenter fanned out to many listeners"""
+
+import base64
+import importlib
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from src.core.audio_frames import BINARY_SUBPROTOCOL, FrameKind, decode_frame
+from src.core.config import Settings
+from src.core.rooms import RoomError, RoomRegistry
+from src.core.speech_engine import synthetic_audio
+
+AUDIO_CHUNK = base64.b64encode(b"\x00" * 6400).decode()  # 200 ms of 16 kHz 16-bit mono
+
+
+class TestRoomRegistry:
+    """Tests for presenting, joining and room lifetime"""
+
+    def test_listeners_may_join_before_presenter(self):
+        """Test a room waits for its presenter and keeps listeners when it leaves"""
+        rooms = RoomRegistry()
+        room = rooms.join("council", "listener", max_listeners=10)
+        assert room.presenter is None
+
+        assert rooms.present("council", "presenter") is room
+        assert room.audience("presenter") == ("presenter", "listener")
+        rooms.release(room, "presenter")
+
+        assert rooms.get("council") is room
+        assert room.listeners == ("listener",)
+
+    def test_one_presenter_per_room(self):
+        """Test a second presenter is refused while the first one presents"""
+        rooms = RoomRegistry()
+        room = rooms.present("council", "first")
+
+        with pytest.raises(RoomError):
+            rooms.present("council", "second")
+        rooms.release(room, "first")
+        assert rooms.present("council", "second").presenter == "second"
+
+    def test_listener_limit(self):
+        """Test joining a full room raises RoomError"""
+        rooms = RoomRegistry()
+        rooms.join("council", "a", max_listeners=2)
+        rooms.join("council", "b", max_listeners=2)
+
+        with pytest.raises(RoomError):
+            rooms.join("council", "c", max_listeners=2)
+
+    def test_empty_room_is_dropped(self):
+        """Test a room disappears once its presenter and listeners are gone"""
+        rooms = RoomRegistry()
+        room = rooms.present("council", "presenter")
+        rooms.join("council", "listener", max_listeners=10)
+        snapshot = room.audience("presenter")
+
+        rooms.leave(room, "listener")
+        assert snapshot == ("presenter", "listener")  # Snapshots are unaffected by later changes
+        rooms.release(room, "presenter")
+
+        assert rooms.get("council") is None
+        assert rooms.stats() == {"rooms": 0, "listeners": 0, "by_room": {}}
+
+
+@pytest.fixture
+def main():
+    """Backend module; its import-time logging setup is undone afterwards so other tests stay quiet"""
+    handlers, level = list(logging.root.handlers), logging.root.level
+    yield importlib.import_module("src.react_app.backend.main")
+    logging.root.handlers[:] = handlers
+    logging.root.setLevel(level)
+
+
+@pytest.fixture
+def client(main, monkeypatch):
+    """Backend on a fast simulated engine"""
+    settings = Settings(speech_key='test_key', speech_region='eastus', speech_engine='simulated',
+                        target_language='es-ES', target_language_2=None, tts_cache_enabled=False,
+                        simulated_latency_ms=20, simulated_jitter_ms=0, simulated_connect_ms=10,
+                        simulated_synthesis_ms=5)
+    monkeypatch.setattr(main, "settings", settings)
+    with TestClient(main.app) as client:
+        yield client
+
+
+def receive(ws):
+    """Next message: a decoded frame for binary messages, the parsed JSON otherwise"""
+    message = ws.receive()
+    if message.get("bytes") is not None:
+        return decode_frame(message["bytes"])
+    return json.loads(message["text"])
+
+
+def receive_until(ws, message_type: str) -> dict:
+    """Read messages until a JSON message of the given type arrives, skipping frames"""
+    while True:
+        message = receive(ws)
+        if isinstance(message, dict) and message["type"] == message_type:
+            return message
+        assert not isinstance(message, dict) or message["type"] != "error", message
+
+
+class TestBackendRooms:
+    """Tests for rooms over the backend WebSockets"""
+
+    def test_results_fan_out_to_listeners(self, main, client):
+        """Test listeners in different formats get the presenter's results and audio"""
+        with client.websocket_connect("/ws/listen/council") as early, \
+                client.websocket_connect("/ws/translate") as presenter:
+            assert receive_until(early, "connected")["data"]["presenter"] is False
+            receive_until(presenter, "connected")
+            presenter.send_json({"type": "config", "data": {
+                "target_languages": ["es-ES"], "audio_source": "stream", "audio_format": "mp3", "room": "council"
+            }})
+            assert receive_until(presenter, "config_confirmed")["data"]["room"] == "council"
+            assert receive_until(early, "room_config")["data"]["audio_mime_type"] == "audio/mpeg"
+
+            with client.websocket_connect("/ws/listen/council", subprotocols=[BINARY_SUBPROTOCOL]) as framed:
+                assert receive_until(framed, "connected")["data"]["presenter"] is True
+                receive_until(framed, "room_config")
+                presenter.send_json({"type": "start_recording"})
+                for _ in range(12):
+                    presenter.send_json({"type": "audio", "data": AUDIO_CHUNK})
+
+                recognized = receive_until(presenter, "recognized")["data"]
+                translation = recognized["translations"]["es-ES"]
+                expected = synthetic_audio(translation, "mp3")
+                assert base64.b64decode(recognized["synthesized_audio"]["es-ES"]) == expected
+
+                heard = receive_until(early, "recognized")["data"]
+                assert heard["utterance_id"] == recognized["utterance_id"]
+                assert base64.b64decode(heard["synthesized_audio"]["es-ES"]) == expected
+
+                assert receive_until(framed, "recognized")["data"]["synthesized_audio"] == {}
+                frame = receive(framed)
+                assert frame.kind == FrameKind.CLIP and frame.payload == expected
+
+                assert main.manager.rooms.get("council").stats()["listeners"] == 2
+
+            presenter.send_json({"type": "stop_recording"})
+            receive_until(presenter, "stopped")
+            presenter.close()
+            assert receive_until(early, "presenter_left")["data"]["room"] == "council"
+
+    def test_second_presenter_refused(self, client):
+        """Test configuring a room another connection presents to is an error"""
+        with client.websocket_connect("/ws/translate") as first, client.websocket_connect("/ws/translate") as second:
+            first.send_json({"type": "config", "data": {"target_languages": ["es-ES"], "room": "council"}})
+            receive_until(first, "config_confirmed")
+            second.send_json({"type": "config", "data": {"target_languages": ["es-ES"], "room": "council"}})
+
+            receive_until(second, "connected")
+            assert "already has a presenter" in second.receive_json()["data"]["message"]
+
+    def test_full_room_and_listener_messages(self, main, client, monkeypatch):
+        """Test joining a full room is refused, and listeners may only ping"""
+        monkeypatch.setattr(main.settings, "room_max_listeners", 1)
+        with client.websocket_connect("/ws/listen/council") as listener:
+            receive_until(listener, "connected")
+            with client.websocket_connect("/ws/listen/council") as refused:
+                assert "is full" in refused.receive_json()["data"]["message"]
+                with pytest.raises(WebSocketDisconnect):
+                    refused.receive_json()
+
+            listener.send_json({"type": "ping", "data": {"timestamp": 7}})
+            assert listener.receive_json() == {"type": "pong", "data": {"timestamp": 7}}
+            listener.send_json({"type": "config", "data": {}})
+            assert listener.receive_json()["type"] == "error"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
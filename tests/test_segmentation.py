@@ -0,0 +1,172 @@
+"""Pytest unit tests for silence segmentation of long recordings"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from src.core.batch import BatchTranslator
+from src.core.config import Settings
+from src.core.segmentation import find_silence_cuts, frame_levels_db, plan_segments, to_mono_int16
+from src.core.translator import AzureSpeechTranslator
+from tests.fakes import FakeFileRecognizer
+
+RATE = 16000
+
+
+def speech_and_silence(pattern):
+    """Build int16 PCM from (seconds, is_speech) pairs"""
+    parts = []
+    for seconds, is_speech in pattern:
+        n = int(seconds * RATE)
+        if is_speech:
+            t = np.arange(n) / RATE
+            parts.append((np.sin(2 * np.pi * 220 * t) * 8000).astype(np.int16))
+        else:
+            parts.append(np.zeros(n, dtype=np.int16))
+    return np.concatenate(parts)
+
+
+def segment_recognizer(text, delay, error=None):
+    """Recognizer that reports one utterance for its segment after a delay"""
+    return FakeFileRecognizer([] if error else [(100, text)], delay, error)
+
+
+@pytest.fixture
+def translator():
+    """Translator used for result parsing"""
+    translator = AzureSpeechTranslator(
+        Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False)
+    )
+    yield translator
+    translator.close()
+
+
+class TestSilenceAnalysis:
+    """Tests for frame levels and silence detection"""
+
+    def test_frame_levels(self):
+        """Test silence and tone frames get very different levels"""
+        samples = speech_and_silence([(1.0, False), (1.0, True)])
+
+        levels = frame_levels_db(samples, RATE, frame_ms=20, block_frames=7)
+
+        assert len(levels) == 100
+        assert levels[:50].max() < -90
+        assert levels[50:].min() > -20
+
+    def test_cuts_at_middle_of_long_silences_only(self):
+        """Test short pauses are not cut points"""
+        levels = np.array([0] * 10 + [-80] * 30 + [0] * 10 + [-80] * 5 + [0] * 10, dtype=np.float32)
+
+        cuts = find_silence_cuts(levels, threshold_db=-40, min_silence_frames=25)
+
+        assert list(cuts) == [25]
+
+    def test_to_mono_int16(self):
+        """Test float stereo input is downmixed and scaled"""
+        stereo = np.array([[0.5, 0.5], [-1.5, -1.5]])
+
+        mono = to_mono_int16(stereo)
+
+        assert mono.dtype == np.int16
+        assert list(mono) == [16383, -32767]
+
+
+class TestPlanSegments:
+    """Tests for segment planning"""
+
+    def test_segments_end_at_silences(self):
+        """Test segments reach the target length and end inside a silence"""
+        samples = speech_and_silence([(4, True), (1, False), (4, True), (1, False), (4, True)])
+
+        segments = plan_segments(samples, RATE, target_segment_s=3, max_segment_s=10)
+
+        assert [round(s.start / RATE, 1) for s in segments] == [0.0, 4.5, 9.5]
+        assert segments[-1].end == len(samples)
+        assert segments[1].offset_ms == 4500
+
+    def test_max_length_forces_a_cut(self):
+        """Test speech without silence is cut at max_segment_s"""
+        samples = speech_and_silence([(25, True)])
+
+        segments = plan_segments(samples, RATE, target_segment_s=5, max_segment_s=10)
+
+        assert [s.duration_s for s in segments] == [10, 10, 5]
+
+    def test_silent_segments_are_dropped(self):
+        """Test segments without speech are skipped"""
+        samples = speech_and_silence([(3, True), (1, False), (12, False), (1, False), (3, True)])
+
+        segments = plan_segments(samples, RATE, target_segment_s=2, max_segment_s=6)
+
+        assert all(
+            np.abs(samples[s.start:s.end]).max() > 0 for s in segments
+        )
+        assert sum(s.duration_s for s in segments) < 20
+
+
+class TestTranslateSegmented:
+    """Tests for parallel segment translation and stitching"""
+
+    def test_results_stitched_in_order_with_offsets(self, translator):
+        """Test later segments finishing first doesn't reorder the transcript"""
+        samples = speech_and_silence([(3, True), (1, False)] * 4)
+        received = []
+        delays = iter([0.15, 0.1, 0.05, 0.0])
+
+        engine = BatchTranslator(
+            translator, max_concurrency=4,
+            segment_recognizer_factory=lambda pcm, rate: segment_recognizer(f"{len(pcm)}", next(delays))
+        )
+        report = asyncio.run(engine.translate_segmented(
+            "meeting.wav", on_record=received.append, samples=samples, sample_rate=RATE,
+            target_segment_s=2, max_segment_s=8
+        ))
+
+        assert report.error is None
+        assert report.utterances == 4
+        assert report.audio_seconds == 16
+        assert [r.index for r in received] == [0, 1, 2, 3]
+        assert [r.offset_ms for r in received] == [100, 3600, 7600, 11600]
+        assert all(r.file == "meeting.wav" for r in received)
+
+    def test_segments_run_in_parallel(self, translator):
+        """Test wall-clock time is bounded by concurrency, not segment count"""
+        samples = speech_and_silence([(3, True), (1, False)] * 6)
+        engine = BatchTranslator(
+            translator, max_concurrency=6,
+            segment_recognizer_factory=lambda pcm, rate: segment_recognizer("x", 0.1)
+        )
+
+        start = time.perf_counter()
+        report = asyncio.run(engine.translate_segmented(
+            "long.wav", samples=samples, sample_rate=RATE, target_segment_s=2, max_segment_s=8
+        ))
+
+        assert report.utterances == 6
+        assert time.perf_counter() - start < 0.4  # 6 x 100ms serialized would take 0.6s
+
+    def test_failed_segment_is_reported_and_skipped(self, translator):
+        """Test one failing segment doesn't block later records"""
+        samples = speech_and_silence([(3, True), (1, False)] * 3)
+        received = []
+        errors = iter([None, "network", None])
+        engine = BatchTranslator(
+            translator,
+            segment_recognizer_factory=lambda pcm, rate: segment_recognizer("ok", 0, next(errors))
+        )
+
+        report = asyncio.run(engine.translate_segmented(
+            "x.wav", on_record=received.append, samples=samples, sample_rate=RATE,
+            target_segment_s=2, max_segment_s=8
+        ))
+
+        assert "segment 1 at 3500ms" in report.error
+        assert [r.offset_ms for r in received] == [100, 7600]
+        assert [r.index for r in received] == [0, 1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
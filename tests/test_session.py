@@ -0,0 +1,233 @@
+"""Pytest unit tests for TranslationSession lifecycle and teardown"""
+
+import asyncio
+import gc
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from src.core.config import Settings
+from src.core.session import TranslationSession
+from src.core.speech_engine import SimulatedSpeechEngine
+from src.core.translator import AzureSpeechTranslator, LiveInterpreterTranslator
+
+SIGNALS = ("recognizing", "recognized", "synthesizing", "canceled", "session_started", "session_stopped")
+
+
+@pytest.fixture
+def settings():
+    """Settings for offline runs"""
+    return Settings(
+        speech_key='test_key',
+        speech_region='eastus',
+        speech_engine='simulated',
+        target_language='es-ES',
+        tts_cache_enabled=False,
+        interim_coalesce_ms=50
+    )
+
+
+@pytest.fixture
+def engine():
+    """Simulated engine with no handshake or latency"""
+    return SimulatedSpeechEngine(latency_ms=0, jitter_ms=0, connect_ms=0, synthesis_ms=0, utterance_s=0.05)
+
+
+def microphone(translator):
+    """Recognizer factory for microphone sessions"""
+    return lambda push_stream: translator.create_recognizer_from_microphone()
+
+
+def handler_count(recognizer) -> int:
+    return sum(len(getattr(recognizer, name)._handlers) for name in SIGNALS)
+
+
+def wait_for_threads(baseline: int, timeout: float = 2.0) -> int:
+    """Give finished SDK/timer threads a moment to exit, then count threads"""
+    deadline = time.monotonic() + timeout
+    while threading.active_count() > baseline and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return threading.active_count()
+
+
+class TestTeardown:
+    """Tests for what a session releases"""
+
+    def test_context_manager_releases_everything(self, settings, engine):
+        """Test leaving the block disconnects handlers and closes the translator"""
+        translator = AzureSpeechTranslator(settings, engine=engine)
+        translator.warm_synthesizers(["es-ES"])
+        finals = []
+
+        with TranslationSession(translator, microphone(translator), idle_timeout_s=None) as session:
+            session.start(recognized_callback=finals.append, recognizing_callback=lambda r: None)
+            recognizer = session.warm.recognizer
+            assert handler_count(recognizer) > 0
+            time.sleep(0.1)
+
+        assert finals
+        assert session.closed and not session.running
+        assert handler_count(recognizer) == 0
+        assert translator.synthesizer_pool.idle_count() == 0
+        assert session.stats()["recognizers_released"] == 1
+        with pytest.raises(RuntimeError):
+            session.start()
+
+    def test_borrowed_translator_stays_open(self, settings, engine):
+        """Test owns_translator=False leaves the translator's synthesizers alone"""
+        translator = AzureSpeechTranslator(settings, engine=engine)
+        translator.warm_synthesizers(["es-ES"])
+
+        with TranslationSession(translator, microphone(translator), owns_translator=False) as session:
+            session.prewarm()
+
+        assert translator.synthesizer_pool.idle_count() == 1
+        translator.close()
+
+    def test_close_is_idempotent(self, settings, engine):
+        """Test closing twice is harmless"""
+        translator = AzureSpeechTranslator(settings, engine=engine)
+        session = TranslationSession(translator, microphone(translator))
+        session.start()
+
+        session.close()
+        session.close()
+
+        assert session.warm is None
+
+    def test_end_recording_builds_fresh_recognizer(self, settings, engine):
+        """Test a released recognizer is replaced on the next start with the same callbacks"""
+        translator = AzureSpeechTranslator(settings, engine=engine)
+        finals = []
+        with TranslationSession(translator, microphone(translator), idle_timeout_s=None) as session:
+            session.start(recognized_callback=finals.append)
+            first = session.warm.recognizer
+            session.end_recording()
+            assert handler_count(first) == 0
+
+            session.start()
+            time.sleep(0.1)
+            assert session.warm.recognizer is not first
+            assert session.stats()["recognizers_created"] == 2
+        assert finals
+
+    def test_stale_candidates_rebuild(self, settings, engine):
+        """Test a recognizer with outdated adaptive candidates is rebuilt on start"""
+        settings.adaptive_language_detection = True
+        translator = LiveInterpreterTranslator(settings, use_personal_voice=False, engine=engine)
+        with TranslationSession(translator, microphone(translator), idle_timeout_s=None) as session:
+            session.start()
+            session.pause()
+            first = session.warm.recognizer
+            for _ in range(3):
+                translator.language_tracker.observe("en-US")
+
+            session.start()
+
+            assert session.warm.recognizer is not first
+            assert session.warm.recognizer.auto_detect_languages == ["en-US"]
+
+    def test_stream_input_flushes_on_close(self, settings):
+        """Test queued client audio reaches the recognizer before the session closes"""
+        engine = SimulatedSpeechEngine(latency_ms=0, jitter_ms=0, connect_ms=0, utterance_s=0.1)
+        translator = AzureSpeechTranslator(settings, engine=engine)
+        factory = lambda push_stream: translator.create_recognizer_from_stream(push_stream)  # noqa: E731
+
+        async def run():
+            async with TranslationSession(translator, factory, stream_input=True, idle_timeout_s=None) as session:
+                await session.start_async()
+                for _ in range(3):
+                    await session.feed(b"\x00" * 3200)
+                push_stream = session.feeder.push_stream
+            return session, push_stream
+
+        session, push_stream = asyncio.run(run())
+
+        assert push_stream.closed
+        assert push_stream.bytes_written == 9600
+        assert session.feeder is None
+
+    def test_feed_requires_stream_input(self, settings, engine):
+        """Test microphone sessions refuse client audio"""
+        translator = AzureSpeechTranslator(settings, engine=engine)
+        session = TranslationSession(translator, microphone(translator))
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(session.feed(b"\x00\x00"))
+        session.close()
+
+
+class TestSoak:
+    """Tests that repeated start/stop cycles don't accumulate resources"""
+
+    CYCLES = 1000
+
+    def test_start_pause_cycles_are_flat(self, settings, engine):
+        """Test 1,000 async start/pause cycles on one session keep handlers, threads and memory flat"""
+        translator = AzureSpeechTranslator(settings, engine=engine)
+
+        async def run():
+            async with TranslationSession(translator, microphone(translator), idle_timeout_s=None) as session:
+                async def cycle():
+                    await session.start_async(recognized_callback=lambda r: None, recognizing_callback=lambda r: None)
+                    await session.pause_async()
+
+                for _ in range(50):
+                    await cycle()
+                recognizer = session.warm.recognizer
+                handlers = handler_count(recognizer)
+                gc.collect()
+                baseline_threads = wait_for_threads(threading.active_count())
+                tracemalloc.start()
+                before = tracemalloc.take_snapshot()
+
+                for _ in range(self.CYCLES):
+                    await cycle()
+
+                gc.collect()
+                threads = wait_for_threads(baseline_threads)
+                after = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+                growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+                return handlers, handler_count(recognizer), baseline_threads, threads, growth
+
+        handlers_before, handlers_after, threads_before, threads_after, growth = asyncio.run(run())
+
+        assert handlers_after == handlers_before
+        assert threads_after <= threads_before
+        assert growth < 256 * 1024
+
+    def test_session_cycles_are_flat(self, settings, engine):
+        """Test 1,000 open/start/stop/close session cycles return threads and memory to baseline"""
+        translator = AzureSpeechTranslator(settings, engine=engine)
+
+        def cycle():
+            with TranslationSession(translator, microphone(translator), idle_timeout_s=None, owns_translator=False) as session:
+                session.start(recognized_callback=lambda r: None, recognizing_callback=lambda r: None)
+                session.pause()
+
+        for _ in range(50):
+            cycle()
+        gc.collect()
+        baseline_threads = wait_for_threads(threading.active_count())
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+
+        for _ in range(self.CYCLES):
+            cycle()
+
+        gc.collect()
+        threads = wait_for_threads(baseline_threads)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        translator.close()
+
+        assert threads <= baseline_threads
+        assert growth < 256 * 1024
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,204 @@
+"""Pytest unit tests for speculative synthesis of stable interim translations"""
+
+import asyncio
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from src.core.audio_formats import concat_audio, decode_audio, parse_audio_format
+from src.core.config import Settings
+from src.core.speculative import SpeculationStats, SpeculativeSynthesizer
+from src.core.speech_engine import SimulatedSpeechEngine, synthetic_audio
+from src.core.translator import AzureSpeechTranslator
+
+
+def run_now(fn, *args):
+    """Submit stand-in that runs the task before returning its future"""
+    future = Future()
+    future.set_result(fn(*args))
+    return future
+
+
+def speculator(submit=run_now, **kwargs):
+    """Speculator rendering text as its own bytes, with private counters"""
+    kwargs.setdefault("quiet_ms", 0)
+    return SpeculativeSynthesizer(lambda text, lang: text.encode(), submit, stats=SpeculationStats(), **kwargs)
+
+
+def observe_all(spec, *texts):
+    for text in texts:
+        spec.observe({"es-ES": text})
+
+
+class TestStability:
+    """Tests for deciding what is stable enough to synthesize"""
+
+    def test_stable_prefix_is_speculated(self):
+        """Test a prefix shared by the last N interims is submitted once it has min_words new words"""
+        spec = speculator(stability_events=3, min_words=2)
+        observe_all(spec, "a b", "a b c", "a b c d")
+        assert [s.text for s in spec._utterances["es-ES"].segments] == ["a b"]
+
+        observe_all(spec, "a b c d e")  # Only one new stable word
+        assert len(spec._utterances["es-ES"].segments) == 1
+
+        observe_all(spec, "a b c d e f")
+        assert [s.text for s in spec._utterances["es-ES"].segments] == ["a b", "c d"]
+        assert spec.stats.segments_started == 2
+
+    def test_changing_prefix_waits(self):
+        """Test nothing is synthesized while the opening words keep changing"""
+        spec = speculator(stability_events=2, min_words=1)
+        observe_all(spec, "a b", "x b c", "y b c d")
+
+        assert spec._utterances["es-ES"].segments == []
+
+    def test_contradiction_cancels_segments(self):
+        """Test an interim that rewrites speculated words cancels that segment and later ones"""
+        pending = []
+
+        def queue(fn, *args):
+            pending.append(Future())
+            return pending[-1]
+
+        spec = speculator(submit=queue, stability_events=1, min_words=2)
+        observe_all(spec, "a b", "a b c d", "a x c d")
+
+        assert [s.text for s in spec._utterances["es-ES"].segments] == ["a x c d"]
+        assert pending[0].cancelled() and pending[1].cancelled()
+        assert spec.stats.segments_wasted == 2
+
+    def test_quiet_period_speculates_whole_interim(self):
+        """Test a pause submits the latest interim even below the stability and size thresholds"""
+        spec = speculator(stability_events=5, min_words=3, quiet_ms=30)
+        observe_all(spec, "a b")
+        time.sleep(0.15)
+
+        assert [s.text for s in spec._utterances["es-ES"].segments] == ["a b"]
+        spec.close()
+
+
+class TestFinalize:
+    """Tests for reconciling speculation with final results"""
+
+    def test_final_with_punctuation_matches(self):
+        """Test case and punctuation changes keep segments, and the new words are left to synthesize"""
+        spec = speculator(stability_events=1, min_words=1)
+        observe_all(spec, "hola a todos")
+        spec.finalize({"es-ES": "Hola a todos, amigos."})
+
+        match = spec.claim("es-ES", "Hola a todos, amigos.")
+        assert [future.result() for future in match.futures] == [b"hola a todos"]
+        assert match.remainder == "amigos."
+        spec.record(match, used=True, waited_s=0.01)
+
+        stats = spec.stats.stats()
+        assert stats["segments_used"] == 1
+        assert stats["finals_speculated"] == 1
+        assert stats["finals_complete"] == 0
+        assert stats["waste_ratio"] == 0
+
+    def test_mismatched_final_wastes(self):
+        """Test segments the final contradicts are wasted and nothing can be claimed"""
+        spec = speculator(stability_events=1, min_words=1)
+        observe_all(spec, "hola a todos")
+        spec.finalize({"es-ES": "adiós a todos"})
+
+        assert spec.claim("es-ES", "adiós a todos") is None
+        assert spec.stats.stats()["waste_ratio"] == 1
+
+    def test_no_match_starts_next_utterance(self):
+        """Test a final without translations wastes the utterance's segments and clears state"""
+        spec = speculator(stability_events=1, min_words=1)
+        observe_all(spec, "hola")
+        spec.finalize({})
+
+        assert spec._utterances == {}
+        assert spec.stats.segments_wasted == 1
+
+    def test_unclaimed_finals_are_bounded(self):
+        """Test finals nobody synthesizes are dropped oldest first and counted as wasted"""
+        spec = speculator(stability_events=1, min_words=1, max_pending_finals=2)
+        for i in range(3):
+            observe_all(spec, f"frase {i}")
+            spec.finalize({"es-ES": f"frase {i}"})
+
+        assert spec.claim("es-ES", "frase 0") is None
+        assert spec.claim("es-ES", "frase 2") is not None
+        assert spec.stats.segments_wasted == 1
+
+
+class TestConcatAudio:
+    """Tests for joining segment clips"""
+
+    def test_raw_is_joined(self):
+        """Test headerless PCM is concatenated as is"""
+        raw = parse_audio_format("raw")
+        assert concat_audio([b"\x01\x00", b"\x02\x00"], raw) == b"\x01\x00\x02\x00"
+
+    def test_wav_is_reencoded(self):
+        """Test WAV clips become one WAV with every sample"""
+        pcm = parse_audio_format("pcm")
+        clips = [synthetic_audio("hola", pcm.name), synthetic_audio("a todos", pcm.name)]
+
+        joined, _ = decode_audio(concat_audio(clips, pcm), pcm, dtype="int16")
+
+        assert len(joined) == sum(len(decode_audio(clip, pcm, dtype="int16")[0]) for clip in clips)
+
+
+class TestTranslatorSpeculation:
+    """Tests for speculation inside continuous translation"""
+
+    @pytest.fixture
+    def translator(self):
+        """Translator whose finals arrive well after the last interim, speculating only on pauses"""
+        settings = Settings(speech_key='test_key', speech_region='eastus', speech_engine='simulated',
+                            target_language='es-ES', tts_cache_enabled=False, interim_coalesce_ms=0,
+                            speculative_synthesis=True, speculative_stability_events=100, speculative_quiet_ms=50)
+        engine = SimulatedSpeechEngine(latency_ms=200, jitter_ms=0, connect_ms=0, synthesis_ms=30, utterance_s=0.3)
+        translator = AzureSpeechTranslator(settings, engine=engine)
+        translator.speculator.stats = SpeculationStats()
+        yield translator
+        translator.close()
+
+    def test_finals_use_speculated_audio(self, translator):
+        """Test finals get audio rendered during the pause, identical to synthesizing them afresh"""
+        outcomes = []
+
+        def on_final(result):
+            outcomes.append((result.translations['es-ES'], translator.synthesize_translations(result.translations)))
+
+        recognizer = translator.create_recognizer_from_microphone()
+        translator.start_continuous_translation(recognizer, recognized_callback=on_final)
+        time.sleep(1.2)
+        translator.stop_continuous_translation(recognizer)
+        translator.release_recognizer(recognizer)
+
+        assert outcomes
+        for text, synthesized in outcomes:
+            assert synthesized['es-ES'].audio_data == synthetic_audio(text, translator.audio_format.name)
+        stats = translator.speculator.stats.stats()
+        assert stats["finals_complete"] == stats["finals"] >= len(outcomes)
+        assert stats["mean_wait_ms"] < 20
+
+    def test_async_synthesis_claims_speculation(self, translator):
+        """Test the event-loop synthesis path joins speculated segments with the remaining words"""
+        translator.speculator.observe({'es-ES': "[es-ES] Good morning"})
+        time.sleep(0.15)
+        translator.speculator.finalize({'es-ES': "[es-ES] Good morning everyone"})
+
+        audio = asyncio.run(translator.synthesize_translation_async("[es-ES] Good morning everyone", 'es-ES'))
+
+        clips = [synthetic_audio(text, translator.audio_format.name) for text in ("[es-ES] Good morning", "everyone")]
+        assert audio == concat_audio(clips, translator.audio_format)
+        assert translator.speculator.stats.segments_used == 1
+
+    def test_disabled_by_default(self):
+        """Test speculation is opt-in"""
+        translator = AzureSpeechTranslator(Settings(speech_key='test_key', speech_region='eastus'))
+        assert translator.speculator is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,128 @@
+"""Pytest unit tests for the shared speech config factory"""
+
+import time
+
+import pytest
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.core.config import Settings
+from src.core.speech_configs import SpeechConfigFactory, get_config_factory
+from src.core.translator import AzureSpeechTranslator, LiveInterpreterTranslator
+
+
+def make_settings(**overrides):
+    """Build test settings with synthesis caching disabled"""
+    values = dict(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False,
+                  source_language='en-US', target_language='es-ES', target_language_2='fr-FR')
+    values.update(overrides)
+    return Settings(**values)
+
+
+class TestSpeechConfigFactory:
+    """Tests for config build/reuse"""
+
+    def test_same_setup_reuses_config(self):
+        """Test identical session setups share one translation config"""
+        factory = SpeechConfigFactory()
+
+        first = factory.translation_config(make_settings(), voice_name='es-ES-ElviraNeural')
+        second = factory.translation_config(make_settings(), voice_name='es-ES-ElviraNeural')
+
+        assert first is second
+        assert factory.stats()['built'] == 1
+        assert factory.stats()['reused'] == 1
+
+    def test_target_order_does_not_matter(self):
+        """Test the target set is keyed without regard to order"""
+        factory = SpeechConfigFactory()
+
+        first = factory.translation_config(make_settings())
+        second = factory.translation_config(make_settings(target_language='fr-FR', target_language_2='es-ES'))
+
+        assert first is second
+
+    @pytest.mark.parametrize("overrides,kwargs", [
+        ({'source_language': 'de-DE'}, {}),
+        ({'target_language_3': 'it-IT'}, {}),
+        ({}, {'voice_name': 'fr-FR-DeniseNeural'}),
+        ({}, {'live_interpreter': True}),
+        ({'speech_region': 'westeurope'}, {}),
+    ])
+    def test_different_setup_builds_new_config(self, overrides, kwargs):
+        """Test each key component separates configs"""
+        factory = SpeechConfigFactory()
+        base = factory.translation_config(make_settings())
+
+        other = factory.translation_config(make_settings(**overrides), **kwargs)
+
+        assert other is not base
+        assert factory.stats()['built'] == 2
+
+    def test_config_has_target_languages(self):
+        """Test built configs carry the target set"""
+        config = SpeechConfigFactory().translation_config(make_settings())
+
+        assert sorted(config.target_languages) == ['es-ES', 'fr-FR']
+
+    def test_auto_detect_config_reused(self):
+        """Test auto-detect configs are cached per candidate list"""
+        factory = SpeechConfigFactory()
+
+        first = factory.auto_detect_config(['en-US', 'es-ES'])
+
+        assert factory.auto_detect_config(['en-US', 'es-ES']) is first
+        assert isinstance(first, speechsdk.languageconfig.AutoDetectSourceLanguageConfig)
+        assert factory.stats()['auto_detect_configs'] == 1
+
+    def test_lru_bound(self):
+        """Test the least recently used config is dropped beyond max_entries"""
+        factory = SpeechConfigFactory(max_entries=2)
+        factory.translation_config(make_settings(source_language='en-US'))
+        factory.translation_config(make_settings(source_language='de-DE'))
+        factory.translation_config(make_settings(source_language='it-IT'))
+
+        factory.translation_config(make_settings(source_language='en-US'))
+
+        assert factory.stats()['translation_configs'] == 2
+        assert factory.stats()['built'] == 4
+
+
+class TestTranslatorConfigReuse:
+    """Tests for translators drawing configs from the shared factory"""
+
+    def test_translators_share_config(self):
+        """Test repeated sessions with the same setup reuse the config"""
+        first = AzureSpeechTranslator(make_settings(voice_name='es-ES-ElviraNeural'))
+        second = AzureSpeechTranslator(make_settings(voice_name='es-ES-ElviraNeural'))
+
+        assert first.translation_config is second.translation_config
+        assert first.config_factory is get_config_factory()
+
+    def test_live_interpreter_config_is_separate(self):
+        """Test Live Interpreter sessions do not share the standard config"""
+        settings = make_settings(voice_name='es-ES-ElviraNeural', enable_live_interpreter=True)
+        standard = AzureSpeechTranslator(settings)
+        live = LiveInterpreterTranslator(settings, use_personal_voice=True)
+
+        assert live.translation_config is not standard.translation_config
+        assert live.translation_config.voice_name == 'personal-voice'
+
+    def test_reused_setup_is_faster(self):
+        """Test reusing a config is cheaper than building one"""
+        factory = SpeechConfigFactory()
+        settings = make_settings()
+
+        start = time.perf_counter()
+        factory.translation_config(settings)
+        build_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(100):
+            factory.translation_config(settings)
+        reuse_s = (time.perf_counter() - start) / 100
+
+        assert reuse_s < build_s
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
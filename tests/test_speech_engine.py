@@ -0,0 +1,254 @@
+"""Pytest unit tests for the speech engine interface and the simulated engine"""
+
+import asyncio
+import io
+import threading
+import time
+import wave
+
+import pytest
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.core.batch import BatchTranslator
+from src.core.config import Settings
+from src.core.speech_engine import (
+    AudioSource,
+    AzureSpeechEngine,
+    SimulatedSpeechEngine,
+    create_speech_engine,
+    synthetic_audio,
+)
+from src.core.translator import AzureSpeechTranslator, LiveInterpreterTranslator
+from src.core.warm_recognizer import KeepWarmRecognizer
+
+SCRIPT = ["hello there everyone", "the motion carries"]
+
+
+@pytest.fixture
+def settings():
+    """Settings for offline runs"""
+    return Settings(
+        speech_key='test_key',
+        speech_region='eastus',
+        speech_engine='simulated',
+        target_language='es-ES',
+        target_language_2='fr-FR',
+        tts_cache_enabled=False,
+        interim_coalesce_ms=0
+    )
+
+
+@pytest.fixture
+def engine():
+    """Fast simulated engine"""
+    return SimulatedSpeechEngine(
+        latency_ms=5, jitter_ms=0, connect_ms=5, synthesis_ms=5, utterance_s=0.2, script=SCRIPT
+    )
+
+
+@pytest.fixture
+def translator(settings, engine):
+    """Translator running on the simulated engine"""
+    translator = AzureSpeechTranslator(settings, engine=engine)
+    yield translator
+    translator.close()
+
+
+def write_wav(path, seconds):
+    """Write a silent 16 kHz mono WAV"""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\x00\x00" * int(16000 * seconds))
+
+
+class TestEngineSelection:
+    """Tests for choosing an engine from settings"""
+
+    def test_default_is_azure(self):
+        """Test the SDK engine is the default"""
+        settings = Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False)
+        translator = AzureSpeechTranslator(settings)
+
+        assert isinstance(translator.engine, AzureSpeechEngine)
+        translator.close()
+
+    def test_simulated_from_settings(self, settings):
+        """Test SPEECH_ENGINE=simulated builds a configured simulated engine"""
+        settings.simulated_latency_ms = 42
+        engine = create_speech_engine(settings)
+
+        assert isinstance(engine, SimulatedSpeechEngine)
+        assert engine.latency_ms == 42
+
+    def test_unknown_engine(self, settings):
+        """Test an unknown engine name is rejected"""
+        settings.speech_engine = 'other'
+
+        with pytest.raises(ValueError):
+            create_speech_engine(settings)
+
+
+class TestSimulatedRecognition:
+    """Tests for simulated recognizers driven through the translator"""
+
+    def test_continuous_push_stream(self, translator):
+        """Test interims and finals follow the audio written to a push stream"""
+        interims, finals, stopped = [], [], threading.Event()
+        stream = translator.create_push_stream()
+        recognizer = translator.create_recognizer_from_stream(stream)
+
+        translator.start_continuous_translation(
+            recognizer,
+            recognizing_callback=interims.append,
+            recognized_callback=finals.append,
+            session_stopped_callback=stopped.set
+        )
+        stream.write(b"\x00" * int(32000 * 0.45))  # Two 0.2 s utterances and a short tail
+        stream.close()
+        assert stopped.wait(2)
+
+        assert [f.original_text for f in finals] == SCRIPT
+        assert finals[0].translations == {'es-ES': '[es-ES] hello there everyone', 'fr-FR': '[fr-FR] hello there everyone'}
+        assert [i.original_text for i in interims[:3]] == ["hello", "hello there", "hello there everyone"]
+
+    def test_async_session_and_offsets(self, translator, tmp_path):
+        """Test the asyncio API and batch offsets work on a simulated file"""
+        write_wav(tmp_path / "meeting.wav", 0.6)
+        engine = BatchTranslator(translator)
+
+        report = asyncio.run(engine.translate_files([str(tmp_path / "meeting.wav")]))
+
+        assert report.files[0].error is None
+        assert report.files[0].utterances == 3
+
+        records = asyncio.run(engine.recognize_all(
+            translator.create_recognizer_from_file(str(tmp_path / "meeting.wav")), "m.wav"
+        ))
+        assert [r.offset_ms for r in records] == [0, 200, 400]
+
+    def test_recognize_once(self, translator, tmp_path):
+        """Test single-shot recognition returns one translated utterance"""
+        write_wav(tmp_path / "short.wav", 1.0)
+
+        result = asyncio.run(translator.translate_once(translator.create_recognizer_from_file(str(tmp_path / "short.wav"))))
+
+        assert result.original_text == "hello there everyone"
+        assert result.translations['fr-FR'] == "[fr-FR] hello there everyone"
+
+    def test_auto_detect_and_live_interpreter(self, settings, engine):
+        """Test Live Interpreter recognizers get continuous language ID and the session voice"""
+        translator = LiveInterpreterTranslator(settings, engine=engine)
+        recognizer = translator.create_recognizer_from_stream(translator.create_push_stream(), ['fr-FR', 'en-US'])
+
+        assert recognizer.properties.get_property(
+            speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode
+        ) == 'Continuous'
+        assert recognizer.voice_name == settings.voice_name
+        translator.close()
+
+    def test_errors_cancel_the_session(self, settings, tmp_path):
+        """Test error_rate=1 cancels recognition with an error"""
+        engine = SimulatedSpeechEngine(latency_ms=1, jitter_ms=0, connect_ms=1, error_rate=1.0, utterance_s=0.1)
+        translator = AzureSpeechTranslator(settings, engine=engine)
+        write_wav(tmp_path / "a.wav", 0.5)
+
+        with pytest.raises(RuntimeError, match="Simulated service error"):
+            asyncio.run(BatchTranslator(translator).recognize_all(
+                translator.create_recognizer_from_file(str(tmp_path / "a.wav")), "a.wav"
+            ))
+        translator.close()
+
+    def test_microphone_runs_until_stopped(self, translator):
+        """Test microphone sessions pace utterances in real time and stop on request"""
+        finals = []
+        recognizer = translator.create_recognizer_from_microphone()
+
+        async def run():
+            await translator.start_continuous_translation_async(recognizer, recognized_callback=finals.append)
+            await asyncio.sleep(0.3)
+            await translator.stop_continuous_translation_async(recognizer)
+
+        asyncio.run(run())
+
+        assert len(finals) == 1
+
+
+class TestSimulatedConnections:
+    """Tests for handshake cost and keep-warm behavior"""
+
+    def test_prewarm_skips_handshake(self, translator, settings):
+        """Test a warm recognizer starts without paying connect_ms again"""
+        translator.engine.connect_ms = 80
+        warm = KeepWarmRecognizer(translator, translator.create_recognizer_from_microphone(), idle_timeout_s=None)
+
+        assert warm.prewarm()
+        time.sleep(0.15)
+        assert warm.is_warm
+
+        start = time.perf_counter()
+        asyncio.run(warm.start_async())
+        assert time.perf_counter() - start < 0.05
+        asyncio.run(warm.close_async())
+
+
+class TestSimulatedSynthesis:
+    """Tests for synthetic audio"""
+
+    def test_synthesize_riff(self, translator):
+        """Test synthesis returns a WAV at the requested rate"""
+        audio = translator.synthesize_translation("Hola a todos", "es-ES")
+
+        with wave.open(io.BytesIO(audio)) as wav:
+            assert wav.getframerate() == 16000
+            assert wav.getnframes() > 0
+
+    def test_streaming_chunks_match_full_audio(self, translator):
+        """Test streamed chunks reassemble to the same audio"""
+        chunks = list(translator.iter_synthesis_chunks("Hola a todos", "es-ES", chunk_size=1024))
+
+        assert len(chunks) > 1
+        assert b"".join(chunks) == synthetic_audio("Hola a todos", "Riff16Khz16BitMonoPcm")
+
+    def test_synthesis_errors(self, settings):
+        """Test error_rate=1 makes synthesis fail"""
+        engine = SimulatedSpeechEngine(synthesis_ms=1, connect_ms=1, jitter_ms=0, error_rate=1.0)
+        translator = AzureSpeechTranslator(settings, engine=engine)
+
+        assert translator.synthesize_translation("Hola", "es-ES") is None
+        assert asyncio.run(translator.synthesize_translation_async("Hola", "es-ES")) is None
+        translator.close()
+
+    def test_raw_and_unsupported_formats(self):
+        """Test raw PCM has no header and formats the apps cannot decode are refused"""
+        raw = synthetic_audio("abc", "Raw24Khz16BitMonoPcm")
+
+        assert len(raw) == int(24000 * 0.2) * 2
+        with pytest.raises(ValueError):
+            synthetic_audio("abc", "Riff16Khz16KbpsMonoSiren")
+
+
+class TestDeterminism:
+    """Tests for reproducible simulated runs"""
+
+    def test_same_seed_same_delays(self):
+        """Test seeded engines draw identical jitter per client"""
+        def delays(seed):
+            engine = SimulatedSpeechEngine(jitter_ms=100, seed=seed)
+            synthesizer = engine.create_synthesizer("v", "Riff16Khz16BitMonoPcm")
+            return [synthesizer._delay(100) for _ in range(5)]
+
+        assert delays(7) == delays(7)
+        assert delays(7) != delays(8)
+
+    def test_source_kinds(self):
+        """Test audio source constructors"""
+        assert AudioSource.microphone().kind == "microphone"
+        assert AudioSource.file("a.wav").path == "a.wav"
+        assert AudioSource.push_stream("s").stream == "s"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,168 @@
+"""Pytest tests for per-language subscriptions and demand-driven synthesis"""
+
+import base64
+import importlib
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.config import Settings
+from src.core.subscriptions import ALL_LANGUAGES, Subscription, audio_languages
+from src.core.translator import AzureSpeechTranslator
+
+AUDIO_CHUNK = base64.b64encode(b"\x00" * 6400).decode()  # 200 ms of 16 kHz 16-bit mono
+TARGETS = ["es-ES", "fr-FR", "de-DE"]
+
+
+class TestSubscription:
+    """Tests for parsing and applying subscriptions"""
+
+    def test_filters_text_and_audio(self):
+        """Test only subscribed languages pass, and text-only subscriptions get no audio"""
+        translations = {"es-ES": "Hola", "fr-FR": "Bonjour", "de-DE": "Hallo"}
+        spanish = Subscription.from_message({"languages": ["es-ES"]})
+        captions = Subscription.from_message({"languages": ["fr-FR"], "audio": False})
+
+        assert spanish.translations(translations) == {"es-ES": "Hola"}
+        assert spanish.audio_for(translations) == {"es-ES": "Hola"}
+        assert captions.translations(translations) == {"fr-FR": "Bonjour"}
+        assert captions.audio_for(translations) == {}
+        assert ALL_LANGUAGES.translations(translations) is translations
+
+    def test_empty_language_list_means_all(self):
+        """Test a subscription without languages covers every language"""
+        assert Subscription.from_message({"languages": []}) == ALL_LANGUAGES
+        assert Subscription.from_message({}).describe() == {"languages": None, "audio": True}
+
+    @pytest.mark.parametrize("data", [None, {"languages": "es-ES"}, {"languages": [1]}, {"audio": "yes"}])
+    def test_malformed_subscriptions_raise(self, data):
+        """Test wrong types are rejected"""
+        with pytest.raises(ValueError):
+            Subscription.from_message(data)
+
+    def test_audio_languages(self):
+        """Test synthesis covers the union of audio subscriptions, or everything if anyone wants all"""
+        spanish = Subscription(frozenset({"es-ES"}))
+        german = Subscription(frozenset({"de-DE"}))
+        captions = Subscription(frozenset({"fr-FR"}), audio=False)
+
+        assert audio_languages([spanish, german, captions, spanish]) == {"es-ES", "de-DE"}
+        assert audio_languages([captions]) == frozenset()
+        assert audio_languages([spanish, ALL_LANGUAGES]) is None
+
+    def test_translator_synthesis_targets(self):
+        """Test the translator synthesizes only the languages it is told someone plays"""
+        translator = AzureSpeechTranslator(Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False))
+        translations = {"es-ES": "Hola", "fr-FR": "Bonjour"}
+
+        assert translator.synthesis_targets(translations) is translations
+        translator.set_synthesis_languages(["fr-FR"])
+        assert translator.synthesis_targets(translations) == {"fr-FR": "Bonjour"}
+        translator.set_synthesis_languages(None)
+        assert translator.synthesis_targets(translations) == translations
+
+
+@pytest.fixture
+def main():
+    """Backend module; its import-time logging setup is undone afterwards so other tests stay quiet"""
+    handlers, level = list(logging.root.handlers), logging.root.level
+    yield importlib.import_module("src.react_app.backend.main")
+    logging.root.handlers[:] = handlers
+    logging.root.setLevel(level)
+
+
+@pytest.fixture
+def client(main, monkeypatch):
+    """Backend on a fast simulated engine"""
+    settings = Settings(speech_key='test_key', speech_region='eastus', speech_engine='simulated',
+                        target_language='es-ES', target_language_2=None, tts_cache_enabled=False,
+                        simulated_latency_ms=20, simulated_jitter_ms=0, simulated_connect_ms=10,
+                        simulated_synthesis_ms=5)
+    monkeypatch.setattr(main, "settings", settings)
+    with TestClient(main.app) as client:
+        yield client
+
+
+def receive_until(ws, message_type: str) -> dict:
+    """Read messages until one of the given type arrives"""
+    while True:
+        message = json.loads(ws.receive()["text"])
+        if message["type"] == message_type:
+            return message
+        assert message["type"] != "error", message
+
+
+def record(ws):
+    """Stream a little audio and return the first final result"""
+    ws.send_json({"type": "start_recording"})
+    for _ in range(12):
+        ws.send_json({"type": "audio", "data": AUDIO_CHUNK})
+    return receive_until(ws, "recognized")["data"]
+
+
+class TestBackendSubscriptions:
+    """Tests for subscriptions over the backend WebSockets"""
+
+    def test_session_receives_subscribed_languages(self, main, client):
+        """Test a client gets only its language and only that language is synthesized"""
+        before = main.synthesis_demand.stats()
+        with client.websocket_connect("/ws/translate") as ws:
+            ws.send_json({"type": "config", "data": {"target_languages": TARGETS, "audio_source": "stream"}})
+            receive_until(ws, "config_confirmed")
+            ws.send_json({"type": "subscribe", "data": {"languages": ["fr-FR"]}})
+            assert receive_until(ws, "subscribed")["data"] == {"languages": ["fr-FR"], "audio": True}
+
+            recognized = record(ws)
+        after = main.synthesis_demand.stats()
+
+        assert set(recognized["translations"]) == {"fr-FR"}
+        assert set(recognized["synthesized_audio"]) == {"fr-FR"}
+        assert after["synthesized"] - before["synthesized"] == 1
+        assert after["skipped"] - before["skipped"] == 2
+
+    def test_room_synthesizes_what_listeners_play(self, main, client):
+        """Test each listener gets its own languages and synthesis covers only played languages"""
+        before = main.synthesis_demand.stats()
+        with client.websocket_connect("/ws/translate") as presenter, \
+                client.websocket_connect("/ws/listen/council") as spanish, \
+                client.websocket_connect("/ws/listen/council") as captions:
+            presenter.send_json({"type": "config", "data": {
+                "target_languages": TARGETS, "audio_source": "stream", "room": "council"
+            }})
+            receive_until(presenter, "config_confirmed")
+            presenter.send_json({"type": "subscribe", "data": {"audio": False}})
+            receive_until(presenter, "subscribed")
+            spanish.send_json({"type": "subscribe", "data": {"languages": ["es-ES"]}})
+            receive_until(spanish, "subscribed")
+            captions.send_json({"type": "subscribe", "data": {"languages": ["fr-FR"], "audio": False}})
+            receive_until(captions, "subscribed")
+
+            everything = record(presenter)
+            heard = receive_until(spanish, "recognized")["data"]
+            read = receive_until(captions, "recognized")["data"]
+            presenter.send_json({"type": "stop_recording"})
+            receive_until(presenter, "stopped")
+        after = main.synthesis_demand.stats()
+
+        assert set(everything["translations"]) == set(TARGETS)
+        assert everything["synthesized_audio"] == {}
+        assert set(heard["translations"]) == {"es-ES"}
+        assert set(heard["synthesized_audio"]) == {"es-ES"}
+        assert set(read["translations"]) == {"fr-FR"}
+        assert read["synthesized_audio"] == {}
+        assert after["synthesized"] - before["synthesized"] == 1
+        assert after["skipped"] - before["skipped"] == 2
+
+    def test_malformed_subscription_is_an_error(self, client):
+        """Test a bad subscribe message is reported and leaves the client subscribed to everything"""
+        with client.websocket_connect("/ws/listen/council") as listener:
+            receive_until(listener, "connected")
+            listener.send_json({"type": "subscribe", "data": {"languages": "es-ES"}})
+
+            assert listener.receive_json()["type"] == "error"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,341 @@
+"""Pytest unit tests for synthesizer pooling"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.core.config import Settings
+from src.core.synthesis import SynthesisError, SynthesizerPool
+from src.core.translator import AzureSpeechTranslator
+
+
+@pytest.fixture
+def mock_settings():
+    """Create a settings object for testing"""
+    return Settings(
+        speech_key='test_key',
+        speech_region='eastus',
+        target_language='es-ES',
+        target_language_2='fr-FR',
+        tts_cache_enabled=False
+    )
+
+
+@pytest.fixture
+def fake_factory():
+    """Factory that records every synthesizer it creates"""
+    created = []
+
+    def factory(voice_name, output_format):
+        synthesizer = MagicMock(name=f"synth-{voice_name}")
+        synthesizer.voice_name = voice_name
+        synthesizer.speak_text.return_value = MagicMock(
+            reason=speechsdk.ResultReason.SynthesizingAudioCompleted,
+            audio_data=b'RIFF' + b'\x00' * 32
+        )
+        created.append(synthesizer)
+        return synthesizer
+
+    factory.created = created
+    return factory
+
+
+class TestSynthesizerPool:
+    """Tests for SynthesizerPool"""
+
+    def test_acquire_creates_when_empty(self, fake_factory):
+        """Test acquire creates a synthesizer when none are idle"""
+        pool = SynthesizerPool(fake_factory)
+
+        synth = pool.acquire('es-ES-ElviraNeural', 'Riff16Khz16BitMonoPcm')
+
+        assert synth is fake_factory.created[0]
+        assert pool.stats()['created'] == 1
+
+    def test_release_then_acquire_reuses(self, fake_factory):
+        """Test released synthesizers are reused for the same key"""
+        pool = SynthesizerPool(fake_factory)
+
+        synth = pool.acquire('es-ES-ElviraNeural', 'Riff16Khz16BitMonoPcm')
+        pool.release('es-ES-ElviraNeural', 'Riff16Khz16BitMonoPcm', synth)
+        again = pool.acquire('es-ES-ElviraNeural', 'Riff16Khz16BitMonoPcm')
+
+        assert again is synth
+        assert pool.stats()['created'] == 1
+        assert pool.stats()['reused'] == 1
+
+    def test_pool_is_keyed_by_voice_and_format(self, fake_factory):
+        """Test different voice or format never share a synthesizer"""
+        pool = SynthesizerPool(fake_factory)
+
+        synth = pool.acquire('es-ES-ElviraNeural', 'Riff16Khz16BitMonoPcm')
+        pool.release('es-ES-ElviraNeural', 'Riff16Khz16BitMonoPcm', synth)
+
+        other_format = pool.acquire('es-ES-ElviraNeural', 'Ogg16Khz16BitMonoOpus')
+        other_voice = pool.acquire('fr-FR-DeniseNeural', 'Riff16Khz16BitMonoPcm')
+
+        assert other_format is not synth
+        assert other_voice is not synth
+        assert len(fake_factory.created) == 3
+
+    def test_max_idle_per_key_bounds_pool(self, fake_factory):
+        """Test only max_idle_per_key synthesizers are retained"""
+        pool = SynthesizerPool(fake_factory, max_idle_per_key=1)
+
+        first = pool.acquire('v', 'f')
+        second = pool.acquire('v', 'f')
+        pool.release('v', 'f', first)
+        pool.release('v', 'f', second)
+
+        assert pool.idle_count('v', 'f') == 1
+        assert pool.stats()['discarded'] == 1
+
+    def test_zero_idle_disables_reuse(self, fake_factory):
+        """Test max_idle_per_key=0 behaves like per-call creation"""
+        pool = SynthesizerPool(fake_factory, max_idle_per_key=0)
+
+        for _ in range(3):
+            pool.release('v', 'f', pool.acquire('v', 'f'))
+
+        assert len(fake_factory.created) == 3
+
+    def test_warm_pre_creates_and_connects(self, fake_factory):
+        """Test warm creates one connected synthesizer per key"""
+        connect = MagicMock(return_value=MagicMock())
+        pool = SynthesizerPool(fake_factory, connect=connect)
+
+        pool.warm([('v1', 'f'), ('v2', 'f'), ('v1', 'f')])
+
+        assert len(fake_factory.created) == 2
+        assert connect.call_count == 2
+        assert pool.idle_count() == 2
+
+    def test_connect_failure_is_not_fatal(self, fake_factory):
+        """Test a failed pre-connect still yields a usable synthesizer"""
+        pool = SynthesizerPool(fake_factory, connect=MagicMock(side_effect=RuntimeError("offline")))
+
+        synth = pool.acquire('v', 'f')
+
+        assert synth is fake_factory.created[0]
+
+    def test_clear_closes_connections(self, fake_factory):
+        """Test clear drops idle synthesizers and closes their connections"""
+        connection = MagicMock()
+        pool = SynthesizerPool(fake_factory, connect=MagicMock(return_value=connection))
+        pool.warm([('v', 'f')])
+
+        pool.clear()
+
+        assert pool.idle_count() == 0
+        connection.close.assert_called_once()
+
+
+class TestTranslatorSynthesisPooling:
+    """Tests for pooled synthesis in AzureSpeechTranslator"""
+
+    def test_synthesize_translation_reuses_synthesizer(self, mock_settings, fake_factory):
+        """Test repeated synthesis in one language creates one synthesizer"""
+        translator = AzureSpeechTranslator(mock_settings)
+        translator.synthesizer_pool = SynthesizerPool(fake_factory)
+
+        first = translator.synthesize_translation("Hola", "es-ES")
+        second = translator.synthesize_translation("Adiós", "es-ES")
+
+        assert first and second
+        assert len(fake_factory.created) == 1
+        assert fake_factory.created[0].speak_text.call_count == 2
+
+    def test_canceled_synthesis_discards_synthesizer(self, mock_settings, fake_factory):
+        """Test a canceled result is not returned to the pool"""
+        translator = AzureSpeechTranslator(mock_settings)
+        translator.synthesizer_pool = SynthesizerPool(fake_factory)
+        synth = translator.synthesizer_pool.acquire(
+            mock_settings.get_voice_for_language('es-ES'), mock_settings.synthesis_output_format
+        )
+        synth.speak_text.return_value = MagicMock(reason=speechsdk.ResultReason.Canceled)
+        translator.synthesizer_pool.release(
+            mock_settings.get_voice_for_language('es-ES'), mock_settings.synthesis_output_format, synth
+        )
+
+        assert translator.synthesize_translation("Hola", "es-ES") is None
+        assert translator.synthesizer_pool.idle_count() == 0
+
+    def test_warm_synthesizers_uses_language_voices(self, mock_settings, fake_factory):
+        """Test warm_synthesizers warms the configured target language voices"""
+        translator = AzureSpeechTranslator(mock_settings)
+        translator.synthesizer_pool = SynthesizerPool(fake_factory)
+
+        translator.warm_synthesizers()
+
+        voices = {synth.voice_name for synth in fake_factory.created}
+        assert voices == {'es-ES-ElviraNeural', 'fr-FR-DeniseNeural'}
+
+    def test_create_synthesizer_applies_output_format(self, mock_settings):
+        """Test the real synthesizer factory accepts the configured format"""
+        translator = AzureSpeechTranslator(mock_settings)
+
+        synthesizer = translator._create_synthesizer('es-ES-ElviraNeural', 'Riff16Khz16BitMonoPcm')
+
+        assert synthesizer is not None
+
+
+class TestMultiLanguageSynthesis:
+    """Tests for concurrent multi-language synthesis fan-out"""
+
+    @pytest.fixture
+    def translator(self, mock_settings):
+        """Translator whose _synthesize sleeps per language instead of calling Azure"""
+        translator = AzureSpeechTranslator(mock_settings)
+        delays = {'es-ES': 0.2, 'fr-FR': 0.05, 'de-DE': 0.1}
+
+        def fake_synthesize(text, lang):
+            time.sleep(delays.get(lang, 0))
+            if text == 'fail':
+                raise SynthesisError(f"Synthesis canceled for {lang}")
+            return f"{lang}:{text}".encode()
+
+        translator._synthesize = fake_synthesize
+        yield translator
+        translator.close()
+
+    def test_wall_clock_approaches_slowest_language(self, translator):
+        """Test three languages take about as long as the slowest one"""
+        start = time.perf_counter()
+        outcomes = translator.synthesize_translations({'es-ES': 'Hola', 'fr-FR': 'Salut', 'de-DE': 'Hallo'})
+        elapsed = time.perf_counter() - start
+
+        assert all(outcome.ok for outcome in outcomes.values())
+        assert elapsed < 0.3  # sum of delays is 0.35s
+
+    def test_results_keep_request_order(self, translator):
+        """Test synthesize_translations returns languages in request order"""
+        outcomes = translator.synthesize_translations({'es-ES': 'Hola', 'fr-FR': 'Salut'})
+
+        assert list(outcomes) == ['es-ES', 'fr-FR']
+        assert outcomes['fr-FR'].audio_data == b'fr-FR:Salut'
+
+    def test_errors_are_reported_per_language(self, translator):
+        """Test one failing language doesn't hide the others"""
+        outcomes = translator.synthesize_translations({'es-ES': 'fail', 'fr-FR': 'Salut'})
+
+        assert not outcomes['es-ES'].ok
+        assert 'canceled' in outcomes['es-ES'].error
+        assert outcomes['fr-FR'].ok
+
+    def test_iter_yields_in_completion_order(self, translator):
+        """Test the iterator yields the fastest language first"""
+        order = [lang for lang, _ in translator.iter_synthesized_translations(
+            {'es-ES': 'Hola', 'fr-FR': 'Salut', 'de-DE': 'Hallo'}
+        )]
+
+        assert order == ['fr-FR', 'de-DE', 'es-ES']
+
+    def test_worker_pool_is_bounded(self, mock_settings):
+        """Test no more than synthesis_max_workers syntheses run at once"""
+        mock_settings.synthesis_max_workers = 2
+        translator = AzureSpeechTranslator(mock_settings)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def fake_synthesize(text, lang):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return b'audio'
+
+        translator._synthesize = fake_synthesize
+        translator.synthesize_translations({f'l{i}': 'x' for i in range(6)})
+        translator.close()
+
+        assert peak[0] == 2
+
+    def test_empty_texts_are_skipped(self, translator):
+        """Test languages with empty translations are not synthesized"""
+        outcomes = translator.synthesize_translations({'es-ES': '', 'fr-FR': 'Salut'})
+
+        assert list(outcomes) == ['fr-FR']
+
+
+def fake_audio_stream(chunk_sizes, final_status=speechsdk.StreamStatus.AllData):
+    """Build a stand-in for speechsdk.AudioDataStream that fills chunk_sizes bytes per read"""
+    class FakeAudioDataStream:
+        def __init__(self, result):
+            self._sizes = list(chunk_sizes)
+            self.status = speechsdk.StreamStatus.PartialData
+
+        def read_data(self, buffer):
+            if not self._sizes:
+                self.status = final_status
+                return 0
+            return min(self._sizes.pop(0), len(buffer))
+
+    return FakeAudioDataStream
+
+
+class TestStreamingSynthesis:
+    """Tests for chunked streaming synthesis"""
+
+    @pytest.fixture
+    def translator(self, mock_settings, fake_factory):
+        """Translator with a fake synthesizer pool"""
+        translator = AzureSpeechTranslator(mock_settings)
+        translator.synthesizer_pool = SynthesizerPool(fake_factory)
+        yield translator
+        translator.close()
+
+    def test_yields_chunks_as_read(self, translator):
+        """Test each stream read becomes one yielded chunk"""
+        with patch('src.core.translator.speechsdk.AudioDataStream', fake_audio_stream([4096, 4096, 100])):
+            chunks = list(translator.iter_synthesis_chunks("Hola a todos", "es-ES"))
+
+        assert [len(chunk) for chunk in chunks] == [4096, 4096, 100]
+        assert translator.synthesizer_pool.idle_count() == 1
+
+    def test_first_chunk_before_stream_finishes(self, translator):
+        """Test the first chunk is yielded before later reads happen"""
+        with patch('src.core.translator.speechsdk.AudioDataStream', fake_audio_stream([10, 10])):
+            stream = translator.iter_synthesis_chunks("Hola", "es-ES")
+            first = next(stream)
+            stream.close()
+
+        assert len(first) == 10
+
+    def test_early_close_discards_synthesizer(self, translator):
+        """Test abandoning a stream stops and discards the synthesizer"""
+        with patch('src.core.translator.speechsdk.AudioDataStream', fake_audio_stream([10, 10])):
+            stream = translator.iter_synthesis_chunks("Hola", "es-ES")
+            next(stream)
+            stream.close()
+
+        assert translator.synthesizer_pool.idle_count() == 0
+        assert translator.synthesizer_pool.stats()['discarded'] == 1
+
+    def test_canceled_stream_raises(self, translator):
+        """Test a stream that ends canceled raises SynthesisError"""
+        with patch('src.core.translator.speechsdk.AudioDataStream',
+                   fake_audio_stream([10], speechsdk.StreamStatus.Canceled)):
+            with pytest.raises(SynthesisError):
+                list(translator.iter_synthesis_chunks("Hola", "es-ES"))
+
+    def test_stream_synthesized_translations_reports_chunks(self, translator):
+        """Test the multi-language stream calls back per chunk and returns full audio"""
+        received = []
+        with patch('src.core.translator.speechsdk.AudioDataStream', fake_audio_stream([8, 8])):
+            outcomes = translator.stream_synthesized_translations(
+                {'es-ES': 'Hola', 'fr-FR': 'Salut'},
+                lambda lang, seq, chunk: received.append((lang, seq, len(chunk)))
+            )
+
+        assert sorted(received) == [('es-ES', 0, 8), ('es-ES', 1, 8), ('fr-FR', 0, 8), ('fr-FR', 1, 8)]
+        assert all(len(outcome.audio_data) == 16 for outcome in outcomes.values())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,161 @@
+"""Pytest unit tests for the synthesis cache"""
+
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.core.config import Settings
+from src.core.synthesis import SynthesizerPool
+from src.core.translator import AzureSpeechTranslator
+from src.core.tts_cache import SynthesisCache, cache_key, get_synthesis_cache, normalize_text
+
+
+VOICE = 'es-ES-ElviraNeural'
+FORMAT = 'Riff16Khz16BitMonoPcm'
+
+
+class TestCacheKey:
+    """Tests for text normalization and content addressing"""
+
+    def test_normalize_collapses_whitespace(self):
+        """Test whitespace differences normalize away"""
+        assert normalize_text("  La moción\t se  aprueba \n") == "La moción se aprueba"
+
+    def test_key_ignores_whitespace_differences(self):
+        """Test equivalent text maps to the same key"""
+        assert cache_key("Motion carries.", VOICE, FORMAT) == cache_key(" Motion  carries. ", VOICE, FORMAT)
+
+    def test_key_depends_on_voice_and_format(self):
+        """Test voice and format are part of the address"""
+        base = cache_key("Motion carries.", VOICE, FORMAT)
+
+        assert base != cache_key("Motion carries.", 'es-ES-AlvaroNeural', FORMAT)
+        assert base != cache_key("Motion carries.", VOICE, 'Ogg16Khz16BitMonoOpus')
+
+
+class TestSynthesisCache:
+    """Tests for the memory and disk tiers"""
+
+    def test_miss_then_hit(self):
+        """Test put makes a later get hit"""
+        cache = SynthesisCache()
+
+        assert cache.get("Hola", VOICE, FORMAT) is None
+        cache.put("Hola", VOICE, FORMAT, b'audio')
+
+        assert cache.get("Hola", VOICE, FORMAT) == b'audio'
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_memory_lru_evicts_least_recent(self):
+        """Test the memory tier evicts by recency within its byte budget"""
+        cache = SynthesisCache(max_memory_bytes=10)
+        cache.put("a", VOICE, FORMAT, b'11111')
+        cache.put("b", VOICE, FORMAT, b'22222')
+        cache.get("a", VOICE, FORMAT)  # a is now most recent
+
+        cache.put("c", VOICE, FORMAT, b'33333')
+
+        assert cache.get("b", VOICE, FORMAT) is None
+        assert cache.get("a", VOICE, FORMAT) == b'11111'
+        assert cache.stats()['evictions'] == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Test a new cache instance reads entries written by a previous one"""
+        SynthesisCache(disk_dir=str(tmp_path)).put("Hola", VOICE, FORMAT, b'audio')
+
+        restarted = SynthesisCache(disk_dir=str(tmp_path))
+
+        assert restarted.get("Hola", VOICE, FORMAT) == b'audio'
+        assert restarted.stats()['disk_hits'] == 1
+
+    def test_disk_hit_is_promoted_to_memory(self, tmp_path):
+        """Test a disk hit serves later lookups from memory"""
+        SynthesisCache(disk_dir=str(tmp_path)).put("Hola", VOICE, FORMAT, b'audio')
+        cache = SynthesisCache(disk_dir=str(tmp_path))
+
+        cache.get("Hola", VOICE, FORMAT)
+        cache.get("Hola", VOICE, FORMAT)
+
+        assert cache.stats()['disk_hits'] == 1
+        assert cache.stats()['hits'] == 2
+
+    def test_disk_budget_prunes_oldest(self, tmp_path):
+        """Test the disk tier stays within max_disk_bytes"""
+        cache = SynthesisCache(disk_dir=str(tmp_path), max_disk_bytes=10)
+        cache.put("a", VOICE, FORMAT, b'11111')
+        time.sleep(0.01)
+        cache.put("b", VOICE, FORMAT, b'22222')
+        time.sleep(0.01)
+        cache.put("c", VOICE, FORMAT, b'33333')
+
+        assert cache.stats()['disk_bytes'] <= 10
+        assert cache.stats()['disk_evictions'] == 1
+        assert SynthesisCache(disk_dir=str(tmp_path)).get("a", VOICE, FORMAT) is None
+
+    def test_memory_hit_is_fast(self):
+        """Test memory hits return in microseconds"""
+        cache = SynthesisCache()
+        cache.put("Next item on the agenda.", VOICE, FORMAT, b'\x00' * 64000)
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            cache.get("Next item on the agenda.", VOICE, FORMAT)
+        per_hit_us = (time.perf_counter() - start) * 1e6 / 1000
+
+        assert per_hit_us < 100
+
+    def test_shared_cache_outlives_translators(self):
+        """Test translators with the same settings share one cache"""
+        settings = Settings(speech_key='test_key', speech_region='eastus')
+
+        assert get_synthesis_cache(settings) is get_synthesis_cache(settings)
+
+    def test_disabled_cache(self):
+        """Test tts_cache_enabled=False disables caching"""
+        settings = Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False)
+
+        assert get_synthesis_cache(settings) is None
+
+
+class TestTranslatorCaching:
+    """Tests for cache use in AzureSpeechTranslator"""
+
+    @pytest.fixture
+    def translator(self):
+        """Translator with a private cache and a fake synthesizer"""
+        settings = Settings(speech_key='test_key', speech_region='eastus', target_language='es-ES')
+        translator = AzureSpeechTranslator(settings)
+        translator.synthesis_cache = SynthesisCache()
+        synthesizer = MagicMock()
+        synthesizer.speak_text.return_value = MagicMock(
+            reason=speechsdk.ResultReason.SynthesizingAudioCompleted,
+            audio_data=b'RIFFaudio'
+        )
+        translator.synthesizer_pool = SynthesizerPool(lambda voice, fmt: synthesizer)
+        translator.fake_synthesizer = synthesizer
+        yield translator
+        translator.close()
+
+    def test_cache_hit_skips_service(self, translator):
+        """Test repeated phrases are synthesized once"""
+        first = translator.synthesize_translation("Se aprueba la moción.", "es-ES")
+        second = translator.synthesize_translation("Se  aprueba la moción.", "es-ES")
+
+        assert first == second == b'RIFFaudio'
+        assert translator.fake_synthesizer.speak_text.call_count == 1
+
+    def test_warm_synthesis_cache_renders_missing_phrases(self, translator):
+        """Test warm-up renders each phrase once and skips cached ones"""
+        phrases = {'es-ES': ["Se aprueba la moción.", "Se levanta la sesión.", "Se aprueba la moción."]}
+
+        assert translator.warm_synthesis_cache(phrases) == {'es-ES': 2}
+        assert translator.warm_synthesis_cache(phrases) == {'es-ES': 0}
+        assert translator.fake_synthesizer.speak_text.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
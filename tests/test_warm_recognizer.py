@@ -0,0 +1,264 @@
+"""Pytest unit tests for kept-warm recognizers"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import azure.cognitiveservices.speech as speechsdk
+
+from src.core.config import Settings
+from src.core.translator import AzureSpeechTranslator
+from src.core.warm_recognizer import KeepWarmRecognizer
+from tests.fakes import FakeRecognizer, FakeSignal, translation_result
+
+
+class FakeConnection:
+    """Connection whose open/close fire connected/disconnected"""
+
+    def __init__(self):
+        self.connected = FakeSignal()
+        self.disconnected = FakeSignal()
+        self.is_open = False
+        self.open_calls = 0
+
+    def open(self, for_continuous_recognition):
+        self.open_calls += 1
+        if not self.is_open:
+            self.is_open = True
+            self.connected.fire(SimpleNamespace())
+
+    def close(self):
+        if self.is_open:
+            self.is_open = False
+            self.disconnected.fire(SimpleNamespace())
+
+
+class WarmingRecognizer(FakeRecognizer):
+    """Recognizer that emits its first interim sooner when the connection is open"""
+
+    COLD_MS = 120
+    WARM_MS = 10
+
+    def __init__(self, connection):
+        super().__init__()
+        self.connection = connection
+        self.starts = 0
+
+    def _interim(self):
+        result = translation_result("Hel", speechsdk.ResultReason.TranslatingSpeech, translations={'es-ES': 'Ho'})
+        self.recognizing.fire(SimpleNamespace(result=result))
+
+    def start_continuous_recognition(self):
+        self.starts += 1
+        delay_ms = self.WARM_MS if self.connection.is_open else self.COLD_MS
+        self.connection.open(True)
+        threading.Timer(delay_ms / 1000, self._interim).start()
+
+    def start_continuous_recognition_async(self):
+        self.start_continuous_recognition()
+        threading.Timer(0.001, self.session_started.fire, args=(SimpleNamespace(),)).start()
+
+    def stop_continuous_recognition(self):
+        self.session_stopped.fire(SimpleNamespace())
+
+    def stop_continuous_recognition_async(self):
+        threading.Timer(0.001, self.session_stopped.fire, args=(SimpleNamespace(),)).start()
+
+
+@pytest.fixture
+def translator():
+    """Translator used only for session control and result parsing"""
+    translator = AzureSpeechTranslator(
+        Settings(speech_key='test_key', speech_region='eastus', tts_cache_enabled=False)
+    )
+    yield translator
+    translator.close()
+
+
+def make_warm(translator, idle_timeout_s=60.0):
+    """Build a KeepWarmRecognizer over fake SDK objects"""
+    connection = FakeConnection()
+    recognizer = WarmingRecognizer(connection)
+    warm = KeepWarmRecognizer(
+        translator, recognizer, idle_timeout_s=idle_timeout_s,
+        connection_factory=lambda r: connection
+    )
+    return warm, recognizer, connection
+
+
+def wait_for(predicate, timeout=1.0):
+    """Poll until predicate() is true"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+class TestKeepWarmRecognizer:
+    """Tests for prewarm, pause/resume and idle expiry"""
+
+    def test_prewarm_opens_connection(self, translator):
+        """Test prewarm opens the service connection before any start"""
+        warm, _, connection = make_warm(translator)
+
+        assert warm.prewarm()
+        assert warm.is_warm
+        assert connection.open_calls == 1
+
+    def test_prewarm_failure_is_reported(self, translator):
+        """Test a failing connection open returns False instead of raising"""
+        def broken(recognizer):
+            raise RuntimeError("no network")
+        warm = KeepWarmRecognizer(translator, WarmingRecognizer(FakeConnection()), connection_factory=broken)
+
+        assert warm.prewarm() is False
+        assert not warm.is_warm
+
+    def test_callbacks_wired_once_across_resumes(self, translator):
+        """Test repeated starts reuse one handler per event and the latest callbacks"""
+        warm, recognizer, _ = make_warm(translator)
+        seen = []
+
+        for i in range(3):
+            warm.set_callbacks(recognizing_callback=lambda result, i=i: seen.append(i))
+            warm.start()
+            wait_for(lambda: len(seen) == i + 1)
+            warm.pause()
+
+        assert seen == [0, 1, 2]
+        assert len(recognizer.recognizing.handlers) == 1
+        assert recognizer.starts == 3
+
+    def test_pause_does_not_forward_session_stopped(self, translator):
+        """Test pausing keeps the session-stopped callback quiet, closing does not"""
+        warm, _, _ = make_warm(translator)
+        stopped = []
+        warm.set_callbacks(session_stopped_callback=lambda: stopped.append(True))
+
+        warm.start()
+        warm.pause()
+        assert stopped == []
+
+        warm.start()
+        warm.close()
+        assert stopped == [True]
+
+    def test_pause_keeps_connection_open(self, translator):
+        """Test the connection stays open while paused"""
+        warm, _, connection = make_warm(translator)
+        warm.set_callbacks()
+
+        warm.start()
+        warm.pause()
+
+        assert connection.is_open
+        assert not warm.running
+        warm.close()
+
+    def test_idle_timeout_closes_connection(self, translator):
+        """Test a paused recognizer goes cold after idle_timeout_s"""
+        warm, _, connection = make_warm(translator, idle_timeout_s=0.05)
+        warm.set_callbacks()
+
+        warm.start()
+        warm.pause()
+        wait_for(lambda: not connection.is_open)
+
+        assert not warm.is_warm
+        assert warm.stats()['expirations'] == 1
+
+    def test_resume_cancels_idle_timeout(self, translator):
+        """Test resuming before the timeout keeps the connection"""
+        warm, _, connection = make_warm(translator, idle_timeout_s=0.05)
+        warm.set_callbacks()
+
+        warm.start()
+        warm.pause()
+        warm.start()
+        time.sleep(0.1)
+
+        assert connection.is_open
+        assert warm.stats()['expirations'] == 0
+        warm.close()
+
+    def test_cold_vs_warm_first_interim(self, translator):
+        """Test instrumentation records a faster first interim on warm starts"""
+        warm, _, _ = make_warm(translator)
+        interims = []
+        warm.set_callbacks(recognizing_callback=lambda result: interims.append(result))
+
+        warm.start()  # cold: nothing pre-opened
+        wait_for(lambda: len(interims) == 1)
+        warm.pause()
+        warm.start()  # warm: connection kept open
+        wait_for(lambda: len(interims) == 2)
+        warm.close()
+
+        stats = warm.stats()
+        assert stats['starts'] == 2
+        assert stats['warm_starts'] == 1
+        assert stats['warm_first_interim_ms'] < stats['cold_first_interim_ms']
+
+    def test_async_start_pause_resume(self, translator):
+        """Test the asyncio start/pause path"""
+        warm, recognizer, _ = make_warm(translator)
+        warm.prewarm()
+        warm.set_callbacks()
+
+        async def run():
+            await warm.start_async()
+            await warm.pause_async()
+            await warm.start_async()
+            await warm.close_async()
+
+        asyncio.run(run())
+
+        assert not warm.running
+        assert recognizer.starts == 2
+
+    def test_speculator_observes_each_interim_once(self):
+        """Test interims reach the speculator once per event across start/pause cycles"""
+        translator = AzureSpeechTranslator(Settings(
+            speech_key='test_key', speech_region='eastus', tts_cache_enabled=False, speculative_synthesis=True
+        ))
+        observed = []
+        translator.speculator.observe = lambda translations: observed.append(translations)
+        warm, recognizer, _ = make_warm(translator)
+        warm.set_callbacks()
+
+        try:
+            for cycle in range(1, 5):
+                warm.start()
+                wait_for(lambda: len(observed) >= cycle)
+                warm.pause()
+            time.sleep(0.05)
+
+            assert len(observed) == recognizer.starts == 4
+            assert len(recognizer.recognizing.handlers) == 1
+        finally:
+            warm.close()
+            translator.close()
+
+    def test_plain_recognizer_feeds_speculator_once(self):
+        """Test restarting a recognizer without an interim callback connects one speculator feed"""
+        translator = AzureSpeechTranslator(Settings(
+            speech_key='test_key', speech_region='eastus', tts_cache_enabled=False, speculative_synthesis=True
+        ))
+        recognizer = WarmingRecognizer(FakeConnection())
+
+        try:
+            for _ in range(3):
+                translator.start_continuous_translation(recognizer)
+                translator.stop_continuous_translation(recognizer)
+
+            assert len(recognizer.recognizing.handlers) == 1
+        finally:
+            translator.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])